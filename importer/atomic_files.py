@@ -0,0 +1,59 @@
+"""Atomic file writes and checksums shared by the importers and local indexes.
+
+Every generated file (indexes, map bundles, snapshots, caches) is written to
+a temp file next to its destination and renamed into place, so readers never
+see a partly written file and an interrupted write keeps the previous one.
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+# Bytes hashed per read in sha256_file
+CHUNK_SIZE = 1 << 20
+
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Yield a temp path next to path and rename it into place on success.
+
+    The parent directory is created first; the temp file is removed if the
+    block raises.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        yield tmp_path
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(path)
+
+
+def write_json(path: Path, data: Any, **dump_kwargs: Any) -> int:
+    """
+    Write JSON atomically (temp file + rename).
+
+    Output is compact UTF-8 unless dump_kwargs override json.dump's
+    arguments (e.g. indent=2, separators=None).
+
+    Returns:
+        Size of the written file in bytes
+    """
+    dump_kwargs = {"ensure_ascii": False, "separators": (",", ":"), **dump_kwargs}
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+    return path.stat().st_size
+
+
+def sha256_file(path: Path) -> str:
+    """sha256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,6 +1,7 @@
 """Command-line interface for Bible importer."""
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from typing import Optional, List, Dict
@@ -10,7 +11,13 @@ import click
 from config import settings
 from csv_parser import parse_bible_csv, validate_verse_integrity
 from verse_chunker import chunk_verses, analyze_chunking_quality
-from prism_client import import_documents_in_batches, PrismClient
+from prism_client import (
+    SEARCH_DOMAINS,
+    PrismClient,
+    default_embedding_cache,
+    default_search_cache,
+    import_documents_in_batches,
+)
 
 
 @click.group()
@@ -72,6 +79,13 @@ def cli():
     is_flag=True,
     help="Enable all optimizations (genre-aware + overlap + cross-refs + parallels)",
 )
+@click.option(
+    "--export",
+    "export_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also write all documents to a columnar file (.parquet or .arrow)",
+)
 def import_bible(
     version: str,
     verses_csv: Path,
@@ -82,9 +96,11 @@ def import_bible(
     genre_aware: bool,
     overlap: bool,
     full_optimization: bool,
+    export_path: Optional[Path],
 ):
     """Import Bible translation into Prism."""
     translation = version.upper()
+    _check_export(export_path)
 
     # Full optimization enables all features
     if full_optimization:
@@ -171,6 +187,11 @@ def import_bible(
             f"({settings.max_chunk_tokens} tokens)"
         )
 
+    if export_path is not None:
+        from corpus_export import write_corpus
+
+        _show_export(write_corpus(documents, export_path))
+
     # Dry run - stop here
     if dry_run:
         click.echo("\n✅ Dry run complete (no data imported)")
@@ -182,6 +203,9 @@ def import_bible(
     click.echo(f"   Batch size: {batch_size}")
     click.echo(f"   Embedding: {'disabled' if no_embed else 'enabled'}")
 
+    # Title -> Prism document ID of every chunk Prism accepted
+    imported_ids: Dict[str, Optional[str]] = {}
+
     def progress_callback(batch_num, total_batches, result):
         if "error" in result:
             click.echo(f"   ❌ Batch {batch_num}/{total_batches}: {result['error']}")
@@ -193,6 +217,8 @@ def import_bible(
                 f"   ✓ Batch {batch_num}/{total_batches}: "
                 f"{imported} imported, {failed} failed"
             )
+            batch = documents[(batch_num - 1) * batch_size:batch_num * batch_size]
+            imported_ids.update(_imported_document_ids(batch, result))
 
     try:
         results = asyncio.run(
@@ -213,6 +239,12 @@ def import_bible(
     click.echo(f"   Successful: {results['success_count']:,}")
     click.echo(f"   Errors: {results['error_count']:,}")
 
+    # Keep the local keyword index in step with Prism (accepted chunks only)
+    _update_keyword_index(
+        [document for document in documents if document["title"] in imported_ids],
+        imported_ids,
+    )
+
     if results["errors"]:
         click.echo(f"\n⚠️  Errors encountered:")
         for error in results["errors"][:10]:  # Show first 10
@@ -340,19 +372,71 @@ def status(version: Optional[str]):
     default=5,
     help="Number of results to return",
 )
-def search(query: str, version: Optional[str], top_k: int):
-    """Test semantic search for Bible verses."""
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the local search result cache",
+)
+@click.option(
+    "--domains",
+    help="Search several domains at once: comma-separated list or 'all'",
+)
+@click.option(
+    "--embedding-cache/--no-embedding-cache",
+    default=None,
+    help="Embed the query client-side with a vector cache (default: from settings)",
+)
+def search(
+    query: str,
+    version: Optional[str],
+    top_k: int,
+    no_cache: bool,
+    domains: Optional[str],
+    embedding_cache: Optional[bool],
+):
+    """Test semantic search for Bible verses.
+
+    Results are cached locally (search_cache_path, search_cache_ttl), so
+    repeated searches return without calling Prism. With --domains, the
+    domains are searched concurrently and merged into one ranking, with
+    identical verse ranges from different translations shown once.
+
+    Example:
+        python cli.py search -q "good shepherd" --domains all
+        python cli.py search -q "love" --domains bible/kjv,lexicon/strongs
+    """
     domain = None
     if version:
         domain = f"bible/{version.lower()}"
 
+    fan_out = None
+    if domains:
+        fan_out = (
+            list(SEARCH_DOMAINS) if domains.strip().lower() == "all"
+            else [d.strip() for d in domains.split(",") if d.strip()]
+        )
+
     click.echo(f"🔍 Searching for: '{query}'")
-    if domain:
+    if fan_out:
+        click.echo(f"   Domains: {', '.join(fan_out)}")
+    elif domain:
         click.echo(f"   Domain: {domain}")
 
+    if embedding_cache is None:
+        embedding_cache = settings.embedding_cache_enabled
+
     async def do_search():
-        async with PrismClient() as client:
-            results = await client.search_documents(query, domain=domain, top_k=top_k)
+        search_cache = None if no_cache else default_search_cache()
+        vector_cache = default_embedding_cache() if embedding_cache else None
+        async with PrismClient(search_cache=search_cache, embedding_cache=vector_cache) as client:
+            if fan_out:
+                results = await client.search_domains(query, fan_out, top_k=top_k)
+                for failed, error in results["errors"].items():
+                    click.echo(f"   ⚠️  {failed}: {error}")
+            else:
+                results = await client.search_documents(query, domain=domain, top_k=top_k)
+            if search_cache is not None and search_cache.hits:
+                click.echo("   (cached)")
 
             documents = results.get("results", [])
             if not documents:
@@ -366,10 +450,20 @@ def search(query: str, version: Optional[str], top_k: int):
                 content = doc.get("content", "")
 
                 click.echo(f"{i}. {title} (similarity: {similarity:.3f})")
+                if fan_out:
+                    also_in = ", ".join(doc.get("also_in", []))
+                    click.echo(f"   [{doc['domain']}{'; also in ' + also_in if also_in else ''}]")
                 # Show first 200 chars of content
                 preview = content[:200] + "..." if len(content) > 200 else content
                 click.echo(f"   {preview}\n")
 
+            if vector_cache is not None:
+                stats = vector_cache.stats()
+                click.echo(
+                    f"🧮 Query embeddings: {stats['hits']} cached, {stats['misses']} computed "
+                    f"({stats['seconds_saved']:.3f}s saved)"
+                )
+
     try:
         asyncio.run(do_search())
     except Exception as e:
@@ -400,11 +494,19 @@ def search(query: str, version: Optional[str], top_k: int):
     is_flag=True,
     help="Parse only, don't import to Prism",
 )
+@click.option(
+    "--export",
+    "export_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also write all documents to a columnar file (.parquet or .arrow)",
+)
 def import_lexicon(
     data_dir: Path,
     batch_size: int,
     no_embed: bool,
     dry_run: bool,
+    export_path: Optional[Path],
 ):
     """Import Strong's Hebrew and Greek lexicon to Prism.
 
@@ -414,9 +516,12 @@ def import_lexicon(
     Example:
         python cli.py import-lexicon --dry-run
         python cli.py import-lexicon
+        python cli.py import-lexicon --dry-run --export lexicon.parquet
     """
     from lexicon_importer import LexiconImporter
 
+    _check_export(export_path)
+
     click.echo("📖 Strong's Lexicon Importer")
     click.echo(f"   Data directory: {data_dir}")
     click.echo(f"   Domain: lexicon/strongs")
@@ -430,13 +535,15 @@ def import_lexicon(
 
     # Progress callback
     def progress_callback(batch_num, total_batches, result):
+        # Streaming import does not know the batch count up front
+        total = total_batches if total_batches is not None else "?"
         if "error" in result:
-            click.echo(f"   ❌ Batch {batch_num}/{total_batches}: {result['error']}")
+            click.echo(f"   ❌ Batch {batch_num}/{total}: {result['error']}")
         else:
             imported = result.get("imported", 0)
             failed = result.get("failed", 0)
             click.echo(
-                f"   ✓ Batch {batch_num}/{total_batches}: "
+                f"   ✓ Batch {batch_num}/{total}: "
                 f"{imported} imported, {failed} failed"
             )
 
@@ -448,13 +555,17 @@ def import_lexicon(
             embed=not no_embed,
             dry_run=dry_run,
             progress_callback=progress_callback if not dry_run else None,
+            export_path=export_path,
         )
+        _show_export(results.get("export"))
 
         if dry_run:
             click.echo(f"\n✅ Dry run complete!")
             click.echo(f"   Total entries: {results['total_documents']:,}")
             click.echo(f"   Hebrew: {results['hebrew_count']:,}")
             click.echo(f"   Greek: {results['greek_count']:,}")
+            for language, stats in results["languages"].items():
+                click.echo(f"   {language.title()} conversion: {stats['docs_per_sec']:,} docs/sec")
             click.echo(f"\n📝 Sample entries:")
             for i, doc in enumerate(results['sample_documents'], 1):
                 click.echo(f"\n   {i}. {doc['title']}")
@@ -467,6 +578,13 @@ def import_lexicon(
             click.echo(f"   Greek entries: {results['greek_count']:,}")
             click.echo(f"   Successful: {results['success_count']:,}")
             click.echo(f"   Errors: {results['error_count']:,}")
+            for language, stats in results["languages"].items():
+                click.echo(f"   {language.title()} throughput: {stats.get('docs_per_sec', 0):,} docs/sec")
+            index_stats = results["lexicon_index"]
+            click.echo(
+                f"   Lookup index: {index_stats['entries']:,} entries "
+                f"({index_stats['with_document_id']:,} with document IDs) → {index_stats['path']}"
+            )
 
             if results["errors"]:
                 click.echo(f"\n⚠️  Errors encountered:")
@@ -489,10 +607,16 @@ def import_lexicon(
     "--strong-ids",
     help="Comma-separated Strong's IDs to verify (e.g., H1,G26)",
 )
-def verify_lexicon(strong_ids: Optional[str]):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the local search result cache",
+)
+def verify_lexicon(strong_ids: Optional[str], no_cache: bool):
     """Verify lexicon entries were imported correctly.
 
-    Searches Prism for specific Strong's entries and displays results.
+    Looks up specific Strong's entries (local index first, then Prism
+    search) and displays results.
 
     Example:
         python cli.py verify-lexicon
@@ -508,7 +632,10 @@ def verify_lexicon(strong_ids: Optional[str]):
         click.echo(f"   Checking IDs: {', '.join(ids)}")
 
     try:
-        results = asyncio.run(verify_lexicon_import(strong_ids=ids))
+        results = asyncio.run(verify_lexicon_import(
+            strong_ids=ids,
+            search_cache=default_search_cache(persist=False) if no_cache else None,
+        ))
 
         click.echo(f"\n📊 Prism Statistics:")
         stats = results.get("prism_stats", {})
@@ -528,7 +655,10 @@ def verify_lexicon(strong_ids: Optional[str]):
             if search_results:
                 entry = search_results[0]
                 click.echo(f"\n   {strong_id}: {entry.get('document_title', 'Unknown')}")
-                click.echo(f"      Similarity: {entry.get('similarity', 0):.3f}")
+                if entry.get("match") == "index":
+                    click.echo(f"      Exact match (document {entry.get('document_id') or 'unknown'})")
+                else:
+                    click.echo(f"      Similarity: {entry.get('similarity', 0):.3f}")
                 content = entry.get('content', '')
                 preview = content[:200] + "..." if len(content) > 200 else content
                 click.echo(f"      {preview}")
@@ -540,6 +670,55 @@ def verify_lexicon(strong_ids: Optional[str]):
         sys.exit(1)
 
 
+@cli.command()
+@click.argument("strong_ids", nargs=-1, required=True)
+@click.option(
+    "--fetch",
+    is_flag=True,
+    help="Also fetch the full document from Prism",
+)
+def lexicon_lookup(strong_ids: tuple, fetch: bool):
+    """Look up lexicon entries by exact Strong's number.
+
+    Uses the local index written by import-lexicon, so no embedding
+    search is needed.
+
+    Example:
+        python cli.py lexicon-lookup H157 G26
+        python cli.py lexicon-lookup H157 --fetch
+    """
+    from prism_client import PrismClient
+
+    async def lookup():
+        async with PrismClient() as client:
+            return [
+                (strong_id, await client.get_lexicon_entry(strong_id, fetch_document=fetch))
+                for strong_id in strong_ids
+            ]
+
+    try:
+        entries = asyncio.run(lookup())
+    except FileNotFoundError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    for strong_id, entry in entries:
+        if entry is None:
+            click.echo(f"\n{strong_id}: ❌ Not found")
+            continue
+        click.echo(f"\n{entry['title']}")
+        click.echo(f"   Document ID: {entry.get('document_id') or 'unknown'}")
+        for field in ("language", "lemma", "transliteration", "definition"):
+            if entry.get(field):
+                click.echo(f"   {field.title()}: {entry[field]}")
+        if "document" in entry:
+            content = entry["document"].get("content", "")
+            click.echo(f"   Content: {content[:200]}{'...' if len(content) > 200 else ''}")
+
+
 @cli.command()
 @click.option(
     "--batch-size",
@@ -658,12 +837,40 @@ def export_book_metadata(
     is_flag=True,
     help="Fail if data missing instead of auto-downloading",
 )
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Revalidate the download (ETag/Last-Modified) and re-import only changed places",
+)
+@click.option(
+    "--bundle-output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="GeoJSON places bundle for the map UI (default: from settings)",
+)
+@click.option(
+    "--clusters-output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Marker cluster tile directory for the map UI (default: from settings)",
+)
+@click.option(
+    "--export",
+    "export_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also write all documents to a columnar file (.parquet or .arrow)",
+)
 def import_geography(
     data_dir: Path,
     batch_size: int,
     no_embed: bool,
     dry_run: bool,
     no_download: bool,
+    refresh: bool,
+    bundle_output: Optional[Path],
+    clusters_output: Optional[Path],
+    export_path: Optional[Path],
 ):
     """Import biblical geography data to Prism.
 
@@ -675,30 +882,39 @@ def import_geography(
         python cli.py import-geography --dry-run
         python cli.py import-geography
         python cli.py import-geography --no-download
+        python cli.py import-geography --refresh
+        python cli.py import-geography --bundle-output places.geojson --clusters-output clusters
+        python cli.py import-geography --dry-run --export places.arrow
     """
     from geography_importer import GeographyImporter
 
+    _check_export(export_path)
+
     click.echo("🗺️  Biblical Geography Importer")
     click.echo(f"   Data directory: {data_dir}")
     click.echo(f"   Domain: geography/biblical")
-    click.echo(f"   Download: {'disabled' if no_download else 'auto'}")
+    click.echo(f"   Download: {'disabled' if no_download else 'refresh' if refresh else 'auto'}")
 
     # Initialize importer
     try:
-        importer = GeographyImporter(data_dir=data_dir)
+        importer = GeographyImporter(
+            data_dir=data_dir, bundle_path=bundle_output, clusters_dir=clusters_output
+        )
     except Exception as e:
         click.echo(f"❌ Error initializing importer: {e}", err=True)
         sys.exit(1)
 
     # Progress callback
     def progress_callback(batch_num, total_batches, result):
+        # Streaming import does not know the batch count up front
+        total = total_batches if total_batches is not None else "?"
         if "error" in result:
-            click.echo(f"   ❌ Batch {batch_num}/{total_batches}: {result['error']}")
+            click.echo(f"   ❌ Batch {batch_num}/{total}: {result['error']}")
         else:
             imported = result.get("imported", 0)
             failed = result.get("failed", 0)
             click.echo(
-                f"   ✓ Batch {batch_num}/{total_batches}: "
+                f"   ✓ Batch {batch_num}/{total}: "
                 f"{imported} imported, {failed} failed"
             )
 
@@ -712,18 +928,39 @@ def import_geography(
             dry_run=dry_run,
             download=not no_download,
             progress_callback=progress_callback if not dry_run else None,
+            refresh=refresh,
+            export_path=export_path,
         )
 
         if "error" in results:
             click.echo(f"\n❌ {results['error']}", err=True)
             sys.exit(1)
 
+        download = importer.last_download
+        if download.get("status") == "downloaded":
+            click.echo(f"\n⬇️  Downloaded {download['bytes']:,} bytes (sha256 {download['sha256'][:12]})")
+        elif download.get("status") == "not_modified":
+            click.echo("\n⬇️  Source not modified since last download")
+
+        changes = results.get("changes")
+        if changes:
+            click.echo(
+                f"🔁 Changes since last import: {len(changes['added'])} added, "
+                f"{len(changes['changed'])} changed, {len(changes['removed'])} removed, "
+                f"{changes['unchanged']} unchanged"
+            )
+        _show_export(results.get("export"))
+        if results.get("up_to_date"):
+            click.echo("\n✅ Geography is up to date, nothing to import")
+            return
+
         if dry_run:
             click.echo(f"\n✅ Dry run complete!")
             click.echo(f"   Total places: {results['total_documents']:,}")
             click.echo(f"\n📊 Place types:")
             for place_type, count in sorted(results['type_counts'].items()):
                 click.echo(f"      {place_type:12}: {count:3}")
+            _show_place_report(results.get("report"))
             click.echo(f"\n📝 Sample places:")
             for i, doc in enumerate(results['sample_documents'], 1):
                 meta = doc['metadata']
@@ -744,6 +981,48 @@ def import_geography(
             click.echo(f"\n📊 Place types:")
             for place_type, count in sorted(results['type_counts'].items()):
                 click.echo(f"      {place_type:12}: {count:3}")
+            _show_place_report(results.get("report"))
+
+            spatial = results.get("spatial_index")
+            if spatial:
+                click.echo(
+                    f"\n📍 Spatial index: {spatial['places']:,} places "
+                    f"({spatial['with_document_id']:,} with document IDs) → {spatial['path']}"
+                )
+            verse_index = results.get("verse_index")
+            if verse_index:
+                click.echo(
+                    f"📖 Verse place index: {verse_index['verses']:,} verses, "
+                    f"{verse_index['places']:,} places → {verse_index['path']}"
+                )
+            bundle = results.get("bundle")
+            if bundle:
+                click.echo(
+                    f"🗺️  Map bundle: {bundle['places']:,} places, "
+                    f"{bundle['bytes'] / 1024:.0f} KB → {bundle['path']}"
+                )
+            clusters = results.get("clusters")
+            if clusters:
+                click.echo(
+                    f"🔵 Marker clusters: {clusters['zooms']} zoom levels, "
+                    f"{clusters['tiles']:,} tiles → {clusters['path']}"
+                )
+
+            if results.get("present"):
+                click.echo(f"\nℹ️  {results['present']:,} places were already in Prism")
+
+            stale = results.get("stale")
+            if stale:
+                click.echo(
+                    f"\n⚠️  {len(stale)} changed places still have their old version in Prism, "
+                    "which keeps one document per title and domain:"
+                )
+                for entry in stale[:10]:
+                    click.echo(f"   - {entry['title']} (document {entry['document_id'] or 'unknown'})")
+                click.echo(
+                    "   Delete these documents in Prism, then run import-geography --refresh again "
+                    "to upload the new versions."
+                )
 
             if results["errors"]:
                 click.echo(f"\n⚠️  Errors encountered:")
@@ -898,12 +1177,600 @@ def import_original(
     click.echo(f"   4. UI: Display Hebrew/Greek alongside English text")
 
 
+@cli.command()
+@click.option(
+    "--modules-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to SWORD modules directory (default: from settings)",
+)
+@click.option(
+    "--host",
+    default=None,
+    help="Bind address (default: from settings)",
+)
+@click.option(
+    "--port",
+    type=int,
+    default=None,
+    help="Port (default: from settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Number of server processes (each loads the modules once)",
+)
+def serve_sword(
+    modules_dir: Optional[Path],
+    host: Optional[str],
+    port: Optional[int],
+    workers: int,
+):
+    """Serve original Hebrew/Greek texts over HTTP for the UI.
+
+    Provides the /api/sword/hebrew, /api/sword/greek, /api/sword/interlinear,
+    /api/sword/chapter and /api/sword/batch endpoints.
+
+    Example:
+        python cli.py serve-sword
+        python cli.py serve-sword --port 8200 --workers 4
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        click.echo("❌ uvicorn not installed. Install with: pip install -e '.[service]'", err=True)
+        sys.exit(1)
+
+    if modules_dir is not None:
+        # Worker processes rebuild settings from the environment
+        os.environ["BIBLE_IMPORTER_SWORD_MODULES_DIR"] = str(modules_dir)
+        settings.sword_modules_dir = modules_dir
+    host = host or settings.sword_service_host
+    port = port or settings.sword_service_port
+
+    click.echo(f"📖 SWORD original-text service")
+    click.echo(f"   Modules directory: {settings.sword_modules_dir}")
+    click.echo(f"   Listening on: http://{host}:{port}")
+
+    uvicorn.run(
+        "sword_service:create_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+    )
+
+
+@cli.command()
+@click.option(
+    "--modules-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to SWORD modules directory (default: from settings)",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Index output directory (default: from settings)",
+)
+def build_strongs_index(modules_dir: Optional[Path], output: Optional[Path]):
+    """Build the verse-level Strong's concordance index.
+
+    Reads WLC and SBLGNT once and writes an inverted index from Strong's
+    number to packed verse IDs, used by strongs-lookup and serve-sword.
+
+    Example:
+        python cli.py build-strongs-index
+        python cli.py build-strongs-index --output /tmp/strongs_index
+    """
+    from strongs_index import build_strongs_index as build_index
+    from sword_parser import SwordParser
+
+    modules_dir = modules_dir or settings.sword_modules_dir
+    output = output or settings.strongs_index_dir
+
+    click.echo("📚 Building Strong's concordance index")
+    click.echo(f"   Modules directory: {modules_dir}")
+    click.echo(f"   Output: {output}")
+
+    try:
+        parser = SwordParser(modules_dir=modules_dir)
+        parser.initialize()
+        stats = build_index(parser, output)
+    except Exception as e:
+        click.echo(f"\n❌ Error building index: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"\n✅ Indexed {stats['verses']:,} verses")
+    click.echo(f"   Verses with Strong's tags: {stats['tagged_verses']:,}")
+    click.echo(f"   Strong's numbers: {stats['strongs_numbers']:,}")
+    click.echo(f"   Verse postings: {stats['postings']:,}")
+    if stats["tagged_verses"] == 0:
+        click.echo("\n⚠️  No Strong's tags found - install Strong's-tagged modules")
+
+
+@cli.command()
+@click.argument("strongs")
+@click.option(
+    "--index-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Index directory (default: from settings)",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=20,
+    help="Number of verses to display",
+)
+def strongs_lookup(strongs: str, index_dir: Optional[Path], limit: int):
+    """List verses containing a Strong's number.
+
+    Example:
+        python cli.py strongs-lookup H7225
+        python cli.py strongs-lookup G3056 --limit 50
+    """
+    from strongs_index import StrongsIndex
+
+    try:
+        with StrongsIndex(index_dir or settings.strongs_index_dir) as index:
+            result = index.lookup(strongs, limit=limit)
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"🔍 {result['strongs']}: {result['verse_count']:,} verses, "
+        f"{result['occurrences']:,} occurrences"
+    )
+    for verse in result["verses"]:
+        click.echo(f"   {verse['book']} {verse['chapter']}:{verse['verse']}")
+    if result["verse_count"] > len(result["verses"]):
+        click.echo(f"   ... and {result['verse_count'] - len(result['verses']):,} more")
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "inputs",
+    type=click.Path(exists=True, path_type=Path),
+    multiple=True,
+    required=True,
+    help="Exported chunk embeddings (JSON lines); repeat for several files",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Index output directory (default: from settings)",
+)
+@click.option(
+    "--lists",
+    type=int,
+    default=None,
+    help="Number of inverted lists (default: about sqrt of the chunk count)",
+)
+def build_vector_index(inputs: tuple, output: Optional[Path], lists: Optional[int]):
+    """Build the offline IVF vector index from exported chunk embeddings.
+
+    Example:
+        python cli.py build-vector-index --input kjv_chunks.jsonl --input lexicon.jsonl
+    """
+    try:
+        from vector_index import build_vector_index as build_index, iter_embedding_records
+    except ImportError:
+        click.echo("❌ numpy not installed. Install with: pip install -e '.[vector]'", err=True)
+        sys.exit(1)
+
+    output = output or settings.vector_index_dir
+
+    click.echo("🧭 Building offline vector index")
+    click.echo(f"   Inputs: {', '.join(str(path) for path in inputs)}")
+    click.echo(f"   Output: {output}")
+
+    try:
+        stats = build_index(iter_embedding_records(inputs), output, n_lists=lists)
+    except (ValueError, KeyError) as e:
+        click.echo(f"\n❌ Error building index: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"\n✅ Indexed {stats['count']:,} chunks ({stats['dimension']} dimensions)")
+    click.echo(f"   Inverted lists: {stats['lists']:,}")
+    click.echo(f"   Domains: {stats['domains']}")
+
+
+@cli.command()
+@click.argument("query")
+@click.option(
+    "--domain",
+    help="Filter by domain (e.g., bible/kjv)",
+)
+@click.option(
+    "--top-k",
+    type=int,
+    default=5,
+    help="Number of results to return",
+)
+@click.option(
+    "--index-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Index directory (default: from settings)",
+)
+def vector_search(query: str, domain: Optional[str], top_k: int, index_dir: Optional[Path]):
+    """Search the offline vector index.
+
+    The query is embedded once (cached in the query embedding cache) and
+    searched locally without Prism's vector search.
+
+    Example:
+        python cli.py vector-search "The Lord is my shepherd" --domain bible/kjv
+    """
+    try:
+        from vector_index import VectorIndex
+    except ImportError:
+        click.echo("❌ numpy not installed. Install with: pip install -e '.[vector]'", err=True)
+        sys.exit(1)
+
+    async def do_search(index):
+        async with PrismClient(
+            embedding_cache=default_embedding_cache(), local_index=index
+        ) as client:
+            return await client.search_documents(query, domain=domain, top_k=top_k)
+
+    try:
+        with VectorIndex(index_dir or settings.vector_index_dir, nprobe=settings.vector_index_nprobe) as index:
+            results = asyncio.run(do_search(index))
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    documents = results["results"]
+    if not documents:
+        click.echo("❌ No results found")
+        return
+    for i, doc in enumerate(documents, 1):
+        click.echo(f"{i}. {doc['document_title']} [{doc['domain']}] (similarity: {doc['similarity']:.3f})")
+        content = doc.get("content", "")
+        click.echo(f"   {content[:200] + '...' if len(content) > 200 else content}\n")
+
+
+@cli.command()
+@click.argument("query")
+@click.option(
+    "--domain",
+    help="Filter by domain (e.g., bible/kjv)",
+)
+@click.option(
+    "--top-k",
+    type=int,
+    default=5,
+    help="Number of results to return",
+)
+@click.option(
+    "--hybrid",
+    is_flag=True,
+    help="Fuse with Prism semantic search (reciprocal rank fusion)",
+)
+def keyword_search(query: str, domain: Optional[str], top_k: int, hybrid: bool):
+    """Search the local BM25 keyword index.
+
+    The index is updated by every `import`. With --hybrid, BM25 and
+    semantic results are fused with reciprocal rank fusion.
+
+    Example:
+        python cli.py keyword-search "The Lord is my shepherd" --domain bible/kjv
+        python cli.py keyword-search "faith without works" --hybrid
+    """
+    from keyword_index import KeywordIndex
+
+    try:
+        index = KeywordIndex(settings.keyword_index_dir).load()
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+    async def do_hybrid():
+        async with PrismClient(keyword_index=index) as client:
+            return await client.hybrid_search(query, domain=domain, top_k=top_k)
+
+    try:
+        results = asyncio.run(do_hybrid()) if hybrid else index.search(query, top_k=top_k, domain=domain)
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    documents = results["results"]
+    if not documents:
+        click.echo("❌ No results found")
+        return
+    for i, doc in enumerate(documents, 1):
+        if hybrid:
+            vector_rank, keyword_rank = doc["ranks"]
+            click.echo(
+                f"{i}. {doc['document_title']} (rrf: {doc['rrf_score']:.4f}; "
+                f"semantic #{vector_rank or '-'}, keyword #{keyword_rank or '-'})"
+            )
+        else:
+            click.echo(f"{i}. {doc['document_title']} (bm25: {doc['score']:.2f})")
+
+
+def _show_place_report(report: Optional[Dict]) -> None:
+    """Print the confidence and coordinate histograms of a geography import."""
+    if not report:
+        return
+    width = 30
+    peak = max(report["score_histogram"].values()) or 1
+    click.echo(f"\n📈 Confidence levels:")
+    for level, count in report["confidence_levels"].items():
+        click.echo(f"      {level:12}: {count:5,}")
+    click.echo(f"\n📈 Confidence scores (vote totals):")
+    for bucket, count in report["score_histogram"].items():
+        bar = "█" * round(width * count / peak)
+        click.echo(f"      {bucket:>10}: {count:5,} {bar}")
+    coordinates = report["coordinates"]
+    click.echo(
+        f"\n📍 Coordinates: {coordinates['located']:,} located, "
+        f"{coordinates['missing']:,} missing, {coordinates['invalid']:,} invalid"
+    )
+
+
+def _check_export(export_path: Optional[Path]) -> None:
+    """Fail before parsing if --export cannot be written."""
+    if export_path is None:
+        return
+    try:
+        from corpus_export import corpus_format
+    except ImportError:
+        click.echo("❌ pyarrow not installed. Install with: pip install -e '.[arrow]'", err=True)
+        sys.exit(1)
+    try:
+        corpus_format(export_path)
+    except ValueError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+
+def _show_export(export: Optional[Dict]) -> None:
+    """Print where a corpus export was written."""
+    if not export:
+        return
+    click.echo(
+        f"\n💾 Exported {export['documents']:,} documents ({export['columns']} columns, "
+        f"{export['format']}, {export['bytes'] / 1024:.0f} KB) → {export['path']}"
+    )
+
+
+def _load_spatial_index():
+    """Load the spatial index or exit with an error."""
+    from spatial_index import SpatialIndex
+
+    try:
+        return SpatialIndex(settings.spatial_index_path).load()
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+
+def _show_places(places: List[Dict]) -> None:
+    """Print places from a spatial index query."""
+    if not places:
+        click.echo("❌ No places found")
+        return
+    for i, place in enumerate(places, 1):
+        distance = f" - {place['distance_km']:.1f} km" if "distance_km" in place else ""
+        click.echo(
+            f"{i}. {place['name']} ({place['latitude']:.4f}°N, {place['longitude']:.4f}°E)"
+            f"{distance} [{place.get('place_type') or 'unknown'}, "
+            f"{place.get('confidence_level') or 'unknown'}]"
+        )
+
+
+@cli.command()
+@click.argument("place")
+@click.option(
+    "--radius",
+    type=float,
+    default=20.0,
+    help="Search radius in kilometres",
+)
+@click.option(
+    "--nearest",
+    type=int,
+    default=None,
+    help="Return the N nearest places instead of a radius search",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=25,
+    help="Maximum number of places to display",
+)
+def places_near(place: str, radius: float, nearest: Optional[int], limit: int):
+    """List places near a biblical place or a "lat,lon" point.
+
+    Answered from the local spatial index written by import-geography.
+
+    Example:
+        python cli.py places-near Jerusalem --radius 20
+        python cli.py places-near "31.7767,35.2345" --nearest 5
+    """
+    index = _load_spatial_index()
+
+    try:
+        lat, lon = (float(part) for part in place.split(","))
+        center = None
+    except ValueError:
+        center = index.find(place)
+        if center is None:
+            click.echo(f"❌ Unknown place (or place without coordinates): {place}", err=True)
+            sys.exit(1)
+        lat, lon = center["latitude"], center["longitude"]
+
+    if nearest:
+        places = index.nearest(lat, lon, k=nearest + (1 if center else 0))
+        click.echo(f"📍 {nearest} places nearest to {place}:")
+    else:
+        places = index.within_radius(lat, lon, radius, limit=limit + (1 if center else 0))
+        click.echo(f"📍 Places within {radius:g} km of {place}:")
+
+    if center:
+        places = [p for p in places if p["slug"] != center["slug"]]
+    _show_places(places[:nearest or limit])
+
+
+@cli.command()
+@click.argument("south", type=float)
+@click.argument("west", type=float)
+@click.argument("north", type=float)
+@click.argument("east", type=float)
+def places_within(south: float, west: float, north: float, east: float):
+    """List places inside a bounding box (south west north east).
+
+    Example:
+        python cli.py places-within 31.0 34.5 32.0 35.5
+    """
+    index = _load_spatial_index()
+
+    try:
+        places = index.within_bbox(south, west, north, east)
+    except ValueError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"🗺️  {len(places):,} places in [{south}, {west}, {north}, {east}]")
+    _show_places(places)
+
+
+@cli.command()
+@click.option(
+    "--bundle",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="GeoJSON places bundle (default: from settings)",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Cluster tile directory (default: from settings)",
+)
+@click.option(
+    "--max-zoom",
+    type=int,
+    default=12,
+    help="Highest clustered zoom level (single places above it)",
+)
+@click.option(
+    "--radius",
+    type=int,
+    default=40,
+    help="Cluster radius in screen pixels",
+)
+def build_place_clusters(bundle: Optional[Path], output: Optional[Path], max_zoom: int, radius: int):
+    """Precompute per-zoom marker clusters from the places bundle.
+
+    import-geography runs this automatically; use it to rebuild clusters
+    with different settings without re-importing.
+
+    Example:
+        python cli.py build-place-clusters
+        python cli.py build-place-clusters --max-zoom 14
+    """
+    import json
+
+    from place_clusters import build_place_clusters as build_clusters
+
+    bundle = bundle or settings.geography_bundle_path
+    output = output or settings.place_clusters_dir
+
+    try:
+        with open(bundle, encoding="utf-8") as f:
+            places = json.load(f)
+        stats = build_clusters(places, output, max_zoom=max_zoom, radius_px=radius)
+    except (OSError, ValueError, KeyError) as e:
+        click.echo(f"❌ Error building clusters: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ Clustered {stats['places']:,} places into {stats['tiles']:,} tiles → {output}")
+    for zoom, count in stats["clusters_per_zoom"].items():
+        click.echo(f"   z{zoom:<2}: {count:,} markers")
+
+
+@cli.command()
+@click.option(
+    "--events-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Researched journey event files (default: from settings)",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Journeys artifact for the map UI (default: from settings)",
+)
+def build_journeys(events_dir: Optional[Path], output: Optional[Path]):
+    """Compute journey routes from the researched event files.
+
+    Resolves each stop against the spatial index written by import-geography
+    (stops stay unlinked if it is missing), measures every leg and writes all
+    journeys with their map polylines to one file.
+
+    Example:
+        python cli.py build-journeys
+        python cli.py build-journeys --output journeys.json
+    """
+    try:
+        from journeys import build_journeys as compute_journeys, load_events, write_journeys
+    except ImportError:
+        click.echo("❌ numpy not installed. Install with: pip install -e '.[vector]'", err=True)
+        sys.exit(1)
+    from spatial_index import SpatialIndex
+
+    events_dir = events_dir or settings.events_dir
+    output = output or settings.journeys_path
+
+    try:
+        index = SpatialIndex(settings.spatial_index_path).load()
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"⚠️  {e} Stops will not be linked to places.")
+        index = None
+
+    try:
+        artifact = compute_journeys(load_events(events_dir), index)
+        size = write_journeys(artifact, output)
+    except (OSError, ValueError, KeyError) as e:
+        click.echo(f"❌ Error building journeys: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"🧭 {artifact['count']} journeys ({size / 1024:.0f} KB) → {output}")
+    for journey in artifact["journeys"]:
+        stats = journey["stats"]
+        click.echo(
+            f"   {journey['name']}: {stats['stops']} stops "
+            f"({stats['resolved_stops']} linked to places), {stats['total_km']:,.0f} km "
+            f"(researched {stats['researched_km']:,.0f} km)"
+        )
+
+
 @cli.command()
 @click.option(
     "--query",
     help="Optional place name to search for (e.g., Jerusalem)",
 )
-def verify_geography(query: Optional[str]):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the local search result cache",
+)
+def verify_geography(query: Optional[str], no_cache: bool):
     """Verify geography import was successful.
 
     Searches Prism for biblical places and displays results.
@@ -922,7 +1789,10 @@ def verify_geography(query: Optional[str]):
         click.echo(f"   Searching for: {query}")
 
     try:
-        results = asyncio.run(verify_geography_import(sample_queries=sample_queries))
+        results = asyncio.run(verify_geography_import(
+            sample_queries=sample_queries,
+            search_cache=default_search_cache(persist=False) if no_cache else None,
+        ))
 
         click.echo(f"\n📊 Prism Statistics:")
         stats = results.get("prism_stats", {})
@@ -959,6 +1829,244 @@ def verify_geography(query: Optional[str]):
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Snapshot directory (default: from settings)",
+)
+@click.option(
+    "--domain",
+    "domains",
+    multiple=True,
+    help="Domain to export; repeat for several (default: all corpus domains)",
+)
+@click.option(
+    "--no-embeddings",
+    is_flag=True,
+    help="Export documents only (restore will re-embed)",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="Domains exported at once (default: from settings)",
+)
+def export_snapshot(
+    output: Optional[Path],
+    domains: tuple,
+    no_embeddings: bool,
+    concurrency: Optional[int],
+):
+    """Export whole Prism domains with embeddings into a local snapshot.
+
+    Example:
+        python cli.py export-snapshot --output data_sources/snapshots/2026-10
+        python cli.py export-snapshot --domain bible/kjv --domain lexicon/strongs
+    """
+    try:
+        from snapshot import default_domains, export_snapshot as export_domains
+    except ImportError:
+        click.echo("❌ pyarrow not installed. Install with: pip install -e '.[arrow]'", err=True)
+        sys.exit(1)
+
+    output = output or settings.snapshot_dir
+    domains = list(domains) or default_domains()
+
+    click.echo(f"📦 Exporting {len(domains)} domains from Prism ({settings.prism_base_url})")
+    click.echo(f"   Output: {output}")
+    click.echo(f"   Embeddings: {'excluded' if no_embeddings else 'included'}")
+
+    def progress_callback(domain, entry):
+        click.echo(
+            f"   ✓ {domain}: {entry['documents']:,} documents, "
+            f"{entry['embedded']:,} with embeddings, {entry['bytes'] / 1024 / 1024:.1f} MB"
+        )
+
+    try:
+        manifest = asyncio.run(
+            export_domains(
+                output,
+                domains,
+                include_embeddings=not no_embeddings,
+                concurrency=concurrency,
+                progress_callback=progress_callback,
+            )
+        )
+    except Exception as e:
+        click.echo(f"\n❌ Export failed: {e}", err=True)
+        sys.exit(1)
+
+    entries = manifest["domains"].values()
+    click.echo(f"\n✅ Snapshot complete!")
+    click.echo(f"   Documents: {sum(entry['documents'] for entry in entries):,}")
+    click.echo(f"   With embeddings: {sum(entry['embedded'] for entry in entries):,}")
+    click.echo(f"   Size: {sum(entry['bytes'] for entry in entries) / 1024 / 1024:.1f} MB")
+    empty = [domain for domain, entry in manifest["domains"].items() if entry["documents"] == 0]
+    if empty:
+        click.echo(f"   ⚠️  Empty domains: {', '.join(empty)}")
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "input_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Snapshot directory (default: from settings)",
+)
+@click.option(
+    "--domain",
+    "domains",
+    multiple=True,
+    help="Domain to restore; repeat for several (default: all in the snapshot)",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=100,
+    help="Documents per API batch (max 100)",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="Concurrent batch uploads (default: from settings)",
+)
+@click.option(
+    "--reembed",
+    is_flag=True,
+    help="Ignore stored embeddings and let Prism embed again",
+)
+def restore_snapshot(
+    input_dir: Optional[Path],
+    domains: tuple,
+    batch_size: int,
+    concurrency: Optional[int],
+    reembed: bool,
+):
+    """Restore Prism domains from a snapshot made by export-snapshot.
+
+    Domains exported with embeddings are uploaded with embed=False, so a
+    full rebuild takes minutes instead of hours. Restore into an empty
+    Prism: existing documents are reported as failed. Restored documents
+    get new IDs, which are written into the local indexes, map data and
+    search cache.
+
+    Example:
+        python cli.py restore-snapshot --input data_sources/snapshots/2026-10
+        python cli.py restore-snapshot --domain bible/kjv
+    """
+    try:
+        from snapshot import load_manifest, restore_snapshot as restore_domains
+    except ImportError:
+        click.echo("❌ pyarrow not installed. Install with: pip install -e '.[arrow]'", err=True)
+        sys.exit(1)
+
+    input_dir = input_dir or settings.snapshot_dir
+    try:
+        manifest = load_manifest(input_dir)
+    except (FileNotFoundError, ValueError) as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"📦 Restoring snapshot from {input_dir} (created {manifest['created_at']})")
+    click.echo(f"   Prism: {settings.prism_base_url}")
+    if manifest.get("embedding_model") != settings.embedding_model and not reembed:
+        click.echo(
+            f"   ⚠️  Snapshot embedding model '{manifest.get('embedding_model')}' differs from "
+            f"'{settings.embedding_model}'"
+        )
+
+    def progress_callback(batch_num, total_batches, result):
+        if "error" in result:
+            click.echo(f"   ❌ Batch {batch_num}: {result['error']}")
+        elif batch_num % 20 == 0:
+            click.echo(f"   ✓ {batch_num:,} batches uploaded")
+
+    try:
+        results = asyncio.run(
+            restore_domains(
+                input_dir,
+                list(domains) or None,
+                batch_size=batch_size,
+                concurrency=concurrency,
+                reembed=reembed,
+                progress_callback=progress_callback,
+            )
+        )
+    except Exception as e:
+        click.echo(f"\n❌ Restore failed: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"\n✅ Restore complete!")
+    for domain, stats in results["domains"].items():
+        click.echo(
+            f"   {domain:20} {stats['success_count']:7,} restored, {stats['error_count']:5,} failed "
+            f"({'embedded by Prism' if stats['embed'] else 'stored embeddings'}, "
+            f"{stats.get('docs_per_sec', 0):,} docs/sec)"
+        )
+    click.echo(f"   Total: {results['success_count']:,} restored, {results['error_count']:,} errors")
+
+    if results["remapped"]:
+        click.echo(f"\n🔗 Document IDs updated in local files:")
+        for path, count in results["remapped"].items():
+            click.echo(f"   {path}: {count:,}")
+    for index in results["rebuild"]:
+        click.echo(f"   ⚠️  Rebuild the {index}: it still refers to the old document IDs")
+
+    if results["errors"]:
+        click.echo(f"\n⚠️  Errors encountered:")
+        for error in results["errors"][:10]:
+            if "batch" in error:
+                click.echo(f"   - Batch {error['batch']}: {error['error']}")
+            else:
+                click.echo(f"   - {error.get('document', 'Unknown')}: {error['error']}")
+
+    if results["error_count"] > 0:
+        sys.exit(1)
+
+
+def _imported_document_ids(batch: List[Dict], result: Dict) -> Dict[str, Optional[str]]:
+    """
+    Titles of the batch documents Prism accepted, with their document IDs.
+
+    Per-document results decide when Prism sends them; otherwise the whole
+    batch counts as imported only if nothing failed (without IDs).
+    """
+    if result.get("results"):
+        return {
+            doc_result["title"]: doc_result.get("document_id") and str(doc_result["document_id"])
+            for doc_result in result["results"]
+            if doc_result.get("success", True) and doc_result.get("title")
+        }
+    if result.get("failed", 0):
+        return {}
+    return {document["title"]: None for document in batch}
+
+
+def _update_keyword_index(
+    documents: List[Dict],
+    document_ids: Optional[Dict[str, Optional[str]]] = None,
+) -> None:
+    """Add imported chunks to the local BM25 keyword index."""
+    from keyword_index import KeywordIndex
+
+    index = KeywordIndex(settings.keyword_index_dir)
+    try:
+        try:
+            index.load()
+        except FileNotFoundError:
+            pass
+        count = index.add_documents(documents, document_ids)
+        index.save()
+    except (OSError, ValueError) as e:
+        click.echo(f"   ⚠️  Keyword index not updated: {e}")
+        return
+    click.echo(f"   Keyword index: {count:,} chunks updated ({len(index):,} total)")
+
+
 def _show_genre_distribution(documents: List[Dict]) -> None:
     """Display chunk distribution by genre."""
     from collections import defaultdict
@@ -1,6 +1,8 @@
 """Configuration for Bible importer."""
 
 from pathlib import Path
+from typing import List, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -17,6 +19,68 @@ class BibleImporterSettings(BaseSettings):
         default=300,
         description="Timeout for Prism API calls in seconds",
     )
+    import_concurrency: int = Field(
+        default=4,
+        description="Concurrent batch uploads in the streaming import pipeline",
+    )
+    document_page_size: int = Field(
+        default=100,
+        description="Documents per request when listing a Prism domain (Prism serves at most 100)",
+    )
+    search_concurrency: int = Field(
+        default=8,
+        description="Concurrent requests in PrismClient.search_many",
+    )
+    search_cache_size: int = Field(
+        default=2048,
+        description="Maximum number of cached search responses",
+    )
+    search_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds a cached search response stays valid",
+    )
+    search_cache_path: Path = Field(
+        default=Path("data_sources/search_cache.json"),
+        description="File the CLI search cache is persisted to",
+    )
+
+    # Client-side query embeddings
+    embedding_cache_enabled: bool = Field(
+        default=False,
+        description="Embed queries client-side with a vector cache and search by vector",
+    )
+    embedding_model: str = Field(
+        default="default",
+        description="Embedding model name (part of the query vector cache key)",
+    )
+    embedding_cache_size: int = Field(
+        default=4096,
+        description="Maximum number of cached query vectors",
+    )
+    embedding_cache_path: Path = Field(
+        default=Path("data_sources/embedding_cache.json"),
+        description="File the query vector cache is persisted to",
+    )
+    prism_embed_path: str = Field(
+        default="/api/v1/embed",
+        description="Prism endpoint that embeds query text",
+    )
+    prism_vector_search_path: str = Field(
+        default="/api/v1/search/vector",
+        description="Prism endpoint that searches by query vector",
+    )
+    vector_index_dir: Path = Field(
+        default=Path("data_sources/vector_index"),
+        description="Directory containing the offline IVF vector index",
+    )
+    vector_index_nprobe: int = Field(
+        default=8,
+        description="Inverted lists scanned per query in the offline vector index",
+    )
+    keyword_index_dir: Path = Field(
+        default=Path("data_sources/keyword_index"),
+        description="Directory containing the BM25 keyword index (updated on import)",
+    )
 
     # Chunking configuration
     target_chunk_tokens: int = Field(
@@ -74,6 +138,74 @@ class BibleImporterSettings(BaseSettings):
         description="Base directory for Bible CSV data",
     )
 
+    # SWORD service configuration
+    sword_modules_dir: Path = Field(
+        default=Path("data_sources/sword_modules"),
+        description="Directory containing WLC/SBLGNT SWORD modules",
+    )
+    sword_service_host: str = Field(
+        default="127.0.0.1",
+        description="Bind address for the SWORD original-text service",
+    )
+    sword_service_port: int = Field(
+        default=8200,
+        description="Port for the SWORD original-text service",
+    )
+    sword_cache_size: int = Field(
+        default=20000,
+        description="Maximum number of rendered responses kept in memory",
+    )
+    sword_cache_max_age: int = Field(
+        default=86400,
+        description="Cache-Control max-age (seconds) for original-text responses",
+    )
+    sword_max_batch_size: int = Field(
+        default=500,
+        description="Maximum number of verses accepted by one batch request",
+    )
+    strongs_index_dir: Path = Field(
+        default=Path("data_sources/strongs_index"),
+        description="Directory containing the prebuilt Strong's concordance index",
+    )
+    lexicon_index_path: Path = Field(
+        default=Path("data_sources/lexicon_index.json"),
+        description="Strong's ID to Prism document index written by import-lexicon",
+    )
+    spatial_index_path: Path = Field(
+        default=Path("data_sources/geography/spatial_index.json"),
+        description="Grid index of place coordinates written by import-geography",
+    )
+    geography_bundle_path: Path = Field(
+        default=Path("../ui/static/data/places.geojson"),
+        description="GeoJSON bundle of all places for the map UI (served as /data/places.geojson), written by import-geography",
+    )
+    verse_place_index_path: Path = Field(
+        default=Path("data_sources/geography/verse_places.json"),
+        description="Verse ID to place reverse index written by import-geography, read when chunking",
+    )
+    events_dir: Path = Field(
+        default=Path("../research/events"),
+        description="Directory of researched journey event files (research/events/*.json)",
+    )
+    journeys_path: Path = Field(
+        default=Path("../ui/static/data/journeys.json"),
+        description="Journey routes with stops, leg distances and map polylines (served as /data/journeys.json), written by build-journeys",
+    )
+    place_clusters_dir: Path = Field(
+        default=Path("../ui/static/data/place-clusters"),
+        description="Per-zoom marker cluster tiles for the map UI (served as /data/place-clusters), written by import-geography",
+    )
+
+    # Corpus snapshots
+    snapshot_dir: Path = Field(
+        default=Path("data_sources/snapshots/latest"),
+        description="Snapshot directory written by export-snapshot and read by restore-snapshot",
+    )
+    snapshot_domains: Optional[List[str]] = Field(
+        default=None,
+        description="Prism domains included in a corpus snapshot (default: every domain the importers write, prism_client.SEARCH_DOMAINS)",
+    )
+
     class Config:
         env_prefix = "BIBLE_IMPORTER_"
         case_sensitive = False
@@ -0,0 +1,331 @@
+"""Columnar export of prepared Prism documents (Parquet or Arrow IPC).
+
+import-bible, import-lexicon and import-geography can write every document
+they generate to one columnar file (--export), so re-imports, analytics and
+offline index builds read the prepared corpus instead of re-parsing and
+re-chunking the sources. One row per document:
+
+    title                 string
+    content               string
+    domain                string
+    metadata.<key>        one column per metadata field
+    metadata.<a>.<b>      nested objects flattened to dotted columns
+    metadata              JSON object of the metadata fields whose names
+                          cannot be column names (they contain ".")
+
+Scalar values and lists of scalars keep their Arrow types (e.g. verse_ids is
+list<int64>). These are stored as JSON strings instead:
+
+    - values Arrow cannot type consistently
+    - lists of objects (places, cross_references)
+    - objects with more than MAX_FLATTEN_KEYS distinct keys (kjv_usage word
+      counts) or with keys containing "."
+    - fields where any value is an empty object
+
+The schema metadata lists the JSON columns so iter_corpus() decodes them
+again. A missing field and a null value both read back as an absent key.
+
+The format follows the file suffix:
+
+    .parquet                  zstd-compressed Parquet (smallest on disk)
+    .arrow / .feather / .ipc  uncompressed Arrow IPC file; read_corpus()
+                              memory-maps it, so columns are zero-copy views
+                              of the file
+
+Requires the `arrow` extra (pyarrow).
+
+Usage:
+    python cli.py import-bible -v kjv --verses-csv kjv.csv --dry-run --export kjv.arrow
+
+    table = read_corpus(Path("kjv.arrow"))
+    for document in iter_corpus(Path("kjv.arrow")):
+        ...
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from atomic_files import atomic_path
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CORPUS_VERSION = 1
+
+DOCUMENT_FIELDS = ("title", "content", "domain")
+METADATA_PREFIX = "metadata."
+# Holds the metadata fields that cannot become metadata.<key> columns
+METADATA_COLUMN = "metadata"
+
+# Nested objects with more keys than this stay one JSON column
+MAX_FLATTEN_KEYS = 32
+
+# Rows per Parquet row group / IPC record batch
+ROW_GROUP_SIZE = 10_000
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+# Schema metadata keys
+_VERSION_KEY = b"corpus.version"
+_JSON_COLUMNS_KEY = b"corpus.json_columns"
+
+
+def corpus_format(path: Path) -> str:
+    """
+    Export format for a file name: "parquet" or "arrow".
+
+    Raises:
+        ValueError: If the suffix is not a supported format
+    """
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return "parquet"
+    if suffix in ARROW_SUFFIXES:
+        return "arrow"
+    supported = ", ".join(PARQUET_SUFFIXES + ARROW_SUFFIXES)
+    raise ValueError(f"Unsupported corpus export format '{path.suffix}' (use {supported})")
+
+
+def _is_plain_type(arrow_type: pa.DataType) -> bool:
+    """True for scalar types and lists of scalars."""
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        arrow_type = arrow_type.value_type
+    return not pa.types.is_nested(arrow_type) and not pa.types.is_null(arrow_type)
+
+
+def _is_column_key(key: Any) -> bool:
+    """True if a dict key can be a dotted column name segment."""
+    return isinstance(key, str) and "." not in key
+
+
+def _json_default(value: Any) -> Any:
+    return str(value)
+
+
+def _to_json(values: List[Any]) -> pa.Array:
+    return pa.array(
+        [None if value is None else json.dumps(value, ensure_ascii=False, default=_json_default) for value in values],
+        type=pa.string(),
+    )
+
+
+def _flatten(
+    name: str,
+    values: List[Any],
+    columns: Dict[str, pa.Array],
+    json_columns: List[str],
+) -> None:
+    """Add the column(s) for one field, flattening nested objects."""
+    present = [value for value in values if value is not None]
+    if not present:
+        return
+
+    # Empty objects would leave no column behind, so they keep the field JSON
+    if all(isinstance(value, dict) and value for value in present):
+        keys: Dict[str, None] = {}
+        for value in present:
+            keys.update(dict.fromkeys(value))
+        if len(keys) <= MAX_FLATTEN_KEYS and all(_is_column_key(key) for key in keys):
+            for key in keys:
+                _flatten(
+                    f"{name}.{key}",
+                    [value.get(key) if isinstance(value, dict) else None for value in values],
+                    columns,
+                    json_columns,
+                )
+            return
+
+    try:
+        array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        array = None
+    if array is not None and _is_plain_type(array.type):
+        columns[name] = array
+    else:
+        columns[name] = _to_json(values)
+        json_columns.append(name)
+
+
+def documents_to_table(documents: List[Dict[str, Any]]) -> pa.Table:
+    """
+    Convert documents into one table (see module docstring for the columns).
+
+    The column set is decided from all documents together, so a field that
+    only appears in later documents still gets its own column.
+    """
+    columns: Dict[str, pa.Array] = {
+        field: pa.array([document.get(field) for document in documents], type=pa.string())
+        for field in DOCUMENT_FIELDS
+    }
+    json_columns: List[str] = []
+
+    metadata_keys: Dict[str, None] = {}
+    for document in documents:
+        metadata_keys.update(dict.fromkeys(document.get("metadata") or {}))
+    for key in metadata_keys:
+        if _is_column_key(key):
+            _flatten(
+                METADATA_PREFIX + key,
+                [(document.get("metadata") or {}).get(key) for document in documents],
+                columns,
+                json_columns,
+            )
+
+    other_keys = [key for key in metadata_keys if not _is_column_key(key)]
+    if other_keys:
+        rows = []
+        for document in documents:
+            metadata = document.get("metadata") or {}
+            rows.append({key: metadata[key] for key in other_keys if key in metadata} or None)
+        columns[METADATA_COLUMN] = _to_json(rows)
+        json_columns.append(METADATA_COLUMN)
+
+    table = pa.table(columns)
+    return table.replace_schema_metadata({
+        _VERSION_KEY: str(CORPUS_VERSION).encode(),
+        _JSON_COLUMNS_KEY: json.dumps(json_columns).encode(),
+    })
+
+
+class CorpusWriter:
+    """
+    Collect documents as they stream past and write them on close.
+
+    add() is thread-safe, so one writer can tap several document streams
+    converted in worker threads (see import_document_streams).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.format = corpus_format(path)
+        self.documents: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, document: Dict[str, Any]) -> None:
+        with self._lock:
+            self.documents.append(document)
+
+    def tap(self, documents: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Record each document and pass it on unchanged."""
+        for document in documents:
+            self.add(document)
+            yield document
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Write the collected documents atomically (temp file + rename).
+
+        Returns:
+            {"path", "format", "documents", "columns", "bytes"}
+        """
+        table = documents_to_table(self.documents)
+
+        with atomic_path(self.path) as tmp_path:
+            if self.format == "parquet":
+                pq.write_table(table, tmp_path, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+            else:
+                with pa.OSFile(str(tmp_path), "wb") as sink:
+                    with ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table, max_chunksize=ROW_GROUP_SIZE)
+
+        stats = {
+            "path": str(self.path),
+            "format": self.format,
+            "documents": table.num_rows,
+            "columns": table.num_columns,
+            "bytes": self.path.stat().st_size,
+        }
+        logger.info(
+            f"Exported {stats['documents']} documents ({stats['columns']} columns) "
+            f"to {self.path} ({stats['bytes']:,} bytes)"
+        )
+        return stats
+
+
+def write_corpus(documents: Iterable[Dict[str, Any]], path: Path) -> Dict[str, Any]:
+    """Write documents to a corpus file; returns the CorpusWriter.close() stats."""
+    writer = CorpusWriter(path)
+    for document in documents:
+        writer.add(document)
+    return writer.close()
+
+
+def read_corpus(path: Path, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Open an exported corpus as an Arrow table.
+
+    Arrow IPC files are memory-mapped, so the table's buffers point into the
+    file's pages and nothing is copied until a value is used. Parquet is
+    decompressed on read.
+
+    Args:
+        path: Exported corpus file
+        columns: Optional subset of columns to read
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the format or version is not supported
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Corpus export not found: {path}. Run an import with --export first.")
+
+    if corpus_format(path) == "parquet":
+        table = pq.read_table(path, columns=columns, memory_map=True)
+    else:
+        table = ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        if columns is not None:
+            table = table.select(columns)
+
+    version = (table.schema.metadata or {}).get(_VERSION_KEY)
+    if version != str(CORPUS_VERSION).encode():
+        raise ValueError(f"Unsupported corpus export version: {version.decode() if version else None}")
+    return table
+
+
+def _unflatten(row: Dict[str, Any], json_columns: set) -> Dict[str, Any]:
+    """Rebuild a document dict from one table row."""
+    document: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = {}
+    for name, value in row.items():
+        if value is None:
+            continue
+        if name in json_columns:
+            value = json.loads(value)
+        if name == METADATA_COLUMN:
+            metadata.update(value)
+            continue
+        if not name.startswith(METADATA_PREFIX):
+            document[name] = value
+            continue
+        *parents, key = name[len(METADATA_PREFIX):].split(".")
+        target = metadata
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = value
+    document["metadata"] = metadata
+    return document
+
+
+def iter_corpus(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream documents back out of an exported corpus, one record batch at a time.
+
+    Yields:
+        {"title", "content", "domain", "metadata"} document dicts
+    """
+    table = read_corpus(path)
+    json_columns = set(json.loads((table.schema.metadata or {}).get(_JSON_COLUMNS_KEY, b"[]")))
+    for batch in table.to_batches(max_chunksize=ROW_GROUP_SIZE):
+        for row in batch.to_pylist():
+            yield _unflatten(row, json_columns)
@@ -1,30 +1,16 @@
 """CSV parser for scrollmapper Bible database format."""
 
 import csv
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Generator, List, Optional, Set, Dict, Any
 
+from verse_ids import BOOKS, get_book, pack_verse_id
+
 
 # Bible book order and testament mapping (standard 66-book canon)
-BIBLE_BOOKS = [
-    # Old Testament (1-39)
-    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-    "Joshua", "Judges", "Ruth", "I Samuel", "II Samuel",
-    "I Kings", "II Kings", "I Chronicles", "II Chronicles",
-    "Ezra", "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
-    "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah", "Lamentations",
-    "Ezekiel", "Daniel", "Hosea", "Joel", "Amos",
-    "Obadiah", "Jonah", "Micah", "Nahum", "Habakkuk",
-    "Zephaniah", "Haggai", "Zechariah", "Malachi",
-    # New Testament (40-66)
-    "Matthew", "Mark", "Luke", "John", "Acts",
-    "Romans", "I Corinthians", "II Corinthians", "Galatians", "Ephesians",
-    "Philippians", "Colossians", "I Thessalonians", "II Thessalonians",
-    "I Timothy", "II Timothy", "Titus", "Philemon",
-    "Hebrews", "James", "I Peter", "II Peter",
-    "I John", "II John", "III John", "Jude", "Revelation of John",
-]
+BIBLE_BOOKS = [book.name for book in BOOKS]
 
 BOOK_TO_ID = {book: idx + 1 for idx, book in enumerate(BIBLE_BOOKS)}
 
@@ -257,6 +243,119 @@ PARALLEL_PASSAGES = {
 }
 
 
+class ParallelPassageIndex:
+    """
+    Interval index over parallel passages, keyed by (book, chapter).
+
+    Built once from a PARALLEL_PASSAGES-style table. Each (book, chapter)
+    bucket holds its passages sorted by start verse together with a running
+    maximum of end verses; both are monotonic, so the overlapping window is
+    found with two binary searches. Result dicts (event, description and the
+    other accounts' references) are precomputed per passage.
+    """
+
+    def __init__(self, passages: Dict[str, List[tuple]]):
+        """
+        Build index.
+
+        Args:
+            passages: Mapping of event name to (book, chapter, verse_start,
+                verse_end) tuples, one per account
+        """
+        buckets: Dict[tuple, List[tuple]] = {}
+        for order, (event, accounts) in enumerate(passages.items()):
+            for book, chapter, verse_start, verse_end in accounts:
+                info = {
+                    "event": event,
+                    "description": event.replace("_", " ").title(),
+                    "parallel_passages": [
+                        f"{pb} {pc}:{pvs}-{pve}"
+                        for pb, pc, pvs, pve in accounts
+                        if pb != book or pc != chapter
+                    ],
+                }
+                key = (self._book_key(book), chapter)
+                buckets.setdefault(key, []).append((verse_start, verse_end, order, info))
+
+        self._starts: Dict[tuple, List[int]] = {}
+        self._max_ends: Dict[tuple, List[int]] = {}
+        self._entries: Dict[tuple, List[tuple]] = {}
+        for key, entries in buckets.items():
+            entries.sort(key=lambda entry: entry[:3])
+            max_ends = []
+            running = 0
+            for _, verse_end, _, _ in entries:
+                running = max(running, verse_end)
+                max_ends.append(running)
+            self._starts[key] = [entry[0] for entry in entries]
+            self._max_ends[key] = max_ends
+            self._entries[key] = entries
+
+    @staticmethod
+    def _book_key(book_name: str):
+        """Canonical book ID, so "I John" and "1 John" share a bucket."""
+        book = get_book(book_name)
+        return book.id if book else book_name
+
+    def find(
+        self,
+        book_name: str,
+        chapter: int,
+        verse_start: int,
+        verse_end: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find every passage overlapping a verse range.
+
+        Returns:
+            Result dicts in table order (empty if none overlap)
+        """
+        key = (self._book_key(book_name), chapter)
+        entries = self._entries.get(key)
+        if not entries:
+            return []
+
+        # Entries before lo all end before verse_start; entries from hi on
+        # all start after verse_end
+        lo = bisect_left(self._max_ends[key], verse_start)
+        hi = bisect_right(self._starts[key], verse_end)
+
+        matches = [
+            (order, info)
+            for _, entry_end, order, info in entries[lo:hi]
+            if entry_end >= verse_start
+        ]
+        matches.sort(key=lambda match: match[0])
+        return [
+            {**info, "parallel_passages": list(info["parallel_passages"])}
+            for _, info in matches
+        ]
+
+
+PARALLEL_PASSAGE_INDEX = ParallelPassageIndex(PARALLEL_PASSAGES)
+
+
+def find_parallel_passages(
+    book_name: str,
+    chapter: int,
+    verse_start: int,
+    verse_end: int,
+) -> List[Dict[str, Any]]:
+    """
+    Find every parallel passage a chunk overlaps.
+
+    Args:
+        book_name: Book name
+        chapter: Chapter number
+        verse_start: Starting verse
+        verse_end: Ending verse
+
+    Returns:
+        List of dicts with event name and parallel references
+    """
+    return PARALLEL_PASSAGE_INDEX.find(book_name, chapter, verse_start, verse_end)
+
+
 def identify_parallel_passages(
     book_name: str,
     chapter: int,
@@ -273,27 +372,11 @@ def identify_parallel_passages(
         verse_end: Ending verse
 
     Returns:
-        Dict with event name and parallel references, or None
+        Dict with event name and parallel references for the first
+        overlapping event, or None
     """
-    for event, passages in PARALLEL_PASSAGES.items():
-        for psg_book, psg_ch, psg_v_start, psg_v_end in passages:
-            # Check if this chunk overlaps with the passage
-            if book_name == psg_book and chapter == psg_ch:
-                # Simple overlap check
-                if not (verse_end < psg_v_start or verse_start > psg_v_end):
-                    # Build parallel references
-                    parallels = []
-                    for pb, pc, pvs, pve in passages:
-                        if pb != book_name or pc != chapter:
-                            parallels.append(f"{pb} {pc}:{pvs}-{pve}")
-
-                    return {
-                        "event": event,
-                        "description": event.replace("_", " ").title(),
-                        "parallel_passages": parallels,
-                    }
-
-    return None
+    matches = find_parallel_passages(book_name, chapter, verse_start, verse_end)
+    return matches[0] if matches else None
 
 
 @dataclass
@@ -336,13 +419,14 @@ class BibleVerse:
         """Get human-readable reference (e.g., 'Genesis 1:1')."""
         return f"{self.book_name} {self.chapter}:{self.verse}"
 
+    @property
+    def verse_id(self) -> int:
+        """Get canonical packed verse ID (e.g., 1001001 for Genesis 1:1)."""
+        return pack_verse_id(self.book_id, self.chapter, self.verse)
+
     def __lt__(self, other: "BibleVerse") -> bool:
         """Enable sorting by canonical order."""
-        return (self.book_id, self.chapter, self.verse) < (
-            other.book_id,
-            other.chapter,
-            other.verse,
-        )
+        return self.verse_id < other.verse_id
 
 
 def parse_bible_csv(
@@ -0,0 +1,175 @@
+"""Client-side cache of query embeddings.
+
+Every plain search makes Prism embed the query text again, although
+verification suites and the UI send the same few hundred queries over and
+over. With a QueryEmbeddingCache attached, PrismClient embeds each distinct
+query once (through Prism's embed endpoint or a local embedder) and searches
+by vector afterwards.
+
+Vectors are keyed by (model, normalized query) and stored as float32. The
+cache is an LRU with optional JSON persistence (vectors base64-encoded).
+Each entry keeps the time it took to embed, also across restarts, so a hit
+counts exactly the embedding time it avoided.
+"""
+
+import base64
+import json
+import logging
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from atomic_files import write_json
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+EmbeddingKey = Tuple[str, str]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for cache keys (NFC, case-folded, single spaces)."""
+    text = unicodedata.normalize("NFC", query).casefold()
+    return WHITESPACE_RUN_PATTERN.sub(" ", text).strip()
+
+
+def _encode_vector(vector: array) -> str:
+    data = vector if sys.byteorder == "little" else _swapped(vector)
+    return base64.b64encode(data.tobytes()).decode("ascii")
+
+
+def _decode_vector(encoded: str) -> array:
+    vector = array("f")
+    vector.frombytes(base64.b64decode(encoded))
+    return vector if sys.byteorder == "little" else _swapped(vector)
+
+
+def _swapped(vector: array) -> array:
+    swapped = array("f", vector)
+    swapped.byteswap()
+    return swapped
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query vectors with embedding-time metrics."""
+
+    def __init__(self, max_size: int = 4096, path: Optional[Path] = None):
+        """
+        Initialize embedding cache.
+
+        Args:
+            max_size: Maximum number of cached vectors
+            path: Optional JSON file to load from and save to
+        """
+        self.max_size = max_size
+        self.path = path
+        # key -> (vector, seconds it took to compute)
+        self._entries: "OrderedDict[EmbeddingKey, Tuple[array, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.embed_seconds = 0.0  # time spent computing vectors on misses
+        self.seconds_saved = 0.0  # stored compute time of the vectors hits returned
+        self._dirty = False
+        if path is not None and path.exists():
+            self.load()
+
+    @staticmethod
+    def key(model: str, query: str) -> EmbeddingKey:
+        """Cache key for a query embedded by model."""
+        return model, normalize_query(query)
+
+    def get(self, key: EmbeddingKey) -> Optional[List[float]]:
+        """Return the cached vector, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        vector, seconds = entry
+        self.hits += 1
+        self.seconds_saved += seconds
+        return vector.tolist()
+
+    def put(self, key: EmbeddingKey, vector: Sequence[float], seconds: float = 0.0) -> None:
+        """
+        Store a vector.
+
+        Args:
+            key: Cache key (see key())
+            vector: Query embedding
+            seconds: Time it took to compute, for the savings metric
+        """
+        self._entries[key] = (array("f", vector), seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self.embed_seconds += seconds
+        self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache metrics.
+
+        seconds_saved sums the recorded embedding time of every vector a hit
+        returned, including vectors computed by earlier runs.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "embed_seconds": round(self.embed_seconds, 3),
+            "seconds_saved": round(self.seconds_saved, 3),
+        }
+
+    def load(self) -> None:
+        """Load vectors from the cache file (unreadable files are ignored)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')}")
+            for model, query, encoded, seconds in data["entries"]:
+                self._entries[(model, query)] = (_decode_vector(encoded), float(seconds))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring embedding cache {self.path}: {e}")
+            self._entries.clear()
+            return
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write vectors to the cache file if anything changed."""
+        if self.path is None or not self._dirty:
+            return
+        write_json(
+            self.path,
+            {
+                "version": CACHE_VERSION,
+                "entries": [
+                    [model, query, _encode_vector(vector), round(seconds, 6)]
+                    for (model, query), (vector, seconds) in self._entries.items()
+                ],
+            },
+        )
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def timed_embedding(embed, query: str) -> Tuple[List[float], float]:
+    """Call a synchronous embedder and return (vector, seconds)."""
+    started = time.perf_counter()
+    vector = list(embed(query))
+    return vector, time.perf_counter() - started
@@ -0,0 +1,133 @@
+"""Prebuilt GeoJSON bundle of biblical places for the map UI.
+
+The geography page used to list place documents from Prism (capped at 100)
+and then fetch each one individually. import-geography now also writes every
+place with coordinates into one versioned GeoJSON FeatureCollection that the
+UI loads in a single, cacheable request:
+
+    {"type": "FeatureCollection", "version": 1, "generated_at": "...",
+     "count": 1342, "bbox": [west, south, east, north],
+     "place_types": {"settlement": 700, ...},
+     "features": [{"type": "Feature", "id": "jerusalem",
+                   "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                   "properties": {"name", "document_id", "place_type",
+                                  "confidence_score", "confidence_level",
+                                  "verse_references", "alternate_names"}}]}
+
+Coordinates are rounded to 5 decimal places (about 1 m) and the file is
+written without whitespace.
+
+Usage:
+    python cli.py import-geography      # writes ../ui/static/data/places.geojson
+"""
+
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from atomic_files import write_json
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+BUNDLE_VERSION = 1
+COORDINATE_PRECISION = 5
+
+# Document metadata copied into feature properties
+FEATURE_PROPERTIES = (
+    "place_type",
+    "confidence_score",
+    "confidence_level",
+    "verse_references",
+    "alternate_names",
+)
+
+
+def place_feature(document: Dict[str, Any], document_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Convert a place document (place_to_document output) to a GeoJSON feature.
+
+    Args:
+        document: Prism place document
+        document_id: Prism document ID, if known
+
+    Returns:
+        GeoJSON Point feature, or None if the place has no coordinates
+    """
+    metadata = document.get("metadata", {})
+    lat, lon = metadata.get("latitude"), metadata.get("longitude")
+    if lat is None or lon is None:
+        return None
+
+    properties = {"name": metadata.get("place_name", metadata.get("slug")), "document_id": document_id}
+    properties.update({field: metadata[field] for field in FEATURE_PROPERTIES if field in metadata})
+    return {
+        "type": "Feature",
+        "id": metadata.get("slug"),
+        "geometry": {
+            "type": "Point",
+            "coordinates": [round(lon, COORDINATE_PRECISION), round(lat, COORDINATE_PRECISION)],
+        },
+        "properties": properties,
+    }
+
+
+def build_places_bundle(
+    documents: Iterable[Dict[str, Any]],
+    document_ids: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the places FeatureCollection.
+
+    Args:
+        documents: Place documents from GeographyImporter.place_to_document
+        document_ids: Optional slug -> Prism document ID mapping
+
+    Returns:
+        Versioned GeoJSON FeatureCollection (places without coordinates are skipped)
+    """
+    document_ids = document_ids or {}
+    features = []
+    for document in documents:
+        slug = document.get("metadata", {}).get("slug")
+        feature = place_feature(document, document_ids.get(slug))
+        if feature is not None:
+            features.append(feature)
+    return places_bundle(features)
+
+
+def places_bundle(features: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap place features in the versioned FeatureCollection with summary fields."""
+    place_types: Dict[str, int] = {}
+    for feature in features:
+        place_type = feature["properties"].get("place_type", "unknown")
+        place_types[place_type] = place_types.get(place_type, 0) + 1
+
+    bbox = None
+    if features:
+        lons = [feature["geometry"]["coordinates"][0] for feature in features]
+        lats = [feature["geometry"]["coordinates"][1] for feature in features]
+        bbox = [min(lons), min(lats), max(lons), max(lats)]
+
+    return {
+        "type": "FeatureCollection",
+        "version": BUNDLE_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "count": len(features),
+        "bbox": bbox,
+        "place_types": dict(sorted(place_types.items())),
+        "features": features,
+    }
+
+
+def write_places_bundle(bundle: Dict[str, Any], path: Path) -> int:
+    """
+    Write a bundle atomically (temp file + rename).
+
+    Returns:
+        Size of the written file in bytes
+    """
+    size = write_json(path, bundle)
+    logger.info(f"Wrote geography bundle with {bundle['count']} places to {path} ({size:,} bytes)")
+    return size
@@ -5,79 +5,297 @@ into Prism as searchable documents for spatial RAG context.
 
 Data source: Open Bible Info Bible Geocoding Data (CC-BY-SA 4.0)
 https://github.com/openbibleinfo/Bible-Geocoding-Data
+
+Next to ancient.jsonl the importer keeps two small files:
+
+    ancient.meta.json  - ETag, Last-Modified, size and sha256 of the download,
+                         used for conditional re-downloads and to verify the
+                         cached copy before it is trusted
+    place_hashes.json  - slug -> content hash of every place at the last
+                         successful import, diffed on refresh so only added
+                         or changed places are re-imported
+
+Prism keeps one document per title and domain and rejects (or skips) a
+re-upload, so a refresh cannot replace a changed place's document. Such
+places are reported as "stale" with their existing document ID; they keep
+their previous hash in place_hashes.json, so the next refresh tries again
+once the old document has been deleted in Prism.
+
+Usage:
+    python cli.py import-geography            # full import
+    python cli.py import-geography --refresh  # conditional download, changed places only
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
 import logging
 
 import httpx
 
+from atomic_files import sha256_file, write_json
 from config import settings
-from prism_client import import_documents_in_batches
+from geography_bundle import place_feature, places_bundle, write_places_bundle
+from place_clusters import build_place_clusters
+from prism_client import SearchCache, import_document_streams
+from reference_parser import extract_verse_ranges
+from spatial_index import SpatialIndex
+from verse_ids import parse_reference
+from verse_place_index import VersePlaceIndex
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Optional faster JSON decoder (falls back to the standard library)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    _json_loads = json.loads
+
+# Optional vectorized place scoring for the import report (vector extra)
+try:
+    import place_scoring
+except ImportError:  # pragma: no cover - depends on installed extras
+    place_scoring = None
+
 # Data source URL
 GEOGRAPHY_DATA_URL = (
     "https://raw.githubusercontent.com/openbibleinfo/Bible-Geocoding-Data/"
     "main/data/ancient.jsonl"
 )
 
+# Download chunk size (bytes written to disk per read)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+SNAPSHOT_VERSION = 1
+
+
+def place_key(entry: Dict[str, Any]) -> str:
+    """Stable key of a place entry (the slug used in document metadata)."""
+    return entry.get("url_slug", entry.get("friendly_id", "unknown"))
+
+
+def place_hash(entry: Dict[str, Any]) -> str:
+    """Content hash of a place entry, independent of key order."""
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def diff_place_hashes(previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Compare two slug -> hash snapshots.
+
+    Returns:
+        {"added": [...], "changed": [...], "removed": [...], "unchanged": count}
+    """
+    return {
+        "added": sorted(slug for slug in current if slug not in previous),
+        "changed": sorted(
+            slug for slug, digest in current.items() if slug in previous and previous[slug] != digest
+        ),
+        "removed": sorted(slug for slug in previous if slug not in current),
+        "unchanged": sum(1 for slug, digest in current.items() if previous.get(slug) == digest),
+    }
+
+
+def _is_duplicate_error(error: Optional[str]) -> bool:
+    """True for Prism's rejection of a document it already has."""
+    return bool(error) and "duplicate" in error.lower()
+
 
 class GeographyImporter:
     """Importer for biblical geography data with coordinates and verse references."""
 
-    def __init__(self, data_dir: Path = Path("data_sources/geography")):
+    def __init__(
+        self,
+        data_dir: Path = Path("data_sources/geography"),
+        index_path: Optional[Path] = None,
+        bundle_path: Optional[Path] = None,
+        clusters_dir: Optional[Path] = None,
+        source_url: str = GEOGRAPHY_DATA_URL,
+        verse_index_path: Optional[Path] = None,
+    ):
         """
         Initialize geography importer.
 
         Args:
             data_dir: Path to geography data directory
+            index_path: Spatial index written on import
+            bundle_path: GeoJSON places bundle for the map UI written on import
+            clusters_dir: Marker cluster tiles for the map UI written on import
+            source_url: URL of ancient.jsonl
+            verse_index_path: Verse → place reverse index written on import
         """
         self.data_dir = data_dir
         self.jsonl_file = data_dir / "ancient.jsonl"
-
-    async def download_data(self, force: bool = False) -> Path:
+        self.meta_file = data_dir / "ancient.meta.json"
+        self.snapshot_file = data_dir / "place_hashes.json"
+        self.source_url = source_url
+        # Outcome of the last download_data() call: cached, not_modified or downloaded
+        self.last_download: Dict[str, Any] = {}
+        self.index_path = index_path or settings.spatial_index_path
+        self.bundle_path = bundle_path or settings.geography_bundle_path
+        self.clusters_dir = clusters_dir or settings.place_clusters_dir
+        self.verse_index_path = verse_index_path or settings.verse_place_index_path
+
+    async def download_data(self, force: bool = False, refresh: bool = False) -> Path:
         """
-        Download ancient.jsonl from GitHub if not already cached.
+        Download ancient.jsonl if not already cached.
+
+        The response is streamed to a temporary file in chunks and renamed
+        into place once complete, so memory use does not grow with the file
+        and an interrupted download never replaces the cached copy. The
+        ETag, Last-Modified, size and sha256 of each download are stored in
+        ancient.meta.json. A cached copy whose checksum no longer matches is
+        downloaded again.
 
         Args:
-            force: If True, download even if file exists
+            force: If True, download unconditionally even if file exists
+            refresh: If True, revalidate the cached copy with a conditional
+                request (If-None-Match / If-Modified-Since); the file is only
+                replaced when the server returns new content
 
         Returns:
             Path to downloaded file
 
         Raises:
             httpx.HTTPError: If download fails
+            ValueError: If the download is shorter than its Content-Length
         """
+        metadata = {} if force else self.read_download_metadata()
+
         if self.jsonl_file.exists() and not force:
-            logger.info(f"Using cached geography data at {self.jsonl_file}")
-            return self.jsonl_file
+            sha256 = sha256_file(self.jsonl_file)
+            if metadata.get("sha256") and metadata["sha256"] != sha256:
+                logger.warning(
+                    f"Cached geography data {self.jsonl_file} failed checksum verification, downloading again"
+                )
+                metadata = {}
+            elif not refresh:
+                logger.info(f"Using cached geography data at {self.jsonl_file}")
+                self.last_download = {"status": "cached", "sha256": sha256}
+                return self.jsonl_file
+        else:
+            metadata = {}
 
         # Ensure directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Downloading geography data from {GEOGRAPHY_DATA_URL}")
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(GEOGRAPHY_DATA_URL)
-            response.raise_for_status()
+        logger.info(f"Downloading geography data from {self.source_url}")
 
-            # Save to file
-            self.jsonl_file.write_text(response.text, encoding="utf-8")
-            logger.info(f"Downloaded {len(response.text)} bytes to {self.jsonl_file}")
+        tmp_file = self.jsonl_file.with_suffix(self.jsonl_file.suffix + ".tmp")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                async with client.stream("GET", self.source_url, headers=headers) as response:
+                    if response.status_code == 304:
+                        logger.info(f"Geography data not modified since {metadata.get('downloaded_at')}")
+                        self.last_download = {"status": "not_modified", "sha256": metadata.get("sha256")}
+                        return self.jsonl_file
+                    response.raise_for_status()
+                    with open(tmp_file, "wb") as f:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            digest.update(chunk)
+                            size += len(chunk)
+
+                    # Content-Length counts encoded bytes, so only compare identity responses
+                    expected = response.headers.get("content-length")
+                    if expected and "content-encoding" not in response.headers and int(expected) != size:
+                        raise ValueError(
+                            f"Incomplete geography download: got {size} of {expected} bytes"
+                        )
+                    response_headers = response.headers
+            tmp_file.replace(self.jsonl_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
 
+        metadata = {
+            "url": self.source_url,
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+            "size": size,
+            "sha256": digest.hexdigest(),
+            "downloaded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        write_json(self.meta_file, metadata)
+        self.last_download = {"status": "downloaded", "bytes": size, "sha256": metadata["sha256"]}
+
+        logger.info(f"Downloaded {size} bytes to {self.jsonl_file}")
         return self.jsonl_file
 
+    def read_download_metadata(self) -> Dict[str, Any]:
+        """ETag, Last-Modified and checksum of the cached download ({} if unknown)."""
+        if not self.meta_file.exists():
+            return {}
+        try:
+            with open(self.meta_file, encoding="utf-8") as f:
+                return json.load(f)
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable download metadata {self.meta_file}: {e}")
+            return {}
+
+    def place_hashes(self, jsonl_file: Optional[Path] = None) -> Dict[str, str]:
+        """Stream the data file into a slug -> content hash mapping."""
+        return {place_key(entry): place_hash(entry) for entry in self.iter_jsonl(jsonl_file)}
+
+    def load_snapshot(self) -> Dict[str, str]:
+        """Place hashes recorded by the last successful import ({} if none)."""
+        return self._read_snapshot().get("places", {})
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """The place snapshot with its data file checksum ({} if none)."""
+        if not self.snapshot_file.exists():
+            return {}
+        try:
+            with open(self.snapshot_file, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable place snapshot {self.snapshot_file}: {e}")
+            return {}
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning(f"Ignoring place snapshot version {snapshot.get('version')}")
+            return {}
+        return snapshot
+
+    def save_snapshot(self, hashes: Dict[str, str], complete: bool = True) -> None:
+        """
+        Record the place hashes of a successful import.
+
+        The data file's checksum is only recorded when the hashes are
+        complete; a snapshot that keeps older hashes for some places must
+        not let the next refresh skip the file as unchanged.
+        """
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        write_json(
+            self.snapshot_file,
+            {
+                "version": SNAPSHOT_VERSION,
+                "sha256": sha256_file(self.jsonl_file) if complete else None,
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "places": hashes,
+            },
+        )
+
     def parse_jsonl(self, jsonl_file: Optional[Path] = None) -> List[Dict[str, Any]]:
         """
         Parse JSON Lines file to extract place entries.
 
         Each line is a separate JSON object representing one biblical place.
+        Prefer iter_jsonl() for large files.
 
         Args:
             jsonl_file: Path to JSONL file (defaults to self.jsonl_file)
@@ -87,7 +305,23 @@ class GeographyImporter:
 
         Raises:
             FileNotFoundError: If JSONL file doesn't exist
-            ValueError: If file cannot be parsed
+        """
+        return list(self.iter_jsonl(jsonl_file))
+
+    def iter_jsonl(self, jsonl_file: Optional[Path] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream place entries from a JSON Lines file, one line at a time.
+
+        Invalid lines are skipped with a warning.
+
+        Args:
+            jsonl_file: Path to JSONL file (defaults to self.jsonl_file)
+
+        Yields:
+            Place entry dictionaries
+
+        Raises:
+            FileNotFoundError: If JSONL file doesn't exist
         """
         file_path = jsonl_file or self.jsonl_file
 
@@ -97,30 +331,80 @@ class GeographyImporter:
                 "Run with --download or check data directory."
             )
 
-        places = []
+        parsed = 0
         skipped = 0
 
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open(file_path, "rb") as f:
             for line_num, line in enumerate(f, start=1):
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    entry = json.loads(line)
-                    places.append(entry)
-                except json.JSONDecodeError as e:
+                    entry = _json_loads(line)
+                except ValueError as e:
                     logger.warning(
                         f"Skipping invalid JSON on line {line_num}: {e}"
                     )
                     skipped += 1
                     continue
+                parsed += 1
+                yield entry
 
         if skipped > 0:
             logger.warning(f"Skipped {skipped} invalid lines")
 
-        logger.info(f"Parsed {len(places)} place entries from {file_path}")
-        return places
+        logger.info(f"Parsed {parsed} place entries from {file_path}")
+
+    def iter_documents(
+        self, entries: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Convert place entries to Prism documents lazily.
+
+        Entries that fail to convert are skipped with a warning.
+
+        Args:
+            entries: Place entries (defaults to streaming self.jsonl_file)
+
+        Yields:
+            Prism documents
+        """
+        for entry in self.iter_jsonl() if entries is None else entries:
+            try:
+                yield self.place_to_document(entry)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to convert place {entry.get('name', 'Unknown')}: {e}"
+                )
+
+    def place_report(
+        self,
+        jsonl_file: Optional[Path] = None,
+        table: Optional["place_scoring.PlaceTableBuilder"] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Confidence and coordinate histograms for every place in the data file.
+
+        Scores, levels and coordinates are computed in one batch with
+        place_scoring (the per-entry methods below are the reference).
+
+        Args:
+            jsonl_file: Path to JSONL file (defaults to self.jsonl_file)
+            table: Place table collected while the entries were converted;
+                the file is only read when this is None
+
+        Returns:
+            place_scoring.summarize_places() output, or None without numpy
+        """
+        if place_scoring is None:
+            logger.debug("numpy not installed, skipping place report")
+            return None
+        if table is not None:
+            columns = table.table()
+        else:
+            columns = place_scoring.place_table(self.iter_jsonl(jsonl_file))
+        return place_scoring.summarize_places(place_scoring.score_places(columns))
 
     def calculate_confidence_score(self, entry: Dict[str, Any]) -> int:
         """
@@ -235,6 +519,36 @@ class GeographyImporter:
 
         return refs
 
+    def extract_verse_ids(self, entry: Dict[str, Any]) -> List[int]:
+        """
+        Extract canonical verse IDs from the verses array.
+
+        Uses the "osis" field (e.g., "2Kgs.5.12"), falling back to parsing
+        "readable" citations (e.g., "2 Kgs 5:12") with reference_parser.
+        Ranges contribute every verse they cover (see VerseRange.verse_ids).
+        Unlike extract_verse_references(), the list is not truncated.
+
+        Args:
+            entry: Place entry dictionary
+
+        Returns:
+            Sorted, deduplicated list of packed verse IDs
+        """
+        verse_ids = set()
+        for verse in entry.get("verses", []):
+            osis = verse.get("osis")
+            readable = verse.get("readable")
+            if isinstance(osis, str) and osis:
+                try:
+                    verse_ids.update(parse_reference(osis).verse_ids())
+                    continue
+                except ValueError:
+                    logger.debug(f"Unparseable OSIS reference: {osis}")
+            if isinstance(readable, str):
+                for verse_range in extract_verse_ranges(readable):
+                    verse_ids.update(verse_range.verse_ids())
+        return sorted(verse_ids)
+
     def get_best_identification(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Extract the best identification resolution from OpenBible data.
@@ -280,7 +594,7 @@ class GeographyImporter:
             Prism document dict with title, content, domain, metadata
         """
         # Extract core fields (OpenBible format)
-        slug = entry.get("url_slug", entry.get("friendly_id", "unknown"))
+        slug = place_key(entry)
         place_name = entry.get("friendly_id", slug)
 
         # Get place type from types array (first type)
@@ -317,6 +631,7 @@ class GeographyImporter:
 
         # Extract verse references
         verse_refs = self.extract_verse_references(entry)
+        verse_ids = self.extract_verse_ids(entry)
         verse_count = len(verse_refs)
 
         # Extract alternate names from translation_name_counts
@@ -380,6 +695,8 @@ class GeographyImporter:
             metadata["longitude"] = longitude
         if verse_refs:
             metadata["verse_references"] = verse_refs  # Full list in metadata
+        if verse_ids:
+            metadata["verse_ids"] = verse_ids
         if alternate_names:
             metadata["alternate_names"] = alternate_names
 
@@ -397,91 +714,276 @@ class GeographyImporter:
         dry_run: bool = False,
         download: bool = True,
         progress_callback: Optional[callable] = None,
+        refresh: bool = False,
+        export_path: Optional[Path] = None,
     ) -> Dict[str, Any]:
         """
         Import biblical geography data to Prism.
 
+        The data file is read once: each place is hashed as it is converted
+        and compared with the snapshot of the last successful import (see
+        diff_place_hashes). The spatial index, map bundle and clusters are
+        always rebuilt from every place; with refresh only added and changed
+        places are uploaded to Prism, and Prism is not contacted at all when
+        the data file matches the snapshot. Removed places drop out of the
+        local artifacts but their Prism documents are left in place.
+
+        Changed places whose upload Prism rejects as a duplicate, or accepts
+        without returning a document ID, are listed under "stale" instead of
+        counting as errors (see module docstring). Other places Prism rejects
+        as duplicates are already imported (e.g. a first refresh without
+        place_hashes.json) and are counted under "present".
+
         Args:
             batch_size: Documents per batch (max 100)
             embed: Whether to generate embeddings
             dry_run: If True, parse only without importing
             download: If True, download data if not cached
             progress_callback: Optional callback(batch_num, total_batches, result)
+            refresh: If True, revalidate the download and re-import only
+                places that changed since the last import
+            export_path: Optional Parquet/Arrow file to write every place
+                document to, including unchanged ones on refresh (see
+                corpus_export; needs the `arrow` extra)
 
         Returns:
-            Import results summary
+            Import results summary (export stats under "export"; changed
+            places Prism did not update under "stale" as {"slug", "title",
+            "document_id", "error"}, error None when Prism skipped the upload;
+            the number of places Prism already had under "present")
 
         Raises:
             FileNotFoundError: If data file missing and download=False
         """
         # Download data if requested
         if download:
-            asyncio.run(self.download_data())
-
-        # Parse data
-        entries = self.parse_jsonl()
-
-        if not entries:
+            asyncio.run(self.download_data(refresh=refresh))
+
+        previous = self._read_snapshot()
+        previous_hashes = previous.get("places", {})
+        up_to_date = refresh and previous.get("sha256") == sha256_file(self.jsonl_file)
+
+        # Stream entries → documents; stop early if there are none. Place
+        # hashes and the report's place table are collected in the same pass.
+        hashes: Dict[str, str] = {}
+
+        def hash_places(entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for entry in entries:
+                hashes[place_key(entry)] = place_hash(entry)
+                yield entry
+
+        entries = hash_places(self.iter_jsonl())
+        table = None
+        if place_scoring is not None:
+            table = place_scoring.PlaceTableBuilder()
+            entries = table.tap(entries)
+        documents = self.iter_documents(entries)
+        first = next(documents, None)
+        if first is None:
             return {
                 "error": "No place entries found in data file",
                 "total_documents": 0,
             }
+        documents = itertools.chain([first], documents)
 
-        # Convert to documents
-        documents = []
-        for entry in entries:
-            try:
-                doc = self.place_to_document(entry)
-                documents.append(doc)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to convert place {entry.get('name', 'Unknown')}: {e}"
-                )
-                continue
+        writer = None
+        if export_path is not None:
+            from corpus_export import CorpusWriter
 
-        logger.info(f"Converted {len(documents)} place entries to documents")
+            writer = CorpusWriter(export_path)
+            documents = writer.tap(documents)
 
-        # Count places by type
-        type_counts = {}
-        for doc in documents:
-            place_type = doc["metadata"].get("place_type", "unknown")
-            type_counts[place_type] = type_counts.get(place_type, 0) + 1
+        # Count places by type as documents stream past
+        type_counts: Dict[str, int] = {}
+
+        def count_types(docs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for doc in docs:
+                place_type = doc["metadata"].get("place_type", "unknown")
+                type_counts[place_type] = type_counts.get(place_type, 0) + 1
+                yield doc
 
         if dry_run:
-            return {
-                "total_documents": len(documents),
+            samples = list(itertools.islice(count_types(documents), 3))
+            total = len(samples) + sum(1 for _ in count_types(documents))
+            logger.info(f"Converted {total} place entries to documents")
+            results = {
+                "total_documents": total,
                 "type_counts": type_counts,
-                "sample_documents": documents[:3],  # Show first 3 as samples
+                "sample_documents": samples,  # Show first 3 as samples
+                "changes": self._log_changes(previous_hashes, hashes),
+                "report": self.place_report(table=table),
             }
+            if writer is not None:
+                results["export"] = writer.close()
+            return results
+
+        # The spatial and verse indexes and the map bundle are filled from
+        # every place while documents upload; on refresh unchanged places are
+        # not uploaded
+        def is_changed(slug: str) -> bool:
+            return previous_hashes.get(slug, hashes[slug]) != hashes[slug]
+
+        index = self._open_index()
+        verse_index = VersePlaceIndex(self.verse_index_path)
+        features = []
+        # Title -> slug of uploaded places
+        uploaded_titles: Dict[str, str] = {}
+        stale: List[Dict[str, Any]] = []
+        present: List[str] = []
+
+        def track(docs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for doc in docs:
+                index.add_document(doc)
+                verse_index.add_document(doc)
+                feature = place_feature(doc)
+                if feature is not None:
+                    features.append(feature)
+                slug = doc["metadata"]["slug"]
+                if not refresh or (not up_to_date and previous_hashes.get(slug) != hashes[slug]):
+                    uploaded_titles[doc["title"]] = slug
+                    yield doc
+
+        def record_batch(batch_num, total_batches, result):
+            index.record_batch_result(result)
+            for doc_result in result.get("results", []):
+                slug = uploaded_titles.get(doc_result.get("title"))
+                if slug is None:
+                    continue
+                if not doc_result.get("success", True) and _is_duplicate_error(doc_result.get("error")):
+                    if is_changed(slug):
+                        stale.append({"slug": slug, "title": doc_result["title"], "error": doc_result["error"]})
+                    else:
+                        present.append(doc_result["title"])
+                elif is_changed(slug) and doc_result.get("success", True) and not doc_result.get("document_id"):
+                    stale.append({"slug": slug, "title": doc_result["title"], "error": None})
+            if progress_callback:
+                progress_callback(batch_num, total_batches, result)
 
         # Import to Prism
-        results = asyncio.run(
-            import_documents_in_batches(
-                documents,
-                batch_size=batch_size,
-                embed=embed,
-                progress_callback=progress_callback,
+        if up_to_date:
+            logger.info("Data file unchanged since last import, nothing to upload")
+            for _ in track(count_types(documents)):
+                pass
+            results = {"total_documents": 0, "success_count": 0, "error_count": 0, "errors": [], "up_to_date": True}
+        else:
+            results = asyncio.run(
+                import_document_streams(
+                    {"places": track(count_types(documents))},
+                    batch_size=batch_size,
+                    embed=embed,
+                    progress_callback=record_batch,
+                )
+            )
+            results.pop("streams", None)
+            logger.info(f"Converted {results['total_documents']} place entries to documents")
+        changes = self._log_changes(previous_hashes, hashes)
+
+        # Prism still serves the old version of stale places; that is not
+        # an import error, but it must not be recorded as done either.
+        # Duplicates of other places are already imported.
+        rejected = {entry["title"] for entry in stale if entry["error"]} | set(present)
+        results["errors"] = [error for error in results["errors"] if error.get("document") not in rejected]
+        results["error_count"] -= len(rejected)
+        results["present"] = len(present)
+
+        index.build().save()
+        results["spatial_index"] = {
+            "path": str(self.index_path),
+            "places": len(index),
+            "with_document_id": sum(1 for place in index.places if place.get("document_id")),
+        }
+
+        verse_index.build().save()
+        results["verse_index"] = {
+            "path": str(self.verse_index_path),
+            "verses": len(verse_index),
+            "places": len(verse_index.places),
+        }
+
+        document_ids = {place["slug"]: place["document_id"] for place in index.places}
+        for entry in stale:
+            entry["document_id"] = document_ids.get(entry["slug"])
+        results["stale"] = stale
+        for feature in features:
+            feature["properties"]["document_id"] = document_ids.get(feature["id"])
+        bundle = places_bundle(features)
+        results["bundle"] = {
+            "path": str(self.bundle_path),
+            "places": bundle["count"],
+            "bytes": write_places_bundle(bundle, self.bundle_path),
+        }
+        results["clusters"] = {
+            "path": str(self.clusters_dir),
+            **build_place_clusters(bundle, self.clusters_dir),
+        }
+        if writer is not None:
+            results["export"] = writer.close()
+
+        # Only a clean import becomes the baseline for the next refresh;
+        # stale places keep their old hash so the next refresh retries them
+        if results["error_count"]:
+            logger.warning("Import had errors; keeping the previous place snapshot")
+        elif not up_to_date:
+            self.save_snapshot(
+                {**hashes, **{entry["slug"]: previous_hashes[entry["slug"]] for entry in stale}},
+                complete=not stale,
+            )
+        if stale:
+            logger.warning(
+                f"{len(stale)} changed places were not updated: Prism keeps the existing "
+                "document for a title and domain"
+            )
+        if changes["removed"]:
+            logger.warning(
+                f"{len(changes['removed'])} places were removed upstream; their Prism documents were kept"
             )
-        )
 
         # Add geography-specific stats
         results["type_counts"] = type_counts
+        results["changes"] = changes
+        results["report"] = self.place_report(table=table)
 
         return results
 
+    def _log_changes(self, previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, Any]:
+        """Diff place hashes (see diff_place_hashes) and log the counts."""
+        changes = diff_place_hashes(previous, current)
+        summary = {key: len(value) if isinstance(value, list) else value for key, value in changes.items()}
+        logger.info(f"Place changes since last import: {summary}")
+        return changes
+
+    def _open_index(self) -> SpatialIndex:
+        """Load the existing spatial index, keeping IDs from earlier imports."""
+        index = SpatialIndex(self.index_path)
+        if self.index_path.exists():
+            try:
+                index.load()
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Rebuilding spatial index: {e}")
+                index = SpatialIndex(self.index_path)
+        return index
+
 
-async def verify_geography_import(sample_queries: Optional[List[str]] = None) -> Dict[str, Any]:
+async def verify_geography_import(
+    sample_queries: Optional[List[str]] = None,
+    search_cache: Optional[SearchCache] = None,
+) -> Dict[str, Any]:
     """
     Verify geography entries were imported correctly by searching for known places.
 
     Args:
         sample_queries: Optional list of place names to search for
                        If None, uses common examples
+        search_cache: Search result cache (default: the persisted CLI cache,
+                      so repeated verification runs skip Prism)
 
     Returns:
         Verification results with search results for each query
     """
-    from prism_client import PrismClient
+    from prism_client import PrismClient, default_search_cache
+
+    if search_cache is None:
+        search_cache = default_search_cache()
 
     if sample_queries is None:
         # Common biblical places
@@ -494,7 +996,7 @@ async def verify_geography_import(sample_queries: Optional[List[str]] = None) ->
 
     results = {}
 
-    async with PrismClient() as client:
+    async with PrismClient(search_cache=search_cache) as client:
         # Check overall stats
         stats = await client.get_stats()
         results["prism_stats"] = stats
@@ -504,11 +1006,12 @@ async def verify_geography_import(sample_queries: Optional[List[str]] = None) ->
         results["geography_document_count"] = geography_count
 
         # Search for specific places
-        results["places"] = {}
-        for query in sample_queries:
-            search_results = await client.search_documents(
-                query=query, domain="geography/biblical", top_k=3
-            )
-            results["places"][query] = search_results.get("results", [])
+        search_results = await client.search_many(
+            sample_queries, domain="geography/biblical", top_k=3
+        )
+        results["places"] = {
+            query: search_result.get("results", [])
+            for query, search_result in zip(sample_queries, search_results)
+        }
 
     return results
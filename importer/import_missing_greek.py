@@ -11,14 +11,10 @@ async def get_existing_greek_ids():
 
     existing_ids = set()
     async with PrismClient() as client:
-        # Get all Greek documents
-        response = await client.client.get(
-            "/api/v1/documents",
-            params={"domain": "lexicon/strongs", "limit": 10000}
-        )
-        data = response.json()
-
-        for doc in data.get("documents", []):
+        # Page through the lexicon domain, fetching only the Strong's IDs
+        async for doc in client.iter_documents(
+            "lexicon/strongs", fields=["metadata.strong_id"]
+        ):
             strong_id = doc.get("metadata", {}).get("strong_id")
             if strong_id and strong_id.startswith("G"):
                 existing_ids.add(strong_id)
@@ -0,0 +1,297 @@
+"""Biblical journey routes computed from the researched event files.
+
+research/events/*.json hold hand-researched journeys (Exodus, Paul's first
+missionary journey, Jesus' final journey): numbered stops with [lat, lon]
+coordinates, verse references and a route_to_next polyline per leg. This
+module resolves each stop against the spatial index (see spatial_index),
+measures every leg along its polyline with vectorized great-circle
+distances, and writes all journeys into one artifact for the map:
+
+    {"version": 1, "generated_at": "...", "count": 3,
+     "journeys": [{"id", "name", "category", "subcategory",
+                   "biblical_references", "metadata",
+                   "bbox": [west, south, east, north],
+                   "stats": {"stops", "segments", "total_km", "direct_km",
+                             "researched_km", "km_by_route_type",
+                             "km_per_day", "resolved_stops"},
+                   "stops": [{"sequence", "name", "latitude", "longitude",
+                              "verse_references", "event_description",
+                              "cumulative_km", "place": {"slug", "name",
+                              "document_id", "distance_km", "match"}}],
+                   "segments": [{"from", "to", "type", "historical_route",
+                                 "distance_km", "direct_km",
+                                 "researched_km", "path": [[lat, lon]]}]}]}
+
+Stop coordinates stay as researched; "place" links the stop to the nearest
+matching geography place (null if none is close). Path points are rounded
+to 5 decimal places (about 1 m).
+
+Requires the `vector` extra (numpy).
+
+Usage:
+    python cli.py build-journeys        # writes ../ui/static/data/journeys.json
+"""
+
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from atomic_files import write_json
+from spatial_index import EARTH_RADIUS_KM, SpatialIndex
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+JOURNEYS_VERSION = 1
+COORDINATE_PRECISION = 5
+
+# A place with the stop's name is accepted this far from the stop...
+NAME_MATCH_KM = 50.0
+# ...any other place only this close
+NEAREST_MATCH_KM = 10.0
+
+# Disambiguators such as "Antioch (Syria)"
+_QUALIFIER_PATTERN = re.compile(r"\s*\([^)]*\)\s*$")
+
+
+def haversine_km(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """Element-wise great-circle distances in kilometres (degrees in)."""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lon2) - np.asarray(lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def load_events(events_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Load journey event files, sorted by file name.
+
+    Files that are not JSON objects with waypoints are skipped with a warning.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    if not events_dir.is_dir():
+        raise FileNotFoundError(f"Events directory not found: {events_dir}")
+
+    events = []
+    for path in sorted(events_dir.glob("*.json")):
+        try:
+            with open(path, encoding="utf-8") as f:
+                event = json.load(f)
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable event file {path}: {e}")
+            continue
+        if not isinstance(event, dict) or not event.get("waypoints"):
+            logger.warning(f"Skipping {path}: no waypoints")
+            continue
+        events.append(event)
+    logger.info(f"Loaded {len(events)} journeys from {events_dir}")
+    return events
+
+
+def resolve_stop(
+    index: SpatialIndex,
+    name: str,
+    lat: float,
+    lon: float,
+    place_id: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Link a journey stop to a geography place.
+
+    Tries the stop's place_id, then the nearest place within NAME_MATCH_KM
+    whose name matches the stop name (ignoring a trailing qualifier such as
+    "(Syria)"), then any place within NEAREST_MATCH_KM.
+
+    Returns:
+        {"slug", "name", "document_id", "distance_km", "match"} or None
+    """
+    if place_id:
+        place = index.find(place_id)
+        if place is not None:
+            distance = float(haversine_km(lat, lon, place["latitude"], place["longitude"]))
+            return _stop_place(place, distance, "place_id")
+
+    base = _QUALIFIER_PATTERN.sub("", name).casefold()
+    candidates = index.within_radius(lat, lon, NAME_MATCH_KM)
+    for place in candidates:
+        place_name = place["name"].casefold()
+        if place_name in (name.casefold(), base) or place_name.startswith(base + " "):
+            return _stop_place(place, place["distance_km"], "name")
+    if candidates and candidates[0]["distance_km"] <= NEAREST_MATCH_KM:
+        return _stop_place(candidates[0], candidates[0]["distance_km"], "nearest")
+    return None
+
+
+def _stop_place(place: Dict[str, Any], distance_km: float, match: str) -> Dict[str, Any]:
+    return {
+        "slug": place["slug"],
+        "name": place["name"],
+        "document_id": place.get("document_id"),
+        "distance_km": round(distance_km, 3),
+        "match": match,
+    }
+
+
+def _leg_path(waypoint: Dict[str, Any], start: List[float], end: List[float]) -> List[List[float]]:
+    """Researched polyline of a leg, pinned to both stops (at least two points)."""
+    route = waypoint.get("route_to_next") or {}
+    path = [list(point) for point in route.get("waypoints") or []]
+    if not path or path[0] != start:
+        path.insert(0, start)
+    if len(path) == 1 or path[-1] != end:
+        path.append(end)
+    return path
+
+
+def compute_journey(event: Dict[str, Any], index: Optional[SpatialIndex] = None) -> Dict[str, Any]:
+    """
+    Resolve stops and measure every leg of one journey.
+
+    All leg polylines are concatenated into one coordinate array so point
+    distances come from a single vectorized haversine call and per-leg
+    sums from one np.bincount over the leg each point pair belongs to.
+
+    Args:
+        event: Parsed research/events file
+        index: Spatial index to link stops to places (None to skip)
+
+    Returns:
+        Journey entry of the artifact (see module docstring)
+    """
+    waypoints = sorted(event["waypoints"], key=lambda waypoint: waypoint.get("sequence", 0))
+    coordinates = [[float(value) for value in waypoint["coordinates"]] for waypoint in waypoints]
+    stops_array = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+
+    legs = [_leg_path(waypoints[i], coordinates[i], coordinates[i + 1]) for i in range(len(waypoints) - 1)]
+    if legs:
+        points = np.asarray([point for leg in legs for point in leg], dtype=np.float64)
+        point_leg = np.repeat(np.arange(len(legs)), [len(leg) for leg in legs])
+        steps = haversine_km(points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1])
+        within = point_leg[:-1] == point_leg[1:]  # drop pairs that jump from one leg to the next
+        leg_km = np.bincount(point_leg[:-1][within], weights=steps[within], minlength=len(legs))
+        direct_km = haversine_km(
+            stops_array[:-1, 0], stops_array[:-1, 1], stops_array[1:, 0], stops_array[1:, 1]
+        )
+    else:
+        points = stops_array
+        leg_km = direct_km = np.zeros(0)
+    cumulative_km = np.concatenate([[0.0], np.cumsum(leg_km)])
+
+    segments = []
+    km_by_route_type: Dict[str, float] = {}
+    researched_km = 0.0
+    for i, leg in enumerate(legs):
+        route = waypoints[i].get("route_to_next") or {}
+        route_type = route.get("type", "unknown")
+        km_by_route_type[route_type] = km_by_route_type.get(route_type, 0.0) + float(leg_km[i])
+        researched_km += route.get("distance_km") or 0
+        segments.append({
+            "from": waypoints[i].get("sequence", i + 1),
+            "to": waypoints[i + 1].get("sequence", i + 2),
+            "type": route_type,
+            "historical_route": route.get("historical_route"),
+            "distance_km": round(float(leg_km[i]), 1),
+            "direct_km": round(float(direct_km[i]), 1),
+            "researched_km": route.get("distance_km"),
+            "path": np.round(np.asarray(leg), COORDINATE_PRECISION).tolist(),
+        })
+
+    stops = []
+    for i, waypoint in enumerate(waypoints):
+        lat, lon = coordinates[i]
+        place = (
+            resolve_stop(index, waypoint.get("name", ""), lat, lon, waypoint.get("place_id"))
+            if index is not None
+            else None
+        )
+        stops.append({
+            "sequence": waypoint.get("sequence", i + 1),
+            "name": waypoint.get("name"),
+            "latitude": lat,
+            "longitude": lon,
+            "verse_references": waypoint.get("verse_references", []),
+            "event_description": waypoint.get("event_description"),
+            "cumulative_km": round(float(cumulative_km[i]), 1),
+            "place": place,
+        })
+
+    metadata = event.get("metadata", {})
+    total_km = float(cumulative_km[-1])
+    days = metadata.get("estimated_duration_days")
+    mins, maxs = points.min(axis=0), points.max(axis=0)
+    return {
+        "id": event.get("id"),
+        "name": event.get("name"),
+        "category": event.get("category"),
+        "subcategory": event.get("subcategory"),
+        "biblical_references": event.get("biblical_references", []),
+        "metadata": metadata,
+        "bbox": [float(mins[1]), float(mins[0]), float(maxs[1]), float(maxs[0])],
+        "stats": {
+            "stops": len(stops),
+            "segments": len(segments),
+            "total_km": round(total_km, 1),
+            "direct_km": round(float(direct_km.sum()), 1),
+            "researched_km": researched_km,
+            "km_by_route_type": {
+                route_type: round(km, 1) for route_type, km in sorted(km_by_route_type.items())
+            },
+            "km_per_day": round(total_km / days, 1) if days else None,
+            "resolved_stops": sum(1 for stop in stops if stop["place"] is not None),
+        },
+        "stops": stops,
+        "segments": segments,
+    }
+
+
+def build_journeys(events: List[Dict[str, Any]], index: Optional[SpatialIndex] = None) -> Dict[str, Any]:
+    """Compute every journey and wrap them in the versioned artifact."""
+    journeys = [compute_journey(event, index) for event in events]
+    return {
+        "version": JOURNEYS_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "count": len(journeys),
+        "journeys": journeys,
+    }
+
+
+def write_journeys(artifact: Dict[str, Any], path: Path) -> int:
+    """
+    Write the journeys artifact atomically (temp file + rename).
+
+    Returns:
+        Size of the written file in bytes
+    """
+    size = write_json(path, artifact)
+    logger.info(f"Wrote {artifact['count']} journeys to {path} ({size:,} bytes)")
+    return size
+
+
+def load_journeys(path: Path) -> Dict[str, Any]:
+    """
+    Read the journeys artifact.
+
+    Raises:
+        FileNotFoundError: If journeys have not been built
+        ValueError: If the version is not supported
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Journeys not found: {path}. Run build-journeys first.")
+    with open(path, encoding="utf-8") as f:
+        artifact = json.load(f)
+    if artifact.get("version") != JOURNEYS_VERSION:
+        raise ValueError(f"Unsupported journeys version: {artifact.get('version')}")
+    return artifact
@@ -0,0 +1,382 @@
+"""Local BM25 keyword index over Bible chunks, with rank fusion.
+
+Exact-phrase queries ("The Lord is my shepherd") are matched better by
+terms than by embedding similarity alone. This index scores chunk content
+(as produced by verse_chunker) with Okapi BM25 and can be fused with vector
+results through reciprocal rank fusion (RRF).
+
+Posting lists are stored compressed: for every term, (document gap, term
+frequency) pairs encoded as LEB128 varints. Document numbers only grow, so
+importing a translation appends to the existing lists. Re-imported chunks
+(same domain and title) replace the old ones: those are tombstoned and the
+lists are compacted once at the end of the update. Stored files:
+
+    postings.bin  - concatenated varint posting lists
+    index.json    - term table (offset, length, df, last document),
+                    document table and collection statistics
+
+Usage:
+    python cli.py import --version kjv      # updates the index
+    python cli.py keyword-search "The Lord is my shepherd" --domain bible/kjv
+"""
+
+import heapq
+import json
+import logging
+import math
+import re
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+POSTINGS_FILE = "postings.bin"
+KEYS_FILE = "index.json"
+
+# BM25 parameters (Robertson/Zaragoza defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Reciprocal rank fusion constant (Cormack et al.)
+RRF_K = 60
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Overlap context (indexed with its own chunk) and leading verse numbers
+# added by verse_chunker
+OVERLAP_CONTEXT_PATTERN = re.compile(
+    r"--- Context from previous verses ---.*?--- Current passage ---", re.DOTALL
+)
+VERSE_NUMBER_PATTERN = re.compile(r"^\d+ ", re.MULTILINE)
+
+DECODED_CACHE_SIZE = 256
+
+# Document metadata kept for results
+RESULT_METADATA = ("verse_id_start", "verse_id_end")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens ("LORD's" → "lord", "s")."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_postings(data: bytes) -> List[Tuple[int, int]]:
+    """Decode a posting list into [(document number, term frequency), ...]."""
+    postings = []
+    doc = 0
+    value = shift = 0
+    pending_doc = None
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        if pending_doc is None:
+            doc += value
+            pending_doc = doc
+        else:
+            postings.append((pending_doc, value))
+            pending_doc = None
+        value = shift = 0
+    return postings
+
+
+def document_key(document: Dict[str, Any]) -> str:
+    """Identity of a chunk across re-imports ("bible/kjv|Psalms 23:1-6 (KJV)")."""
+    return f"{document.get('domain', '')}|{document.get('title', document.get('document_title', ''))}"
+
+
+class KeywordIndex:
+    """Incrementally updated BM25 index with varint-compressed postings."""
+
+    def __init__(self, index_dir: Path):
+        """
+        Initialize index.
+
+        Args:
+            index_dir: Directory holding postings.bin and index.json
+        """
+        self.index_dir = index_dir
+        # Document number -> {"key", "title", "domain", "length", "metadata"}
+        self.documents: List[Optional[Dict[str, Any]]] = []
+        self._by_key: Dict[str, int] = {}
+        self._postings: Dict[str, bytearray] = {}
+        self._df: Dict[str, int] = {}
+        self._last_doc: Dict[str, int] = {}
+        self._total_length = 0
+        self._live = 0
+        self._decoded: "OrderedDict[str, List[Tuple[int, int]]]" = OrderedDict()
+
+    def load(self) -> "KeywordIndex":
+        """
+        Load the index from disk.
+
+        Raises:
+            FileNotFoundError: If the index has not been built
+            ValueError: If the index version is not supported
+        """
+        keys_path = self.index_dir / KEYS_FILE
+        if not keys_path.exists():
+            raise FileNotFoundError(
+                f"Keyword index not found: {keys_path}. Import a translation first."
+            )
+        with open(keys_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported keyword index version: {data.get('version')}")
+
+        blob = (self.index_dir / POSTINGS_FILE).read_bytes()
+        self.documents = data["documents"]
+        self._by_key = {doc["key"]: number for number, doc in enumerate(self.documents) if doc}
+        self._postings = {}
+        self._df = {}
+        self._last_doc = {}
+        for term, (offset, length, df, last_doc) in data["terms"].items():
+            self._postings[term] = bytearray(blob[offset:offset + length])
+            self._df[term] = df
+            self._last_doc[term] = last_doc
+        self._total_length = data["total_length"]
+        self._live = len(self._by_key)
+        self._decoded.clear()
+
+        logger.info(f"Loaded keyword index with {self._live} chunks and {len(self._df)} terms")
+        return self
+
+    def save(self) -> None:
+        """Write postings.bin and index.json."""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        terms = {}
+        blob = bytearray()
+        for term in sorted(self._postings):
+            data = self._postings[term]
+            terms[term] = [len(blob), len(data), self._df[term], self._last_doc[term]]
+            blob += data
+        (self.index_dir / POSTINGS_FILE).write_bytes(bytes(blob))
+        with open(self.index_dir / KEYS_FILE, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "total_length": self._total_length,
+                    "documents": self.documents,
+                    "terms": terms,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        logger.info(f"Wrote keyword index with {self._live} chunks to {self.index_dir}")
+
+    def __len__(self) -> int:
+        return self._live
+
+    def add_documents(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        document_ids: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Index chunks, replacing earlier versions with the same domain/title.
+
+        Args:
+            documents: Prism documents ({"title", "content", "domain", "metadata"})
+            document_ids: Optional Prism document ID per title, stored with the chunk
+
+        Returns:
+            Number of chunks indexed
+        """
+        added = 0
+        replaced = 0
+        for document in documents:
+            key = document_key(document)
+            if key in self._by_key:
+                self._remove(self._by_key[key])
+                replaced += 1
+
+            content = OVERLAP_CONTEXT_PATTERN.sub(" ", document.get("content", ""))
+            content = VERSE_NUMBER_PATTERN.sub("", content)
+            frequencies = Counter(tokenize(content))
+            length = sum(frequencies.values())
+            number = len(self.documents)
+            metadata = document.get("metadata", {})
+            title = document.get("title", document.get("document_title", ""))
+            entry = {
+                "key": key,
+                "title": title,
+                "domain": document.get("domain", ""),
+                "length": length,
+                "metadata": {field: metadata[field] for field in RESULT_METADATA if field in metadata},
+            }
+            if document_ids and document_ids.get(title):
+                entry["document_id"] = document_ids[title]
+            self.documents.append(entry)
+            self._by_key[key] = number
+            self._total_length += length
+            self._live += 1
+
+            for term, tf in frequencies.items():
+                postings = self._postings.setdefault(term, bytearray())
+                encode_varint(number - self._last_doc.get(term, 0), postings)
+                encode_varint(tf, postings)
+                self._last_doc[term] = number
+                self._df[term] = self._df.get(term, 0) + 1
+                self._decoded.pop(term, None)
+            added += 1
+
+        if replaced:
+            self.compact()
+        return added
+
+    def _remove(self, number: int) -> None:
+        """Tombstone a document (document frequencies are fixed by compact())."""
+        document = self.documents[number]
+        self.documents[number] = None
+        del self._by_key[document["key"]]
+        self._total_length -= document["length"]
+        self._live -= 1
+
+    def compact(self) -> None:
+        """Rewrite posting lists without tombstoned documents, renumbering."""
+        renumber = {}
+        documents = []
+        for number, document in enumerate(self.documents):
+            if document is not None:
+                renumber[number] = len(documents)
+                documents.append(document)
+
+        postings_by_term = {}
+        for term in list(self._postings):
+            live = [(renumber[doc], tf) for doc, tf in self._term_postings(term) if doc in renumber]
+            if live:
+                postings_by_term[term] = live
+
+        self.documents = documents
+        self._by_key = {doc["key"]: number for number, doc in enumerate(documents)}
+        self._postings, self._df, self._last_doc = {}, {}, {}
+        self._decoded.clear()
+        for term, postings in postings_by_term.items():
+            data = bytearray()
+            previous = 0
+            for doc, tf in postings:
+                encode_varint(doc - previous, data)
+                encode_varint(tf, data)
+                previous = doc
+            self._postings[term] = data
+            self._df[term] = len(postings)
+            self._last_doc[term] = previous
+
+    def _term_postings(self, term: str) -> List[Tuple[int, int]]:
+        """Decoded postings for a term (small LRU, since common terms repeat)."""
+        postings = self._decoded.get(term)
+        if postings is not None:
+            self._decoded.move_to_end(term)
+            return postings
+        postings = decode_postings(self._postings.get(term, b""))
+        self._decoded[term] = postings
+        if len(self._decoded) > DECODED_CACHE_SIZE:
+            self._decoded.popitem(last=False)
+        return postings
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        domain: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Rank chunks by BM25.
+
+        Args:
+            query: Keyword query
+            top_k: Number of results to return
+            domain: Optional domain filter (e.g., "bible/kjv")
+
+        Returns:
+            {"results": [{"document_title", "domain", "score", "metadata"}, ...],
+             "total": n} in the search_documents shape; results also carry
+            "document_id" when the import recorded one
+        """
+        if not self._live:
+            return {"results": [], "total": 0}
+
+        average_length = self._total_length / self._live
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            df = self._df.get(term, 0)
+            if not df:
+                continue
+            idf = math.log(1 + (self._live - df + 0.5) / (df + 0.5))
+            for number, tf in self._term_postings(term):
+                document = self.documents[number]
+                if document is None or (domain is not None and document["domain"] != domain):
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * document["length"] / average_length)
+                scores[number] = scores.get(number, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        results = [
+            {
+                "document_title": self.documents[number]["title"],
+                "domain": self.documents[number]["domain"],
+                "score": round(score, 4),
+                "metadata": self.documents[number]["metadata"],
+                **({"document_id": self.documents[number]["document_id"]}
+                   if "document_id" in self.documents[number] else {}),
+            }
+            for number, score in best
+        ]
+        return {"results": results, "total": len(results)}
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    """
+    Identity of a search result for fusion.
+
+    Chunk titles carry the translation ("John 3:16-18 (KJV)"), so they are
+    unique across domains, and Prism results do not always echo the domain.
+    """
+    return result.get("document_title", result.get("title", ""))
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[Sequence[Dict[str, Any]]],
+    top_k: int = 10,
+    k: int = RRF_K,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked result lists: score = sum(weight / (k + rank)).
+
+    The first list a result appears in supplies its fields; every result
+    gets "rrf_score" and "ranks" (1-based rank per list, None if absent).
+
+    Args:
+        result_lists: Ranked lists (e.g., vector results, BM25 results)
+        top_k: Number of fused results
+        k: RRF constant; larger values flatten rank differences
+        weights: Optional weight per list (default 1.0 each)
+
+    Returns:
+        Fused results, best first
+    """
+    weights = weights or [1.0] * len(result_lists)
+    fused: Dict[str, Dict[str, Any]] = {}
+    for list_index, (results, weight) in enumerate(zip(result_lists, weights)):
+        for rank, result in enumerate(results, 1):
+            key = result_key(result)
+            entry = fused.get(key)
+            if entry is None:
+                entry = fused[key] = {**result, "rrf_score": 0.0, "ranks": [None] * len(result_lists)}
+            if entry["ranks"][list_index] is None:
+                entry["ranks"][list_index] = rank
+                entry["rrf_score"] += weight / (k + rank)
+
+    return sorted(fused.values(), key=lambda entry: entry["rrf_score"], reverse=True)[:top_k]
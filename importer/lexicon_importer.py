@@ -10,43 +10,69 @@ https://github.com/openscriptures/strongs
 import asyncio
 import json
 import re
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import logging
 
 from config import settings
-from prism_client import import_documents_in_batches
+from lexicon_index import LexiconIndex
+from prism_client import SearchCache, import_document_streams
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Start of the object literal: var strongsHebrewDictionary = {
+DICTIONARY_START_PATTERN = re.compile(r"var\s+strongs\w+Dictionary\s*=\s*\{")
+WHITESPACE_PATTERN = re.compile(r"\s*")
+
+# KJV usage: word (count) or word(-hyphenated) (count)
+KJV_USAGE_PATTERN = re.compile(r"([\w\-\s]+)\s*\((\d+)\)")
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the offset of the next non-whitespace character."""
+    return WHITESPACE_PATTERN.match(text, pos).end()
+
 
 class LexiconImporter:
     """Importer for Strong's Hebrew and Greek lexicon data."""
 
-    def __init__(self, data_dir: Path = Path("data_sources/strongs")):
+    def __init__(
+        self,
+        data_dir: Path = Path("data_sources/strongs"),
+        index_path: Optional[Path] = None,
+    ):
         """
         Initialize lexicon importer.
 
         Args:
             data_dir: Path to Strong's dictionary data directory
+            index_path: Strong's ID lookup index written on import
+                (default: from settings)
         """
         self.data_dir = data_dir
+        self.index_path = index_path or settings.lexicon_index_path
         self.hebrew_file = data_dir / "hebrew" / "strongs-hebrew-dictionary.js"
         self.greek_file = data_dir / "greek" / "strongs-greek-dictionary.js"
 
-    def parse_js_dictionary(self, js_file: Path) -> Dict[str, Dict[str, Any]]:
+    def iter_js_dictionary(
+        self, js_file: Path, chunk_size: int = 1 << 16
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        Parse JavaScript dictionary file to extract JSON data.
+        Stream (strong_id, entry) pairs from a JavaScript dictionary file.
 
-        The files contain: var strongsGreekDictionary = {...}
-        or: var strongsHebrewDictionary = {...}
+        The files contain: var strongsGreekDictionary = {...};
+        The file is read in chunks; the object literal is located by offset and
+        each entry is decoded on its own with the C JSON scanner, so only the
+        current chunk and one entry are held in memory.
 
         Args:
             js_file: Path to JavaScript file
+            chunk_size: Characters to read per chunk
 
-        Returns:
-            Dictionary of Strong's entries keyed by number
+        Yields:
+            (strong_id, entry) tuples in file order
 
         Raises:
             FileNotFoundError: If JS file doesn't exist
@@ -55,23 +81,94 @@ class LexiconImporter:
         if not js_file.exists():
             raise FileNotFoundError(f"Dictionary file not found: {js_file}")
 
-        # Read file content
-        content = js_file.read_text(encoding="utf-8")
+        decoder = json.JSONDecoder()
+
+        with open(js_file, encoding="utf-8") as f:
+            buffer = ""
+            eof = False
+
+            def fill() -> bool:
+                """Append the next chunk; False at end of file."""
+                nonlocal buffer, eof
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                return not eof
+
+            # Locate the object literal: var strongsXXXDictionary = {
+            while True:
+                match = DICTIONARY_START_PATTERN.search(buffer)
+                if match:
+                    pos = match.end()
+                    break
+                # Keep a tail in case the assignment straddles two chunks
+                buffer = buffer[-256:]
+                if not fill():
+                    raise ValueError(f"Could not extract dictionary from {js_file}")
+
+            def decode(pos: int) -> Tuple[Any, int]:
+                """Decode one JSON value at pos, reading more input as needed."""
+                nonlocal buffer
+                while True:
+                    pos = _skip_whitespace(buffer, pos)
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        if eof or not fill():
+                            raise ValueError(f"Failed to parse JSON from {js_file}: {e}")
+                        continue
+                    # A value touching the end of the buffer may be truncated
+                    if end < len(buffer) or eof or not fill():
+                        return value, end
+
+            def next_token(pos: int) -> Tuple[str, int]:
+                """Return the next non-whitespace character and its offset."""
+                nonlocal buffer
+                while True:
+                    pos = _skip_whitespace(buffer, pos)
+                    if pos < len(buffer):
+                        return buffer[pos], pos
+                    if not fill():
+                        raise ValueError(f"Unexpected end of dictionary in {js_file}")
+
+            while True:
+                # Drop consumed input once it dominates the buffer
+                if pos > chunk_size:
+                    buffer = buffer[pos:]
+                    pos = 0
+
+                token, pos = next_token(pos)
+                if token == "}":
+                    return
+                if token == ",":
+                    pos += 1
+                    continue
+
+                strong_id, pos = decode(pos)
+                token, pos = next_token(pos)
+                if token != ":" or not isinstance(strong_id, str):
+                    raise ValueError(f"Failed to parse JSON from {js_file}: bad key at {strong_id!r}")
+                entry, pos = decode(pos + 1)
+                yield strong_id, entry
 
-        # Extract JSON from JavaScript variable assignment
-        # Pattern: var strongsXXXDictionary = {...};
-        match = re.search(r"var\s+strongs\w+Dictionary\s*=\s*(\{.+\});", content, re.DOTALL)
-        if not match:
-            raise ValueError(f"Could not extract dictionary from {js_file}")
+    def parse_js_dictionary(self, js_file: Path) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse JavaScript dictionary file to extract JSON data.
+
+        The files contain: var strongsGreekDictionary = {...}
+        or: var strongsHebrewDictionary = {...}
 
-        json_str = match.group(1)
+        Args:
+            js_file: Path to JavaScript file
 
-        # Parse JSON
-        try:
-            dictionary = json.loads(json_str)
-            return dictionary
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON from {js_file}: {e}")
+        Returns:
+            Dictionary of Strong's entries keyed by number
+
+        Raises:
+            FileNotFoundError: If JS file doesn't exist
+            ValueError: If file cannot be parsed
+        """
+        return dict(self.iter_js_dictionary(js_file))
 
     def hebrew_entry_to_document(self, strong_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -242,16 +339,22 @@ class LexiconImporter:
             return None
 
         usage = {}
-        # Pattern: word (count) or word(-hyphenated) (count)
-        pattern = r"([\w\-\s]+)\s*\((\d+)\)"
-        matches = re.findall(pattern, kjv_def)
-
-        for word, count in matches:
+        for word, count in KJV_USAGE_PATTERN.findall(kjv_def):
             word = word.strip()
             usage[word] = int(count)
 
         return usage if usage else None
 
+    def iter_hebrew_documents(self) -> Iterator[Dict[str, Any]]:
+        """Stream Hebrew lexicon entries as Prism documents."""
+        for strong_id, entry in self.iter_js_dictionary(self.hebrew_file):
+            yield self.hebrew_entry_to_document(strong_id, entry)
+
+    def iter_greek_documents(self) -> Iterator[Dict[str, Any]]:
+        """Stream Greek lexicon entries as Prism documents."""
+        for strong_id, entry in self.iter_js_dictionary(self.greek_file):
+            yield self.greek_entry_to_document(strong_id, entry)
+
     def import_hebrew_lexicon(self, dry_run: bool = False) -> List[Dict[str, Any]]:
         """
         Import Hebrew lexicon entries.
@@ -263,13 +366,7 @@ class LexiconImporter:
             List of Prism document dicts
         """
         logger.info(f"Parsing Hebrew lexicon from {self.hebrew_file}")
-        hebrew_dict = self.parse_js_dictionary(self.hebrew_file)
-
-        documents = []
-        for strong_id, entry in hebrew_dict.items():
-            doc = self.hebrew_entry_to_document(strong_id, entry)
-            documents.append(doc)
-
+        documents = list(self.iter_hebrew_documents())
         logger.info(f"Parsed {len(documents)} Hebrew lexicon entries")
         return documents
 
@@ -284,13 +381,7 @@ class LexiconImporter:
             List of Prism document dicts
         """
         logger.info(f"Parsing Greek lexicon from {self.greek_file}")
-        greek_dict = self.parse_js_dictionary(self.greek_file)
-
-        documents = []
-        for strong_id, entry in greek_dict.items():
-            doc = self.greek_entry_to_document(strong_id, entry)
-            documents.append(doc)
-
+        documents = list(self.iter_greek_documents())
         logger.info(f"Parsed {len(documents)} Greek lexicon entries")
         return documents
 
@@ -300,67 +391,157 @@ class LexiconImporter:
         embed: bool = True,
         dry_run: bool = False,
         progress_callback: Optional[callable] = None,
+        export_path: Optional[Path] = None,
     ) -> Dict[str, Any]:
         """
         Import both Hebrew and Greek lexicons to Prism.
 
+        For a real import the Hebrew and Greek streams feed one upload
+        pipeline (see import_document_streams), so uploads start as soon as
+        the first batch is converted. A dry run converts the languages one
+        after the other; conversion is CPU-bound, so each language's
+        throughput is measured on its own.
+
         Args:
             batch_size: Documents per batch (max 100)
             embed: Whether to generate embeddings
             dry_run: If True, parse only without importing
             progress_callback: Optional callback(batch_num, total_batches, result)
+            export_path: Optional Parquet/Arrow file to write every document
+                to (see corpus_export; needs the `arrow` extra)
 
         Returns:
-            Import results summary
+            Import results summary, including per-language throughput under
+            "languages" ({"hebrew": {"documents", "seconds", "docs_per_sec"}, ...})
+            and the export stats under "export" when export_path is set
         """
-        # Parse both lexicons
-        hebrew_docs = self.import_hebrew_lexicon(dry_run=True)
-        greek_docs = self.import_greek_lexicon(dry_run=True)
+        if export_path is not None:
+            from corpus_export import CorpusWriter
 
-        all_documents = hebrew_docs + greek_docs
-
-        logger.info(
-            f"Total lexicon entries: {len(all_documents)} "
-            f"({len(hebrew_docs)} Hebrew + {len(greek_docs)} Greek)"
-        )
+            writer = CorpusWriter(export_path)
 
         if dry_run:
-            return {
+            hebrew_docs, hebrew_stats = self._timed(self.import_hebrew_lexicon)
+            greek_docs, greek_stats = self._timed(self.import_greek_lexicon)
+
+            all_documents = hebrew_docs + greek_docs
+            logger.info(
+                f"Total lexicon entries: {len(all_documents)} "
+                f"({len(hebrew_docs)} Hebrew + {len(greek_docs)} Greek)"
+            )
+            results = {
                 "total_documents": len(all_documents),
                 "hebrew_count": len(hebrew_docs),
                 "greek_count": len(greek_docs),
+                "languages": {"hebrew": hebrew_stats, "greek": greek_stats},
                 "sample_documents": all_documents[:3],  # Show first 3 as samples
             }
+            if export_path is not None:
+                for document in all_documents:
+                    writer.add(document)
+                results["export"] = writer.close()
+            return results
+
+        # Fail fast on missing files before starting the pipeline
+        for js_file in (self.hebrew_file, self.greek_file):
+            if not js_file.exists():
+                raise FileNotFoundError(f"Dictionary file not found: {js_file}")
+
+        index = self._open_index()
+
+        def record_batch(batch_num, total_batches, result):
+            index.record_batch_result(result)
+            if progress_callback:
+                progress_callback(batch_num, total_batches, result)
+
+        streams = {
+            "hebrew": index.track(self.iter_hebrew_documents()),
+            "greek": index.track(self.iter_greek_documents()),
+        }
+        if export_path is not None:
+            streams = {name: writer.tap(documents) for name, documents in streams.items()}
 
-        # Import to Prism
         results = asyncio.run(
-            import_documents_in_batches(
-                all_documents,
+            import_document_streams(
+                streams,
                 batch_size=batch_size,
                 embed=embed,
-                progress_callback=progress_callback,
+                progress_callback=record_batch,
             )
         )
 
+        index.save()
+        if export_path is not None:
+            results["export"] = writer.close()
+        results["lexicon_index"] = {
+            "path": str(self.index_path),
+            "entries": len(index),
+            "with_document_id": sum(
+                1 for entry in index.entries.values() if entry.get("document_id")
+            ),
+        }
+
         # Add lexicon-specific stats
-        results["hebrew_count"] = len(hebrew_docs)
-        results["greek_count"] = len(greek_docs)
+        streams = results.pop("streams")
+        results["hebrew_count"] = streams["hebrew"]["documents"]
+        results["greek_count"] = streams["greek"]["documents"]
+        results["languages"] = streams
 
+        logger.info(
+            f"Imported lexicon: {results['hebrew_count']} Hebrew "
+            f"({streams['hebrew'].get('docs_per_sec', 0)} docs/sec), "
+            f"{results['greek_count']} Greek "
+            f"({streams['greek'].get('docs_per_sec', 0)} docs/sec)"
+        )
         return results
 
+    def _open_index(self) -> LexiconIndex:
+        """Load the existing lookup index, keeping IDs from earlier imports."""
+        index = LexiconIndex(self.index_path)
+        if self.index_path.exists():
+            try:
+                index.load()
+            except ValueError as e:
+                logger.warning(f"Rebuilding lexicon index: {e}")
+                index = LexiconIndex(self.index_path)
+        return index
+
+    @staticmethod
+    def _timed(convert) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Run a conversion and return (documents, throughput stats)."""
+        started = time.perf_counter()
+        documents = convert()
+        seconds = time.perf_counter() - started
+        return documents, {
+            "documents": len(documents),
+            "seconds": round(seconds, 2),
+            "docs_per_sec": round(len(documents) / seconds, 1) if seconds else 0.0,
+        }
+
 
-async def verify_lexicon_import(strong_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+async def verify_lexicon_import(
+    strong_ids: Optional[List[str]] = None,
+    search_cache: Optional[SearchCache] = None,
+) -> Dict[str, Any]:
     """
-    Verify lexicon entries were imported correctly by searching for specific entries.
+    Verify lexicon entries were imported correctly by looking up specific entries.
+
+    IDs are resolved through the local lexicon index; semantic search is the
+    fallback when the index is missing or does not contain an ID.
 
     Args:
         strong_ids: Optional list of Strong's IDs to verify (e.g., ["H1", "G26"])
                    If None, uses common examples
+        search_cache: Search result cache (default: the persisted CLI cache,
+                      so repeated verification runs skip Prism)
 
     Returns:
-        Verification results with search results for each ID
+        Verification results with matching entries for each ID
     """
-    from prism_client import PrismClient
+    from prism_client import PrismClient, default_search_cache
+
+    if search_cache is None:
+        search_cache = default_search_cache()
 
     if strong_ids is None:
         # Common examples: H1 (father), H157 (love), G26 (agape), G2316 (God)
@@ -368,7 +549,7 @@ async def verify_lexicon_import(strong_ids: Optional[List[str]] = None) -> Dict[
 
     results = {}
 
-    async with PrismClient() as client:
+    async with PrismClient(search_cache=search_cache) as client:
         # Check overall stats
         stats = await client.get_stats()
         results["prism_stats"] = stats
@@ -377,12 +558,32 @@ async def verify_lexicon_import(strong_ids: Optional[List[str]] = None) -> Dict[
         lexicon_count = await client.count_domain_documents("lexicon/strongs")
         results["lexicon_document_count"] = lexicon_count
 
-        # Search for specific entries
+        # Exact lookups through the local index; semantic search only for
+        # IDs the index cannot answer
         results["entries"] = {}
+        results["lexicon_index"] = True
         for strong_id in strong_ids:
-            search_results = await client.search_documents(
-                query=strong_id, domain="lexicon/strongs", top_k=1
-            )
-            results["entries"][strong_id] = search_results.get("results", [])
+            entry = None
+            if results["lexicon_index"]:
+                try:
+                    entry = client.lookup_strongs(strong_id)
+                except (FileNotFoundError, ValueError) as e:
+                    logger.warning(f"Lexicon index unavailable, using search: {e}")
+                    results["lexicon_index"] = False
+
+            if entry:
+                results["entries"][strong_id] = [{
+                    "document_title": entry["title"],
+                    "document_id": entry.get("document_id"),
+                    "content": entry.get("definition", ""),
+                    "match": "index",
+                }]
+            else:
+                results["entries"][strong_id] = None
+
+        unresolved = [strong_id for strong_id, entry in results["entries"].items() if entry is None]
+        search_results = await client.search_many(unresolved, domain="lexicon/strongs", top_k=1)
+        for strong_id, search_result in zip(unresolved, search_results):
+            results["entries"][strong_id] = search_result.get("results", [])
 
     return results
@@ -0,0 +1,156 @@
+"""Local Strong's ID → Prism document index for the lexicon.
+
+Looking up "H157" through semantic search embeds the query and ranks every
+lexicon chunk, although the caller already knows the exact key. This index is
+written while the lexicon is imported and maps each Strong's number to its
+Prism document ID and core fields:
+
+    {"version": 1, "domain": "lexicon/strongs",
+     "entries": {"H157": {"document_id": "...", "title": "...", "language":
+                 "hebrew", "lemma": "...", "transliteration": "...",
+                 "definition": "..."}}}
+
+Lookups are a dict access on the loaded file and never touch the embedder.
+
+Usage:
+    python cli.py import-lexicon        # writes the index
+    python cli.py lexicon-lookup H157
+"""
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from atomic_files import write_json
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+LEXICON_DOMAIN = "lexicon/strongs"
+
+STRONGS_ID_PATTERN = re.compile(r'^([HG])0*(\d+)$', re.IGNORECASE)
+
+# Document metadata copied into each index entry
+CORE_FIELDS = ("language", "lemma", "transliteration", "definition")
+
+
+def normalize_strongs(strongs: str) -> str:
+    """
+    Normalize a Strong's number ("h07225" → "H7225").
+
+    Raises:
+        ValueError: If the value is not a Hebrew/Greek Strong's number
+    """
+    match = STRONGS_ID_PATTERN.match(strongs.strip())
+    if not match:
+        raise ValueError(f"Invalid Strong's number: {strongs}")
+    return f"{match.group(1).upper()}{match.group(2)}"
+
+
+class LexiconIndex:
+    """Exact-key lookup table for imported lexicon documents."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize index.
+
+        Args:
+            path: JSON file holding the index
+        """
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._titles: Dict[str, str] = {}  # document title -> Strong's ID
+        self._lock = threading.Lock()
+
+    def load(self) -> "LexiconIndex":
+        """
+        Load the index from disk.
+
+        Raises:
+            FileNotFoundError: If the lexicon has not been imported
+            ValueError: If the index version is not supported
+        """
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"Lexicon index not found: {self.path}. Run import-lexicon first."
+            )
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported lexicon index version: {data.get('version')}")
+
+        self.entries = data["entries"]
+        self._titles = {entry["title"]: strong_id for strong_id, entry in self.entries.items()}
+        logger.info(f"Loaded lexicon index with {len(self.entries)} entries")
+        return self
+
+    def save(self) -> None:
+        """Write the index atomically (temp file + rename)."""
+        write_json(
+            self.path,
+            {"version": INDEX_VERSION, "domain": LEXICON_DOMAIN, "entries": self.entries},
+            separators=None,
+        )
+        logger.info(f"Wrote lexicon index with {len(self.entries)} entries to {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, strongs: str) -> bool:
+        return self.get(strongs) is not None
+
+    def get(self, strongs: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up one Strong's number.
+
+        Returns:
+            Entry dict with "strong_id", "document_id" (None if the upload
+            did not report one) and core fields, or None if unknown
+        """
+        try:
+            strong_id = normalize_strongs(strongs)
+        except ValueError:
+            return None
+        entry = self.entries.get(strong_id)
+        return {"strong_id": strong_id, **entry} if entry is not None else None
+
+    def add_document(self, document: Dict[str, Any]) -> None:
+        """Record a converted lexicon document (document ID filled in on upload)."""
+        metadata = document.get("metadata", {})
+        strong_id = normalize_strongs(metadata["strong_id"])
+        entry = {"document_id": None, "title": document["title"]}
+        entry.update({field: metadata[field] for field in CORE_FIELDS if field in metadata})
+        with self._lock:
+            # Re-imports skip duplicates without reporting an ID; keep the old one
+            previous = self.entries.get(strong_id)
+            if previous is not None and previous.get("title") == document["title"]:
+                entry["document_id"] = previous.get("document_id")
+            self.entries[strong_id] = entry
+            self._titles[document["title"]] = strong_id
+
+    def track(self, documents: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass documents through unchanged, recording each one."""
+        for document in documents:
+            self.add_document(document)
+            yield document
+
+    def record_batch_result(self, result: Dict[str, Any]) -> int:
+        """
+        Attach Prism document IDs from an import_corpus_batch response.
+
+        Returns:
+            Number of entries that received a document ID
+        """
+        recorded = 0
+        with self._lock:
+            for doc_result in result.get("results", []):
+                strong_id = self._titles.get(doc_result.get("title"))
+                if strong_id and doc_result.get("document_id"):
+                    self.entries[strong_id]["document_id"] = str(doc_result["document_id"])
+                    recorded += 1
+        return recorded
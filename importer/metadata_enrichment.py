@@ -324,41 +324,22 @@ PERSON_ENTITIES = {
     "Israel", "Judah", "Israelites", "Jews", "Gentiles",
 }
 
-PLACE_ENTITIES = {
-    # OT Geography
-    "Eden", "Ur", "Haran", "Canaan", "Egypt", "Sinai", "Wilderness",
-    "Jerusalem", "Bethlehem", "Hebron", "Samaria", "Babylon", "Assyria",
-
-    # NT Geography
-    "Nazareth", "Galilee", "Judea", "Jerusalem", "Bethlehem",
-    "Capernaum", "Damascus", "Antioch", "Ephesus", "Corinth",
-    "Philippi", "Thessalonica", "Rome", "Asia Minor",
-
-    # Geographic features
-    "Jordan River", "Dead Sea", "Sea of Galilee", "Red Sea",
-    "Mount Sinai", "Mount Zion", "Mount of Olives",
-}
-
 
 def extract_named_entities(text: str) -> Dict[str, List[str]]:
     """
-    Extract named entities (people, places) from text.
+    Extract named people from text.
 
     Simple regex-based extraction for common Biblical names.
-    Could be enhanced with spaCy NER or custom model.
+    Could be enhanced with spaCy NER or custom model. Places come from the
+    verse place index built by import-geography (see verse_place_index).
     """
-    entities = {"people": [], "places": [], "groups": []}
+    entities = {"people": [], "groups": []}
 
     # Extract people
     for person in PERSON_ENTITIES:
         if re.search(r'\b' + re.escape(person) + r'\b', text, re.IGNORECASE):
             entities["people"].append(person)
 
-    # Extract places
-    for place in PLACE_ENTITIES:
-        if re.search(r'\b' + re.escape(place) + r'\b', text, re.IGNORECASE):
-            entities["places"].append(place)
-
     return entities
 
 
@@ -0,0 +1,268 @@
+"""Precomputed marker clusters for the geography map.
+
+Clustering every place in the browser on each zoom change is wasted work:
+places only change on import. This build step clusters the places bundle
+(see geography_bundle) once per zoom level, supercluster-style: starting
+from individual places, each zoom merges the items of the level below that
+lie within a fixed pixel radius (in Web Mercator space), weighting centroids
+by place count. Clusters carry their count, bounds and the zoom at which
+they split apart.
+
+Each level is cut into map tiles, so the UI requests only the tiles covering
+its viewport:
+
+    clusters/index.json       - version, zoom range, radius and the list of
+                                non-empty tiles per zoom
+    clusters/{z}/{x}/{y}.json - GeoJSON FeatureCollection of the clusters
+                                (properties.cluster = true) and single
+                                places whose centroid falls in the tile
+
+Level max_zoom + 1 holds the individual places.
+
+Usage:
+    python cli.py import-geography          # builds clusters after import
+    python cli.py build-place-clusters --max-zoom 14
+"""
+
+import json
+import logging
+import math
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CLUSTERS_VERSION = 1
+INDEX_FILE = "index.json"
+TILE_SIZE = 256  # pixels per map tile
+CLUSTER_RADIUS_PX = 40
+DEFAULT_MIN_ZOOM = 0
+DEFAULT_MAX_ZOOM = 12
+MAX_LATITUDE = 85.05113  # Web Mercator limit
+
+# Place properties kept on single-place features
+POINT_PROPERTIES = ("name", "document_id", "place_type", "confidence_score", "confidence_level")
+
+
+def project(lon: float, lat: float) -> Tuple[float, float]:
+    """Longitude/latitude to Web Mercator x/y in [0, 1]."""
+    sin_lat = math.sin(math.radians(max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))))
+    y = 0.5 - 0.25 * math.log((1 + sin_lat) / (1 - sin_lat)) / math.pi
+    return lon / 360 + 0.5, y
+
+
+def unproject(x: float, y: float) -> Tuple[float, float]:
+    """Web Mercator x/y back to longitude/latitude."""
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+    return (x - 0.5) * 360, lat
+
+
+def _cluster_level(items: List[Dict[str, Any]], zoom: int, radius: float) -> List[Dict[str, Any]]:
+    """Merge items of the level below that lie within `radius` of each other."""
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for i, item in enumerate(items):
+        grid.setdefault((math.floor(item["x"] / radius), math.floor(item["y"] / radius)), []).append(i)
+
+    merged = [False] * len(items)
+    level = []
+    for i, item in enumerate(items):
+        if merged[i]:
+            continue
+        merged[i] = True
+        cx, cy = math.floor(item["x"] / radius), math.floor(item["y"] / radius)
+        neighbours = [
+            j
+            for gx in (cx - 1, cx, cx + 1)
+            for gy in (cy - 1, cy, cy + 1)
+            for j in grid.get((gx, gy), ())
+            if not merged[j]
+            and (items[j]["x"] - item["x"]) ** 2 + (items[j]["y"] - item["y"]) ** 2 <= radius * radius
+        ]
+        if not neighbours:
+            level.append(item)
+            continue
+
+        members = [item] + [items[j] for j in neighbours]
+        for j in neighbours:
+            merged[j] = True
+        count = sum(member["count"] for member in members)
+        level.append({
+            "id": f"c{zoom}-{len(level)}",
+            "x": sum(member["x"] * member["count"] for member in members) / count,
+            "y": sum(member["y"] * member["count"] for member in members) / count,
+            "count": count,
+            "bounds": [
+                min(member["bounds"][0] for member in members),
+                min(member["bounds"][1] for member in members),
+                max(member["bounds"][2] for member in members),
+                max(member["bounds"][3] for member in members),
+            ],
+            "expansion_zoom": zoom + 1,
+        })
+    return level
+
+
+def _feature(item: Dict[str, Any]) -> Dict[str, Any]:
+    """GeoJSON feature for a cluster or single place."""
+    lon, lat = unproject(item["x"], item["y"])
+    if item["count"] == 1:
+        lon, lat = item["lon"], item["lat"]
+        properties = dict(item["properties"])
+    else:
+        properties = {
+            "cluster": True,
+            "count": item["count"],
+            "bounds": [round(value, 5) for value in item["bounds"]],
+            "expansion_zoom": item["expansion_zoom"],
+        }
+    return {
+        "type": "Feature",
+        "id": item["id"],
+        "geometry": {"type": "Point", "coordinates": [round(lon, 5), round(lat, 5)]},
+        "properties": properties,
+    }
+
+
+def cluster_places(
+    bundle: Dict[str, Any],
+    min_zoom: int = DEFAULT_MIN_ZOOM,
+    max_zoom: int = DEFAULT_MAX_ZOOM,
+    radius_px: int = CLUSTER_RADIUS_PX,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Cluster bundle places for every zoom level.
+
+    Args:
+        bundle: Places FeatureCollection from build_places_bundle
+        min_zoom: Lowest zoom level
+        max_zoom: Highest clustered zoom level
+        radius_px: Cluster radius in screen pixels
+
+    Returns:
+        zoom -> GeoJSON features (zoom max_zoom + 1 holds single places)
+    """
+    items = []
+    for feature in bundle.get("features", []):
+        lon, lat = feature["geometry"]["coordinates"]
+        x, y = project(lon, lat)
+        items.append({
+            "id": feature["id"],
+            "x": x,
+            "y": y,
+            "lon": lon,
+            "lat": lat,
+            "count": 1,
+            "bounds": [lon, lat, lon, lat],
+            "properties": {
+                field: feature["properties"][field]
+                for field in POINT_PROPERTIES
+                if field in feature.get("properties", {})
+            },
+        })
+
+    levels = {max_zoom + 1: [_feature(item) for item in items]}
+    for zoom in range(max_zoom, min_zoom - 1, -1):
+        items = _cluster_level(items, zoom, radius_px / (TILE_SIZE * 2 ** zoom))
+        levels[zoom] = [_feature(item) for item in items]
+    return levels
+
+
+def build_place_clusters(
+    bundle: Dict[str, Any],
+    output_dir: Path,
+    min_zoom: int = DEFAULT_MIN_ZOOM,
+    max_zoom: int = DEFAULT_MAX_ZOOM,
+    radius_px: int = CLUSTER_RADIUS_PX,
+) -> Dict[str, Any]:
+    """
+    Cluster bundle places and write the tile tree.
+
+    The tree is written next to output_dir and swapped in when complete.
+
+    Returns:
+        Build stats: {"places", "zooms", "tiles", "clusters_per_zoom"}
+    """
+    levels = cluster_places(bundle, min_zoom, max_zoom, radius_px)
+
+    tmp_dir = output_dir.with_name(output_dir.name + ".tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tiles_per_zoom: Dict[str, List[str]] = {}
+    for zoom, features in sorted(levels.items()):
+        scale = 2 ** zoom
+        tiles: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        for feature in features:
+            x, y = project(*feature["geometry"]["coordinates"])
+            tile = tuple(max(0, min(scale - 1, math.floor(value * scale))) for value in (x, y))
+            tiles.setdefault(tile, []).append(feature)
+        for (x, y), tile_features in tiles.items():
+            tile_path = tmp_dir / str(zoom) / str(x) / f"{y}.json"
+            tile_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tile_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"type": "FeatureCollection", "features": tile_features},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+        tiles_per_zoom[str(zoom)] = sorted(f"{x}/{y}" for x, y in tiles)
+
+    with open(tmp_dir / INDEX_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": CLUSTERS_VERSION,
+                "min_zoom": min_zoom,
+                "max_zoom": max_zoom,
+                "radius_px": radius_px,
+                "tile_size": TILE_SIZE,
+                "bundle_generated_at": bundle.get("generated_at"),
+                "count": len(levels[max_zoom + 1]),
+                "tiles": tiles_per_zoom,
+            },
+            f,
+            separators=(",", ":"),
+        )
+
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    tmp_dir.replace(output_dir)
+
+    stats = {
+        "places": len(levels[max_zoom + 1]),
+        "zooms": len(levels),
+        "tiles": sum(len(tiles) for tiles in tiles_per_zoom.values()),
+        "clusters_per_zoom": {zoom: len(features) for zoom, features in sorted(levels.items())},
+    }
+    logger.info(f"Wrote {stats['tiles']} cluster tiles for {stats['places']} places to {output_dir}")
+    return stats
+
+
+def load_clusters_index(output_dir: Path) -> Dict[str, Any]:
+    """
+    Read the cluster tile index.
+
+    Raises:
+        FileNotFoundError: If clusters have not been built
+        ValueError: If the version is not supported
+    """
+    index_path = output_dir / INDEX_FILE
+    if not index_path.exists():
+        raise FileNotFoundError(
+            f"Place clusters not found: {index_path}. Run build-place-clusters first."
+        )
+    with open(index_path, encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("version") != CLUSTERS_VERSION:
+        raise ValueError(f"Unsupported place clusters version: {index.get('version')}")
+    return index
+
+
+def tile_features(output_dir: Path, zoom: int, x: int, y: int) -> Optional[List[Dict[str, Any]]]:
+    """Features of one tile, or None if the tile is empty."""
+    tile_path = output_dir / str(zoom) / str(x) / f"{y}.json"
+    if not tile_path.exists():
+        return None
+    with open(tile_path, encoding="utf-8") as f:
+        return json.load(f)["features"]
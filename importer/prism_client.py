@@ -1,25 +1,193 @@
 """Async client for Prism corpus API."""
 
 import asyncio
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
 import httpx
-from typing import Any, Optional, Callable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from config import settings
+from embedding_cache import QueryEmbeddingCache, timed_embedding
+from keyword_index import KeywordIndex, reciprocal_rank_fusion
+from lexicon_index import LexiconIndex
+from reference_parser import extract_verse_ranges
+
+if TYPE_CHECKING:
+    from vector_index import VectorIndex
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_VERSION = 1
+
+SearchKey = Tuple[str, Optional[str], int]
+
+# Domains written by the importers
+TRANSLATION_DOMAINS = ("bible/kjv", "bible/asv", "bible/bbe", "bible/ylt", "bible/webster")
+SEARCH_DOMAINS = TRANSLATION_DOMAINS + ("lexicon/strongs", "geography/biblical", "metadata/books")
+
+
+class SearchCache:
+    """LRU cache of search responses with a time-to-live and optional file."""
+
+    def __init__(
+        self,
+        max_size: int = 2048,
+        ttl: float = 3600,
+        path: Optional[Path] = None,
+    ):
+        """
+        Initialize search cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl: Seconds a response stays valid
+            path: Optional JSON file to load from and save to
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        # key -> (stored_at, response); wall-clock time so entries survive restarts
+        self._entries: "OrderedDict[SearchKey, Tuple[float, dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if path is not None and path.exists():
+            self.load()
+
+    @staticmethod
+    def key(query: str, domain: Optional[str], top_k: int) -> SearchKey:
+        """Cache key for one search (whitespace-trimmed query)."""
+        return query.strip(), domain, top_k
+
+    def get(self, key: SearchKey) -> Optional[dict]:
+        """Return a copy of the cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+                self._dirty = True
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: SearchKey, response: dict) -> None:
+        """Store a response."""
+        self._entries[key] = (time.time(), copy.deepcopy(response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load unexpired entries from the cache file (unreadable files are ignored)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SEARCH_CACHE_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring search cache {self.path}: {e}")
+            return
+
+        now = time.time()
+        for query, domain, top_k, stored_at, response in data["entries"]:
+            if now - stored_at <= self.ttl:
+                self._entries[(query, domain, top_k)] = (stored_at, response)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write entries to the cache file if anything changed."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": SEARCH_CACHE_VERSION,
+                    "entries": [
+                        [query, domain, top_k, stored_at, response]
+                        for (query, domain, top_k), (stored_at, response) in self._entries.items()
+                    ],
+                },
+                f,
+                ensure_ascii=False,
+            )
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def default_embedding_cache(persist: bool = True) -> QueryEmbeddingCache:
+    """Query embedding cache configured from settings."""
+    return QueryEmbeddingCache(
+        max_size=settings.embedding_cache_size,
+        path=settings.embedding_cache_path if persist else None,
+    )
+
+
+def default_search_cache(persist: bool = True) -> SearchCache:
+    """Search cache configured from settings (persisted to search_cache_path)."""
+    return SearchCache(
+        max_size=settings.search_cache_size,
+        ttl=settings.search_cache_ttl,
+        path=settings.search_cache_path if persist else None,
+    )
 
 
 class PrismClient:
     """Async HTTP client for Prism API operations."""
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        search_cache: Optional[SearchCache] = None,
+        embedding_cache: Optional[QueryEmbeddingCache] = None,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        local_index: Optional["VectorIndex"] = None,
+        keyword_index: Optional[KeywordIndex] = None,
+    ):
         """
         Initialize Prism client.
 
         Args:
             base_url: Override default Prism URL (default: from settings)
+            search_cache: Optional cache for search_documents/search_many
+                (saved on exit if it has a file)
+            embedding_cache: Optional query vector cache; when set, searches
+                embed the query client-side and search by vector
+            embedder: Optional local function(text) -> vector used instead
+                of Prism's embed endpoint
+            local_index: Optional loaded VectorIndex; searches are then
+                answered locally (the query is still embedded via embedder
+                or Prism unless its vector is cached)
+            keyword_index: Optional loaded KeywordIndex for hybrid_search
         """
         self.base_url = base_url or settings.prism_base_url
         self.client: httpx.AsyncClient | None = None
         self.timeout = httpx.Timeout(settings.prism_timeout)
+        self.search_cache = search_cache
+        self.embedding_cache = embedding_cache
+        self.embedder = embedder
+        self.local_index = local_index
+        self.keyword_index = keyword_index
+        self._lexicon_index: LexiconIndex | None = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -33,6 +201,10 @@ class PrismClient:
         """Async context manager exit."""
         if self.client:
             await self.client.aclose()
+        if self.search_cache is not None:
+            self.search_cache.save()
+        if self.embedding_cache is not None:
+            self.embedding_cache.save()
 
     async def check_health(self) -> bool:
         """
@@ -119,6 +291,9 @@ class PrismClient:
         """
         Search documents by semantic similarity.
 
+        Responses are served from and stored in search_cache when set. With
+        a local_index the search runs against it instead of Prism.
+
         Args:
             query: Search query text
             domain: Optional domain filter (e.g., "bible/kjv")
@@ -130,6 +305,19 @@ class PrismClient:
         Raises:
             httpx.HTTPStatusError: If API returns error status
         """
+        if self.search_cache is not None:
+            key = SearchCache.key(query, domain, top_k)
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.local_index is not None:
+            vector = await self.embed_query(query)
+            result = self.local_index.search(vector, top_k=top_k, domain=domain)
+            if self.search_cache is not None:
+                self.search_cache.put(key, result)
+            return result
+
         payload = {
             "query": query,
             "top_k": top_k,
@@ -137,42 +325,482 @@ class PrismClient:
         if domain:
             payload["domain"] = domain
 
+        if self.embedding_cache is not None:
+            # Prism searches by the supplied vector instead of re-embedding
+            payload["query_embedding"] = await self.embed_query(query)
+            path = settings.prism_vector_search_path
+        else:
+            path = "/api/v1/search"
+
         response = await self.client.post(
-            "/api/v1/search",
+            path,
             json=payload,
         )
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        if self.search_cache is not None:
+            self.search_cache.put(key, result)
+        return result
 
-    async def count_domain_documents(self, domain: str) -> int:
+    async def embed_query(self, query: str) -> List[float]:
         """
-        Count documents in a specific domain by searching.
+        Embed query text, reusing cached vectors for repeated queries.
+
+        Vectors come from the local embedder when one is configured,
+        otherwise from Prism's embed endpoint.
 
         Args:
-            domain: Domain to count (e.g., "bible/kjv")
+            query: Search query text
 
         Returns:
-            Number of documents in domain
+            Query vector
 
         Raises:
             httpx.HTTPStatusError: If API returns error status
         """
-        # Search with a very generic query to get documents in domain
-        # This is a workaround since stats doesn't break down by domain
-        try:
-            response = await self.client.get(
-                "/api/v1/documents",
-                params={"domain": domain, "limit": 1},
+        cache = self.embedding_cache
+        key = QueryEmbeddingCache.key(settings.embedding_model, query)
+        if cache is not None:
+            vector = cache.get(key)
+            if vector is not None:
+                return vector
+
+        if self.embedder is not None:
+            vector, seconds = await asyncio.to_thread(timed_embedding, self.embedder, query)
+        else:
+            started = time.perf_counter()
+            response = await self.client.post(
+                settings.prism_embed_path,
+                json={"texts": [query], "model": settings.embedding_model},
             )
             response.raise_for_status()
             data = response.json()
-            # If Prism returns a total count, use that
-            # Otherwise we'll need to implement actual counting
-            return data.get("total", len(data.get("documents", [])))
+            vector = data["embeddings"][0] if "embeddings" in data else data["embedding"]
+            seconds = time.perf_counter() - started
+
+        if cache is not None:
+            cache.put(key, vector, seconds)
+        return vector
+
+    async def hybrid_search(
+        self,
+        query: str,
+        domain: Optional[str] = None,
+        top_k: int = 10,
+        candidates: Optional[int] = None,
+        weights: Optional[Sequence[float]] = None,
+    ) -> dict:
+        """
+        Fuse semantic and BM25 keyword results with reciprocal rank fusion.
+
+        Args:
+            query: Search query text
+            domain: Optional domain filter (e.g., "bible/kjv")
+            top_k: Number of fused results
+            candidates: Results taken from each retriever (default: 2 * top_k)
+            weights: Optional (vector, keyword) weights for the fusion
+
+        Returns:
+            {"results": [...], "total": n}; each result has "rrf_score" and
+            "ranks" ([vector rank, keyword rank], None where absent)
+
+        Raises:
+            RuntimeError: If the client has no keyword_index
+        """
+        if self.keyword_index is None:
+            raise RuntimeError("hybrid_search needs a keyword_index")
+
+        candidates = candidates or top_k * 2
+        vector_results = await self.search_documents(query, domain=domain, top_k=candidates)
+        keyword_results = self.keyword_index.search(query, top_k=candidates, domain=domain)
+        fused = reciprocal_rank_fusion(
+            [vector_results.get("results", []), keyword_results["results"]],
+            top_k=top_k,
+            weights=weights,
+        )
+        return {"results": fused, "total": len(fused)}
+
+    async def search_many(
+        self,
+        queries: Sequence[Union[str, Dict[str, Any]]],
+        domain: Optional[str] = None,
+        top_k: int = 5,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[dict, Exception]]:
+        """
+        Run many searches with bounded concurrency.
+
+        Args:
+            queries: Query strings, or dicts with "query" and optional
+                "domain"/"top_k" overriding the defaults
+            domain: Default domain filter
+            top_k: Default number of results per query
+            concurrency: Maximum requests in flight (default: from settings)
+            return_exceptions: Return failed searches as exceptions in place
+                instead of raising the first failure
+
+        Returns:
+            One search response per query, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.search_concurrency)
+
+        async def run(key: SearchKey) -> dict:
+            async with semaphore:
+                return await self.search_documents(key[0], domain=key[1], top_k=key[2])
+
+        # Identical searches in one call share a single request
+        keys = []
+        for spec in queries:
+            if isinstance(spec, str):
+                spec = {"query": spec}
+            keys.append(SearchCache.key(
+                spec["query"], spec.get("domain", domain), spec.get("top_k", top_k)
+            ))
+        unique_keys = list(dict.fromkeys(keys))
+        responses = await asyncio.gather(
+            *(run(key) for key in unique_keys), return_exceptions=return_exceptions
+        )
+        by_key = dict(zip(unique_keys, responses))
+
+        results = []
+        seen = set()
+        for key in keys:
+            response = by_key[key]
+            # Repeats get their own copy so callers can mutate results freely
+            if key in seen and not isinstance(response, Exception):
+                response = copy.deepcopy(response)
+            seen.add(key)
+            results.append(response)
+        return results
+
+    async def search_domains(
+        self,
+        query: str,
+        domains: Sequence[str] = SEARCH_DOMAINS,
+        top_k: int = 10,
+        quotas: Optional[Dict[str, int]] = None,
+        dedupe: bool = True,
+    ) -> dict:
+        """
+        Search several domains concurrently and merge the results.
+
+        Every domain is queried at once (latency is that of the slowest
+        domain), results are ranked by similarity, each domain contributes
+        at most its quota, and a verse range already taken from one
+        translation is folded into that result's "also_in" list rather
+        than repeated. A failing domain is reported under "errors" instead
+        of failing the whole search.
+
+        Args:
+            query: Search query text
+            domains: Domains to search (default: translations, lexicon,
+                geography and book metadata)
+            top_k: Number of merged results to return
+            quotas: Optional maximum results per domain (default: top_k)
+            dedupe: Fold identical verse ranges across translations
+
+        Returns:
+            {"query", "results": [...], "domains": {domain: results used},
+             "errors": {domain: message}}; each result carries "domain"
+        """
+        quotas = quotas or {}
+        domains = list(dict.fromkeys(domains))
+        responses = await self.search_many(
+            [
+                {"query": query, "domain": domain, "top_k": min(quotas.get(domain, top_k), top_k)}
+                for domain in domains
+            ],
+            return_exceptions=True,
+        )
+
+        candidates = []
+        errors = {}
+        for domain, response in zip(domains, responses):
+            if isinstance(response, Exception):
+                errors[domain] = str(response)
+                continue
+            for result in response.get("results", []):
+                candidates.append({**result, "domain": result.get("domain") or domain})
+        # Stable sort keeps each domain's own order among equal scores
+        candidates.sort(key=lambda result: result.get("similarity", 0), reverse=True)
+
+        merged = []
+        used = {domain: 0 for domain in domains}
+        by_range: Dict[Tuple[int, int], dict] = {}
+        for result in candidates:
+            if len(merged) == top_k:
+                break
+            domain = result["domain"]
+            if used.get(domain, 0) >= quotas.get(domain, top_k):
+                continue
+
+            verse_range = _result_verse_range(result) if dedupe else None
+            if verse_range is not None:
+                kept = by_range.get(verse_range)
+                if kept is not None:
+                    kept.setdefault("also_in", []).append(domain)
+                    continue
+                by_range[verse_range] = result
+
+            merged.append(result)
+            used[domain] = used.get(domain, 0) + 1
+
+        return {"query": query, "results": merged, "domains": used, "errors": errors}
+
+    async def get_document(self, document_id: str) -> dict:
+        """
+        Fetch one document by ID.
+
+        Args:
+            document_id: Prism document UUID
+
+        Returns:
+            Document dict
+
+        Raises:
+            httpx.HTTPStatusError: If API returns error status
+        """
+        response = await self.client.get(f"/api/v1/documents/{document_id}")
+        response.raise_for_status()
+        return response.json()
+
+    def lookup_strongs(self, strongs: str) -> Optional[dict]:
+        """
+        Exact Strong's lookup in the local lexicon index (no Prism call).
+
+        The index is written by import-lexicon and loaded on first use.
+
+        Args:
+            strongs: Strong's number (e.g., "H157", "g26")
+
+        Returns:
+            Index entry with "strong_id", "document_id", "title" and core
+            fields, or None if the number is not in the lexicon
+
+        Raises:
+            FileNotFoundError: If the lexicon has not been imported
+        """
+        if self._lexicon_index is None:
+            self._lexicon_index = LexiconIndex(settings.lexicon_index_path).load()
+        return self._lexicon_index.get(strongs)
+
+    async def get_lexicon_entry(self, strongs: str, fetch_document: bool = False) -> Optional[dict]:
+        """
+        Look up a lexicon entry by Strong's number without semantic search.
+
+        Args:
+            strongs: Strong's number (e.g., "H157")
+            fetch_document: Also fetch the full Prism document
+
+        Returns:
+            Index entry (plus "document" if fetched), or None if unknown
+        """
+        entry = self.lookup_strongs(strongs)
+        if entry and fetch_document and entry.get("document_id"):
+            entry["document"] = await self.get_document(entry["document_id"])
+        return entry
+
+    async def list_documents_page(
+        self,
+        domain: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_embeddings: bool = False,
+    ) -> Tuple[List[dict], Optional[int]]:
+        """
+        Fetch one page of documents in a domain.
+
+        Args:
+            domain: Domain to list (e.g., "lexicon/strongs")
+            offset: Index of the first document
+            limit: Page size (default: from settings)
+            fields: Optional projection, e.g. ["id", "metadata.strong_id"]
+            include_embeddings: Also return each document's stored vector
+                under "embedding"
+
+        Returns:
+            (documents, total) where total is None if Prism does not report it
+
+        Raises:
+            httpx.HTTPStatusError: If API returns error status
+        """
+        params = {
+            "domain": domain,
+            "offset": offset,
+            "limit": limit or settings.document_page_size,
+        }
+        if fields:
+            params["fields"] = ",".join(fields)
+        if include_embeddings:
+            params["include_embeddings"] = "true"
+
+        response = await self.client.get("/api/v1/documents", params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        # Prism has returned both {"documents": [...]} and {"items": [...]}
+        if isinstance(data, list):
+            documents, total = data, None
+        else:
+            documents = data.get("documents", data.get("items", []))
+            total = data.get("total")
+
+        if fields:
+            documents = [_project(document, fields) for document in documents]
+        return documents, total
+
+    async def iter_documents(
+        self,
+        domain: str,
+        fields: Optional[Sequence[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 2,
+        include_embeddings: bool = False,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream every document in a domain, page by page.
+
+        Up to prefetch pages beyond the current one are requested
+        concurrently, so large domains (30k+ documents) are listed without
+        one huge response. Documents are yielded in offset order.
+
+        Listing stops at the reported total, at an empty page, at a page
+        whose first document was already seen (a server that ignores offset
+        would otherwise return the same page forever), or, when Prism reports
+        no total, at a short page. A short page below the reported total
+        means Prism caps the page size: listing continues after it with the
+        smaller size.
+
+        Args:
+            domain: Domain to list (e.g., "bible/kjv")
+            fields: Optional projection (dotted paths into metadata allowed)
+            page_size: Documents per request (default: from settings)
+            prefetch: Extra pages kept in flight
+            include_embeddings: Also return each document's stored vector
+
+        Yields:
+            Document dicts
+
+        Raises:
+            httpx.HTTPStatusError: If API returns error status
+        """
+        page_size = page_size or settings.document_page_size
+        pending: deque = deque()
+        next_offset = 0
+        total: Optional[int] = None
+        seen_first_ids = set()
+
+        # Always list IDs so repeated pages can be recognized
+        request_fields = fields
+        if fields and "id" not in fields:
+            request_fields = [*fields, "id"]
+
+        def schedule() -> None:
+            nonlocal next_offset
+            while len(pending) <= prefetch and (total is None or next_offset < total):
+                pending.append((next_offset, asyncio.ensure_future(
+                    self.list_documents_page(domain, next_offset, page_size, request_fields, include_embeddings)
+                )))
+                next_offset += page_size
+
+        try:
+            schedule()
+            while pending:
+                offset, task = pending.popleft()
+                documents, page_total = await task
+                if page_total is not None:
+                    total = page_total
+                if not documents:
+                    break
+                first_id = documents[0].get("id")
+                if first_id is not None:
+                    if first_id in seen_first_ids:
+                        logger.warning(f"Prism returned a page of {domain} twice (offset ignored?); stopping")
+                        break
+                    seen_first_ids.add(first_id)
+                for document in documents:
+                    yield _project(document, fields) if request_fields is not fields else document
+                end = offset + len(documents)
+                if total is None:
+                    # Without a total, a short page is the last one
+                    if len(documents) < page_size:
+                        break
+                elif end >= total:
+                    break
+                elif len(documents) < page_size:
+                    # Prism capped the page size: drop the prefetched pages
+                    # and continue from here with the size it served
+                    for _, stale in pending:
+                        stale.cancel()
+                    await asyncio.gather(*(stale for _, stale in pending), return_exceptions=True)
+                    pending.clear()
+                    page_size = len(documents)
+                    next_offset = end
+                schedule()
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    async def count_domain_documents(self, domain: str) -> int:
+        """
+        Count documents in a specific domain.
+
+        Uses the total Prism reports with the first page; otherwise pages
+        through the domain fetching only document IDs.
+
+        Args:
+            domain: Domain to count (e.g., "bible/kjv")
+
+        Returns:
+            Number of documents in domain (0 if the listing fails)
+        """
+        try:
+            documents, total = await self.list_documents_page(domain, limit=1, fields=["id"])
+            if total is not None:
+                return total
+            if not documents:
+                return 0
+
+            count = 0
+            async for _ in self.iter_documents(domain, fields=["id"]):
+                count += 1
+            return count
         except Exception:
             return 0
 
 
+def _result_verse_range(result: dict) -> Optional[Tuple[int, int]]:
+    """Packed verse range of a Bible search result, or None for other domains."""
+    if not result.get("domain", "").startswith("bible/"):
+        return None
+    metadata = result.get("metadata") or {}
+    if metadata.get("verse_id_start") and metadata.get("verse_id_end"):
+        return metadata["verse_id_start"], metadata["verse_id_end"]
+    # Chunk titles read "Genesis 1:1-5 (KJV)"
+    ranges = extract_verse_ranges(result.get("document_title", result.get("title", "")))
+    return (ranges[0].start, ranges[0].end) if ranges else None
+
+
+def _project(document: dict, fields: Sequence[str]) -> dict:
+    """Keep only the given (possibly dotted) fields of a document."""
+    projected: dict = {}
+    for field in fields:
+        source, target = document, projected
+        *parents, leaf = field.split(".")
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+            if source is None:
+                break
+            target = target.setdefault(key, {})
+        else:
+            if isinstance(source, dict) and leaf in source:
+                target[leaf] = source[leaf]
+    return projected
+
+
 async def import_documents_in_batches(
     documents: list,
     batch_size: int = 100,
@@ -258,3 +886,151 @@ async def import_documents_in_batches(
             await asyncio.sleep(0.5)
 
     return aggregated_results
+
+
+async def import_document_streams(
+    streams: Dict[str, Iterable[dict]],
+    batch_size: int = 100,
+    embed: bool = True,
+    concurrency: Optional[int] = None,
+    progress_callback: Optional[Callable] = None,
+) -> dict:
+    """
+    Convert and import several document streams through one upload pipeline.
+
+    Each stream is consumed in its own worker thread (so document conversion
+    for e.g. Hebrew and Greek runs concurrently) and cut into batches that
+    feed a bounded queue. A fixed number of upload tasks drain the queue, so
+    conversion overlaps with uploads and several batches are in flight at once.
+
+    Args:
+        streams: Mapping of stream name to iterable of documents
+        batch_size: Documents per batch (max 100)
+        embed: Whether to generate embeddings
+        concurrency: Concurrent upload requests (default: from settings)
+        progress_callback: Optional function(batch_num, total_batches, result);
+            total_batches is None because streams are not counted up front
+
+    Returns:
+        Aggregated results as import_documents_in_batches, plus per-stream
+        "streams": {name: {"documents", "success_count", "error_count",
+        "seconds", "docs_per_sec"}}
+    """
+    if batch_size > 100:
+        raise ValueError("Batch size cannot exceed 100")
+
+    concurrency = concurrency or settings.import_concurrency
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(concurrency * 2, len(streams)))
+    stop = threading.Event()
+    started = time.perf_counter()
+
+    aggregated_results = {
+        "total_documents": 0,
+        "total_batches": 0,
+        "success_count": 0,
+        "error_count": 0,
+        "errors": [],
+        "streams": {
+            name: {"documents": 0, "success_count": 0, "error_count": 0}
+            for name in streams
+        },
+    }
+    pending = {name: 0 for name in streams}
+    finished_producing = set()
+
+    def finish_stream(name: str) -> None:
+        """Record throughput once a stream is converted and fully uploaded."""
+        stats = aggregated_results["streams"][name]
+        stats["seconds"] = round(time.perf_counter() - started, 2)
+        stats["docs_per_sec"] = round(stats["documents"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+
+    def produce(name: str, documents: Iterable[dict]) -> None:
+        """Cut one stream into batches (runs in a worker thread)."""
+        batch = []
+        for document in documents:
+            if stop.is_set():
+                return
+            batch.append(document)
+            if len(batch) == batch_size:
+                asyncio.run_coroutine_threadsafe(queue.put((name, batch)), loop).result()
+                batch = []
+        if batch and not stop.is_set():
+            asyncio.run_coroutine_threadsafe(queue.put((name, batch)), loop).result()
+
+    async with PrismClient() as client:
+        if not await client.check_health():
+            raise RuntimeError(
+                f"Prism service not accessible at {client.base_url}. "
+                "Ensure Prism is running: docker compose up -d prism"
+            )
+
+        async def run_producer(name: str, documents: Iterable[dict]) -> None:
+            try:
+                await asyncio.to_thread(produce, name, documents)
+            finally:
+                finished_producing.add(name)
+                if pending[name] == 0:
+                    finish_stream(name)
+
+        async def upload() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    queue.task_done()
+                    return
+
+                name, batch = item
+                stats = aggregated_results["streams"][name]
+                pending[name] += 1
+                aggregated_results["total_batches"] += 1
+                batch_num = aggregated_results["total_batches"]
+                aggregated_results["total_documents"] += len(batch)
+                stats["documents"] += len(batch)
+
+                try:
+                    result = await client.import_corpus_batch(batch, embed=embed)
+                    imported = result.get("imported", 0)
+                    failed = result.get("failed", 0)
+                    for doc_result in result.get("results", []):
+                        if not doc_result.get("success", True) and doc_result.get("error"):
+                            aggregated_results["errors"].append({
+                                "document": doc_result.get("title", "Unknown"),
+                                "error": doc_result.get("error"),
+                            })
+                except Exception as e:
+                    error_msg = f"Batch {batch_num} ({name}) failed: {str(e)}"
+                    imported, failed = 0, len(batch)
+                    aggregated_results["errors"].append({"batch": batch_num, "error": error_msg})
+                    result = {"error": error_msg}
+
+                aggregated_results["success_count"] += imported
+                aggregated_results["error_count"] += failed
+                stats["success_count"] += imported
+                stats["error_count"] += failed
+
+                if progress_callback:
+                    progress_callback(batch_num, None, result)
+
+                pending[name] -= 1
+                if name in finished_producing and pending[name] == 0:
+                    finish_stream(name)
+                queue.task_done()
+
+        uploaders = [asyncio.create_task(upload()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*(
+                run_producer(name, documents) for name, documents in streams.items()
+            ))
+            for _ in uploaders:
+                await queue.put(None)
+            await asyncio.gather(*uploaders)
+        finally:
+            # On failure, unblock producer threads still waiting on the queue
+            stop.set()
+            for task in uploaders:
+                task.cancel()
+            while not queue.empty():
+                queue.get_nowait()
+
+    return aggregated_results
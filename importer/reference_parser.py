@@ -0,0 +1,161 @@
+"""Fast free-text verse citation parser.
+
+Finds references such as "Genesis 15:6", "1 John 3:16", "2 Kgs 5:12",
+"Rom 3:23; 6:23" or "John 3:16-18, 21" in arbitrary text and resolves them to
+canonical VerseRanges (see verse_ids).
+
+Every book name, OSIS ID and abbreviation from verse_ids is inserted into a
+character trie, which is compiled into a single regular expression with shared
+prefixes factored out ("1 Sam|1 Samuel|1 Sm" → "1 S(?:am(?:uel)?|m)"). The
+whole scan is one pass of the regex engine, so it runs at regex speed and
+numbered books win over their unnumbered suffix ("1 John" is never read as
+"John").
+
+Matching ignores case, except that abbreviations of one or two letters
+("Is", "Am", "Ex") must be capitalized or followed by a period, so prose
+such as "it is 5:30" or "am 3:15" is not read as a citation.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+from verse_ids import (
+    BOOKS,
+    VerseRange,
+    book_name_variants,
+    get_book,
+    normalize_book_key,
+    pack_verse_id,
+)
+
+
+def _trie_to_regex(node: Dict[str, Dict]) -> str:
+    """
+    Compile a character trie into a regex alternation.
+
+    A "" key marks the end of a word. Spaces match any run of whitespace.
+    """
+    terminal = "" in node
+    branches = []
+    for char in sorted(k for k in node if k):
+        token = r"\s+" if char == " " else re.escape(char)
+        branches.append(token + _trie_to_regex(node[char]))
+
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    # Branches start with distinct characters; a greedy "?" on a word end
+    # makes the engine prefer "1 Samuel" to "1 Sam"
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+def build_book_pattern() -> str:
+    """Build the book-name regex from every accepted spelling."""
+    trie: Dict[str, Dict] = {}
+    for book in BOOKS:
+        for variant in book_name_variants(book):
+            node = trie
+            for char in normalize_book_key(variant):
+                node = node.setdefault(char, {})
+            node[""] = {}
+    return _trie_to_regex(trie)
+
+
+# One verse position after the book: "3:16", optionally "-18" or "-4:2"
+_POSITION = r"\d{1,3}:\d{1,3}(?:\s*[-–]\s*\d{1,3}(?::\d{1,3})?)?"
+
+REFERENCE_PATTERN = re.compile(
+    r"(?<![\w])(?P<book>" + build_book_pattern() + r")\.?\s*"
+    r"(?P<refs>" + _POSITION + r"(?:\s*[,;]\s*(?:\d{1,3}:)?\d{1,3}(?:\s*[-–]\s*\d{1,3}(?::\d{1,3})?)?(?![\w:]))*)"
+    r"(?![\w:])",
+    re.IGNORECASE,
+)
+
+# Numbering in front of a book name ("1 ", "2", "II ")
+_NUMBER_PREFIX = re.compile(r"^(?:[123]\s*|I{1,3}\s+)")
+
+# Abbreviations this short must be capitalized or end with a period
+SHORT_ABBREVIATION_LENGTH = 2
+
+# Pieces of the refs group: "16", "16-18", "4:2", "4:2-5:1"
+_PART_PATTERN = re.compile(
+    r"(?:(\d+):)?(\d+)(?:\s*[-–]\s*(?:(\d+):)?(\d+))?"
+)
+
+
+@dataclass(frozen=True)
+class ReferenceMatch:
+    """One verse range found in text."""
+
+    range: VerseRange
+    start: int  # character offset of the citation in the text
+    end: int
+    text: str
+
+    def format(self, style: str = "display") -> str:
+        """Canonical reference string ("1 John 3:16")."""
+        return self.range.format(style)
+
+
+def _is_ambiguous_abbreviation(text: str, match: re.Match) -> bool:
+    """True for a lowercase one- or two-letter book name without a period."""
+    name = _NUMBER_PREFIX.sub("", match.group("book"))
+    if len(name) > SHORT_ABBREVIATION_LENGTH or name[:1].isupper():
+        return False
+    return not text.startswith(".", match.end("book"))
+
+
+def iter_references(text: str) -> Iterator[ReferenceMatch]:
+    """
+    Scan text for verse citations.
+
+    A citation may list several positions in the same book: commas continue
+    the previous chapter ("John 3:16, 18") and a chapter:verse after a comma
+    or semicolon switches chapter ("Rom 3:23; 6:23").
+
+    Args:
+        text: Free text to scan
+
+    Yields:
+        ReferenceMatch for each verse range, in order of appearance
+    """
+    for match in REFERENCE_PATTERN.finditer(text):
+        book = get_book(match.group("book"))
+        if book is None or _is_ambiguous_abbreviation(text, match):
+            continue
+
+        chapter = None
+        for part in _PART_PATTERN.finditer(match.group("refs")):
+            start_chapter, start_verse, end_chapter, end_verse = part.groups()
+            if start_chapter is not None:
+                chapter = int(start_chapter)
+            if chapter is None:
+                continue
+
+            start = pack_verse_id(book.id, chapter, int(start_verse))
+            if end_verse is None:
+                end = start
+            else:
+                if end_chapter is not None:
+                    chapter = int(end_chapter)
+                end = max(start, pack_verse_id(book.id, chapter, int(end_verse)))
+
+            yield ReferenceMatch(
+                range=VerseRange(start, end),
+                start=match.start(),
+                end=match.end(),
+                text=match.group(0),
+            )
+
+
+def find_references(text: str) -> List[ReferenceMatch]:
+    """List every verse citation in text (see iter_references)."""
+    return list(iter_references(text))
+
+
+def extract_verse_ranges(text: str) -> List[VerseRange]:
+    """List the VerseRanges cited in text, in order of appearance."""
+    return [match.range for match in iter_references(text)]
@@ -0,0 +1,574 @@
+"""Snapshot export and fast restore of whole Prism domains.
+
+Rebuilding Prism from the sources means re-running every import with
+embedding enabled, which takes hours. export-snapshot instead pages through
+each domain (PrismClient.iter_documents, include_embeddings) and stores the
+documents with their stored vectors; restore-snapshot uploads them again
+through the parallel import pipeline (import_document_streams) with
+embed=False, so Prism only has to write rows.
+
+A snapshot is a directory:
+
+    manifest.json           {"version": 1, "created_at", "prism_base_url",
+                             "embedding_model",
+                             "domains": {domain: {"file", "documents",
+                                                  "embedded", "dimension",
+                                                  "bytes", "sha256"}}}
+    bible__kjv.arrow        one Arrow IPC file per domain, zstd-compressed
+    lexicon__strongs.arrow  record batches of BATCH_ROWS documents
+
+Domain files have the columns id, title, content, domain, metadata (JSON
+text) and embedding (list<float32>, null when Prism returned no vector).
+Files are written to a temp name and renamed; the manifest is written
+last, so a snapshot without manifest.json is incomplete.
+
+Only domains where every document has a vector are restored with
+embed=False; other domains are re-embedded by Prism on restore. Afterwards
+one page of each such domain is listed with include_embeddings to check
+that Prism kept the uploaded vectors.
+
+Restored documents get new Prism IDs. Restore maps the exported IDs to the
+new ones and rewrites the "document_id" fields of the local files that
+store them (see local_id_files()). The offline vector index keeps its
+records in a binary layout and has to be rebuilt (build-vector-index).
+
+Requires the `arrow` extra (pyarrow).
+
+Usage:
+    python cli.py export-snapshot --output data_sources/snapshots/2026-10
+    python cli.py restore-snapshot --input data_sources/snapshots/2026-10
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from atomic_files import sha256_file, write_json
+from config import settings
+from keyword_index import KEYS_FILE
+from prism_client import SEARCH_DOMAINS, PrismClient, import_document_streams
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# Documents per record batch in a domain file
+BATCH_ROWS = 1000
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("title", pa.string()),
+    ("content", pa.string()),
+    ("domain", pa.string()),
+    ("metadata", pa.string()),
+    ("embedding", pa.list_(pa.float32())),
+])
+
+
+def default_domains() -> List[str]:
+    """Domains a snapshot covers by default: settings.snapshot_domains, else every search domain."""
+    return list(settings.snapshot_domains or SEARCH_DOMAINS)
+
+
+def domain_file(domain: str) -> str:
+    """File name of a domain in the snapshot ("bible/kjv" -> "bible__kjv.arrow")."""
+    return domain.replace("/", "__") + ".arrow"
+
+
+class DomainWriter:
+    """Stream one domain's documents into a compressed Arrow IPC file."""
+
+    def __init__(self, path: Path, domain: str):
+        self.path = path
+        self.domain = domain
+        self.tmp_path = path.with_suffix(path.suffix + ".tmp")
+        self.rows: Dict[str, List[Any]] = {name: [] for name in SNAPSHOT_SCHEMA.names}
+        self.documents = 0
+        self.embedded = 0
+        self.dimension: Optional[int] = None
+        self._sink = pa.OSFile(str(self.tmp_path), "wb")
+        self._writer = ipc.new_file(
+            self._sink, SNAPSHOT_SCHEMA, options=ipc.IpcWriteOptions(compression="zstd")
+        )
+
+    @property
+    def pending(self) -> int:
+        """Documents buffered but not yet written."""
+        return len(self.rows["id"])
+
+    def add(self, document: Dict[str, Any]) -> None:
+        """Buffer one Prism document (see flush)."""
+        embedding = document.get("embedding")
+        if embedding:
+            self.embedded += 1
+            if self.dimension is None:
+                self.dimension = len(embedding)
+            elif len(embedding) != self.dimension:
+                raise ValueError(
+                    f"{self.domain}: embedding dimension {len(embedding)} differs from {self.dimension}"
+                )
+        else:
+            embedding = None
+
+        self.rows["id"].append(document.get("id") or document.get("document_id"))
+        self.rows["title"].append(document.get("title") or document.get("document_title"))
+        self.rows["content"].append(document.get("content"))
+        self.rows["domain"].append(document.get("domain") or self.domain)
+        self.rows["metadata"].append(json.dumps(document.get("metadata") or {}, ensure_ascii=False))
+        self.rows["embedding"].append(embedding)
+        self.documents += 1
+
+    def flush(self) -> None:
+        """Compress and write the buffered documents as one record batch."""
+        if self.pending:
+            self._writer.write_batch(pa.record_batch(self.rows, schema=SNAPSHOT_SCHEMA))
+            self.rows = {name: [] for name in SNAPSHOT_SCHEMA.names}
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish the file and move it into place.
+
+        Returns:
+            Manifest entry {"file", "documents", "embedded", "dimension",
+            "bytes", "sha256"}
+        """
+        self.flush()
+        self._writer.close()
+        self._sink.close()
+        self.tmp_path.replace(self.path)
+        return {
+            "file": self.path.name,
+            "documents": self.documents,
+            "embedded": self.embedded,
+            "dimension": self.dimension,
+            "bytes": self.path.stat().st_size,
+            "sha256": sha256_file(self.path),
+        }
+
+    def abort(self) -> None:
+        """Discard a partly written file."""
+        self._writer.close()
+        self._sink.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+async def export_domain(
+    client: PrismClient,
+    domain: str,
+    directory: Path,
+    include_embeddings: bool = True,
+    page_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Page through one domain and write its snapshot file.
+
+    Pages are prefetched by iter_documents while full record batches are
+    compressed and written in a worker thread. The document count Prism
+    reports for the domain is recorded as "total" (None if Prism does not
+    report one) and must match the exported documents.
+
+    Returns:
+        Manifest entry for the domain (see DomainWriter.close) plus "total"
+
+    Raises:
+        RuntimeError: If the exported documents differ from Prism's total
+    """
+    _, total = await client.list_documents_page(domain, limit=1, fields=["id"])
+    writer = DomainWriter(directory / domain_file(domain), domain)
+    try:
+        async for document in client.iter_documents(
+            domain, page_size=page_size, include_embeddings=include_embeddings
+        ):
+            if not include_embeddings:
+                document.pop("embedding", None)
+            writer.add(document)
+            if writer.pending >= BATCH_ROWS:
+                await asyncio.to_thread(writer.flush)
+        if total is not None and writer.documents != total:
+            raise RuntimeError(
+                f"Exported {writer.documents} documents from {domain} "
+                f"but Prism reported {total}"
+            )
+        entry = await asyncio.to_thread(writer.close)
+    except BaseException:
+        writer.abort()
+        raise
+    entry["total"] = total
+
+    logger.info(
+        f"Exported {entry['documents']} documents from {domain} "
+        f"({entry['embedded']} with embeddings, {entry['bytes']:,} bytes)"
+    )
+    return entry
+
+
+async def export_snapshot(
+    directory: Path,
+    domains: Optional[Sequence[str]] = None,
+    include_embeddings: bool = True,
+    concurrency: Optional[int] = None,
+    page_size: Optional[int] = None,
+    progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Export whole Prism domains into a snapshot directory.
+
+    Args:
+        directory: Snapshot directory (created if missing)
+        domains: Domains to export (default: default_domains())
+        include_embeddings: Store each document's vector for a fast restore
+        concurrency: Domains exported at once (default: from settings)
+        page_size: Documents per listing request (default: from settings)
+        progress_callback: Optional function(domain, manifest_entry) called
+            as each domain finishes
+
+    Returns:
+        The written manifest
+
+    Raises:
+        RuntimeError: If Prism is not reachable
+    """
+    domains = list(domains or default_domains())
+    directory.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency or settings.import_concurrency)
+
+    async with PrismClient() as client:
+        if not await client.check_health():
+            raise RuntimeError(
+                f"Prism service not accessible at {client.base_url}. "
+                "Ensure Prism is running: docker compose up -d prism"
+            )
+
+        async def run(domain: str) -> Dict[str, Any]:
+            async with semaphore:
+                entry = await export_domain(client, domain, directory, include_embeddings, page_size)
+            if entry["documents"] == 0:
+                logger.warning(f"Domain {domain} is empty")
+            if progress_callback:
+                progress_callback(domain, entry)
+            return entry
+
+        entries = await asyncio.gather(*(run(domain) for domain in domains))
+
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "prism_base_url": client.base_url,
+        "embedding_model": settings.embedding_model,
+        "domains": dict(zip(domains, entries)),
+    }
+    write_json(directory / MANIFEST_FILE, manifest, indent=2, separators=None)
+    return manifest
+
+
+def load_manifest(directory: Path) -> Dict[str, Any]:
+    """
+    Read a snapshot manifest.
+
+    Raises:
+        FileNotFoundError: If the directory holds no complete snapshot
+        ValueError: If the version is not supported
+    """
+    path = directory / MANIFEST_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"Snapshot not found: {path}. Run export-snapshot first.")
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {manifest.get('version')}")
+    return manifest
+
+
+def verify_snapshot(directory: Path, domains: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Check domain files against the manifest checksums and document counts.
+
+    Returns:
+        The manifest
+
+    Raises:
+        FileNotFoundError: If the snapshot or a domain file is missing
+        ValueError: If a domain is not in the snapshot, a file is corrupt or
+            a domain count differs from the total Prism reported at export
+    """
+    manifest = load_manifest(directory)
+    for domain in domains or manifest["domains"]:
+        entry = manifest["domains"].get(domain)
+        if entry is None:
+            raise ValueError(f"Domain {domain} is not in snapshot {directory}")
+        total = entry.get("total")
+        if total is not None and entry["documents"] != total:
+            raise ValueError(
+                f"Snapshot domain {domain} holds {entry['documents']} documents "
+                f"but Prism reported {total}"
+            )
+        path = directory / entry["file"]
+        if not path.exists():
+            raise FileNotFoundError(f"Snapshot file missing: {path}")
+        if sha256_file(path) != entry["sha256"]:
+            raise ValueError(f"Snapshot file {path} does not match its checksum")
+    return manifest
+
+
+def iter_snapshot_documents(
+    directory: Path,
+    domain: str,
+    include_embeddings: bool = True,
+    include_ids: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a domain's documents from a snapshot as Prism import documents.
+
+    The file is memory-mapped and decoded one record batch at a time.
+
+    Yields:
+        {"title", "content", "domain", "metadata"} plus "embedding" when
+        stored and include_embeddings is set, and the exported Prism ID
+        under "id" with include_ids
+    """
+    entry = load_manifest(directory)["domains"][domain]
+    columns = ["title", "content", "domain", "metadata"]
+    if include_embeddings:
+        columns.append("embedding")
+    if include_ids:
+        columns.append("id")
+
+    with pa.memory_map(str(directory / entry["file"]), "r") as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i).select(columns)
+            for row in batch.to_pylist():
+                document = {
+                    "title": row["title"],
+                    "content": row["content"],
+                    "domain": row["domain"],
+                    "metadata": json.loads(row["metadata"]),
+                }
+                if row.get("embedding") is not None:
+                    document["embedding"] = row["embedding"]
+                if row.get("id") is not None:
+                    document["id"] = row["id"]
+                yield document
+
+
+def local_id_files() -> List[Path]:
+    """
+    Local JSON files that store Prism document IDs.
+
+    The lexicon and spatial indexes, the map bundle and its cluster tiles,
+    the journeys artifact, the keyword index and the search cache.
+    """
+    paths = [
+        settings.lexicon_index_path,
+        settings.spatial_index_path,
+        settings.geography_bundle_path,
+        settings.journeys_path,
+        settings.keyword_index_dir / KEYS_FILE,
+        settings.search_cache_path,
+    ]
+    if settings.place_clusters_dir.is_dir():
+        paths.extend(sorted(settings.place_clusters_dir.rglob("*.json")))
+    return paths
+
+
+def _remap_value(value: Any, mapping: Dict[str, str]) -> int:
+    """Replace mapped IDs in "document_id" fields (strings or lists) in place."""
+    replaced = 0
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "document_id" and isinstance(item, str) and item in mapping:
+                value[key] = mapping[item]
+                replaced += 1
+            elif key == "document_id" and isinstance(item, list):
+                for i, document_id in enumerate(item):
+                    if isinstance(document_id, str) and document_id in mapping:
+                        item[i] = mapping[document_id]
+                        replaced += 1
+            else:
+                replaced += _remap_value(item, mapping)
+    elif isinstance(value, list):
+        for item in value:
+            replaced += _remap_value(item, mapping)
+    return replaced
+
+
+def remap_document_ids(mapping: Dict[str, str], paths: Sequence[Path]) -> Dict[str, int]:
+    """
+    Rewrite old -> new Prism document IDs in local JSON files.
+
+    Missing files are skipped; files are only rewritten (temp file +
+    rename) when an ID changed.
+
+    Returns:
+        {path: IDs replaced} for every rewritten file
+    """
+    remapped = {}
+    for path in paths:
+        if not path.exists():
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError as e:
+            logger.warning(f"Cannot remap document IDs in {path}: {e}")
+            continue
+        replaced = _remap_value(data, mapping)
+        if not replaced:
+            continue
+        write_json(path, data)
+        remapped[str(path)] = replaced
+    return remapped
+
+
+async def _check_stored_embeddings(domains: Sequence[str], sample_size: int = 20) -> List[str]:
+    """Domains whose first page comes back from Prism without vectors."""
+    missing = []
+    async with PrismClient() as client:
+        for domain in domains:
+            documents, _ = await client.list_documents_page(
+                domain, limit=sample_size, include_embeddings=True
+            )
+            if not documents or any(not document.get("embedding") for document in documents):
+                missing.append(domain)
+    return missing
+
+
+async def restore_snapshot(
+    directory: Path,
+    domains: Optional[Sequence[str]] = None,
+    batch_size: int = 100,
+    concurrency: Optional[int] = None,
+    reembed: bool = False,
+    progress_callback: Optional[Callable] = None,
+    id_files: Optional[Sequence[Path]] = None,
+) -> Dict[str, Any]:
+    """
+    Upload snapshot domains back into Prism.
+
+    Checksums are verified first. Domains where every document has a vector
+    are uploaded with their vectors and embed=False; the rest (or all of
+    them with reembed) are uploaded with embed=True. Each domain is one
+    stream of import_document_streams, so domains upload in parallel.
+    Prism reports documents that already exist (same title and domain) as
+    failed, so restore into an empty Prism.
+
+    The exported IDs of restored documents are then replaced by their new
+    IDs in id_files, and a page of every domain uploaded with embed=False is
+    checked for its vectors.
+
+    Args:
+        directory: Snapshot directory
+        domains: Domains to restore (default: all in the snapshot)
+        batch_size: Documents per batch (max 100)
+        concurrency: Concurrent upload requests (default: from settings)
+        reembed: Ignore stored vectors and let Prism embed again
+        progress_callback: Optional function(batch_num, total_batches, result)
+        id_files: Local files to remap document IDs in (default:
+            local_id_files())
+
+    Returns:
+        Aggregated results as import_document_streams, with per-domain
+        stats under "domains" (each with "embed": bool), the number of
+        remapped IDs per file under "remapped" and the local indexes that
+        must be rebuilt under "rebuild"
+
+    Raises:
+        RuntimeError: If Prism dropped the vectors uploaded with embed=False
+            (restore with reembed instead)
+    """
+    manifest = await asyncio.to_thread(verify_snapshot, directory, domains)
+    domains = list(domains or manifest["domains"])
+
+    def fully_embedded(domain: str) -> bool:
+        entry = manifest["domains"][domain]
+        return entry["documents"] > 0 and entry["embedded"] == entry["documents"]
+
+    with_vectors = [] if reembed else [domain for domain in domains if fully_embedded(domain)]
+    groups = (
+        (with_vectors, False),
+        ([domain for domain in domains if domain not in with_vectors], True),
+    )
+
+    results: Dict[str, Any] = {
+        "total_documents": 0,
+        "total_batches": 0,
+        "success_count": 0,
+        "error_count": 0,
+        "errors": [],
+        "domains": {},
+    }
+
+    # Title -> exported ID (None when a title occurs in several domains)
+    # and title -> new ID from the batch results
+    old_ids: Dict[str, Optional[str]] = {}
+    new_ids: Dict[str, str] = {}
+
+    def track_ids(documents: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for document in documents:
+            old_id = document.pop("id", None)
+            title = document["title"]
+            old_ids[title] = None if title in old_ids else old_id
+            yield document
+
+    def record_batch(batch_num, total_batches, result):
+        for doc_result in result.get("results", []):
+            if doc_result.get("title") and doc_result.get("document_id"):
+                new_ids[doc_result["title"]] = str(doc_result["document_id"])
+        if progress_callback:
+            progress_callback(batch_num, total_batches, result)
+
+    for group, embed in groups:
+        if not group:
+            continue
+        logger.info(f"Restoring {', '.join(group)} (embed={embed})")
+        group_results = await import_document_streams(
+            {
+                domain: track_ids(
+                    iter_snapshot_documents(directory, domain, include_embeddings=not embed, include_ids=True)
+                )
+                for domain in group
+            },
+            batch_size=batch_size,
+            embed=embed,
+            concurrency=concurrency,
+            progress_callback=record_batch,
+        )
+        for key in ("total_documents", "total_batches", "success_count", "error_count"):
+            results[key] += group_results[key]
+        results["errors"].extend(group_results["errors"])
+        for domain, stats in group_results["streams"].items():
+            results["domains"][domain] = {**stats, "embed": embed}
+
+    mapping = {
+        old_ids[title]: new_id
+        for title, new_id in new_ids.items()
+        if old_ids.get(title) and old_ids[title] != new_id
+    }
+    results["remapped"] = {}
+    if mapping:
+        results["remapped"] = await asyncio.to_thread(
+            remap_document_ids, mapping, local_id_files() if id_files is None else id_files
+        )
+    results["rebuild"] = (
+        ["vector index (build-vector-index)"]
+        if mapping and (settings.vector_index_dir / "index.json").exists()
+        else []
+    )
+    logger.info(f"Remapped {len(mapping)} document IDs in {len(results['remapped'])} local files")
+
+    restored = [domain for domain in with_vectors if results["domains"][domain]["success_count"]]
+    missing = await _check_stored_embeddings(restored)
+    if missing:
+        raise RuntimeError(
+            f"Prism did not keep the uploaded embeddings of {', '.join(missing)}; "
+            "delete those documents and run restore-snapshot --reembed"
+        )
+    return results
@@ -0,0 +1,354 @@
+"""Local spatial index over biblical places.
+
+Radius ("within 20 km of Jerusalem"), bounding-box (map viewport) and
+k-nearest queries are answered from a uniform latitude/longitude grid built
+from place_to_document output at import time. Places are stored sorted by
+grid cell, so each cell is a contiguous slice; coordinates are kept as
+integer 1e-5 degrees (about 1 m):
+
+    {"version": 1, "cell_size": 0.1,
+     "places": {"slug": [...], "name": [...], "lat": [...], "lon": [...],
+                "place_type": [...], "confidence_level": [...],
+                "document_id": [...]},
+     "cells": {"317,352": [start, end], ...}}
+
+A query touches only the cells overlapping its search area and compares
+exact great-circle distances for the places in them.
+
+Usage:
+    python cli.py import-geography      # writes the index
+    python cli.py places-near Jerusalem --radius 20
+    python cli.py places-within 31.0 34.5 32.0 35.5
+"""
+
+import heapq
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from atomic_files import write_json
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_CELL_SIZE = 0.1  # degrees (about 11 km north-south)
+COORDINATE_SCALE = 100_000  # stored coordinates are integer 1e-5 degrees
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Columns kept per place (besides coordinates)
+PLACE_FIELDS = ("slug", "name", "place_type", "confidence_level", "document_id")
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class SpatialIndex:
+    """Grid index answering radius, bounding-box and nearest-place queries."""
+
+    def __init__(self, path: Path, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Initialize index.
+
+        Args:
+            path: JSON file holding the index
+            cell_size: Grid cell size in degrees (used when building)
+        """
+        self.path = path
+        self.cell_size = cell_size
+        self.places: List[Dict[str, Any]] = []
+        self._lats: List[float] = []
+        self._lons: List[float] = []
+        self._cells: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._by_slug: Dict[str, int] = {}
+        self._by_name: Dict[str, int] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._titles: Dict[str, str] = {}  # document title -> slug
+
+    def load(self) -> "SpatialIndex":
+        """
+        Load the index from disk.
+
+        Raises:
+            FileNotFoundError: If geography has not been imported
+            ValueError: If the index version is not supported
+        """
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"Spatial index not found: {self.path}. Run import-geography first."
+            )
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported spatial index version: {data.get('version')}")
+
+        columns = data["places"]
+        self.cell_size = data["cell_size"]
+        self._lats = [value / COORDINATE_SCALE for value in columns["lat"]]
+        self._lons = [value / COORDINATE_SCALE for value in columns["lon"]]
+        self.places = [
+            {field: columns[field][row] for field in PLACE_FIELDS}
+            for row in range(len(self._lats))
+        ]
+        for row, place in enumerate(self.places):
+            place["latitude"] = self._lats[row]
+            place["longitude"] = self._lons[row]
+        self._cells = {
+            tuple(int(part) for part in key.split(",")): (start, end)
+            for key, (start, end) in data["cells"].items()
+        }
+        self._index_names()
+
+        logger.info(f"Loaded spatial index with {len(self.places)} places")
+        return self
+
+    def save(self) -> None:
+        """Write the index atomically (temp file + rename)."""
+        columns: Dict[str, List[Any]] = {field: [] for field in PLACE_FIELDS}
+        columns["lat"] = []
+        columns["lon"] = []
+        for row, place in enumerate(self.places):
+            for field in PLACE_FIELDS:
+                columns[field].append(place.get(field))
+            columns["lat"].append(round(self._lats[row] * COORDINATE_SCALE))
+            columns["lon"].append(round(self._lons[row] * COORDINATE_SCALE))
+
+        write_json(
+            self.path,
+            {
+                "version": INDEX_VERSION,
+                "cell_size": self.cell_size,
+                "places": columns,
+                "cells": {f"{i},{j}": list(span) for (i, j), span in self._cells.items()},
+            },
+        )
+        logger.info(f"Wrote spatial index with {len(self.places)} places to {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lon / self.cell_size)
+
+    def _index_names(self) -> None:
+        self._by_slug = {place["slug"]: row for row, place in enumerate(self.places)}
+        self._by_name = {}
+        for row, place in enumerate(self.places):
+            self._by_name.setdefault(place["name"].casefold(), row)
+
+    # -- Building -----------------------------------------------------------
+
+    def add_document(self, document: Dict[str, Any]) -> bool:
+        """
+        Record a converted place document.
+
+        Places without coordinates are skipped. Call build() when done.
+
+        Returns:
+            True if the place was added
+        """
+        metadata = document.get("metadata", {})
+        lat, lon = metadata.get("latitude"), metadata.get("longitude")
+        if lat is None or lon is None:
+            return False
+        slug = metadata.get("slug", document.get("title", ""))
+        self._pending[slug] = {
+            "slug": slug,
+            "name": metadata.get("place_name", slug),
+            "place_type": metadata.get("place_type"),
+            "confidence_level": metadata.get("confidence_level"),
+            "document_id": None,
+            "latitude": float(lat),
+            "longitude": float(lon),
+        }
+        self._titles[document.get("title", "")] = slug
+        return True
+
+    def record_batch_result(self, result: Dict[str, Any]) -> int:
+        """
+        Attach Prism document IDs from an import_corpus_batch response.
+
+        Returns:
+            Number of places that received a document ID
+        """
+        recorded = 0
+        for doc_result in result.get("results", []):
+            slug = self._titles.get(doc_result.get("title"))
+            if slug in self._pending and doc_result.get("document_id"):
+                self._pending[slug]["document_id"] = str(doc_result["document_id"])
+                recorded += 1
+        return recorded
+
+    def build(self) -> "SpatialIndex":
+        """Sort recorded places into grid cells."""
+        # Re-imports skip duplicates without reporting an ID; keep the old one
+        previous_ids = {place["slug"]: place.get("document_id") for place in self.places}
+        for slug, place in self._pending.items():
+            if place["document_id"] is None:
+                place["document_id"] = previous_ids.get(slug)
+
+        rows = sorted(
+            self._pending.values(),
+            key=lambda place: (self._cell(place["latitude"], place["longitude"]), place["slug"]),
+        )
+        self.places = rows
+        self._lats = [place["latitude"] for place in rows]
+        self._lons = [place["longitude"] for place in rows]
+        self._cells = {}
+        for row, place in enumerate(rows):
+            cell = self._cell(place["latitude"], place["longitude"])
+            start, _ = self._cells.get(cell, (row, row))
+            self._cells[cell] = (start, row + 1)
+        self._index_names()
+        return self
+
+    # -- Queries ------------------------------------------------------------
+
+    def find(self, place: str) -> Optional[Dict[str, Any]]:
+        """Look up a place by slug or (case-insensitive) name."""
+        row = self._by_slug.get(place)
+        if row is None:
+            row = self._by_name.get(place.strip().casefold())
+        return dict(self.places[row]) if row is not None else None
+
+    def _result(self, row: int, distance: Optional[float] = None) -> Dict[str, Any]:
+        result = dict(self.places[row])
+        if distance is not None:
+            result["distance_km"] = round(distance, 3)
+        return result
+
+    def _cells_in(self, lat_range: Tuple[int, int], lon_range: Tuple[int, int]) -> Iterable[Tuple[int, int]]:
+        """Row spans of occupied cells in an inclusive cell range."""
+        (i0, i1), (j0, j1) = lat_range, lon_range
+        span = (i1 - i0 + 1) * (j1 - j0 + 1)
+        if span > len(self._cells):
+            return [
+                rows for (i, j), rows in self._cells.items()
+                if i0 <= i <= i1 and j0 <= j <= j1
+            ]
+        return [
+            self._cells[(i, j)]
+            for i in range(i0, i1 + 1)
+            for j in range(j0, j1 + 1)
+            if (i, j) in self._cells
+        ]
+
+    def within_radius(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Places within a great-circle radius, nearest first.
+
+        Args:
+            lat: Centre latitude
+            lon: Centre longitude
+            radius_km: Search radius in kilometres
+            limit: Optional maximum number of places
+
+        Returns:
+            Place dicts with "distance_km"
+        """
+        lat_delta = radius_km / KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(89.9, abs(lat) + lat_delta)))
+        lon_delta = min(180.0, radius_km / (KM_PER_DEGREE * max(cos_lat, 1e-6)))
+        south, west = self._cell(lat - lat_delta, lon - lon_delta)
+        north, east = self._cell(lat + lat_delta, lon + lon_delta)
+
+        hits = []
+        for start, end in self._cells_in((south, north), (west, east)):
+            for row in range(start, end):
+                distance = haversine_km(lat, lon, self._lats[row], self._lons[row])
+                if distance <= radius_km:
+                    hits.append((distance, row))
+        hits.sort()
+        if limit is not None:
+            hits = hits[:limit]
+        return [self._result(row, distance) for distance, row in hits]
+
+    def within_bbox(self, south: float, west: float, north: float, east: float) -> List[Dict[str, Any]]:
+        """
+        Places inside a bounding box (e.g., a map viewport).
+
+        Raises:
+            ValueError: If south > north or west > east
+        """
+        if south > north or west > east:
+            raise ValueError(f"Invalid bounding box: {south}, {west}, {north}, {east}")
+        i0, j0 = self._cell(south, west)
+        i1, j1 = self._cell(north, east)
+
+        results = []
+        for start, end in self._cells_in((i0, i1), (j0, j1)):
+            for row in range(start, end):
+                if south <= self._lats[row] <= north and west <= self._lons[row] <= east:
+                    results.append(self._result(row))
+        return results
+
+    def nearest(self, lat: float, lon: float, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        The k places nearest to a point.
+
+        Scans rings of grid cells outward from the point's cell and stops
+        once no unscanned cell can hold a closer place. Once a ring would
+        cover more cells than are occupied, the remaining occupied cells
+        are scanned directly.
+
+        Returns:
+            Place dicts with "distance_km", nearest first
+        """
+        if not self._cells or k <= 0:
+            return []
+        ci, cj = self._cell(lat, lon)
+        best: List[Tuple[float, int]] = []  # max-heap of (-distance, row)
+
+        def scan(span: Tuple[int, int]) -> None:
+            for row in range(*span):
+                distance = haversine_km(lat, lon, self._lats[row], self._lons[row])
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, row))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, row))
+
+        ring = 0
+        while True:
+            if 8 * ring > len(self._cells):
+                for (i, j), span in self._cells.items():
+                    if max(abs(i - ci), abs(j - cj)) >= ring:
+                        scan(span)
+                break
+
+            if ring == 0:
+                ring_cells = [(ci, cj)]
+            else:
+                ring_cells = [(i, j) for i in (ci - ring, ci + ring) for j in range(cj - ring, cj + ring + 1)]
+                ring_cells += [(i, j) for j in (cj - ring, cj + ring) for i in range(ci - ring + 1, ci + ring)]
+            for cell in ring_cells:
+                span = self._cells.get(cell)
+                if span is not None:
+                    scan(span)
+
+            if len(best) == k:
+                # Any place in a further ring is at least `ring` cells away
+                # (east-west cells shrink with latitude)
+                edge_lat = min(89.9, abs(lat) + (ring + 1) * self.cell_size)
+                bound_km = ring * self.cell_size * KM_PER_DEGREE * math.cos(math.radians(edge_lat))
+                if -best[0][0] <= bound_km:
+                    break
+            ring += 1
+
+        return [self._result(row, -neg) for neg, row in sorted(best, reverse=True)]
@@ -0,0 +1,263 @@
+"""Verse-level Strong's concordance index.
+
+Answers "which verses use H7225" without scanning the SWORD modules. The index
+is built offline in one pass over WLC (OT) and SBLGNT (NT) and stored as:
+
+    postings.bin  - uint32 packed verse IDs, one sorted run per Strong's number
+    index.json    - Strong's number -> [offset, verse count, occurrences]
+
+Postings are canonical packed verse IDs (see verse_ids), sorted and
+de-duplicated per Strong's number, so each run is in canonical reading
+order whatever book order the module uses. postings.bin is memory-mapped on load; a lookup is a
+dict access plus a slice of the mapped array.
+
+Usage:
+    python cli.py build-strongs-index
+    python cli.py strongs-lookup H7225
+"""
+
+import json
+import logging
+import mmap
+import re
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lexicon_index import normalize_strongs
+from sword_parser import SwordParser
+from verse_ids import BOOKS, get_book, pack_verse_id, unpack_verse_id
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+POSTINGS_FILE = "postings.bin"
+KEYS_FILE = "index.json"
+
+# lemma="strong:H07225" or lemma="strong:H1254 strong:H9000"
+STRONGS_TOKEN_PATTERN = re.compile(r'strong:([HG])0*(\d+)')
+
+
+def _strongs_sort_key(strongs: str) -> Tuple[str, int]:
+    """Order by prefix, then numerically ("H", 7225)."""
+    return strongs[0], int(strongs[1:])
+
+
+def build_strongs_index(parser: SwordParser, output_dir: Path) -> Dict[str, int]:
+    """
+    Build the concordance index with one pass over each module.
+
+    Books are read in the module's own order (WLC follows the Leningrad
+    Codex, e.g. Chronicles after Malachi), so each posting list is sorted
+    and de-duplicated before it is written.
+
+    Args:
+        parser: Initialized SwordParser
+        output_dir: Directory to write postings.bin and index.json
+
+    Returns:
+        Statistics (verses, tagged_verses, strongs_numbers, postings, occurrences)
+    """
+    if parser.modules is None:
+        raise RuntimeError("SWORD modules not initialized. Call initialize() first.")
+
+    postings: Dict[str, array] = {}
+    occurrences: Counter = Counter()
+    stats = {"verses": 0, "tagged_verses": 0}
+
+    for module, testament in ((parser.wlc, "ot"), (parser.sblgnt, "nt")):
+        if module is None:
+            logger.warning(f"Skipping {testament.upper()}: module not loaded")
+            continue
+
+        for book in module.get_structure().get_books()[testament]:
+            book_id = get_book(book.name).id
+            refs = (
+                (chapter, verse)
+                for chapter, length in enumerate(book.chapter_lengths, start=1)
+                for verse in range(1, length + 1)
+            )
+            raw_verses = module.get_iter(books=[book.name], clean=False)
+
+            for (chapter, verse), raw_text in zip(refs, raw_verses):
+                stats["verses"] += 1
+                tokens = STRONGS_TOKEN_PATTERN.findall(raw_text or "")
+                if not tokens:
+                    continue
+                stats["tagged_verses"] += 1
+
+                verse_id = pack_verse_id(book_id, chapter, verse)
+                for prefix, number in tokens:
+                    strongs = prefix + number
+                    occurrences[strongs] += 1
+                    verse_ids = postings.setdefault(strongs, array("I"))
+                    if not verse_ids or verse_ids[-1] != verse_id:
+                        verse_ids.append(verse_id)
+
+            logger.debug(f"Indexed {book.name}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    offset = 0
+    with open(output_dir / POSTINGS_FILE, "wb") as f:
+        for strongs in sorted(postings, key=_strongs_sort_key):
+            verse_ids = array("I", sorted(set(postings[strongs])))
+            if sys.byteorder == "big":
+                verse_ids.byteswap()
+            verse_ids.tofile(f)
+            entries[strongs] = [offset, len(verse_ids), occurrences[strongs]]
+            offset += len(verse_ids)
+
+    with open(output_dir / KEYS_FILE, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": INDEX_VERSION,
+            "verses": stats["verses"],
+            "entries": entries,
+        }, f, separators=(",", ":"))
+
+    stats.update(
+        strongs_numbers=len(entries),
+        postings=offset,
+        occurrences=sum(occurrences.values()),
+    )
+    logger.info(
+        f"Built Strong's index: {stats['strongs_numbers']} numbers, "
+        f"{stats['postings']} verse postings → {output_dir}"
+    )
+    return stats
+
+
+class StrongsIndex:
+    """Read-only, memory-mapped view of a built concordance index."""
+
+    def __init__(self, index_dir: Path):
+        """
+        Initialize index reader.
+
+        Args:
+            index_dir: Directory containing postings.bin and index.json
+        """
+        self.index_dir = index_dir
+        self.entries: Dict[str, List[int]] = {}
+        self.verse_total = 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._postings: memoryview = memoryview(array("I"))
+
+    def load(self) -> "StrongsIndex":
+        """
+        Load the key table and memory-map the postings.
+
+        Raises:
+            FileNotFoundError: If the index has not been built
+            ValueError: If the index version is not supported
+        """
+        keys_path = self.index_dir / KEYS_FILE
+        if not keys_path.exists():
+            raise FileNotFoundError(
+                f"Strong's index not found: {keys_path}. Run build-strongs-index first."
+            )
+
+        with open(keys_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported Strong's index version: {data.get('version')}")
+
+        self.entries = data["entries"]
+        self.verse_total = data["verses"]
+
+        self._file = open(self.index_dir / POSTINGS_FILE, "rb")
+        # mmap cannot map an empty file (untagged modules give no postings)
+        if self.entries:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            postings = memoryview(self._mmap).cast("I")
+            if sys.byteorder == "big":
+                swapped = array("I", postings)
+                swapped.byteswap()
+                postings = memoryview(swapped)
+            self._postings = postings
+
+        logger.info(f"Loaded Strong's index with {len(self.entries)} numbers")
+        return self
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._postings.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "StrongsIndex":
+        return self.load()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, strongs: str) -> bool:
+        try:
+            return normalize_strongs(strongs) in self.entries
+        except ValueError:
+            return False
+
+    def verse_ids(self, strongs: str) -> List[int]:
+        """
+        Get packed verse IDs (ascending) for a Strong's number.
+
+        Returns:
+            List of packed verse IDs (empty if the number never occurs)
+        """
+        entry = self.entries.get(normalize_strongs(strongs))
+        if entry is None:
+            return []
+        offset, count, _ = entry
+        return self._postings[offset:offset + count].tolist()
+
+    def counts(self, strongs: str) -> Tuple[int, int]:
+        """Get (verse count, total occurrences) for a Strong's number."""
+        entry = self.entries.get(normalize_strongs(strongs))
+        if entry is None:
+            return 0, 0
+        return entry[1], entry[2]
+
+    def lookup(self, strongs: str, limit: Optional[int] = None) -> Dict:
+        """
+        Get the verses containing a Strong's number.
+
+        Args:
+            strongs: Strong's number (e.g., "H7225", "g3056")
+            limit: Maximum number of verses to return (default: all)
+
+        Returns:
+            Dictionary with strongs, verse_count, occurrences and a
+            "verses" list of {book, chapter, verse}
+        """
+        strongs = normalize_strongs(strongs)
+        verse_count, occurrences = self.counts(strongs)
+        verse_ids = self.verse_ids(strongs)
+        if limit is not None:
+            verse_ids = verse_ids[:limit]
+
+        verses = []
+        for verse_id in verse_ids:
+            book_id, chapter, verse = unpack_verse_id(verse_id)
+            verses.append({
+                "book": BOOKS[book_id - 1].display_name,
+                "chapter": chapter,
+                "verse": verse,
+            })
+
+        return {
+            "strongs": strongs,
+            "verse_count": verse_count,
+            "occurrences": occurrences,
+            "verses": verses,
+        }
@@ -14,9 +14,16 @@ from typing import Dict, List, Optional, Any
 
 from pysword.modules import SwordModules
 
+from verse_ids import get_book
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# OSIS word elements: <w lemma="strong:H7225" morph="HNcfsa">בְּרֵאשִׁית</w>
+WORD_ELEMENT_PATTERN = re.compile(r'<w\b([^>]*)>(.*?)</w>', re.DOTALL)
+LEMMA_ATTR_PATTERN = re.compile(r'lemma="strong:([HG]\d+)')
+MORPH_ATTR_PATTERN = re.compile(r'morph="(?:\w+:)?([^"]+)"')
+
 
 class SwordParser:
     """Parser for SWORD Bible modules (Hebrew OT, Greek NT)."""
@@ -145,6 +152,25 @@ class SwordParser:
 
         return book_name
 
+    def sword_book_name(self, book_name: str) -> str:
+        """
+        Resolve a book name to the name passed to pysword.
+
+        pysword only matches its own names ("I Samuel"), OSIS IDs and preferred
+        abbreviations, so "1 Samuel" would not be found. The OSIS ID is used
+        for every book that verse_ids recognizes.
+
+        Args:
+            book_name: Book name in any accepted form
+
+        Returns:
+            OSIS book ID (e.g., "1Sam"), or the normalized name if unrecognized
+        """
+        book = get_book(book_name)
+        if book is None:
+            return self.normalize_book_name(book_name)
+        return book.osis
+
     def get_testament(self, book_name: str) -> str:
         """
         Determine if book is Old Testament or New Testament.
@@ -280,7 +306,7 @@ class SwordParser:
         try:
             # pysword returns raw text with OSIS markup
             raw_text = module.get(
-                books=[normalized_book],
+                books=[self.sword_book_name(normalized_book)],
                 chapters=[chapter],
                 verses=[verse]
             )
@@ -314,6 +340,106 @@ class SwordParser:
             )
             return None
 
+    def _select_module(self, book: str) -> Optional[tuple]:
+        """
+        Resolve a book to its SWORD module.
+
+        Args:
+            book: Book name (will be normalized)
+
+        Returns:
+            Tuple of (module, language, sword_book), or None if the book
+            is unknown or its module is not loaded
+
+        Raises:
+            RuntimeError: If modules not initialized
+        """
+        if self.modules is None:
+            raise RuntimeError("SWORD modules not initialized. Call initialize() first.")
+
+        normalized_book = self.normalize_book_name(book)
+
+        try:
+            testament = self.get_testament(normalized_book)
+        except ValueError as e:
+            logger.error(f"Cannot determine testament for {book}: {e}")
+            return None
+
+        module = self.wlc if testament == "OT" else self.sblgnt
+        if module is None:
+            logger.warning(f"{'WLC' if testament == 'OT' else 'SBLGNT'} module not loaded")
+            return None
+
+        language = "hebrew" if testament == "OT" else "greek"
+        return module, language, self.sword_book_name(normalized_book)
+
+    def get_verse_words(
+        self,
+        book: str,
+        chapter: int,
+        verse: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get word-level original text for a single verse (interlinear display).
+
+        Reads the verse with OSIS markup intact and splits it into <w> elements,
+        keeping lemma (Strong's) and morph attributes for each word. Modules
+        without word tagging fall back to whitespace tokenization.
+
+        Args:
+            book: Book name (will be normalized)
+            chapter: Chapter number
+            verse: Verse number
+
+        Returns:
+            Dictionary with language and words list, or None if verse not found
+
+        Raises:
+            RuntimeError: If modules not initialized
+        """
+        selected = self._select_module(book)
+        if selected is None:
+            return None
+        module, language, normalized_book = selected
+
+        try:
+            raw_text = module.get(
+                books=[normalized_book],
+                chapters=[chapter],
+                verses=[verse],
+                clean=False,
+            )
+        except Exception as e:
+            logger.error(f"Error fetching {normalized_book} {chapter}:{verse}: {e}")
+            return None
+
+        if not raw_text:
+            return None
+
+        words = []
+        for match in WORD_ELEMENT_PATTERN.finditer(raw_text):
+            attrs, inner = match.groups()
+            original = self._clean_sword_markup(inner)
+            if not original:
+                continue
+            lemma = LEMMA_ATTR_PATTERN.search(attrs)
+            morph = MORPH_ATTR_PATTERN.search(attrs)
+            word = {"original": original}
+            if lemma:
+                word["strongs"] = lemma.group(1)
+            if morph:
+                word["morphology"] = morph.group(1)
+            words.append(word)
+
+        if not words:
+            words = [
+                {"original": token}
+                for token in self._clean_sword_markup(raw_text).split(" ")
+                if token
+            ]
+
+        return {"language": language, "words": words}
+
     def get_chapter_verses(
         self,
         book: str,
@@ -346,6 +472,110 @@ class SwordParser:
 
         return results
 
+    def get_verse_range(
+        self,
+        book: str,
+        chapter: int,
+        verse_start: int = 1,
+        verse_end: Optional[int] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get original texts for a verse range with a single module read.
+
+        Unlike get_chapter_verses(), the range is clamped to the chapter length
+        from the module's versification and decoded in one pysword call.
+
+        Args:
+            book: Book name (will be normalized)
+            chapter: Chapter number
+            verse_start: Starting verse (default: 1)
+            verse_end: Ending verse (default: end of chapter)
+
+        Returns:
+            Dictionary mapping verse numbers to verse data (empty if the
+            chapter does not exist)
+
+        Raises:
+            RuntimeError: If modules not initialized
+        """
+        selected = self._select_module(book)
+        if selected is None:
+            return {}
+        module, language, normalized_book = selected
+
+        if chapter < 1:
+            return {}
+
+        try:
+            _, book_structure = module.get_structure().find_book(normalized_book)
+            chapter_length = book_structure.chapter_lengths[chapter - 1]
+        except (ValueError, IndexError) as e:
+            logger.warning(f"No chapter {normalized_book} {chapter}: {e}")
+            return {}
+
+        verse_start = max(verse_start, 1)
+        verse_end = chapter_length if verse_end is None else min(verse_end, chapter_length)
+        if verse_start > verse_end:
+            return {}
+
+        verse_numbers = list(range(verse_start, verse_end + 1))
+        try:
+            raw_verses = list(module.get_iter(
+                books=[normalized_book],
+                chapters=[chapter],
+                verses=verse_numbers,
+                clean=False,
+            ))
+        except Exception as e:
+            logger.error(
+                f"Error fetching {normalized_book} {chapter}:{verse_start}-{verse_end}: {e}"
+            )
+            return {}
+
+        results = {}
+        for verse, raw_text in zip(verse_numbers, raw_verses):
+            if not raw_text:
+                continue
+            result = {
+                "original_text": self._clean_sword_markup(raw_text),
+                "language": language,
+            }
+            strongs = self._extract_strongs_numbers(raw_text)
+            if strongs:
+                result["strongs_numbers"] = strongs
+            results[verse] = result
+
+        return results
+
+    def get_verses(
+        self,
+        references: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """
+        Get original texts for many references in one call.
+
+        Args:
+            references: List of (book, chapter, verse_start, verse_end) tuples;
+                verse_end may be None for "to end of chapter"
+
+        Returns:
+            One dict per reference, in order, with book, chapter, verse_start,
+            verse_end and a "verses" list of verse data (each with its verse number)
+        """
+        results = []
+        for book, chapter, verse_start, verse_end in references:
+            verses = self.get_verse_range(book, chapter, verse_start, verse_end)
+            results.append({
+                "book": book,
+                "chapter": chapter,
+                "verse_start": verse_start,
+                "verse_end": max(verses) if verse_end is None and verses else verse_end,
+                "verses": [
+                    {**data, "verse": verse} for verse, data in sorted(verses.items())
+                ],
+            })
+        return results
+
 
 def verify_book_normalization() -> Dict[str, str]:
     """
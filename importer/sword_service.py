@@ -0,0 +1,530 @@
+"""Async HTTP service for SWORD original-text lookups.
+
+Serves the `/api/sword/*` endpoints used by the UI (ui/src/lib/api/sword.ts)
+from a single SwordParser instance that is loaded once at startup.
+
+Original texts never change between module releases, so every response is
+rendered once, kept in an in-memory LRU cache and served with a strong ETag
+and a long Cache-Control max-age. Parser calls are blocking (pysword reads and
+decompresses module blocks), so they run in a worker thread behind a lock to
+keep the event loop free for cached responses.
+
+Run with:
+    python cli.py serve-sword --port 8200
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from config import settings
+from strongs_index import StrongsIndex, normalize_strongs
+from sword_parser import SwordParser
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+LANGUAGE_TESTAMENTS = {"hebrew": "OT", "greek": "NT"}
+
+# "Genesis 1", "1 John 3:16", "Psalms 23:1-6"
+RANGE_REFERENCE_PATTERN = re.compile(r"^(.+?)\s+(\d+)(?::(\d+)(?:-(\d+))?)?$")
+
+
+class ResponseCache:
+    """Bounded LRU cache of rendered response bodies and their ETags."""
+
+    def __init__(self, max_size: int = 20000):
+        """
+        Initialize response cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple, Tuple[bytes, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Tuple[bytes, str]]:
+        """Return (body, etag) for key, or None if not cached."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Tuple, payload: Any) -> Tuple[bytes, str]:
+        """Render payload to JSON, store it and return (body, etag)."""
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self._entries[key] = (body, etag)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return body, etag
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SwordService:
+    """Request handlers wrapping one shared SwordParser."""
+
+    def __init__(
+        self,
+        parser: SwordParser,
+        cache_size: int = 20000,
+        max_age: int = 86400,
+        max_batch_size: int = 500,
+        strongs_index: Optional[StrongsIndex] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            parser: SwordParser (initialized at startup if not already)
+            cache_size: Maximum number of cached responses
+            max_age: Cache-Control max-age in seconds
+            max_batch_size: Maximum verses per batch request
+            strongs_index: Concordance index (loaded at startup if built)
+        """
+        self.parser = parser
+        self.cache = ResponseCache(max_size=cache_size)
+        self.max_age = max_age
+        self.max_batch_size = max_batch_size
+        self._parser_lock = threading.Lock()
+        self.strongs_index = strongs_index
+        self._strongs_loaded = False
+
+    def startup(self) -> None:
+        """Load SWORD modules once (no-op if already loaded)."""
+        if self.parser.modules is None:
+            self.parser.initialize()
+        logger.info(
+            f"SWORD service ready (WLC: {self.parser.wlc is not None}, "
+            f"SBLGNT: {self.parser.sblgnt is not None})"
+        )
+        if self.strongs_index is not None:
+            try:
+                self.strongs_index.load()
+                self._strongs_loaded = True
+            except FileNotFoundError as e:
+                logger.warning(f"Strong's lookups disabled: {e}")
+
+    def shutdown(self) -> None:
+        """Release the concordance index."""
+        if self._strongs_loaded:
+            self.strongs_index.close()
+            self._strongs_loaded = False
+
+    # ------------------------------------------------------------------
+    # Lookups (blocking; run in threadpool)
+    # ------------------------------------------------------------------
+
+    def _lookup_verse(self, language: Optional[str], book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """Fetch one verse and shape it like the UI's VerseText."""
+        testament = LANGUAGE_TESTAMENTS.get(language) if language else None
+        with self._parser_lock:
+            data = self.parser.get_verse_text(book, chapter, verse, testament=testament)
+        if data is None:
+            return None
+        return {**data, "book": book, "chapter": chapter, "verse": verse}
+
+    def _lookup_interlinear(self, book: str, chapter: int, verse: int) -> Optional[Dict[str, Any]]:
+        """Fetch one verse word-by-word and shape it like the UI's InterlinearVerse."""
+        with self._parser_lock:
+            data = self.parser.get_verse_words(book, chapter, verse)
+        if data is None:
+            return None
+        words = [
+            {
+                "original": word["original"],
+                "transliteration": word.get("transliteration", ""),
+                "gloss": word.get("gloss", ""),
+                **({"strongs": word["strongs"]} if "strongs" in word else {}),
+                **({"morphology": word["morphology"]} if "morphology" in word else {}),
+            }
+            for word in data["words"]
+        ]
+        return {
+            "book": book,
+            "chapter": chapter,
+            "verse": verse,
+            "language": data["language"],
+            "words": words,
+        }
+
+    def _lookup_chapter(self, book: str, chapter: int, verse_start: int, verse_end: Optional[int]) -> Dict[str, Any]:
+        """Fetch a verse range within one chapter."""
+        with self._parser_lock:
+            verses = self.parser.get_verse_range(book, chapter, verse_start, verse_end)
+        return {
+            "book": book,
+            "chapter": chapter,
+            "verses": [
+                {**data, "book": book, "chapter": chapter, "verse": verse}
+                for verse, data in sorted(verses.items())
+            ],
+        }
+
+    def _lookup_range(self, book: str, chapter: int, verse_start: int, verse_end: Optional[int]) -> Dict[str, Any]:
+        """Fetch a verse range with one module read."""
+        with self._parser_lock:
+            result = self.parser.get_verses([(book, chapter, verse_start, verse_end)])[0]
+        for verse_data in result["verses"]:
+            verse_data.update(book=book, chapter=chapter)
+        return result
+
+    def _lookup_strongs(self, strongs: str, limit: Optional[int]) -> Dict[str, Any]:
+        """Fetch concordance verses for one Strong's number."""
+        return self.strongs_index.lookup(strongs, limit=limit)
+
+    # ------------------------------------------------------------------
+    # Response helpers
+    # ------------------------------------------------------------------
+
+    async def _respond(self, request: Request, key: Tuple, lookup, *args) -> Response:
+        """
+        Serve a cached rendering of lookup(*args), honoring If-None-Match.
+
+        Returns 404 when the lookup yields None (nothing is cached in that case).
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            payload = await run_in_threadpool(lookup, *args)
+            if payload is None:
+                return JSONResponse({"error": "Verse not found"}, status_code=404)
+            entry = self.cache.put(key, payload)
+
+        body, etag = entry
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    async def health(self, request: Request) -> Response:
+        """Health check with module and cache status."""
+        return JSONResponse({
+            "status": "healthy",
+            "modules": {
+                "WLC": self.parser.wlc is not None,
+                "SBLGNT": self.parser.sblgnt is not None,
+            },
+            "strongs_index": self._strongs_loaded,
+            "cache": {
+                "entries": len(self.cache),
+                "hits": self.cache.hits,
+                "misses": self.cache.misses,
+            },
+        })
+
+    async def verse(self, request: Request) -> Response:
+        """Original text for one verse (/hebrew or /greek, GET or POST)."""
+        language = request.path_params["language"]
+        if language not in LANGUAGE_TESTAMENTS:
+            return JSONResponse({"error": f"Unknown language: {language}"}, status_code=404)
+        ref, error = await _read_reference(request)
+        if error:
+            return error
+        book, chapter, verse = ref
+        return await self._respond(
+            request, ("verse", language, book, chapter, verse),
+            self._lookup_verse, language, book, chapter, verse,
+        )
+
+    async def interlinear(self, request: Request) -> Response:
+        """Word-level original text for one verse (GET or POST)."""
+        ref, error = await _read_reference(request)
+        if error:
+            return error
+        book, chapter, verse = ref
+        return await self._respond(
+            request, ("interlinear", book, chapter, verse),
+            self._lookup_interlinear, book, chapter, verse,
+        )
+
+    async def chapter(self, request: Request) -> Response:
+        """Original text for a verse range within a chapter (GET or POST)."""
+        if request.method == "POST":
+            body, error = await _read_json(request)
+            if error:
+                return error
+            params = body
+        else:
+            params = {**request.path_params, **request.query_params}
+
+        try:
+            book = str(params["book"])
+            chapter = int(params["chapter"])
+            verse_start = int(params.get("verse_start", params.get("start", 1)))
+            verse_end = params.get("verse_end", params.get("end"))
+            verse_end = int(verse_end) if verse_end is not None else None
+        except (KeyError, TypeError, ValueError):
+            return JSONResponse(
+                {"error": "Expected book, chapter and optional verse_start/verse_end"},
+                status_code=400,
+            )
+
+        return await self._respond(
+            request, ("chapter", book, chapter, verse_start, verse_end),
+            self._lookup_chapter, book, chapter, verse_start, verse_end,
+        )
+
+    async def strongs(self, request: Request) -> Response:
+        """Verses containing a Strong's number (GET, optional ?limit=)."""
+        if not self._strongs_loaded:
+            return JSONResponse(
+                {"error": "Strong's index not built (run build-strongs-index)"},
+                status_code=503,
+            )
+        try:
+            strongs = normalize_strongs(request.path_params["strongs"])
+            limit = request.query_params.get("limit")
+            limit = int(limit) if limit is not None else None
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+
+        return await self._respond(
+            request, ("strongs", strongs, limit),
+            self._lookup_strongs, strongs, limit,
+        )
+
+    async def batch(self, request: Request) -> Response:
+        """
+        Original text for many verses or verse ranges in one request.
+
+        Body (either form):
+            {"verses": [{"book": str, "chapter": int, "verse": int}, ...]}
+            {"references": ["Genesis 1", "John 3:16-18",
+                            {"book": str, "chapter": int,
+                             "verse_start": int, "verse_end": int}, ...]}
+
+        Response: {"results": [...]} in request order. For "verses" each item
+        is a VerseText or null; for "references" each item is a range object
+        with a "verses" list (empty if nothing was found).
+        """
+        body, error = await _read_json(request)
+        if error:
+            return error
+
+        if "references" in body:
+            items, parse = body["references"], _parse_range
+        else:
+            items, parse = body.get("verses"), _parse_reference
+
+        if not isinstance(items, list):
+            return JSONResponse(
+                {"error": "Expected 'verses' or 'references' list"}, status_code=400
+            )
+        if len(items) > self.max_batch_size:
+            return JSONResponse(
+                {"error": f"Batch size {len(items)} exceeds maximum of {self.max_batch_size}"},
+                status_code=400,
+            )
+
+        refs = []
+        for item in items:
+            ref = parse(item)
+            if ref is None:
+                return JSONResponse(
+                    {"error": f"Invalid verse reference: {item!r}"}, status_code=400
+                )
+            refs.append(ref)
+
+        if parse is _parse_range:
+            keys = [("range", *ref) for ref in refs]
+            lookup = self._lookup_range
+        else:
+            keys = [("verse", None, *ref) for ref in refs]
+            lookup = lambda *ref: self._lookup_verse(None, *ref)
+
+        bodies: List[Optional[bytes]] = []
+        missing = []
+        for index, key in enumerate(keys):
+            entry = self.cache.get(key)
+            bodies.append(entry[0] if entry else None)
+            if entry is None:
+                missing.append(index)
+
+        if missing:
+            fetched = await run_in_threadpool(
+                lambda: [lookup(*refs[i]) for i in missing]
+            )
+            for index, payload in zip(missing, fetched):
+                if payload is not None:
+                    bodies[index] = self.cache.put(keys[index], payload)[0]
+
+        # Splice cached JSON bodies instead of re-encoding them
+        body = b'{"results":[' + b",".join(b or b"null" for b in bodies) + b"]}"
+        return Response(body, media_type="application/json")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _parse_reference(data: Any) -> Optional[Tuple[str, int, int]]:
+    """Extract (book, chapter, verse) from a mapping, or None if invalid."""
+    try:
+        return str(data["book"]), int(data["chapter"]), int(data["verse"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _parse_range(data: Any) -> Optional[Tuple[str, int, int, Optional[int]]]:
+    """
+    Extract (book, chapter, verse_start, verse_end) from a reference.
+
+    Accepts strings ("Genesis 1", "John 3:16", "John 3:16-18") or mappings with
+    book, chapter and optional verse / verse_start / verse_end. A missing end
+    means "to the end of the chapter" for whole-chapter references.
+    """
+    if isinstance(data, str):
+        match = RANGE_REFERENCE_PATTERN.match(data.strip())
+        if not match:
+            return None
+        book, chapter, start, end = match.groups()
+        if start is None:
+            return book, int(chapter), 1, None
+        return book, int(chapter), int(start), int(end or start)
+
+    if not isinstance(data, dict):
+        return None
+    try:
+        book, chapter = str(data["book"]), int(data["chapter"])
+        if "verse" in data:
+            verse = int(data["verse"])
+            return book, chapter, verse, verse
+        start = int(data.get("verse_start", 1))
+        end = data.get("verse_end")
+        return book, chapter, start, int(end) if end is not None else None
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def _read_json(request: Request) -> Tuple[Dict[str, Any], Optional[Response]]:
+    """Decode a JSON object body, returning (body, error_response)."""
+    try:
+        body = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}, JSONResponse({"error": "Invalid JSON body"}, status_code=400)
+    if not isinstance(body, dict):
+        return {}, JSONResponse({"error": "Expected JSON object"}, status_code=400)
+    return body, None
+
+
+async def _read_reference(request: Request) -> Tuple[Optional[Tuple[str, int, int]], Optional[Response]]:
+    """Read (book, chapter, verse) from path params (GET) or JSON body (POST)."""
+    if request.method == "POST":
+        body, error = await _read_json(request)
+        if error:
+            return None, error
+        source = body
+    else:
+        source = request.path_params
+
+    ref = _parse_reference(source)
+    if ref is None:
+        return None, JSONResponse(
+            {"error": "Expected book, chapter and verse"}, status_code=400
+        )
+    return ref, None
+
+
+def create_app(
+    parser: Optional[SwordParser] = None,
+    modules_dir: Optional[Path] = None,
+    cache_size: Optional[int] = None,
+    max_age: Optional[int] = None,
+    strongs_index_dir: Optional[Path] = None,
+) -> Starlette:
+    """
+    Build the SWORD service ASGI application.
+
+    Args:
+        parser: Pre-built SwordParser (default: new parser over modules_dir)
+        modules_dir: SWORD modules directory (default: from settings)
+        cache_size: Response cache size (default: from settings)
+        max_age: Cache-Control max-age in seconds (default: from settings)
+        strongs_index_dir: Concordance index directory (default: from settings)
+
+    Returns:
+        Starlette application
+    """
+    if parser is None:
+        parser = SwordParser(modules_dir=modules_dir or settings.sword_modules_dir)
+
+    service = SwordService(
+        parser,
+        cache_size=cache_size if cache_size is not None else settings.sword_cache_size,
+        max_age=max_age if max_age is not None else settings.sword_cache_max_age,
+        max_batch_size=settings.sword_max_batch_size,
+        strongs_index=StrongsIndex(strongs_index_dir or settings.strongs_index_dir),
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        await run_in_threadpool(service.startup)
+        yield
+        service.shutdown()
+
+    routes = [
+        Route("/health", service.health, methods=["GET"]),
+        Route("/api/sword/batch", service.batch, methods=["POST"]),
+        Route("/api/sword/interlinear", service.interlinear, methods=["POST"]),
+        Route(
+            "/api/sword/interlinear/{book}/{chapter:int}/{verse:int}",
+            service.interlinear,
+            methods=["GET"],
+        ),
+        Route("/api/sword/strongs/{strongs}", service.strongs, methods=["GET"]),
+        Route("/api/sword/chapter", service.chapter, methods=["POST"]),
+        Route("/api/sword/chapter/{book}/{chapter:int}", service.chapter, methods=["GET"]),
+        Route("/api/sword/{language:str}", service.verse, methods=["POST"]),
+        Route(
+            "/api/sword/{language:str}/{book}/{chapter:int}/{verse:int}",
+            service.verse,
+            methods=["GET"],
+        ),
+    ]
+
+    middleware = [
+        Middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_methods=["GET", "POST"],
+            allow_headers=["Content-Type", "If-None-Match"],
+            expose_headers=["ETag"],
+        ),
+    ]
+
+    app = Starlette(routes=routes, middleware=middleware, lifespan=lifespan)
+    app.state.service = service
+    return app
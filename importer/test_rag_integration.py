@@ -7,7 +7,7 @@ for lexicon, book metadata, and Bible verses.
 import asyncio
 import sys
 from typing import Dict, List, Any
-from prism_client import PrismClient
+from prism_client import PrismClient, default_search_cache
 
 
 async def test_domain_coverage():
@@ -16,7 +16,7 @@ async def test_domain_coverage():
     print("TEST 1: Domain Coverage")
     print("=" * 60)
 
-    async with PrismClient() as client:
+    async with PrismClient(search_cache=default_search_cache()) as client:
         stats = await client.get_stats()
 
         print(f"\n📊 Overall Statistics:")
@@ -62,14 +62,12 @@ async def test_lexicon_search():
         ("holy sanctified set apart", ["H6944", "G40"]),  # qodesh, hagios
     ]
 
-    async with PrismClient() as client:
-        for query, expected_ids in test_queries:
+    async with PrismClient(search_cache=default_search_cache()) as client:
+        all_results = await client.search_many(
+            [query for query, _ in test_queries], domain="lexicon/strongs", top_k=3
+        )
+        for (query, expected_ids), results in zip(test_queries, all_results):
             print(f"\n🔍 Query: '{query}'")
-            results = await client.search_documents(
-                query=query,
-                domain="lexicon/strongs",
-                top_k=3
-            )
 
             if results.get("results"):
                 for i, result in enumerate(results["results"][:3], 1):
@@ -102,14 +100,12 @@ async def test_book_metadata_search():
         ("wisdom proverbs practical living", ["Proverbs", "Ecclesiastes"]),
     ]
 
-    async with PrismClient() as client:
-        for query, expected_books in test_queries:
+    async with PrismClient(search_cache=default_search_cache()) as client:
+        all_results = await client.search_many(
+            [query for query, _ in test_queries], domain="metadata/books", top_k=3
+        )
+        for (query, expected_books), results in zip(test_queries, all_results):
             print(f"\n🔍 Query: '{query}'")
-            results = await client.search_documents(
-                query=query,
-                domain="metadata/books",
-                top_k=3
-            )
 
             if results.get("results"):
                 for i, result in enumerate(results["results"][:3], 1):
@@ -141,7 +137,7 @@ async def test_mixed_domain_context():
         "Where does Jesus teach about faith and works?",
     ]
 
-    async with PrismClient() as client:
+    async with PrismClient(search_cache=default_search_cache()) as client:
         for query in test_queries:
             print(f"\n🔍 Query: '{query}'")
 
@@ -201,7 +197,7 @@ async def test_search_quality_metrics():
         ("shepherd psalm", "bible/kjv", 0.6),  # Should find Psalm 23
     ]
 
-    async with PrismClient() as client:
+    async with PrismClient(search_cache=default_search_cache()) as client:
         passed = 0
         failed = 0
 
@@ -238,7 +234,7 @@ async def test_verse_with_enrichment():
     print("TEST 6: Verse Metadata Enrichment")
     print("=" * 60)
 
-    async with PrismClient() as client:
+    async with PrismClient(search_cache=default_search_cache()) as client:
         # Get a sample of KJV verses
         response = await client.client.get(
             "/api/v1/documents",
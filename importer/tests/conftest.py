@@ -2,7 +2,7 @@
 
 import sys
 from pathlib import Path
-from typing import AsyncGenerator, Dict, List
+from typing import AsyncGenerator, Callable, Dict, List
 from unittest.mock import AsyncMock
 
 import httpx
@@ -13,8 +13,10 @@ import pytest_asyncio
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from csv_parser import BibleVerse
+from geography_importer import GeographyImporter
 from prism_client import PrismClient
 from config import BibleImporterSettings
+from verse_ids import format_verse_id
 
 
 @pytest.fixture
@@ -263,3 +265,31 @@ def oversized_verse() -> BibleVerse:
         verse=1,
         text=long_text,
     )
+
+
+@pytest.fixture
+def place_document(tmp_path: Path) -> Callable[..., Dict]:
+    """
+    Factory for geography documents converted from OpenBible place entries.
+
+    place_document(slug, name, lat=None, lon=None, verse_ids=(),
+    place_type="settlement", votes=800); places without lat/lon have no
+    coordinates.
+    """
+    importer = GeographyImporter(data_dir=tmp_path)
+
+    def make(slug, name, lat=None, lon=None, verse_ids=(), place_type="settlement", votes=800):
+        resolutions = [{"lonlat": f"{lon},{lat}"}] if lat is not None else []
+        entry = {
+            "friendly_id": name,
+            "url_slug": slug,
+            "types": [place_type],
+            "identifications": [{"resolutions": resolutions, "score": {"vote_total": votes}}],
+            "verses": [
+                {"osis": format_verse_id(verse_id, "osis"), "readable": format_verse_id(verse_id)}
+                for verse_id in verse_ids
+            ],
+        }
+        return importer.place_to_document(entry)
+
+    return make
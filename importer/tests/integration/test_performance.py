@@ -0,0 +1,71 @@
+"""
+Performance tests for the offline scanners and indexes.
+
+Wall-clock throughput checks kept out of the unit suite; they need no
+Prism but depend on the machine they run on.
+"""
+
+import random
+import time
+
+import pytest
+
+from reference_parser import REFERENCE_PATTERN, find_references
+from spatial_index import SpatialIndex
+
+
+@pytest.mark.slow
+def test_reference_scan_throughput():
+    """The citation scan runs at millions of characters per second."""
+    text = (
+        "And the LORD spake unto Moses, saying, Speak unto the children of "
+        "Israel (see Exodus 3:14 and 1 John 4:8-10). "
+    ) * 20000
+    REFERENCE_PATTERN.search(text)  # warm up
+
+    started = time.perf_counter()
+    matches = find_references(text)
+    elapsed = time.perf_counter() - started
+
+    assert len(matches) == 40000
+    assert len(text) / elapsed > 1_000_000
+
+
+@pytest.mark.slow
+def test_spatial_query_latency(place_document):
+    """Radius queries over 1,500 places take well under a millisecond."""
+    rng = random.Random(3)
+    index = SpatialIndex(None)
+    for i in range(1500):
+        index.add_document(place_document(f"p{i}", f"P{i}", rng.uniform(29, 34), rng.uniform(33, 37)))
+    index.build()
+
+    started = time.perf_counter()
+    for _ in range(1000):
+        index.within_radius(31.7767, 35.2345, 20)
+    assert (time.perf_counter() - started) / 1000 < 0.001
+
+
+@pytest.mark.slow
+def test_vector_query_throughput(tmp_path):
+    """Thousands of queries per second on a Bible-sized index."""
+    np = pytest.importorskip("numpy")
+    from vector_index import VectorIndex, build_vector_index
+
+    rng = np.random.default_rng(0)
+    count, dimension = 40_000, 384
+    vectors = rng.normal(size=(count, dimension)).astype(np.float32)
+    build_vector_index(
+        ({"document_title": str(i), "domain": "bible/kjv", "embedding": vectors[i]} for i in range(count)),
+        tmp_path,
+        iterations=5,
+    )
+    queries = rng.normal(size=(500, dimension)).astype(np.float32)
+
+    with VectorIndex(tmp_path, nprobe=4) as index:
+        started = time.perf_counter()
+        for query in queries:
+            index.search_rows(query, top_k=10)
+        elapsed = time.perf_counter() - started
+
+    assert len(queries) / elapsed > 1000
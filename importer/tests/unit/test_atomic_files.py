@@ -0,0 +1,45 @@
+"""Unit tests for atomic file writes and checksums."""
+
+import hashlib
+import json
+
+import pytest
+
+from atomic_files import atomic_path, sha256_file, write_json
+
+
+def test_write_json(tmp_path):
+    """JSON is compact UTF-8 by default, the directory is created and the size returned."""
+    path = tmp_path / "nested" / "data.json"
+    size = write_json(path, {"name": "Bethlehem", "hebrew": "בֵּית לֶחֶם"})
+
+    assert path.read_text(encoding="utf-8") == '{"name":"Bethlehem","hebrew":"בֵּית לֶחֶם"}'
+    assert size == path.stat().st_size
+    assert not list(path.parent.glob("*.tmp"))
+
+    write_json(path, {"a": 1}, indent=2, separators=None)
+    assert path.read_text() == '{\n  "a": 1\n}'
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    """A write that raises removes its temp file and leaves the old file in place."""
+    path = tmp_path / "data.json"
+    write_json(path, {"version": 1})
+
+    with pytest.raises(TypeError):
+        write_json(path, {"version": object()})
+
+    assert json.loads(path.read_text()) == {"version": 1}
+    assert not (tmp_path / "data.json.tmp").exists()
+
+    with pytest.raises(RuntimeError):
+        with atomic_path(path) as tmp:
+            tmp.write_text("partial")
+            raise RuntimeError("interrupted")
+    assert json.loads(path.read_text()) == {"version": 1}
+
+
+def test_sha256_file(tmp_path):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(b"x" * (3 << 20))
+    assert sha256_file(path) == hashlib.sha256(b"x" * (3 << 20)).hexdigest()
@@ -3,7 +3,7 @@
 import pytest
 from click.testing import CliRunner
 
-from cli import cli
+from cli import _imported_document_ids, cli
 
 
 class TestCLIBasics:
@@ -121,3 +121,22 @@ class TestStatusCommand:
         result = runner.invoke(cli, ["status", "--help"])
 
         assert result.exit_code == 0
+
+
+class TestImportedDocumentIds:
+    """Tests for choosing the chunks the keyword index may record."""
+
+    BATCH = [{"title": "Ruth 1:1 (KJV)"}, {"title": "Ruth 1:2 (KJV)"}]
+
+    def test_only_successful_documents(self):
+        result = {"imported": 1, "failed": 1, "results": [
+            {"title": "Ruth 1:1 (KJV)", "document_id": "doc-1", "success": True},
+            {"title": "Ruth 1:2 (KJV)", "success": False, "error": "duplicate"},
+        ]}
+        assert _imported_document_ids(self.BATCH, result) == {"Ruth 1:1 (KJV)": "doc-1"}
+
+    def test_batch_without_per_document_results(self):
+        assert _imported_document_ids(self.BATCH, {"imported": 2, "failed": 0}) == {
+            "Ruth 1:1 (KJV)": None, "Ruth 1:2 (KJV)": None,
+        }
+        assert _imported_document_ids(self.BATCH, {"imported": 1, "failed": 1}) == {}
@@ -0,0 +1,139 @@
+"""Unit tests for the columnar corpus export."""
+
+import json
+import threading
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from corpus_export import (
+    CorpusWriter,
+    corpus_format,
+    documents_to_table,
+    iter_corpus,
+    read_corpus,
+    write_corpus,
+)
+from lexicon_importer import LexiconImporter
+
+
+def _chunk(i):
+    return {
+        "title": f"Genesis 1:{i}",
+        "content": f"Verse {i} text",
+        "domain": "bible/kjv",
+        "metadata": {
+            "book": "Genesis",
+            "chapter": 1,
+            "verse_ids": [1001000 + i, 1001001 + i],
+            "structure": {"path": f"Genesis/1/{i}", "token_count": 300 + i},
+            "places": [{"slug": "eden", "name": "Eden", "verses": [i]}],
+            "entities": {"people": ["Adam"], "groups": []},
+        },
+    }
+
+
+def _documents():
+    documents = [_chunk(i) for i in range(1, 6)]
+    # Fields that only some documents have, and that mix types
+    documents[2]["metadata"]["genre"] = {"type": "narrative"}
+    documents[3]["metadata"]["chapter"] = "one"
+    documents[4]["metadata"]["kjv_usage"] = {f"word{n}": n for n in range(40)}
+    return documents
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_round_trip(tmp_path, suffix):
+    """Documents read back exactly as they were written."""
+    documents = _documents()
+    stats = write_corpus(documents, tmp_path / f"corpus{suffix}")
+
+    assert stats["documents"] == 5
+    assert stats["format"] == corpus_format(tmp_path / f"corpus{suffix}")
+    assert list(iter_corpus(tmp_path / f"corpus{suffix}")) == documents
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_round_trip_dotted_keys_and_empty_objects(tmp_path):
+    """Field names with "." and empty objects survive the round trip."""
+    documents = [_chunk(i) for i in range(1, 4)]
+    documents[0]["metadata"].update({"v1.2": "x", "extra": {}, "mixed": {}})
+    documents[1]["metadata"].update({"mixed": {"a": 1}, "entities": {"people": [], "other": {}}})
+    write_corpus(documents, tmp_path / "corpus.arrow")
+
+    table = read_corpus(tmp_path / "corpus.arrow")
+    assert "metadata.v1.2" not in table.column_names
+    assert list(iter_corpus(tmp_path / "corpus.arrow")) == documents
+
+
+def test_columns():
+    """Nested objects are flattened; unsuitable values become JSON strings."""
+    table = documents_to_table(_documents())
+    schema = table.schema
+    json_columns = json.loads(schema.metadata[b"corpus.json_columns"])
+
+    assert schema.field("metadata.structure.token_count").type == pa.int64()
+    assert schema.field("metadata.verse_ids").type == pa.list_(pa.int64())
+    assert schema.field("metadata.genre.type").type == pa.string()
+    assert table.column("metadata.genre.type").null_count == 4
+    assert set(json_columns) == {
+        "metadata.chapter",
+        "metadata.places",
+        "metadata.entities.groups",
+        "metadata.kjv_usage",
+    }
+
+
+def test_arrow_is_memory_mapped(tmp_path):
+    """Reading an Arrow IPC export allocates no column buffers."""
+    write_corpus(_documents() * 100, tmp_path / "corpus.arrow")
+
+    before = pa.total_allocated_bytes()
+    table = read_corpus(tmp_path / "corpus.arrow")
+    assert table.num_rows == 500
+    assert pa.total_allocated_bytes() == before
+
+    assert read_corpus(tmp_path / "corpus.arrow", columns=["title"]).column_names == ["title"]
+
+
+def test_writer_tap_is_thread_safe(tmp_path):
+    """Several streams can be tapped from worker threads."""
+    writer = CorpusWriter(tmp_path / "corpus.parquet")
+    threads = [
+        threading.Thread(target=lambda: list(writer.tap(_chunk(i) for i in range(500))))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(writer) == 2000
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported corpus export format"):
+        corpus_format(tmp_path / "corpus.csv")
+    with pytest.raises(FileNotFoundError):
+        read_corpus(tmp_path / "missing.arrow")
+
+    pa.ipc.new_file(pa.OSFile(str(tmp_path / "plain.arrow"), "wb"), pa.schema([])).close()
+    with pytest.raises(ValueError, match="Unsupported corpus export version"):
+        read_corpus(tmp_path / "plain.arrow")
+
+
+def test_lexicon_dry_run_export(tmp_path):
+    """A dry run writes every converted lexicon entry."""
+    for language, var in (("hebrew", "strongsHebrewDictionary"), ("greek", "strongsGreekDictionary")):
+        (tmp_path / language).mkdir()
+        (tmp_path / language / f"strongs-{language}-dictionary.js").write_text(
+            f'var {var} = {{"{language[0].upper()}1": {{"lemma": "x", "strongs_def": "y", "kjv_def": "a (2), b (1)"}}}};',
+            encoding="utf-8",
+        )
+
+    results = LexiconImporter(data_dir=tmp_path).import_all(dry_run=True, export_path=tmp_path / "lexicon.parquet")
+
+    assert results["export"]["documents"] == 2
+    documents = list(iter_corpus(tmp_path / "lexicon.parquet"))
+    assert {document["metadata"]["strong_id"] for document in documents} == {"H1", "G1"}
+    assert documents[0]["metadata"]["kjv_usage"] == {"a": 2, "b": 1}
@@ -223,6 +223,11 @@ class TestBibleVerse:
 
         assert verses == [verse1, verse2, verse3]
 
+    def test_verse_id_property(self):
+        """verse_id packs book, chapter and verse."""
+        assert BibleVerse(1, "Genesis", 1, 1, "Text").verse_id == 1001001
+        assert BibleVerse(66, "Revelation of John", 22, 21, "Text").verse_id == 66022021
+
 
 class TestBibleBooks:
     """Test Bible book constants."""
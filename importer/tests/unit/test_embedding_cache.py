@@ -0,0 +1,95 @@
+"""Unit tests for the client-side query embedding cache."""
+
+import httpx
+import pytest
+
+from embedding_cache import QueryEmbeddingCache, normalize_query
+from prism_client import PrismClient
+
+
+def test_normalize_query():
+    """Case, Unicode form and whitespace do not split cache entries."""
+    assert normalize_query("  Good   Shepherd\n") == "good shepherd"
+    assert normalize_query("Café") == normalize_query("Café")
+
+
+def test_cache_hits_and_metrics():
+    """Hits return stored vectors and count toward time saved."""
+    cache = QueryEmbeddingCache()
+    key = QueryEmbeddingCache.key("model-a", "Love")
+
+    assert cache.get(key) is None
+    cache.put(key, [0.5, -1.0], seconds=0.2)
+
+    assert cache.get(QueryEmbeddingCache.key("model-a", " love ")) == [0.5, -1.0]
+    assert cache.get(QueryEmbeddingCache.key("model-b", "love")) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["seconds_saved"] == pytest.approx(0.2)
+
+
+def test_cache_persistence_and_eviction(tmp_path):
+    """Vectors round-trip through disk; the LRU bound holds on load."""
+    path = tmp_path / "embedding_cache.json"
+    cache = QueryEmbeddingCache(path=path)
+    for i in range(3):
+        cache.put(QueryEmbeddingCache.key("m", f"q{i}"), [float(i), 0.25])
+    cache.save()
+
+    loaded = QueryEmbeddingCache(max_size=2, path=path)
+    assert len(loaded) == 2
+    assert loaded.get(QueryEmbeddingCache.key("m", "q2")) == [2.0, 0.25]
+    assert loaded.get(QueryEmbeddingCache.key("m", "q0")) is None
+
+
+def test_seconds_saved_uses_persisted_embed_time(tmp_path):
+    """Hits in a later process count the time the vector originally took."""
+    path = tmp_path / "embedding_cache.json"
+    cache = QueryEmbeddingCache(path=path)
+    cache.put(QueryEmbeddingCache.key("m", "slow"), [1.0], seconds=0.5)
+    cache.put(QueryEmbeddingCache.key("m", "fast"), [2.0], seconds=0.01)
+    cache.save()
+
+    loaded = QueryEmbeddingCache(path=path)
+    loaded.get(QueryEmbeddingCache.key("m", "slow"))
+    loaded.get(QueryEmbeddingCache.key("m", "slow"))
+    loaded.get(QueryEmbeddingCache.key("m", "fast"))
+
+    stats = loaded.stats()
+    assert (stats["hits"], stats["misses"], stats["embed_seconds"]) == (3, 0, 0.0)
+    assert stats["seconds_saved"] == pytest.approx(1.01)
+
+
+@pytest.mark.asyncio
+async def test_search_embeds_each_query_once(mock_httpx_client):
+    """Repeated searches reuse the vector and search by embedding."""
+    calls = []
+
+    async def post(url, json, **kwargs):
+        calls.append((url, json))
+        body = {"embeddings": [[0.1, 0.2]]} if url.endswith("/embed") else {"results": []}
+        return httpx.Response(200, json=body, request=httpx.Request("POST", "http://test"))
+
+    mock_httpx_client.post.side_effect = post
+    client = PrismClient(embedding_cache=QueryEmbeddingCache())
+    client.client = mock_httpx_client
+
+    await client.search_documents("Faith", domain="bible/kjv")
+    await client.search_documents("faith ", domain="bible/asv")
+
+    urls = [url for url, _ in calls]
+    assert urls.count("/api/v1/embed") == 1
+    assert urls.count("/api/v1/search/vector") == 2
+    assert calls[-1][1]["query_embedding"] == pytest.approx([0.1, 0.2])
+    assert client.embedding_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_local_embedder_skips_prism(mock_httpx_client):
+    """A local embedder replaces the embed endpoint."""
+    client = PrismClient(embedding_cache=QueryEmbeddingCache(), embedder=lambda text: [len(text)])
+    client.client = mock_httpx_client
+
+    assert await client.embed_query("grace") == [5.0]
+    mock_httpx_client.post.assert_not_called()
@@ -8,6 +8,8 @@ from csv_parser import (
     GENRE_CHUNKING_PARAMS,
     BIBLE_BOOKS,
     identify_parallel_passages,
+    find_parallel_passages,
+    ParallelPassageIndex,
 )
 from metadata_enrichment import (
     BOOK_AUTHORS,
@@ -210,6 +212,34 @@ class TestParallelPassages:
         # Should be title case and readable
         assert result["description"] == "Feeding 5000"
 
+    def test_finds_all_overlapping_events(self):
+        """A chunk spanning two events returns both, in table order."""
+        results = find_parallel_passages("Matthew", 14, 1, 36)
+
+        assert [r["event"] for r in results] == ["feeding_5000", "walking_on_water"]
+        assert identify_parallel_passages("Matthew", 14, 1, 36)["event"] == "feeding_5000"
+
+    def test_numbered_book_names_share_bucket(self):
+        """CSV and display names of numbered books resolve to the same passages."""
+        index = ParallelPassageIndex({
+            "example": [("1 Kings", 10, 1, 13), ("II Chronicles", 9, 1, 12)],
+        })
+
+        assert index.find("I Kings", 10, 5, 5)[0]["parallel_passages"] == ["II Chronicles 9:1-12"]
+        assert index.find("2 Chronicles", 9, 12, 20)[0]["event"] == "example"
+        assert index.find("2 Chronicles", 9, 13, 20) == []
+
+    def test_index_window_skips_nested_intervals(self):
+        """Long passages earlier in a chapter still match later verses."""
+        index = ParallelPassageIndex({
+            "long": [("Luke", 1, 1, 80)],
+            "short": [("Luke", 1, 5, 7)],
+            "late": [("Luke", 1, 60, 70)],
+        })
+
+        assert [r["event"] for r in index.find("Luke", 1, 20, 30)] == ["long"]
+        assert [r["event"] for r in index.find("Luke", 1, 6, 65)] == ["long", "short", "late"]
+
 
 class TestNamedEntityExtraction:
     """Test named entity recognition."""
@@ -223,13 +253,12 @@ class TestNamedEntityExtraction:
         assert "Peter" in entities["people"]
         assert "John" in entities["people"]
 
-    def test_extract_place_entities(self):
-        """Should detect common biblical places."""
+    def test_places_not_text_matched(self):
+        """Places come from the verse place index, not from matching names."""
         text = "They traveled from Jerusalem to Galilee via Samaria."
         entities = extract_named_entities(text)
 
-        assert "Jerusalem" in entities["places"]
-        assert "Galilee" in entities["places"]
+        assert "places" not in entities
 
     def test_no_false_positives(self):
         """Should not detect entities that aren't present."""
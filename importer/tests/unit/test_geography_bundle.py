@@ -0,0 +1,44 @@
+"""Unit tests for the GeoJSON places bundle."""
+
+import json
+
+from geography_bundle import BUNDLE_VERSION, build_places_bundle, place_feature, write_places_bundle
+from verse_ids import verse_id_for
+
+
+def test_place_feature(place_document):
+    """Features are GeoJSON points in lon/lat order with compact coordinates."""
+    jerusalem = place_document(
+        "jerusalem", "Jerusalem", 31.776712345, 35.234512345, verse_ids=[verse_id_for("Genesis", 14, 18)]
+    )
+    feature = place_feature(jerusalem, "doc-1")
+
+    assert feature["id"] == "jerusalem"
+    assert feature["geometry"] == {"type": "Point", "coordinates": [35.23451, 31.77671]}
+    assert feature["properties"]["name"] == "Jerusalem"
+    assert feature["properties"]["document_id"] == "doc-1"
+    assert feature["properties"]["verse_references"] == ["Genesis 14:18"]
+    assert "content" not in feature["properties"]
+    assert place_feature(place_document("eden", "Eden")) is None
+
+
+def test_build_and_write_bundle(tmp_path, place_document):
+    """The bundle carries every located place plus version, bounds and type counts."""
+    documents = [
+        place_document("jerusalem", "Jerusalem", 31.7767, 35.2345),
+        place_document("jordan", "Jordan", 32.0, 35.55, place_type="river"),
+        place_document("eden", "Eden"),
+    ]
+
+    bundle = build_places_bundle(documents, {"jordan": "doc-2"})
+    size = write_places_bundle(bundle, tmp_path / "data" / "places.geojson")
+
+    loaded = json.loads((tmp_path / "data" / "places.geojson").read_text())
+    assert loaded["type"] == "FeatureCollection"
+    assert loaded["version"] == BUNDLE_VERSION
+    assert loaded["count"] == 2
+    assert loaded["bbox"] == [35.2345, 31.7767, 35.55, 32.0]
+    assert loaded["place_types"] == {"river": 1, "settlement": 1}
+    assert [f["properties"]["document_id"] for f in loaded["features"]] == [None, "doc-2"]
+    assert size == (tmp_path / "data" / "places.geojson").stat().st_size
+    assert b", " not in (tmp_path / "data" / "places.geojson").read_bytes()
@@ -1,11 +1,18 @@
 """Unit tests for biblical geography importer."""
 
+import email.utils
+import hashlib
 import json
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch, mock_open
 
-from geography_importer import GeographyImporter
+from geography_importer import GeographyImporter, diff_place_hashes, place_hash
 
 
 class TestGeographyImporter:
@@ -230,6 +237,22 @@ class TestGeographyImporter:
         assert "Gen 1:1" in refs
         assert "Gen 4:7" in refs
 
+    def test_extract_verse_ids(self, importer):
+        """Verse IDs come from OSIS refs, sorted and deduplicated; ranges cover every verse."""
+        entry = {
+            "verses": [
+                {"osis": "2Kgs.5.12", "readable": "2 Kgs 5:12"},
+                {"osis": "Gen.14.18-Gen.14.19", "readable": "Gen 14:18-19"},
+                {"osis": "Gen.14.18", "readable": "Gen 14:18"},
+                {"osis": "Josh.18.28-Josh.19.1"},
+                {"readable": "Ps 122:3-4"},
+                {"osis": "Book.1.1"},
+            ]
+        }
+        assert importer.extract_verse_ids(entry) == [
+            1014018, 1014019, 6018028, 6019001, 12005012, 19122003, 19122004,
+        ]
+
     def test_extract_verse_references_max_limit(self, importer):
         """Test verse reference limiting to prevent metadata bloat."""
         # Create entry with 50 verse references
@@ -393,30 +416,59 @@ class TestGeographyImporter:
         # Check warning was logged
         assert "Skipped 2 invalid lines" in caplog.text
 
+    def test_iter_jsonl_streams(self, importer, tmp_path):
+        """Entries and documents are produced lazily, one line at a time."""
+        jsonl_file = tmp_path / "geography" / "ancient.jsonl"
+        jsonl_file.write_text('{"friendly_id": "Dan", "types": ["settlement"]}\n' * 3)
+
+        entries = importer.iter_jsonl(jsonl_file)
+        assert isinstance(entries, types.GeneratorType)
+        assert next(entries)["friendly_id"] == "Dan"
+
+        documents = importer.iter_documents()
+        assert isinstance(documents, types.GeneratorType)
+        assert [doc["title"] for doc in documents] == ["Biblical Place: Dan"] * 3
+
     def test_parse_jsonl_missing_file(self, importer):
         """Test parsing non-existent file raises error."""
         with pytest.raises(FileNotFoundError) as exc_info:
             importer.parse_jsonl(Path("nonexistent.jsonl"))
         assert "not found" in str(exc_info.value)
 
+    @staticmethod
+    def _serve(body: bytes, status_code: int = 200):
+        """Patch httpx.AsyncClient to answer every request with `body`."""
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(lambda request: httpx.Response(status_code, content=body))
+        return patch(
+            "geography_importer.httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
+
     @pytest.mark.asyncio
     async def test_download_data_success(self, importer):
         """Test successful data download."""
-        mock_response = Mock()
-        mock_response.text = '{"slug": "test"}\n'
-        mock_response.raise_for_status = Mock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            mock_client.return_value = mock_context
-
+        with self._serve(b'{"slug": "test"}\n'):
             result = await importer.download_data()
 
-            assert result == importer.jsonl_file
-            assert importer.jsonl_file.exists()
-            content = importer.jsonl_file.read_text()
-            assert content == '{"slug": "test"}\n'
+        assert result == importer.jsonl_file
+        assert importer.jsonl_file.exists()
+        content = importer.jsonl_file.read_text()
+        assert content == '{"slug": "test"}\n'
+
+    @pytest.mark.asyncio
+    async def test_download_data_streams_in_chunks(self, importer):
+        """Large downloads are written chunk by chunk and failures keep the cache."""
+        body = b"".join(b'{"slug": "place%d"}\n' % i for i in range(20000))
+        with self._serve(body):
+            await importer.download_data()
+        assert importer.jsonl_file.read_bytes() == body
+
+        with self._serve(b"gone", status_code=500):
+            with pytest.raises(httpx.HTTPStatusError):
+                await importer.download_data(force=True)
+        assert importer.jsonl_file.read_bytes() == body
+        assert not list(importer.data_dir.glob("*.tmp"))
 
     @pytest.mark.asyncio
     async def test_download_data_cached(self, importer):
@@ -437,20 +489,12 @@ class TestGeographyImporter:
         # Create existing file
         importer.jsonl_file.write_text('{"old": true}\n')
 
-        mock_response = Mock()
-        mock_response.text = '{"new": true}\n'
-        mock_response.raise_for_status = Mock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            mock_client.return_value = mock_context
-
+        with self._serve(b'{"new": true}\n'):
             result = await importer.download_data(force=True)
 
-            assert result == importer.jsonl_file
-            assert "new" in importer.jsonl_file.read_text()
-            assert "old" not in importer.jsonl_file.read_text()
+        assert result == importer.jsonl_file
+        assert "new" in importer.jsonl_file.read_text()
+        assert "old" not in importer.jsonl_file.read_text()
 
     def test_import_all_dry_run(self, importer, sample_place_entry, tmp_path):
         """Test dry run mode (parse only, no import)."""
@@ -477,6 +521,20 @@ class TestGeographyImporter:
         # Verify samples
         assert len(results["sample_documents"]) == 3  # First 3
 
+    def test_import_all_dry_run_export(self, importer, sample_place_entry, tmp_path):
+        """Dry run writes every place document to the corpus export."""
+        pytest.importorskip("pyarrow")
+        from corpus_export import iter_corpus
+
+        jsonl_file = tmp_path / "geography" / "ancient.jsonl"
+        jsonl_file.write_text("\n".join(json.dumps(sample_place_entry) for _ in range(5)) + "\n")
+
+        results = importer.import_all(dry_run=True, download=False, export_path=tmp_path / "places.arrow")
+
+        assert results["export"]["documents"] == 5
+        documents = list(iter_corpus(tmp_path / "places.arrow"))
+        assert documents[0] == importer.place_to_document(sample_place_entry)
+
     def test_import_all_no_data(self, importer, tmp_path):
         """Test import with no place entries."""
         # Create empty JSONL file
@@ -518,6 +576,244 @@ class TestGeographyImporter:
         assert "Failed to convert" in caplog.text
 
 
+class _PlacesHandler(BaseHTTPRequestHandler):
+    """Serves server.body with an ETag and Last-Modified, honouring conditional requests."""
+
+    def do_GET(self):
+        body = self.server.body
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", email.utils.formatdate(usegmt=True))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestGeographyRefresh:
+    """Conditional downloads and change-only re-imports against a local file server."""
+
+    @pytest.fixture
+    def server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _PlacesHandler)
+        server.body = b""
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def importer(self, tmp_path, server):
+        return GeographyImporter(
+            data_dir=tmp_path / "geography",
+            index_path=tmp_path / "spatial_index.json",
+            bundle_path=tmp_path / "places.geojson",
+            clusters_dir=tmp_path / "clusters",
+            verse_index_path=tmp_path / "verse_places.json",
+            source_url=f"http://127.0.0.1:{server.server_address[1]}/ancient.jsonl",
+        )
+
+    @staticmethod
+    def _entry(slug, lonlat, votes=100):
+        return {
+            "friendly_id": slug.title(),
+            "url_slug": slug,
+            "types": ["settlement"],
+            "identifications": [{"resolutions": [{"lonlat": lonlat}], "score": {"vote_total": votes}}],
+        }
+
+    @staticmethod
+    def _body(*entries):
+        return b"".join(json.dumps(entry).encode() + b"\n" for entry in entries)
+
+    def test_place_hash_ignores_key_order(self):
+        assert place_hash({"a": 1, "b": [1, 2]}) == place_hash({"b": [1, 2], "a": 1})
+        assert place_hash({"a": 1}) != place_hash({"a": 2})
+
+    def test_diff_place_hashes(self):
+        changes = diff_place_hashes({"a": "1", "b": "2", "c": "3"}, {"a": "1", "b": "9", "d": "4"})
+        assert changes == {"added": ["d"], "changed": ["b"], "removed": ["c"], "unchanged": 1}
+
+    @pytest.mark.asyncio
+    async def test_conditional_download(self, importer, server):
+        """ETags are stored and a refresh of unchanged data gets 304 and keeps the file."""
+        server.body = self._body(self._entry("jerusalem", "35.2345,31.7767"))
+        await importer.download_data()
+
+        metadata = importer.read_download_metadata()
+        assert metadata["sha256"] == hashlib.sha256(server.body).hexdigest()
+        assert metadata["size"] == len(server.body)
+        assert metadata["etag"] and metadata["last_modified"]
+        assert importer.last_download["status"] == "downloaded"
+
+        await importer.download_data(refresh=True)
+        assert server.requests[-1]["If-None-Match"] == metadata["etag"]
+        assert importer.last_download["status"] == "not_modified"
+        assert importer.jsonl_file.read_bytes() == server.body
+
+        server.body = self._body(self._entry("bethel", "35.2211,31.9300"))
+        await importer.download_data(refresh=True)
+        assert importer.last_download["status"] == "downloaded"
+        assert importer.jsonl_file.read_bytes() == server.body
+
+    @pytest.mark.asyncio
+    async def test_corrupt_cache_is_downloaded_again(self, importer, server):
+        server.body = self._body(self._entry("jerusalem", "35.2345,31.7767"))
+        await importer.download_data()
+        importer.jsonl_file.write_bytes(server.body[:10])
+
+        await importer.download_data()
+
+        assert importer.last_download["status"] == "downloaded"
+        assert importer.jsonl_file.read_bytes() == server.body
+        # The corrupt copy's ETag must not be sent
+        assert "If-None-Match" not in server.requests[-1]
+
+    def test_refresh_imports_only_changed_places(self, importer, server):
+        """A refresh uploads added and changed places and keeps IDs of the rest."""
+        uploads = []
+
+        async def fake_import(streams, batch_size, embed, progress_callback):
+            documents = list(streams["places"])
+            uploads.append([doc["metadata"]["slug"] for doc in documents])
+            progress_callback(1, None, {
+                "results": [
+                    {"title": doc["title"], "document_id": f"{doc['metadata']['slug']}-{len(uploads)}"}
+                    for doc in documents
+                ]
+            })
+            return {"total_documents": len(documents), "success_count": len(documents), "error_count": 0, "errors": []}
+
+        jerusalem = self._entry("jerusalem", "35.2345,31.7767")
+        bethel = self._entry("bethel", "35.2211,31.9300")
+        server.body = self._body(jerusalem, bethel, self._entry("ai", "35.2620,31.9163"))
+        with patch("geography_importer.import_document_streams", fake_import):
+            first = importer.import_all()
+            assert first["changes"]["added"] == ["ai", "bethel", "jerusalem"]
+
+            unchanged = importer.import_all(refresh=True)
+            assert unchanged["up_to_date"]
+            assert unchanged["spatial_index"]["places"] == unchanged["bundle"]["places"] == 3
+            assert importer.last_download["status"] == "not_modified"
+
+            server.body = self._body(
+                jerusalem, self._entry("bethel", "35.2211,31.9300", votes=500), self._entry("shiloh", "35.2897,32.0556")
+            )
+            results = importer.import_all(refresh=True)
+
+        assert uploads == [["jerusalem", "bethel", "ai"], ["bethel", "shiloh"]]
+        assert results["changes"]["removed"] == ["ai"]
+        assert results["spatial_index"]["places"] == 3
+        index = json.loads(importer.bundle_path.read_text())
+        assert {f["id"]: f["properties"]["document_id"] for f in index["features"]} == {
+            "jerusalem": "jerusalem-1",
+            "bethel": "bethel-2",
+            "shiloh": "shiloh-2",
+        }
+        assert importer.load_snapshot() == importer.place_hashes()
+
+
+    def test_refresh_reports_places_prism_rejects_as_duplicates(self, importer, server):
+        """Changed places Prism already has are reported as stale and retried on the next refresh."""
+        stored = {}
+        uploads = []
+
+        async def fake_import(streams, batch_size, embed, progress_callback):
+            results, errors = [], []
+            documents = list(streams["places"])
+            uploads.append([doc["metadata"]["slug"] for doc in documents])
+            for doc in documents:
+                if doc["title"] in stored:
+                    error = f"Duplicate content (existing document: {stored[doc['title']]})"
+                    results.append({"title": doc["title"], "success": False, "error": error})
+                    errors.append({"document": doc["title"], "error": error})
+                else:
+                    stored[doc["title"]] = f"{doc['metadata']['slug']}-1"
+                    results.append({"title": doc["title"], "document_id": stored[doc["title"]], "success": True})
+            progress_callback(1, None, {"results": results})
+            return {
+                "total_documents": len(documents),
+                "success_count": len(documents) - len(errors),
+                "error_count": len(errors),
+                "errors": errors,
+            }
+
+        jerusalem = self._entry("jerusalem", "35.2345,31.7767")
+        server.body = self._body(jerusalem, self._entry("bethel", "35.2211,31.9300"))
+        with patch("geography_importer.import_document_streams", fake_import):
+            importer.import_all()
+            server.body = self._body(jerusalem, self._entry("bethel", "35.2211,31.9300", votes=500))
+            results = importer.import_all(refresh=True)
+            retry = importer.import_all(refresh=True)
+
+            # Once the old document is gone, the retry uploads the new version
+            del stored["Biblical Place: Bethel"]
+            fixed = importer.import_all(refresh=True)
+
+        assert uploads == [["jerusalem", "bethel"], ["bethel"], ["bethel"], ["bethel"]]
+        assert results["error_count"] == 0 and results["errors"] == []
+        assert [(entry["slug"], entry["document_id"]) for entry in results["stale"]] == [("bethel", "bethel-1")]
+        assert retry["changes"]["changed"] == ["bethel"]
+        assert fixed["stale"] == []
+        assert importer.load_snapshot() == importer.place_hashes()
+
+    def test_first_refresh_counts_places_prism_already_has(self, importer, server):
+        """Without place_hashes.json, duplicates of added places are already imported."""
+
+        async def fake_import(streams, batch_size, embed, progress_callback):
+            documents = list(streams["places"])
+            errors = [
+                {"document": doc["title"], "error": "Duplicate content (existing document: x)"}
+                for doc in documents
+            ]
+            progress_callback(1, None, {"results": [{**error, "title": error["document"], "success": False}
+                                                    for error in errors]})
+            return {"total_documents": len(documents), "success_count": 0,
+                    "error_count": len(errors), "errors": errors}
+
+        server.body = self._body(self._entry("jerusalem", "35.2345,31.7767"), self._entry("bethel", "35.2211,31.9300"))
+        with patch("geography_importer.import_document_streams", fake_import):
+            results = importer.import_all(refresh=True)
+            again = importer.import_all(refresh=True)
+
+        assert results["changes"]["added"] == ["bethel", "jerusalem"]
+        assert (results["error_count"], results["errors"], results["stale"]) == (0, [], [])
+        assert results["present"] == 2
+        assert importer.load_snapshot() == importer.place_hashes()
+        assert again["up_to_date"]
+
+    def test_refresh_reports_places_prism_skips(self, importer, server):
+        """A changed place accepted without a document ID was skipped by Prism."""
+
+        async def fake_import(streams, batch_size, embed, progress_callback):
+            documents = list(streams["places"])
+            progress_callback(1, None, {"results": [
+                {"title": doc["title"], "success": True, **({} if len(documents) == 1 else {"document_id": "id"})}
+                for doc in documents
+            ]})
+            return {"total_documents": len(documents), "success_count": len(documents), "error_count": 0, "errors": []}
+
+        server.body = self._body(self._entry("jerusalem", "35.2345,31.7767"), self._entry("bethel", "35.2211,31.9300"))
+        with patch("geography_importer.import_document_streams", fake_import):
+            importer.import_all()
+            server.body = self._body(
+                self._entry("jerusalem", "35.2345,31.7767"), self._entry("bethel", "35.2211,31.9300", votes=500)
+            )
+            results = importer.import_all(refresh=True)
+
+        assert [(entry["slug"], entry["error"]) for entry in results["stale"]] == [("bethel", None)]
+        assert importer.load_snapshot() != importer.place_hashes()
+
 class TestVerifyGeographyImport:
     """Tests for geography import verification function."""
 
@@ -539,7 +835,7 @@ class TestVerifyGeographyImport:
                 "total_chunks": 5000,
             }
             mock_client.count_domain_documents.return_value = 500
-            mock_client.search_documents.return_value = {
+            mock_client.search_many.return_value = [{
                 "results": [
                     {
                         "document_title": "Biblical Place: Jerusalem",
@@ -547,14 +843,16 @@ class TestVerifyGeographyImport:
                         "content": "Jerusalem is a biblical settlement...",
                     }
                 ]
-            }
+            }] * 4
 
             results = await verify_geography_import()
 
             # Verify calls
             assert mock_client.get_stats.called
             assert mock_client.count_domain_documents.called
-            assert mock_client.search_documents.call_count == 4  # 4 default queries
+            # 4 default queries in one concurrent call
+            assert mock_client.search_many.call_count == 1
+            assert len(mock_client.search_many.call_args.args[0]) == 4
 
             # Verify results structure
             assert "prism_stats" in results
@@ -577,12 +875,12 @@ class TestVerifyGeographyImport:
 
             mock_client.get_stats.return_value = {}
             mock_client.count_domain_documents.return_value = 300
-            mock_client.search_documents.return_value = {"results": []}
+            mock_client.search_many.return_value = [{"results": []}] * 2
 
             results = await verify_geography_import(sample_queries=custom_queries)
 
             # Should only search for custom queries
-            assert mock_client.search_documents.call_count == 2
+            assert mock_client.search_many.call_args.args[0] == custom_queries
             assert len(results["places"]) == 2
             assert "Bethlehem" in results["places"]
             assert "Nazareth" in results["places"]
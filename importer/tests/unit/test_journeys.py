@@ -0,0 +1,167 @@
+"""Unit tests for journey route computation."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from journeys import (
+    build_journeys,
+    compute_journey,
+    haversine_km,
+    load_events,
+    load_journeys,
+    resolve_stop,
+    write_journeys,
+)
+from spatial_index import SpatialIndex, haversine_km as scalar_haversine_km
+
+
+EVENTS_DIR = Path(__file__).parents[3] / "research" / "events"
+
+
+@pytest.fixture
+def index(place_document):
+    index = SpatialIndex(None)
+    for place in (
+        place_document("antioch-1", "Antioch 1", 36.2021, 36.1606),
+        place_document("antioch-2", "Antioch 2", 38.3060, 31.1890),
+        place_document("seleucia", "Seleucia", 36.1230, 35.9290),
+        place_document("daphne", "Daphne", 36.1700, 36.1300),
+    ):
+        index.add_document(place)
+    return index.build()
+
+
+@pytest.fixture
+def event():
+    return {
+        "id": "test-journey",
+        "name": "Test Journey",
+        "category": "new_testament",
+        "metadata": {"estimated_duration_days": 2},
+        "waypoints": [
+            {
+                "sequence": 2,
+                "name": "Seleucia",
+                "coordinates": [36.1210, 35.9290],
+                "route_to_next": {"type": "sea", "waypoints": [[36.1210, 35.9290], [35.5, 34.5]], "distance_km": 150},
+            },
+            {
+                "sequence": 1,
+                "name": "Antioch (Syria)",
+                "coordinates": [36.2000, 36.1500],
+                "route_to_next": {"type": "road", "distance_km": 30},
+            },
+            {"sequence": 3, "name": "Salamis", "coordinates": [35.1833, 33.9000], "route_to_next": None},
+        ],
+    }
+
+
+def test_haversine_matches_scalar():
+    """The vectorized distance agrees with the spatial index's scalar one."""
+    lats = np.array([31.7767, 36.2, 30.0])
+    lons = np.array([35.2345, 36.15, 31.0])
+    expected = [scalar_haversine_km(a, b, 35.0, 33.0) for a, b in zip(lats, lons)]
+    assert haversine_km(lats, lons, 35.0, 33.0) == pytest.approx(expected)
+
+
+def test_resolve_stop(index):
+    """Stops link to a same-named place nearby, else to a very close place."""
+    assert resolve_stop(index, "Antioch (Syria)", 36.2, 36.15)["slug"] == "antioch-1"
+    assert resolve_stop(index, "Antioch (Syria)", 36.2, 36.15)["match"] == "name"
+    assert resolve_stop(index, "Harbour", 36.121, 35.929)["match"] == "nearest"
+    assert resolve_stop(index, "Salamis", 35.1833, 33.9) is None
+    assert resolve_stop(index, "Somewhere", 0, 0, place_id="daphne")["match"] == "place_id"
+
+
+def test_compute_journey(event, index):
+    """Legs follow stop order, are pinned to both stops and measured along their path."""
+    journey = compute_journey(event, index)
+
+    assert [stop["sequence"] for stop in journey["stops"]] == [1, 2, 3]
+    first, second = journey["segments"]
+    assert first["type"] == "road" and first["path"] == [[36.2, 36.15], [36.121, 35.929]]
+    assert second["path"][-1] == [35.1833, 33.9]
+    assert first["distance_km"] == first["direct_km"] == pytest.approx(
+        scalar_haversine_km(36.2, 36.15, 36.121, 35.929), abs=0.1
+    )
+    via = scalar_haversine_km(36.121, 35.929, 35.5, 34.5) + scalar_haversine_km(35.5, 34.5, 35.1833, 33.9)
+    assert second["distance_km"] == pytest.approx(via, abs=0.1)
+    assert second["distance_km"] > second["direct_km"]
+
+    stats = journey["stats"]
+    assert stats["total_km"] == pytest.approx(first["distance_km"] + second["distance_km"], abs=0.1)
+    assert journey["stops"][-1]["cumulative_km"] == stats["total_km"]
+    assert stats["researched_km"] == 180
+    assert set(stats["km_by_route_type"]) == {"road", "sea"}
+    assert stats["km_per_day"] == pytest.approx(stats["total_km"] / 2, abs=0.1)
+    assert stats["resolved_stops"] == 2
+    assert journey["bbox"] == [33.9, 35.1833, 36.15, 36.2]
+
+
+def test_single_stop_journey():
+    journey = compute_journey({"id": "x", "waypoints": [{"name": "Ur", "coordinates": [30.96, 46.1]}]})
+    assert journey["stats"]["total_km"] == 0
+    assert journey["segments"] == []
+
+
+def test_zero_length_legs():
+    """Repeated stops give 0 km legs without disturbing the other legs."""
+    waypoints = [[31, 35], [32, 35], [32, 35]]
+    journey = compute_journey({
+        "id": "x",
+        "waypoints": [{"name": f"Stop {i}", "coordinates": point} for i, point in enumerate(waypoints)],
+    })
+
+    first, second = journey["segments"]
+    assert first["distance_km"] == pytest.approx(scalar_haversine_km(31, 35, 32, 35), abs=0.1)
+    assert second["distance_km"] == 0
+    assert second["path"] == [[32, 35], [32, 35]]
+    assert journey["stats"]["total_km"] == first["distance_km"]
+
+    # A researched leg that starts and ends on the same point
+    journey = compute_journey({
+        "id": "y",
+        "waypoints": [
+            {"name": "A", "coordinates": [32, 35], "route_to_next": {"waypoints": [[32, 35]]}},
+            {"name": "B", "coordinates": [32, 35]},
+            {"name": "C", "coordinates": [33, 35]},
+        ],
+    })
+    assert [segment["distance_km"] for segment in journey["segments"]] == [
+        0, pytest.approx(scalar_haversine_km(32, 35, 33, 35), abs=0.1),
+    ]
+
+
+def test_research_events_round_trip(tmp_path):
+    """Every researched journey builds and reloads from one artifact."""
+    events = load_events(EVENTS_DIR)
+    artifact = build_journeys(events)
+    write_journeys(artifact, tmp_path / "journeys.json")
+    loaded = load_journeys(tmp_path / "journeys.json")
+
+    assert loaded["count"] == len(events) >= 3
+    for journey in loaded["journeys"]:
+        assert journey["stats"]["segments"] == journey["stats"]["stops"] - 1
+        for segment, stop in zip(journey["segments"], journey["stops"]):
+            assert segment["path"][0] == [stop["latitude"], stop["longitude"]]
+        # Computed routes stay within a factor of the researched estimate
+        assert 0.5 < journey["stats"]["total_km"] / journey["stats"]["researched_km"] < 1.5
+
+
+def test_load_events_skips_invalid_files(tmp_path):
+    (tmp_path / "broken.json").write_text("{")
+    (tmp_path / "notes.json").write_text(json.dumps({"id": "notes"}))
+    (tmp_path / "trip.json").write_text(json.dumps({"id": "trip", "waypoints": [{"coordinates": [1, 2]}]}))
+
+    assert [event["id"] for event in load_events(tmp_path)] == ["trip"]
+    with pytest.raises(FileNotFoundError):
+        load_events(tmp_path / "missing")
+
+
+def test_load_missing_journeys(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_journeys(tmp_path / "journeys.json")
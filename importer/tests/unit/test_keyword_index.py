@@ -0,0 +1,151 @@
+"""Unit tests for the BM25 keyword index and rank fusion."""
+
+import httpx
+import pytest
+
+from keyword_index import (
+    KeywordIndex,
+    decode_postings,
+    encode_varint,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+from prism_client import PrismClient
+
+
+def _chunk(title, content, domain="bible/kjv", **metadata):
+    return {"title": title, "content": content, "domain": domain, "metadata": metadata}
+
+
+CHUNKS = [
+    _chunk(
+        "Psalms 23:1-3 (KJV)",
+        "1 The LORD is my shepherd; I shall not want.\n"
+        "2 He maketh me to lie down in green pastures: he leadeth me beside the still waters.\n"
+        "3 He restoreth my soul.",
+        verse_id_start=19023001,
+        verse_id_end=19023003,
+    ),
+    _chunk(
+        "John 10:11-12 (KJV)",
+        "11 I am the good shepherd: the good shepherd giveth his life for the sheep.\n"
+        "12 But he that is an hireling, and not the shepherd, whose own the sheep are not.",
+    ),
+    _chunk("Genesis 1:1-2 (KJV)", "1 In the beginning God created the heaven and the earth.\n2 And the earth was without form."),
+    _chunk("Psalms 23:1-3 (ASV)", "1 Jehovah is my shepherd; I shall not want.", domain="bible/asv"),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = KeywordIndex(tmp_path / "keyword_index")
+    index.add_documents(CHUNKS)
+    return index
+
+
+def test_varint_round_trip():
+    """Gaps and frequencies survive varint encoding, including multi-byte values."""
+    data = bytearray()
+    for value in (3, 1, 200, 2, 70000, 1):
+        encode_varint(value, data)
+
+    assert decode_postings(bytes(data)) == [(3, 1), (203, 2), (70203, 1)]
+    assert len(data) == 1 + 1 + 2 + 1 + 3 + 1
+
+
+def test_tokenize():
+    assert tokenize("The LORD's shepherd;") == ["the", "lord", "s", "shepherd"]
+
+
+def test_exact_phrase_ranks_first(index):
+    """Keyword queries find the passage that contains the words."""
+    results = index.search("The Lord is my shepherd", domain="bible/kjv")["results"]
+
+    assert results[0]["document_title"] == "Psalms 23:1-3 (KJV)"
+    assert results[0]["metadata"] == {"verse_id_start": 19023001, "verse_id_end": 19023003}
+    assert {r["domain"] for r in results} == {"bible/kjv"}
+
+
+def test_term_frequency_and_unknown_terms(index):
+    """Repeated terms score higher; unknown terms match nothing."""
+    results = index.search("shepherd")["results"]
+
+    assert results[0]["document_title"] == "John 10:11-12 (KJV)"
+    assert index.search("leviathan")["results"] == []
+
+
+def test_verse_numbers_not_indexed(index):
+    """Leading verse numbers are not terms."""
+    assert index.search("11")["results"] == []
+
+
+def test_incremental_update_and_replacement(index):
+    """New chunks append; re-imported chunks replace their old version."""
+    index.add_documents([_chunk("Psalms 23:1-3 (KJV)", "1 A completely different text about leviathan.")])
+    index.add_documents([_chunk("Revelation 22:21 (KJV)", "21 The grace of our Lord Jesus Christ be with you all.")])
+
+    assert len(index) == 5
+    assert index.search("leviathan")["results"][0]["document_title"] == "Psalms 23:1-3 (KJV)"
+    assert "Psalms 23:1-3 (KJV)" not in [r["document_title"] for r in index.search("pastures")["results"]]
+    assert index.search("grace")["results"][0]["document_title"] == "Revelation 22:21 (KJV)"
+
+
+def test_document_ids_stored_with_chunks(index):
+    """Prism document IDs given at import come back with search results."""
+    index.add_documents(
+        [_chunk("Ruth 1:16 (KJV)", "16 whither thou goest, I will go")],
+        {"Ruth 1:16 (KJV)": "doc-ruth"},
+    )
+
+    assert index.search("whither")["results"][0]["document_id"] == "doc-ruth"
+    assert "document_id" not in index.search("pastures")["results"][0]
+
+
+def test_save_and_load(index):
+    """The index round-trips through disk and keeps accepting updates."""
+    index.save()
+    loaded = KeywordIndex(index.index_dir).load()
+
+    assert loaded.search("still waters") == index.search("still waters")
+    loaded.add_documents([_chunk("Ruth 1:16 (KJV)", "16 whither thou goest, I will go")])
+    assert loaded.search("whither")["results"][0]["document_title"] == "Ruth 1:16 (KJV)"
+
+
+def test_load_missing_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        KeywordIndex(tmp_path).load()
+
+
+def test_reciprocal_rank_fusion():
+    """Results found by both retrievers rise to the top."""
+    vector = [{"document_title": "A"}, {"document_title": "B"}, {"document_title": "C"}]
+    keyword = [{"document_title": "C"}, {"document_title": "D"}]
+
+    fused = reciprocal_rank_fusion([vector, keyword], top_k=3)
+
+    assert [r["document_title"] for r in fused] == ["C", "A", "B"]
+    assert fused[0]["ranks"] == [3, 1]
+    assert fused[0]["rrf_score"] == pytest.approx(1 / 63 + 1 / 61)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search(index, mock_httpx_client):
+    """A passage ranked by both retrievers beats a semantic-only top hit."""
+    mock_httpx_client.post.return_value = httpx.Response(
+        200,
+        json={"results": [
+            {"document_title": "Genesis 1:1-2 (KJV)", "similarity": 0.8},
+            {"document_title": "Psalms 23:1-3 (KJV)", "similarity": 0.7},
+        ]},
+        request=httpx.Request("POST", "http://test"),
+    )
+    client = PrismClient(keyword_index=index)
+    client.client = mock_httpx_client
+
+    result = await client.hybrid_search("The Lord is my shepherd", domain="bible/kjv", top_k=2)
+
+    assert result["results"][0]["document_title"] == "Psalms 23:1-3 (KJV)"
+    assert result["results"][0]["ranks"] == [2, 1]
+
+    with pytest.raises(RuntimeError):
+        await PrismClient().hybrid_search("shepherd")
@@ -0,0 +1,116 @@
+"""Unit tests for Strong's lexicon dictionary parsing."""
+
+import json
+
+import pytest
+
+from lexicon_importer import LexiconImporter
+
+
+ENTRIES = {
+    "H1": {"lemma": "אָב", "xlit": "ʼâb", "strongs_def": "father", "kjv_def": "father (1205)"},
+    "H2": {"lemma": "אַב", "xlit": "ʼab", "strongs_def": "{father}", "kjv_def": "father (9)"},
+    "H3": {"lemma": "אֵב", "xlit": "ʼêb", "strongs_def": "a green plant", "kjv_def": "greenness (1)"},
+}
+
+
+@pytest.fixture
+def importer(tmp_path):
+    """Importer over a temporary data directory."""
+    return LexiconImporter(data_dir=tmp_path)
+
+
+@pytest.fixture
+def js_file(tmp_path):
+    """Dictionary file in the openscriptures layout."""
+    path = tmp_path / "strongs-hebrew-dictionary.js"
+    path.write_text(
+        "/**\n * Strong's Hebrew Dictionary\n */\n"
+        f"var strongsHebrewDictionary = {json.dumps(ENTRIES, ensure_ascii=False, indent=1)};\n\n"
+        "module.exports = strongsHebrewDictionary;\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestIterJsDictionary:
+    """Tests for the streaming dictionary parser."""
+
+    def test_yields_entries_in_order(self, importer, js_file):
+        """Entries stream as (strong_id, entry) pairs in file order."""
+        pairs = list(importer.iter_js_dictionary(js_file))
+
+        assert [strong_id for strong_id, _ in pairs] == ["H1", "H2", "H3"]
+        assert pairs[1][1] == ENTRIES["H2"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64])
+    def test_small_chunks(self, importer, js_file, chunk_size):
+        """Entries and the assignment may straddle chunk boundaries."""
+        assert dict(importer.iter_js_dictionary(js_file, chunk_size=chunk_size)) == ENTRIES
+
+    def test_parse_js_dictionary_matches_stream(self, importer, js_file):
+        """parse_js_dictionary returns the full dictionary."""
+        assert importer.parse_js_dictionary(js_file) == ENTRIES
+
+    def test_missing_file(self, importer, tmp_path):
+        """Missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(importer.iter_js_dictionary(tmp_path / "missing.js"))
+
+    def test_missing_assignment(self, importer, tmp_path):
+        """Files without the dictionary variable raise ValueError."""
+        path = tmp_path / "other.js"
+        path.write_text("var somethingElse = {};", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Could not extract"):
+            importer.parse_js_dictionary(path)
+
+    def test_truncated_file(self, importer, tmp_path):
+        """Truncated JSON raises ValueError after yielding complete entries."""
+        path = tmp_path / "truncated.js"
+        path.write_text('var strongsGreekDictionary = {"G1": {"lemma": "Α"}, "G2": {"lem', encoding="utf-8")
+
+        stream = importer.iter_js_dictionary(path)
+        assert next(stream) == ("G1", {"lemma": "Α"})
+        with pytest.raises(ValueError, match="Failed to parse"):
+            next(stream)
+
+
+class TestImportAll:
+    """Tests for converting and importing both lexicons."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path, js_file):
+        """Data directory with Hebrew and Greek dictionaries."""
+        for language, var in (("hebrew", "strongsHebrewDictionary"), ("greek", "strongsGreekDictionary")):
+            (tmp_path / language).mkdir()
+            entries = ENTRIES if language == "hebrew" else {"G1": {"lemma": "Α", "strongs_def": "alpha"}}
+            (tmp_path / language / f"strongs-{language}-dictionary.js").write_text(
+                f"var {var} = {json.dumps(entries, ensure_ascii=False)};", encoding="utf-8"
+            )
+        return tmp_path
+
+    def test_kjv_usage(self, importer):
+        """KJV usage strings parse into word counts."""
+        assert importer._parse_kjv_usage("father (1205), chief (2), patrimony (1)") == {
+            "father": 1205, "chief": 2, "patrimony": 1,
+        }
+        assert importer._parse_kjv_usage("no counts") is None
+
+    def test_dry_run_reports_languages(self, data_dir):
+        """Dry run converts both languages and reports throughput for each."""
+        results = LexiconImporter(data_dir=data_dir).import_all(dry_run=True)
+
+        assert results["hebrew_count"] == 3
+        assert results["greek_count"] == 1
+        assert results["total_documents"] == 4
+        assert results["languages"]["hebrew"]["documents"] == 3
+        assert "docs_per_sec" in results["languages"]["greek"]
+
+    def test_document_streams(self, data_dir):
+        """Document generators yield Prism documents lazily."""
+        importer = LexiconImporter(data_dir=data_dir)
+
+        hebrew = importer.iter_hebrew_documents()
+        assert next(hebrew)["metadata"]["strong_id"] == "H1"
+        assert len(list(importer.iter_greek_documents())) == 1
@@ -0,0 +1,107 @@
+"""Unit tests for the local Strong's ID lookup index."""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from lexicon_index import LexiconIndex, normalize_strongs
+from prism_client import PrismClient
+
+
+def _document(strong_id, language="hebrew", lemma="אָהַב"):
+    return {
+        "title": f"Strong's {strong_id} - {lemma}",
+        "content": "to love",
+        "domain": "lexicon/strongs",
+        "metadata": {
+            "strong_id": strong_id,
+            "language": language,
+            "lemma": lemma,
+            "definition": "to have affection for",
+            "kjv_def": "love (208)",
+        },
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Index with two tracked documents, one uploaded."""
+    index = LexiconIndex(tmp_path / "lexicon_index.json")
+    list(index.track([_document("H157"), _document("G26", "greek", "ἀγάπη")]))
+    index.record_batch_result({
+        "results": [
+            {"title": "Strong's H157 - אָהַב", "document_id": "doc-157", "success": True},
+            {"title": "Strong's G26 - ἀγάπη", "success": False, "error": "duplicate"},
+        ]
+    })
+    return index
+
+
+def test_normalize_strongs():
+    """Case and zero padding are normalized."""
+    assert normalize_strongs("h0157") == "H157"
+    with pytest.raises(ValueError):
+        normalize_strongs("love")
+
+
+def test_lookup_core_fields(index):
+    """Entries carry the document ID and core metadata only."""
+    entry = index.get("h157")
+
+    assert entry == {
+        "strong_id": "H157",
+        "document_id": "doc-157",
+        "title": "Strong's H157 - אָהַב",
+        "language": "hebrew",
+        "lemma": "אָהַב",
+        "definition": "to have affection for",
+    }
+    assert index.get("G26")["document_id"] is None
+    assert index.get("H9999") is None
+    assert index.get("not-an-id") is None
+    assert "G26" in index
+
+
+def test_save_and_load(index):
+    """Saved index round-trips through disk."""
+    index.save()
+
+    loaded = LexiconIndex(index.path).load()
+    assert len(loaded) == 2
+    assert loaded.get("H157")["document_id"] == "doc-157"
+
+
+def test_reimport_keeps_document_ids(index):
+    """Re-tracking a document keeps the ID Prism reported earlier."""
+    index.save()
+    reloaded = LexiconIndex(index.path).load()
+    list(reloaded.track([_document("H157")]))
+
+    assert reloaded.get("H157")["document_id"] == "doc-157"
+
+
+def test_load_missing_index(tmp_path):
+    """Loading before import raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        LexiconIndex(tmp_path / "missing.json").load()
+
+
+@pytest.mark.asyncio
+async def test_prism_client_lookup_skips_search(index, mock_httpx_client):
+    """PrismClient answers exact lookups from the index without searching."""
+    index.save()
+    mock_httpx_client.get.return_value = httpx.Response(
+        200, json={"id": "doc-157", "content": "to love"},
+        request=httpx.Request("GET", "http://test"),
+    )
+
+    with patch("prism_client.settings.lexicon_index_path", index.path):
+        client = PrismClient()
+        client.client = mock_httpx_client
+
+        entry = await client.get_lexicon_entry("H157", fetch_document=True)
+
+    assert entry["title"] == "Strong's H157 - אָהַב"
+    assert entry["document"]["content"] == "to love"
+    mock_httpx_client.get.assert_called_once_with("/api/v1/documents/doc-157")
+    mock_httpx_client.post.assert_not_called()
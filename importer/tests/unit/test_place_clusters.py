@@ -0,0 +1,119 @@
+"""Unit tests for precomputed marker clusters."""
+
+import random
+
+import pytest
+
+from place_clusters import (
+    build_place_clusters,
+    cluster_places,
+    load_clusters_index,
+    project,
+    tile_features,
+    unproject,
+)
+
+
+def _bundle(points):
+    return {
+        "type": "FeatureCollection",
+        "version": 1,
+        "generated_at": "2026-01-01T00:00:00+00:00",
+        "features": [
+            {
+                "type": "Feature",
+                "id": slug,
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"name": slug.title(), "document_id": f"doc-{slug}", "verse_references": ["Gen 1:1"]},
+            }
+            for slug, (lat, lon) in points.items()
+        ],
+    }
+
+
+POINTS = {
+    "jerusalem": (31.7767, 35.2345),
+    "bethany": (31.7711, 35.2611),
+    "bethlehem": (31.7054, 35.2024),
+    "capernaum": (32.8807, 35.5750),
+    "rome": (41.8925, 12.4853),
+}
+
+
+def test_projection_round_trip():
+    x, y = project(35.2345, 31.7767)
+    assert unproject(x, y) == pytest.approx((35.2345, 31.7767))
+    assert project(0, 0) == pytest.approx((0.5, 0.5))
+
+
+def test_cluster_levels():
+    """Nearby places merge as the map zooms out; counts are conserved."""
+    levels = cluster_places(_bundle(POINTS), max_zoom=12)
+
+    assert sorted(levels) == list(range(14))
+    for features in levels.values():
+        assert sum(f["properties"].get("count", 1) for f in features) == len(POINTS)
+
+    # Zoomed out: Judea collapses, Rome stays separate
+    clusters = [f for f in levels[5] if f["properties"].get("cluster")]
+    assert [c["properties"]["count"] for c in clusters] == [4]
+    west, south, east, north = clusters[0]["properties"]["bounds"]
+    assert (west, south, east, north) == (35.2024, 31.7054, 35.575, 32.8807)
+
+    # Zoomed in: every place is its own marker with its properties
+    points = levels[13]
+    assert {f["id"] for f in points} == set(POINTS)
+    assert points[0]["properties"] == {"name": "Jerusalem", "document_id": "doc-jerusalem"}
+
+
+def test_expansion_zoom_splits_cluster():
+    """A cluster's expansion zoom shows more than one marker for its places."""
+    levels = cluster_places(_bundle(POINTS), max_zoom=12)
+    cluster = next(f for f in levels[8] if f["properties"].get("cluster"))
+    west, south, east, north = cluster["properties"]["bounds"]
+
+    inside = [
+        f for f in levels[cluster["properties"]["expansion_zoom"]]
+        if west <= f["geometry"]["coordinates"][0] <= east and south <= f["geometry"]["coordinates"][1] <= north
+    ]
+    assert len(inside) > 1
+
+
+def test_build_writes_tiles(tmp_path):
+    """Tiles are addressed z/x/y and listed in the index."""
+    output = tmp_path / "clusters"
+    stats = build_place_clusters(_bundle(POINTS), output, max_zoom=10)
+    build_place_clusters(_bundle(POINTS), output, max_zoom=10)  # rebuild replaces
+
+    index = load_clusters_index(output)
+    assert index["max_zoom"] == 10
+    assert index["count"] == stats["places"] == len(POINTS)
+    assert stats["tiles"] == sum(len(tiles) for tiles in index["tiles"].values())
+
+    # Zoom 0 is a single tile holding everything
+    assert index["tiles"]["0"] == ["0/0"]
+    assert sum(f["properties"].get("count", 1) for f in tile_features(output, 0, 0, 0)) == len(POINTS)
+
+    # The Jerusalem tile at max zoom + 1 contains Jerusalem
+    x, y = project(35.2345, 31.7767)
+    tile = (int(x * 2 ** 11), int(y * 2 ** 11))
+    assert "jerusalem" in {f["id"] for f in tile_features(output, 11, *tile)}
+    assert tile_features(output, 11, 0, 0) is None
+    assert not (tmp_path / "clusters.tmp").exists()
+
+
+def test_load_missing_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_clusters_index(tmp_path)
+
+
+def test_random_places_conserve_counts():
+    """Counts are conserved for a dense, realistic distribution."""
+    rng = random.Random(5)
+    points = {f"p{i}": (rng.uniform(29, 34), rng.uniform(33, 37)) for i in range(1400)}
+
+    levels = cluster_places(_bundle(points))
+
+    for zoom, features in levels.items():
+        assert sum(f["properties"].get("count", 1) for f in features) == len(points)
+    assert len(levels[0]) < len(levels[8]) < len(levels[13])
@@ -0,0 +1,137 @@
+"""Unit tests for batch place scoring."""
+
+import json
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from geography_importer import GeographyImporter
+from place_scoring import (
+    VOTE_FIELDS,
+    classify_confidence_scores,
+    parse_coordinates_batch,
+    place_table,
+    score_places,
+    summarize_places,
+)
+
+
+LONLATS = [
+    "35.2345,31.7767",
+    " 35.2345 , 31.7767 ",
+    "-122.4194,37.7749",
+    "180.0,90.0",
+    "-180.0,-90.0",
+    "",
+    "35.2345 31.7767",
+    "35.2345,31.7767,100",
+    "abc,def",
+    "200.0,50.0",
+    "50.0,100.0",
+    "inf,0",
+    ",",
+]
+
+
+def _entries(count=500, seed=7):
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        entry = {"url_slug": f"place-{i}", "types": ["settlement"]}
+        entry.update({field: rng.randint(0, 20) for field in VOTE_FIELDS if rng.random() < 0.7})
+        if rng.random() < 0.9:
+            resolution = {}
+            if rng.random() < 0.9:
+                resolution["lonlat"] = rng.choice(LONLATS + [f"{rng.uniform(-190, 190):.4f},{rng.uniform(-95, 95):.4f}"] * 5)
+            entry["identifications"] = [{"resolutions": [resolution], "score": {"vote_total": rng.randint(-100, 1500)}}]
+        entries.append(entry)
+    return entries
+
+
+@pytest.fixture
+def importer(tmp_path):
+    return GeographyImporter(data_dir=tmp_path)
+
+
+def test_parse_coordinates_matches_reference(importer):
+    """Batch parsing accepts and rejects exactly what parse_coordinates does."""
+    lat, lon = parse_coordinates_batch(np.array(LONLATS))
+
+    for i, text in enumerate(LONLATS):
+        expected = importer.parse_coordinates(text)
+        if expected == (None, None):
+            assert np.isnan(lat[i]) and np.isnan(lon[i]), text
+        else:
+            assert (lat[i], lon[i]) == expected, text
+
+
+def test_classify_matches_reference(importer):
+    scores = np.array([-50, 0, 50, 51, 100, 200, 201, 300, 500, 501, 600])
+    assert classify_confidence_scores(scores).tolist() == [importer.classify_confidence(s) for s in scores]
+
+
+def test_score_places_matches_reference(importer):
+    """Every batch column equals the per-entry reference path."""
+    entries = _entries()
+    scored = score_places(place_table(entries))
+
+    for i, entry in enumerate(entries):
+        document = importer.place_to_document(entry)["metadata"]
+        assert scored["slug"][i] == document["slug"]
+        assert scored["vote_score"][i] == importer.calculate_confidence_score(entry)
+        assert scored["confidence_score"][i] == document["confidence_score"]
+        assert scored["confidence_level"][i] == document["confidence_level"]
+        if "latitude" in document:
+            assert (scored["latitude"][i], scored["longitude"][i]) == (document["latitude"], document["longitude"])
+        else:
+            assert np.isnan(scored["latitude"][i])
+
+
+def test_summarize_places():
+    entries = [
+        {"url_slug": "a", "identifications": [{"resolutions": [{"lonlat": "35,31"}], "score": {"vote_total": 600}}]},
+        {"url_slug": "b", "identifications": [{"resolutions": [{"lonlat": "36,33"}], "score": {"vote_total": 40}}]},
+        {"url_slug": "c", "identifications": [{"resolutions": [{"lonlat": "bad"}], "score": {"vote_total": 120}}]},
+        {"url_slug": "d"},
+    ]
+    report = summarize_places(score_places(place_table(entries)))
+
+    assert report["places"] == 4
+    assert report["confidence_levels"] == {"low": 2, "moderate": 1, "high": 0, "very high": 1}
+    assert report["score_histogram"]["<= 0"] == 1
+    assert report["score_histogram"]["1-50"] == 1
+    assert report["score_histogram"]["101-200"] == 1
+    assert report["score_histogram"]["501-1000"] == 1
+    assert sum(report["score_histogram"].values()) == 4
+    assert report["coordinates"] == {"located": 2, "missing": 1, "invalid": 1}
+    assert report["bbox"] == [35.0, 31.0, 36.0, 33.0]
+
+
+def test_empty_table():
+    report = summarize_places(score_places(place_table([])))
+    assert report["places"] == 0
+    assert report["bbox"] is None
+
+
+def test_importer_place_report(importer):
+    importer.jsonl_file.write_text("\n".join(json.dumps(entry) for entry in _entries(50)))
+    report = importer.place_report()
+
+    assert report["places"] == 50
+    assert sum(report["confidence_levels"].values()) == 50
+
+
+def test_import_report_reads_data_file_once(importer, monkeypatch):
+    """The dry-run report comes from the conversion pass, not another read."""
+    importer.jsonl_file.write_text("\n".join(json.dumps(entry) for entry in _entries(50)))
+    expected = importer.place_report()
+
+    reads = []
+    iter_jsonl = importer.iter_jsonl
+    monkeypatch.setattr(importer, "iter_jsonl", lambda *args: reads.append(args) or iter_jsonl(*args))
+    results = importer.import_all(dry_run=True, download=False)
+
+    assert results["report"] == expected
+    assert len(reads) == 1
@@ -1,10 +1,13 @@
 """Unit tests for Prism client module (with mocked HTTP)."""
 
+import asyncio
+import time
+
 import pytest
 import httpx
 from unittest.mock import AsyncMock, patch
 
-from prism_client import PrismClient, import_documents_in_batches
+from prism_client import PrismClient, SearchCache, import_document_streams, import_documents_in_batches
 
 
 class TestPrismClientInit:
@@ -359,3 +362,359 @@ class TestImportDocumentsInBatches:
             assert len(progress_calls) == 2
             assert progress_calls[0] == (1, 2)
             assert progress_calls[1] == (2, 2)
+
+
+class TestImportDocumentStreams:
+    """Test the streaming multi-source import pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_streams_validate_batch_size(self):
+        """Batch size >100 raises ValueError."""
+        with pytest.raises(ValueError):
+            await import_document_streams({"a": []}, batch_size=101)
+
+    @pytest.mark.asyncio
+    async def test_streams_aggregate_per_stream(self, mock_httpx_client):
+        """Each stream is batched separately and counted on its own."""
+        mock_request = httpx.Request("POST", "http://test")
+        mock_httpx_client.get.return_value = httpx.Response(
+            200, json={"status": "healthy"}, request=mock_request
+        )
+        mock_httpx_client.post.side_effect = lambda url, json, **kwargs: httpx.Response(
+            200,
+            json={"imported": len(json["documents"]), "failed": 0, "results": []},
+            request=mock_request,
+        )
+
+        streams = {
+            "hebrew": ({"title": f"H{i}"} for i in range(7)),
+            "greek": ({"title": f"G{i}"} for i in range(3)),
+        }
+        progress_calls = []
+
+        with patch.object(PrismClient, "__aenter__") as mock_enter, \
+             patch.object(PrismClient, "__aexit__"):
+
+            mock_client_instance = PrismClient()
+            mock_client_instance.client = mock_httpx_client
+            mock_enter.return_value = mock_client_instance
+
+            result = await import_document_streams(
+                streams,
+                batch_size=2,
+                concurrency=2,
+                progress_callback=lambda n, total, r: progress_calls.append(total),
+            )
+
+        # 4 Hebrew batches (2+2+2+1) and 2 Greek batches (2+1)
+        assert result["total_documents"] == 10
+        assert result["total_batches"] == 6
+        assert result["success_count"] == 10
+        assert result["streams"]["hebrew"]["documents"] == 7
+        assert result["streams"]["greek"]["success_count"] == 3
+        assert "docs_per_sec" in result["streams"]["hebrew"]
+        assert progress_calls == [None] * 6
+
+    @pytest.mark.asyncio
+    async def test_streams_record_batch_errors(self, mock_httpx_client):
+        """Failed uploads are counted against their stream."""
+        mock_request = httpx.Request("POST", "http://test")
+        mock_httpx_client.get.return_value = httpx.Response(
+            200, json={"status": "healthy"}, request=mock_request
+        )
+        mock_httpx_client.post.side_effect = httpx.ConnectError("boom")
+
+        with patch.object(PrismClient, "__aenter__") as mock_enter, \
+             patch.object(PrismClient, "__aexit__"):
+
+            mock_client_instance = PrismClient()
+            mock_client_instance.client = mock_httpx_client
+            mock_enter.return_value = mock_client_instance
+
+            result = await import_document_streams(
+                {"greek": [{"title": "G1"}, {"title": "G2"}]}, batch_size=1
+            )
+
+        assert result["error_count"] == 2
+        assert result["streams"]["greek"]["error_count"] == 2
+        assert len(result["errors"]) == 2
+
+
+def _paged_documents(count, key="documents", report_total=True, max_limit=None):
+    """Mock GET handler serving count documents by offset/limit (capped at max_limit)."""
+    documents = [
+        {"id": f"doc-{i}", "title": f"Doc {i}", "metadata": {"strong_id": f"G{i}", "lemma": "λ"}}
+        for i in range(count)
+    ]
+    calls = []
+
+    async def get(url, params=None, **kwargs):
+        calls.append(params)
+        offset, limit = params["offset"], min(params["limit"], max_limit or params["limit"])
+        body = {key: documents[offset:offset + limit]}
+        if report_total:
+            body["total"] = count
+        return httpx.Response(200, json=body, request=httpx.Request("GET", "http://test"))
+
+    return get, calls
+
+
+class TestIterDocuments:
+    """Test paginated document listing."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("report_total", [True, False])
+    async def test_iter_documents_pages_in_order(self, mock_prism_client, report_total):
+        """All documents stream in order, with or without a reported total."""
+        get, calls = _paged_documents(25, report_total=report_total)
+        mock_prism_client.client.get.side_effect = get
+
+        ids = [doc["id"] async for doc in mock_prism_client.iter_documents("lexicon/strongs", page_size=10)]
+
+        assert ids == [f"doc-{i}" for i in range(25)]
+        assert all(call["limit"] == 10 for call in calls)
+        if report_total:
+            assert sorted(call["offset"] for call in calls) == [0, 10, 20]
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_items_key_and_projection(self, mock_prism_client):
+        """"items" responses are accepted and fields are projected."""
+        get, calls = _paged_documents(3, key="items", report_total=False)
+        mock_prism_client.client.get.side_effect = get
+
+        docs = [
+            doc async for doc in mock_prism_client.iter_documents(
+                "lexicon/strongs", fields=["id", "metadata.strong_id"], page_size=2
+            )
+        ]
+
+        assert docs[2] == {"id": "doc-2", "metadata": {"strong_id": "G2"}}
+        assert calls[0]["fields"] == "id,metadata.strong_id"
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_page_size_capped_by_server(self, mock_prism_client):
+        """Short pages below the reported total continue from where they ended."""
+        get, calls = _paged_documents(1342, max_limit=100)
+        mock_prism_client.client.get.side_effect = get
+
+        ids = [doc["id"] async for doc in mock_prism_client.iter_documents("geography/biblical", page_size=500)]
+
+        assert ids == [f"doc-{i}" for i in range(1342)]
+        assert [params["offset"] for params in calls[-3:]] == [1100, 1200, 1300]
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_stops_when_offset_ignored(self, mock_prism_client):
+        """A server that ignores offset yields one page instead of looping forever."""
+        get, calls = _paged_documents(25, report_total=False)
+
+        async def ignore_offset(url, params=None, **kwargs):
+            return await get(url, params={**params, "offset": 0})
+
+        mock_prism_client.client.get.side_effect = ignore_offset
+
+        docs = [
+            doc async for doc in mock_prism_client.iter_documents(
+                "lexicon/strongs", fields=["metadata.strong_id"], page_size=10
+            )
+        ]
+
+        assert [doc["metadata"]["strong_id"] for doc in docs] == [f"G{i}" for i in range(10)]
+        assert "id" not in docs[0]
+        assert calls[0]["fields"] == "metadata.strong_id,id"
+        assert len(calls) <= 4
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_stops_on_empty_page(self, mock_prism_client):
+        """An empty page ends the listing even when a larger total is reported."""
+        get, _ = _paged_documents(20)
+
+        async def truncated(url, params=None, **kwargs):
+            response = await get(url, params=params)
+            if params["offset"] >= 10:
+                return httpx.Response(200, json={"documents": [], "total": 20}, request=response.request)
+            return response
+
+        mock_prism_client.client.get.side_effect = truncated
+
+        ids = [doc["id"] async for doc in mock_prism_client.iter_documents("bible/kjv", page_size=10)]
+        assert ids == [f"doc-{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_count_domain_documents_without_total(self, mock_prism_client):
+        """Counting pages through the domain when no total is reported."""
+        get, _ = _paged_documents(1203, report_total=False)
+        mock_prism_client.client.get.side_effect = get
+
+        assert await mock_prism_client.count_domain_documents("bible/kjv") == 1203
+
+    @pytest.mark.asyncio
+    async def test_count_domain_documents_uses_total(self, mock_prism_client):
+        """A reported total answers the count in one request."""
+        get, calls = _paged_documents(31102)
+        mock_prism_client.client.get.side_effect = get
+
+        assert await mock_prism_client.count_domain_documents("bible/kjv") == 31102
+        assert len(calls) == 1
+
+
+def _echo_search(calls):
+    """Mock POST handler answering each search with its own query."""
+    async def post(url, json, **kwargs):
+        calls.append(json)
+        await asyncio.sleep(0)
+        return httpx.Response(
+            200,
+            json={"results": [{"document_title": json["query"], "domain": json.get("domain")}]},
+            request=httpx.Request("POST", "http://test"),
+        )
+    return post
+
+
+class TestSearchMany:
+    """Test concurrent multi-query search and the result cache."""
+
+    @pytest.mark.asyncio
+    async def test_search_many_preserves_order(self, mock_prism_client):
+        """Responses come back in query order; per-query overrides apply."""
+        calls = []
+        mock_prism_client.client.post.side_effect = _echo_search(calls)
+
+        results = await mock_prism_client.search_many(
+            ["Jerusalem", {"query": "G26", "domain": "lexicon/strongs", "top_k": 1}, "Bethel"],
+            domain="geography/biblical",
+            top_k=3,
+            concurrency=2,
+        )
+
+        assert [r["results"][0]["document_title"] for r in results] == ["Jerusalem", "G26", "Bethel"]
+        assert results[1]["results"][0]["domain"] == "lexicon/strongs"
+        assert {call["top_k"] for call in calls} == {1, 3}
+
+    @pytest.mark.asyncio
+    async def test_search_many_shares_duplicate_queries(self, mock_prism_client):
+        """Identical searches in one call are sent once."""
+        calls = []
+        mock_prism_client.client.post.side_effect = _echo_search(calls)
+
+        results = await mock_prism_client.search_many(["love", "love", " love "])
+
+        assert len(calls) == 1
+        assert results[0] == results[2]
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_search_many_return_exceptions(self, mock_prism_client):
+        """Failures can be returned in place."""
+        mock_prism_client.client.post.side_effect = httpx.ConnectError("down")
+
+        results = await mock_prism_client.search_many(["a"], return_exceptions=True)
+        assert isinstance(results[0], httpx.ConnectError)
+
+        with pytest.raises(httpx.ConnectError):
+            await mock_prism_client.search_many(["a"])
+
+    @pytest.mark.asyncio
+    async def test_cache_serves_repeat_searches(self, mock_httpx_client):
+        """Warm searches skip Prism until the entry expires."""
+        calls = []
+        mock_httpx_client.post.side_effect = _echo_search(calls)
+        client = PrismClient(search_cache=SearchCache(ttl=60))
+        client.client = mock_httpx_client
+
+        first = await client.search_documents("faith", top_k=2)
+        first["results"].clear()  # callers may mutate their copy
+        second = await client.search_documents("faith", top_k=2)
+        await client.search_documents("faith", top_k=3)
+
+        assert len(calls) == 2
+        assert second["results"][0]["document_title"] == "faith"
+        assert client.search_cache.hits == 1
+
+        with patch("prism_client.time.time", return_value=time.time() + 61):
+            await client.search_documents("faith", top_k=2)
+        assert len(calls) == 3
+
+    def test_cache_lru_eviction(self):
+        """Least recently used entries are evicted first."""
+        cache = SearchCache(max_size=2)
+        cache.put(SearchCache.key("a", None, 5), {"n": 1})
+        cache.put(SearchCache.key("b", None, 5), {"n": 2})
+        cache.get(SearchCache.key("a", None, 5))
+        cache.put(SearchCache.key("c", None, 5), {"n": 3})
+
+        assert cache.get(SearchCache.key("b", None, 5)) is None
+        assert cache.get(SearchCache.key("a", None, 5)) == {"n": 1}
+
+    def test_cache_persistence(self, tmp_path):
+        """Saved entries load into a new cache; expired ones are dropped."""
+        path = tmp_path / "search_cache.json"
+        cache = SearchCache(path=path)
+        cache.put(SearchCache.key("grace", "bible/kjv", 5), {"results": [1]})
+        cache.save()
+
+        assert SearchCache(path=path).get(SearchCache.key("grace", "bible/kjv", 5)) == {"results": [1]}
+        assert len(SearchCache(path=path, ttl=-1)) == 0
+
+        path.write_text("not json")
+        assert len(SearchCache(path=path)) == 0
+
+
+class TestSearchDomains:
+    """Test cross-domain fan-out search."""
+
+    @staticmethod
+    def _responses(by_domain):
+        async def post(url, json, **kwargs):
+            body = by_domain[json["domain"]]
+            if isinstance(body, Exception):
+                raise body
+            return httpx.Response(
+                200, json={"results": body[:json["top_k"]]}, request=httpx.Request("POST", "http://test")
+            )
+        return post
+
+    @pytest.mark.asyncio
+    async def test_merge_ranks_and_dedupes_translations(self, mock_prism_client):
+        """Results merge by similarity; a verse range appears once."""
+        mock_prism_client.client.post.side_effect = self._responses({
+            "bible/kjv": [
+                {"document_title": "John 10:11-14 (KJV)", "similarity": 0.91},
+                {"document_title": "Psalms 23:1-6 (KJV)", "similarity": 0.80},
+            ],
+            "bible/asv": [{"document_title": "John 10:11-14 (ASV)", "similarity": 0.93}],
+            "lexicon/strongs": [{"document_title": "Strong's G4166 - ποιμήν", "similarity": 0.85}],
+        })
+
+        result = await mock_prism_client.search_domains(
+            "good shepherd", ["bible/kjv", "bible/asv", "lexicon/strongs"], top_k=5
+        )
+
+        titles = [r["document_title"] for r in result["results"]]
+        assert titles == ["John 10:11-14 (ASV)", "Strong's G4166 - ποιμήν", "Psalms 23:1-6 (KJV)"]
+        assert result["results"][0]["also_in"] == ["bible/kjv"]
+        assert result["results"][1]["domain"] == "lexicon/strongs"
+        assert result["domains"] == {"bible/kjv": 1, "bible/asv": 1, "lexicon/strongs": 1}
+
+    @pytest.mark.asyncio
+    async def test_quotas_and_failed_domains(self, mock_prism_client):
+        """Quotas cap each domain; a failing domain is reported, not raised."""
+        mock_prism_client.client.post.side_effect = self._responses({
+            "geography/biblical": [
+                {"document_title": f"Biblical Place: {name}", "similarity": 0.9 - i / 10}
+                for i, name in enumerate(["Bethlehem", "Jerusalem", "Hebron"])
+            ],
+            "metadata/books": [{"document_title": "Book: Ruth", "similarity": 0.5}],
+            "bible/kjv": httpx.ConnectError("timeout"),
+        })
+
+        result = await mock_prism_client.search_domains(
+            "Bethlehem",
+            ["geography/biblical", "metadata/books", "bible/kjv"],
+            top_k=3,
+            quotas={"geography/biblical": 1},
+        )
+
+        assert [r["document_title"] for r in result["results"]] == [
+            "Biblical Place: Bethlehem", "Book: Ruth",
+        ]
+        assert "bible/kjv" in result["errors"]
@@ -0,0 +1,67 @@
+"""Unit tests for the free-text verse citation parser."""
+
+from reference_parser import extract_verse_ranges, find_references
+from verse_ids import VerseRange
+
+
+def _formatted(text):
+    return [match.format() for match in find_references(text)]
+
+
+class TestFindReferences:
+    """Tests for citation detection."""
+
+    def test_full_names_and_abbreviations(self):
+        """Full names, abbreviations and trailing periods are recognized."""
+        assert _formatted("Genesis 15:6, Gen 15:6 and Gen. 15:6") == ["Genesis 15:6"] * 3
+        assert _formatted("cf. Ex 3:14; Isa 53:5; Mt 5:3") == [
+            "Exodus 3:14", "Isaiah 53:5", "Matthew 5:3",
+        ]
+
+    def test_numbered_books(self):
+        """Numbered books are not read as their unnumbered suffix."""
+        assert _formatted("1 John 3:16") == ["1 John 3:16"]
+        assert _formatted("2 Kgs 5:12, I Sam 3:4, 1Cor 13:4") == [
+            "2 Kings 5:12", "1 Samuel 3:4", "1 Corinthians 13:4",
+        ]
+
+    def test_ranges_and_lists(self):
+        """Ranges, comma lists and semicolon chapter switches."""
+        assert _formatted("Psalm 32:1-2") == ["Psalms 32:1-2"]
+        assert _formatted("John 3:16-4:2") == ["John 3:16-4:2"]
+        assert _formatted("John 3:16, 18") == ["John 3:16", "John 3:18"]
+        assert _formatted("Rom 3:23; 6:23") == ["Romans 3:23", "Romans 6:23"]
+
+    def test_case_insensitive(self):
+        """Lowercase citations resolve to canonical names."""
+        assert _formatted("see genesis 15:6") == ["Genesis 15:6"]
+
+    def test_no_false_positives(self):
+        """Numbers and words that merely contain book names are ignored."""
+        assert find_references("There were 15 men and 6 women.") == []
+        assert find_references("Markers 3:4 and rejoice 5:6") == []
+        assert find_references("Genesis 15") == []
+
+    def test_short_abbreviations_in_prose(self):
+        """Lowercase one- and two-letter words before a time are not books."""
+        assert find_references("it is 5:30 already") == []
+        assert find_references("I am 3:15 early") == []
+        assert find_references("and so 2:3 it went, ex 4:5") == []
+        assert find_references("see 1 jn 3:16") == []
+
+    def test_short_abbreviations_capitalized_or_dotted(self):
+        """Capitalized or abbreviated-with-period short names still resolve."""
+        assert _formatted("Is 53:5, Am 3:15 and is. 40:31") == [
+            "Isaiah 53:5", "Amos 3:15", "Isaiah 40:31",
+        ]
+        assert _formatted("1 Jn 3:16") == ["1 John 3:16"]
+
+    def test_match_offsets(self):
+        """Matches carry their position in the text."""
+        text = "As in Romans 4:3."
+        match = find_references(text)[0]
+        assert text[match.start:match.end] == "Romans 4:3"
+
+    def test_extract_verse_ranges(self):
+        """Ranges are canonical verse IDs."""
+        assert extract_verse_ranges("1 John 4:8-10") == [VerseRange(62004008, 62004010)]
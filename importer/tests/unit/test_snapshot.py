@@ -0,0 +1,211 @@
+"""Unit tests for Prism snapshot export and restore (with mocked HTTP)."""
+
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import snapshot
+from prism_client import SEARCH_DOMAINS, PrismClient
+from snapshot import default_domains, export_snapshot, iter_snapshot_documents, load_manifest, restore_snapshot, verify_snapshot
+
+
+def _documents(domain, count, embedded=True):
+    return [
+        {
+            "id": f"{domain}-{i}",
+            "title": f"{domain} {i}",
+            "content": f"Text {i}",
+            "domain": domain,
+            "metadata": {"n": i, "tags": ["a", "b"], "nested": {"ok": True}},
+            **({"embedding": [i / 4, -0.5, 0.25]} if embedded else {}),
+        }
+        for i in range(count)
+    ]
+
+
+class FakePrism:
+    """Serves paged domain listings and stores imported documents under new IDs."""
+
+    def __init__(self, corpus):
+        self.corpus = corpus
+        self.list_params = []
+        self.imports = []
+        self.keep_embeddings = True
+        self.totals = {}
+
+    async def get(self, url, params=None, **kwargs):
+        request = httpx.Request("GET", "http://test")
+        if url != "/api/v1/documents":
+            return httpx.Response(200, json={"status": "healthy"}, request=request)
+        self.list_params.append(params)
+        documents = self.corpus.get(params["domain"], [])
+        page = documents[params["offset"]:params["offset"] + params["limit"]]
+        if params.get("include_embeddings") != "true":
+            page = [{k: v for k, v in document.items() if k != "embedding"} for document in page]
+        return httpx.Response(200, json={"documents": page, "total": self.totals.get(params["domain"], len(documents))}, request=request)
+
+    async def post(self, url, json, **kwargs):
+        self.imports.append(json)
+        results = []
+        for document in json["documents"]:
+            stored = {k: v for k, v in document.items() if self.keep_embeddings or k != "embedding"}
+            stored["id"] = f"new-{len(self.imports)}-{len(results)}"
+            self.corpus.setdefault(document["domain"], []).append(stored)
+            results.append({"title": document["title"], "document_id": stored["id"], "success": True})
+        return httpx.Response(
+            200,
+            json={"imported": len(results), "failed": 0, "results": results},
+            request=httpx.Request("POST", "http://test"),
+        )
+
+
+@pytest.fixture
+def prism(mock_httpx_client):
+    fake = FakePrism({
+        "bible/kjv": _documents("bible/kjv", 25),
+        "metadata/books": _documents("metadata/books", 4, embedded=False),
+        "geography/biblical": [],
+    })
+    mock_httpx_client.get.side_effect = fake.get
+    mock_httpx_client.post.side_effect = fake.post
+
+    client = PrismClient()
+    client.client = mock_httpx_client
+    with patch.object(PrismClient, "__aenter__", return_value=client), \
+         patch.object(PrismClient, "__aexit__", return_value=None), \
+         patch.object(snapshot, "BATCH_ROWS", 10), \
+         patch.object(snapshot, "local_id_files", return_value=[]):
+        yield fake
+
+
+async def test_export_writes_domains_and_manifest(prism, tmp_path):
+    """Each domain is paged with embeddings into its own file; the manifest comes last."""
+    domains = ["bible/kjv", "metadata/books", "geography/biblical"]
+    manifest = await export_snapshot(tmp_path, domains, page_size=7)
+
+    assert manifest == load_manifest(tmp_path)
+    kjv = manifest["domains"]["bible/kjv"]
+    assert (kjv["file"], kjv["documents"], kjv["embedded"], kjv["dimension"]) == ("bible__kjv.arrow", 25, 25, 3)
+    assert manifest["domains"]["metadata/books"]["embedded"] == 0
+    assert manifest["domains"]["geography/biblical"]["documents"] == 0
+    assert [manifest["domains"][domain]["total"] for domain in domains] == [25, 4, 0]
+    pages = [params for params in prism.list_params if "fields" not in params]
+    assert all(params["include_embeddings"] == "true" for params in pages)
+    assert not list(tmp_path.glob("*.tmp"))
+
+    documents = list(iter_snapshot_documents(tmp_path, "bible/kjv"))
+    assert [document["title"] for document in documents] == [f"bible/kjv {i}" for i in range(25)]
+    assert documents[3]["metadata"] == {"n": 3, "tags": ["a", "b"], "nested": {"ok": True}}
+    assert documents[3]["embedding"] == [0.75, -0.5, 0.25]
+
+
+async def test_restore_uses_stored_embeddings(prism, tmp_path):
+    """Fully embedded domains upload their vectors with embed=False; others are re-embedded."""
+    await export_snapshot(tmp_path, ["bible/kjv", "metadata/books"])
+
+    results = await restore_snapshot(tmp_path, batch_size=10, concurrency=3)
+
+    assert results["success_count"] == results["total_documents"] == 29
+    assert results["domains"]["bible/kjv"]["embed"] is False
+    assert results["domains"]["metadata/books"]["embed"] is True
+    by_domain = {}
+    for payload in prism.imports:
+        for document in payload["documents"]:
+            by_domain.setdefault(document["domain"], []).append((payload["embed"], document))
+    assert all(not embed and "embedding" in doc for embed, doc in by_domain["bible/kjv"])
+    assert all(embed and "embedding" not in doc for embed, doc in by_domain["metadata/books"])
+    assert sorted(doc["title"] for _, doc in by_domain["bible/kjv"]) == sorted(
+        document["title"] for document in _documents("bible/kjv", 25)
+    )
+
+
+async def test_restore_reembed_and_domain_filter(prism, tmp_path):
+    await export_snapshot(tmp_path, ["bible/kjv", "metadata/books"])
+
+    results = await restore_snapshot(tmp_path, domains=["bible/kjv"], reembed=True)
+
+    assert list(results["domains"]) == ["bible/kjv"]
+    assert all(payload["embed"] for payload in prism.imports)
+    assert not any("embedding" in document for payload in prism.imports for document in payload["documents"])
+
+
+async def test_restore_remaps_local_document_ids(prism, tmp_path):
+    """Local files that stored the exported IDs point at the restored documents."""
+    snapshot_dir = tmp_path / "snapshot"
+    await export_snapshot(snapshot_dir, ["bible/kjv", "metadata/books"])
+    prism.corpus = {}  # restore into an empty Prism
+    lexicon = tmp_path / "lexicon_index.json"
+    lexicon.write_text(json.dumps({"entries": {"X": {"document_id": "bible/kjv-3", "title": "x"}}}))
+    spatial = tmp_path / "spatial_index.json"
+    spatial.write_text(json.dumps({"places": {"document_id": ["metadata/books-1", None, "other"]}}))
+    untouched = tmp_path / "journeys.json"
+    untouched.write_text(json.dumps({"journeys": [{"place": {"document_id": "other"}}]}))
+
+    results = await restore_snapshot(snapshot_dir, id_files=[lexicon, spatial, untouched, tmp_path / "missing.json"])
+
+    new_ids = {doc["title"]: doc["id"] for docs in prism.corpus.values() for doc in docs}
+    assert json.loads(lexicon.read_text())["entries"]["X"]["document_id"] == new_ids["bible/kjv 3"]
+    assert json.loads(spatial.read_text())["places"]["document_id"] == [new_ids["metadata/books 1"], None, "other"]
+    assert results["remapped"] == {str(lexicon): 1, str(spatial): 1}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+async def test_restore_fails_when_prism_drops_embeddings(prism, tmp_path):
+    """Restored pages are checked for the vectors uploaded with embed=False."""
+    await export_snapshot(tmp_path, ["bible/kjv"])
+    prism.corpus = {}
+    prism.keep_embeddings = False
+
+    with pytest.raises(RuntimeError, match="--reembed"):
+        await restore_snapshot(tmp_path)
+    assert prism.list_params[-1]["include_embeddings"] == "true"
+
+
+async def test_corrupt_or_missing_snapshot(prism, tmp_path):
+    """Restore refuses files that do not match the manifest."""
+    with pytest.raises(FileNotFoundError, match="export-snapshot"):
+        load_manifest(tmp_path)
+
+    await export_snapshot(tmp_path, ["bible/kjv"])
+    with pytest.raises(ValueError, match="not in snapshot"):
+        verify_snapshot(tmp_path, ["lexicon/strongs"])
+
+    with open(tmp_path / "bible__kjv.arrow", "ab") as f:
+        f.write(b"x")
+    with pytest.raises(ValueError, match="checksum"):
+        await restore_snapshot(tmp_path)
+    assert prism.imports == []
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    manifest["version"] = 99
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match="Unsupported snapshot version"):
+        load_manifest(tmp_path)
+
+
+async def test_export_and_restore_check_reported_total(prism, tmp_path):
+    """An export short of Prism's total fails; a manifest below its total blocks restore."""
+    prism.totals["bible/kjv"] = 26
+    with pytest.raises(RuntimeError, match="Exported 25 documents from bible/kjv but Prism reported 26"):
+        await export_snapshot(tmp_path, ["bible/kjv"])
+    assert not list(tmp_path.iterdir())
+
+    del prism.totals["bible/kjv"]
+    await export_snapshot(tmp_path, ["bible/kjv"])
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    manifest["domains"]["bible/kjv"]["total"] = 30
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match="holds 25 documents but Prism reported 30"):
+        await restore_snapshot(tmp_path)
+    assert prism.imports == []
+
+
+def test_default_domains():
+    """Snapshots cover every search domain unless settings list others."""
+    assert default_domains() == list(SEARCH_DOMAINS)
+    with patch.object(snapshot.settings, "snapshot_domains", ["bible/kjv"]):
+        assert default_domains() == ["bible/kjv"]
@@ -0,0 +1,148 @@
+"""Unit tests for the biblical place spatial index."""
+
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
+from geography_importer import GeographyImporter
+from spatial_index import SpatialIndex, haversine_km
+
+
+PLACES = {
+    # slug: (name, lat, lon)
+    "jerusalem": ("Jerusalem", 31.7767, 35.2345),
+    "bethlehem": ("Bethlehem", 31.7054, 35.2024),
+    "bethany": ("Bethany", 31.7711, 35.2611),
+    "jericho": ("Jericho", 31.8711, 35.4440),
+    "nazareth": ("Nazareth", 32.7021, 35.2978),
+    "capernaum": ("Capernaum", 32.8807, 35.5750),
+    "babylon": ("Babylon", 32.5363, 44.4209),
+    "rome": ("Rome", 41.8925, 12.4853),
+}
+
+
+@pytest.fixture
+def index(tmp_path, place_document):
+    index = SpatialIndex(tmp_path / "spatial_index.json")
+    for slug, (name, lat, lon) in PLACES.items():
+        index.add_document(place_document(slug, name, lat, lon))
+    assert not index.add_document(place_document("eden", "Eden"))
+    return index.build()
+
+
+def test_haversine():
+    """Jerusalem to Bethlehem is about 8 km."""
+    assert haversine_km(31.7767, 35.2345, 31.7054, 35.2024) == pytest.approx(8.5, abs=0.3)
+
+
+def test_within_radius(index):
+    """Radius queries return places sorted by distance."""
+    places = index.within_radius(31.7767, 35.2345, 20)
+
+    assert [p["slug"] for p in places] == ["jerusalem", "bethany", "bethlehem"]
+    assert places[0]["distance_km"] == 0
+    assert [p["slug"] for p in index.within_radius(31.7767, 35.2345, 30, limit=2)] == ["jerusalem", "bethany"]
+
+
+def test_within_bbox(index):
+    """Viewport queries return places inside the box only."""
+    places = index.within_bbox(31.0, 34.5, 32.0, 35.5)
+
+    assert {p["slug"] for p in places} == {"jerusalem", "bethlehem", "bethany", "jericho"}
+    assert {p["slug"] for p in index.within_bbox(-90, -180, 90, 180)} == set(PLACES)
+    with pytest.raises(ValueError):
+        index.within_bbox(32.0, 34.5, 31.0, 35.5)
+
+
+def test_nearest(index):
+    """k-nearest searches expand across cells until the answer is exact."""
+    assert [p["slug"] for p in index.nearest(32.85, 35.5, k=2)] == ["capernaum", "nazareth"]
+    assert [p["slug"] for p in index.nearest(40.0, 20.0, k=1)] == ["rome"]
+    assert len(index.nearest(0, 0, k=50)) == len(PLACES)
+
+
+def test_find(index):
+    """Places resolve by slug or name."""
+    assert index.find("jerusalem")["name"] == "Jerusalem"
+    assert index.find(" JERICHO ")["slug"] == "jericho"
+    assert index.find("Eden") is None
+
+
+def test_save_load_round_trip(index):
+    """The saved index answers queries identically."""
+    index.save()
+    loaded = SpatialIndex(index.path).load()
+
+    assert len(loaded) == len(PLACES)
+    assert loaded.within_radius(31.7767, 35.2345, 20) == index.within_radius(31.7767, 35.2345, 20)
+    assert json.loads(index.path.read_text())["cell_size"] == index.cell_size
+
+
+def test_load_missing_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SpatialIndex(tmp_path / "missing.json").load()
+
+
+def test_matches_brute_force(place_document):
+    """Grid queries agree with a full scan over random places."""
+    rng = random.Random(3)
+    index = SpatialIndex(None)
+    points = {}
+    for i in range(1500):
+        lat, lon = rng.uniform(29, 34), rng.uniform(33, 37)
+        points[f"p{i}"] = (lat, lon)
+        index.add_document(place_document(f"p{i}", f"P{i}", lat, lon))
+    index.build()
+
+    for _ in range(20):
+        lat, lon = rng.uniform(29, 34), rng.uniform(33, 37)
+        distances = sorted((haversine_km(lat, lon, *point), slug) for slug, point in points.items())
+        assert [p["slug"] for p in index.within_radius(lat, lon, 25)] == [
+            slug for distance, slug in distances if distance <= 25
+        ]
+        assert [p["slug"] for p in index.nearest(lat, lon, k=7)] == [slug for _, slug in distances[:7]]
+
+
+def test_import_writes_index_with_document_ids(tmp_path):
+    """import-geography builds the index and keeps Prism document IDs."""
+    importer = GeographyImporter(
+        data_dir=tmp_path,
+        index_path=tmp_path / "spatial_index.json",
+        bundle_path=tmp_path / "places.geojson",
+        clusters_dir=tmp_path / "clusters",
+        verse_index_path=tmp_path / "verse_places.json",
+    )
+    entries = [
+        {
+            "friendly_id": "Jerusalem",
+            "url_slug": "jerusalem",
+            "types": ["settlement"],
+            "identifications": [{"resolutions": [{"lonlat": "35.2345,31.7767"}], "score": {"vote_total": 800}}],
+            "verses": [{"osis": "Gen.14.18", "readable": "Gen 14:18"}],
+        },
+        {"friendly_id": "Eden", "url_slug": "eden", "types": ["region"]},
+    ]
+    importer.jsonl_file.write_text("\n".join(json.dumps(e) for e in entries))
+
+    async def fake_import(streams, batch_size, embed, progress_callback):
+        documents = list(streams["places"])
+        progress_callback(1, None, {"results": [{"title": "Biblical Place: Jerusalem", "document_id": 42}]})
+        return {"total_documents": len(documents), "success_count": len(documents), "error_count": 0, "errors": []}
+
+    with patch("geography_importer.import_document_streams", fake_import):
+        results = importer.import_all(download=False)
+
+    assert results["total_documents"] == 2
+    assert results["type_counts"] == {"settlement": 1, "region": 1}
+    assert results["spatial_index"]["places"] == 1
+    assert results["spatial_index"]["with_document_id"] == 1
+    assert SpatialIndex(importer.index_path).load().find("Jerusalem")["document_id"] == "42"
+
+    bundle = json.loads(importer.bundle_path.read_text())
+    assert results["bundle"]["places"] == bundle["count"] == 1
+    assert bundle["features"][0]["properties"]["document_id"] == "42"
+    assert (importer.clusters_dir / "index.json").exists()
+    assert results["verse_index"]["verses"] == 1
+    assert importer.verse_index_path.exists()
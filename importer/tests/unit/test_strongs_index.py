@@ -0,0 +1,144 @@
+"""Unit tests for the Strong's concordance index."""
+
+import pytest
+from unittest.mock import Mock
+
+from strongs_index import (
+    StrongsIndex,
+    build_strongs_index,
+    normalize_strongs,
+    pack_verse_id,
+    unpack_verse_id,
+)
+
+
+def _module(books, verses):
+    """Mock pysword Bible with the given books and raw verse texts."""
+    module = Mock()
+    module.get_structure.return_value.get_books.return_value = books
+    module.get_iter.side_effect = lambda books, clean: iter(verses[books[0]])
+    return module
+
+
+def _book(name, chapter_lengths):
+    book = Mock()
+    book.name = name
+    book.chapter_lengths = chapter_lengths
+    return book
+
+
+@pytest.fixture
+def parser():
+    """SwordParser stand-in with small tagged OT/NT modules."""
+    parser = Mock()
+    parser.modules = Mock()
+    parser.wlc = _module(
+        {"ot": [_book("Genesis", [2, 1])]},
+        {"Genesis": [
+            '<w lemma="strong:H07225">בְּרֵאשִׁית</w> <w lemma="strong:H1254">בָּרָא</w>',
+            '<w lemma="strong:H0776">וְהָאָרֶץ</w>',
+            '<w lemma="strong:H1254">בָּרָא</w> <w lemma="strong:H1254">בָּרָא</w>',
+        ]},
+    )
+    parser.sblgnt = _module(
+        {"nt": [_book("John", [1])]},
+        {"John": ['<w lemma="strong:G3056">λόγος</w>']},
+    )
+    return parser
+
+
+@pytest.fixture
+def index_dir(parser, tmp_path):
+    """Directory with a freshly built index."""
+    build_strongs_index(parser, tmp_path / "strongs_index")
+    return tmp_path / "strongs_index"
+
+
+def test_pack_verse_id_round_trip():
+    """Packed IDs sort canonically and unpack losslessly."""
+    assert pack_verse_id(1, 1, 1) == 1_001_001
+    assert unpack_verse_id(pack_verse_id(19, 119, 176)) == (19, 119, 176)
+    assert pack_verse_id(1, 50, 26) < pack_verse_id(2, 1, 1)
+
+
+def test_normalize_strongs():
+    """Case and zero padding are normalized."""
+    assert normalize_strongs("h07225") == "H7225"
+    assert normalize_strongs("G3056") == "G3056"
+    with pytest.raises(ValueError):
+        normalize_strongs("7225")
+
+
+def test_build_stats(parser, tmp_path):
+    """Build reports verse and posting counts."""
+    stats = build_strongs_index(parser, tmp_path)
+
+    assert stats["verses"] == 4
+    assert stats["tagged_verses"] == 4
+    assert stats["strongs_numbers"] == 4
+    assert stats["postings"] == 5
+    assert stats["occurrences"] == 6
+
+
+def test_lookup_verses_and_counts(index_dir):
+    """Lookup returns verses in canonical order with counts."""
+    with StrongsIndex(index_dir) as index:
+        result = index.lookup("H1254")
+
+    assert result["strongs"] == "H1254"
+    assert result["verse_count"] == 2
+    assert result["occurrences"] == 3
+    assert result["verses"] == [
+        {"book": "Genesis", "chapter": 1, "verse": 1},
+        {"book": "Genesis", "chapter": 2, "verse": 1},
+    ]
+
+
+def test_lookup_limit_and_unknown(index_dir):
+    """Limit truncates verses; unknown numbers return empty results."""
+    with StrongsIndex(index_dir) as index:
+        assert len(index.lookup("H1254", limit=1)["verses"]) == 1
+        assert index.lookup("H9999")["verses"] == []
+        assert index.verse_ids("g3056") == [pack_verse_id(43, 1, 1)]
+        assert "H7225" in index
+        assert len(index) == 4
+
+
+def test_load_missing_index(tmp_path):
+    """Loading before building raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        StrongsIndex(tmp_path).load()
+
+
+def test_untagged_modules_build_empty_index(parser, tmp_path):
+    """Modules without Strong's tags give an empty but loadable index."""
+    parser.wlc = _module(
+        {"ot": [_book("Genesis", [1])]}, {"Genesis": ["בְּרֵאשִׁית"]}
+    )
+    parser.sblgnt = None
+    build_strongs_index(parser, tmp_path)
+
+    with StrongsIndex(tmp_path) as index:
+        assert len(index) == 0
+        assert index.lookup("H7225")["verse_count"] == 0
+
+
+def test_postings_sorted_for_non_canonical_book_order(parser, tmp_path):
+    """Leningrad book order (Chronicles before Genesis here) still gives sorted postings."""
+    parser.wlc = _module(
+        {"ot": [_book("2 Chronicles", [1]), _book("Ruth", [1]), _book("Genesis", [1, 1])]},
+        {
+            "2 Chronicles": ['<w lemma="strong:H1254">בָּרָא</w>'],
+            "Ruth": ['<w lemma="strong:H1254">בָּרָא</w>'],
+            "Genesis": ['<w lemma="strong:H1254">בָּרָא</w>', '<w lemma="strong:H1254">בָּרָא</w>'],
+        },
+    )
+    build_strongs_index(parser, tmp_path)
+
+    with StrongsIndex(tmp_path) as index:
+        verse_ids = index.verse_ids("H1254")
+        assert verse_ids == sorted(set(verse_ids))
+        assert verse_ids == [
+            pack_verse_id(1, 1, 1), pack_verse_id(1, 2, 1), pack_verse_id(8, 1, 1), pack_verse_id(14, 1, 1),
+        ]
+        assert index.counts("H1254") == (4, 4)
@@ -307,6 +307,112 @@ class TestSwordParser:
             assert result is None
             assert "WLC module not loaded" in caplog.text
 
+    def test_get_verse_words_tagged(self, parser):
+        """Test word-level extraction keeps Strong's and morphology."""
+        parser.modules_dir.mkdir(exist_ok=True)
+
+        mock_wlc = Mock()
+        mock_wlc.get.return_value = (
+            '<w lemma="strong:H7225" morph="oshm:HR/Ncfsa">בְּרֵאשִׁית</w> '
+            '<w lemma="strong:H1254">בָּרָא</w>'
+        )
+
+        with patch("sword_parser.SwordModules") as mock_modules_class:
+            mock_modules = Mock()
+            mock_modules.parse_modules.return_value = ["WLC"]
+            mock_modules.get_bible_from_module.return_value = mock_wlc
+            mock_modules_class.return_value = mock_modules
+
+            parser.initialize()
+            result = parser.get_verse_words("Genesis", 1, 1)
+
+            assert result["language"] == "hebrew"
+            assert result["words"][0] == {
+                "original": "בְּרֵאשִׁית",
+                "strongs": "H7225",
+                "morphology": "HR/Ncfsa",
+            }
+            assert result["words"][1]["strongs"] == "H1254"
+            assert mock_wlc.get.call_args.kwargs["clean"] is False
+
+    def test_get_verse_words_untagged(self, parser):
+        """Test whitespace fallback for modules without <w> tags."""
+        parser.modules_dir.mkdir(exist_ok=True)
+
+        mock_wlc = Mock()
+        mock_wlc.get.return_value = "בְּרֵאשִׁית בָּרָא אֱלֹהִים"
+
+        with patch("sword_parser.SwordModules") as mock_modules_class:
+            mock_modules = Mock()
+            mock_modules.parse_modules.return_value = ["WLC"]
+            mock_modules.get_bible_from_module.return_value = mock_wlc
+            mock_modules_class.return_value = mock_modules
+
+            parser.initialize()
+            result = parser.get_verse_words("Genesis", 1, 1)
+
+            assert [w["original"] for w in result["words"]] == [
+                "בְּרֵאשִׁית", "בָּרָא", "אֱלֹהִים"
+            ]
+
+    def test_get_verse_range_clamps_to_chapter(self, parser):
+        """Test range lookup reads once and stops at the chapter end."""
+        parser.modules_dir.mkdir(exist_ok=True)
+
+        book_structure = Mock()
+        book_structure.chapter_lengths = [3]
+        mock_wlc = Mock()
+        mock_wlc.get_structure.return_value.find_book.return_value = ("ot", book_structure)
+        mock_wlc.get_iter.side_effect = lambda **kwargs: iter(
+            f'<w lemma="strong:H{v}">Verse {v}</w>' for v in kwargs["verses"]
+        )
+
+        with patch("sword_parser.SwordModules") as mock_modules_class:
+            mock_modules = Mock()
+            mock_modules.parse_modules.return_value = ["WLC"]
+            mock_modules.get_bible_from_module.return_value = mock_wlc
+            mock_modules_class.return_value = mock_modules
+
+            parser.initialize()
+            results = parser.get_verse_range("Genesis", 1, verse_start=2, verse_end=10)
+
+            assert list(results) == [2, 3]
+            assert results[2]["original_text"] == "Verse 2"
+            assert results[3]["strongs_numbers"] == ["H3"]
+            mock_wlc.get_iter.assert_called_once()
+            assert mock_wlc.get_iter.call_args.kwargs["verses"] == [2, 3]
+
+    def test_get_verses_batch(self, parser):
+        """Test batch lookup returns one range per reference, in order."""
+        parser.modules_dir.mkdir(exist_ok=True)
+
+        book_structure = Mock()
+        book_structure.chapter_lengths = [2, 4]
+        mock_wlc = Mock()
+        mock_wlc.get_structure.return_value.find_book.return_value = ("ot", book_structure)
+        mock_wlc.get_iter.side_effect = lambda **kwargs: iter(
+            f"{kwargs['chapters'][0]}:{v}" for v in kwargs["verses"]
+        )
+
+        with patch("sword_parser.SwordModules") as mock_modules_class:
+            mock_modules = Mock()
+            mock_modules.parse_modules.return_value = ["WLC"]
+            mock_modules.get_bible_from_module.return_value = mock_wlc
+            mock_modules_class.return_value = mock_modules
+
+            parser.initialize()
+            results = parser.get_verses([
+                ("Genesis", 2, 1, None),
+                ("Genesis", 1, 2, 2),
+                ("Genesis", 9, 1, None),
+            ])
+
+            assert [len(r["verses"]) for r in results] == [4, 1, 0]
+            assert results[0]["verse_end"] == 4
+            assert results[1]["verses"][0] == {
+                "original_text": "1:2", "language": "hebrew", "verse": 2
+            }
+
     def test_get_chapter_verses(self, parser):
         """Test batch fetching of chapter verses."""
         parser.modules_dir.mkdir(exist_ok=True)
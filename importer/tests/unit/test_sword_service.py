@@ -0,0 +1,298 @@
+"""Unit tests for SWORD original-text HTTP service (with mocked parser)."""
+
+import json
+from array import array
+
+import pytest
+from unittest.mock import Mock
+
+from starlette.testclient import TestClient
+
+from sword_service import ResponseCache, create_app
+
+
+@pytest.fixture
+def mock_parser():
+    """SwordParser stand-in with modules already loaded."""
+    parser = Mock()
+    parser.modules = Mock()
+    parser.wlc = Mock()
+    parser.sblgnt = Mock()
+
+    def get_verse_text(book, chapter, verse, testament=None):
+        if verse > 3:
+            return None
+        if book == "John":
+            return {"original_text": f"Ἐν ἀρχῇ {verse}", "language": "greek"}
+        return {
+            "original_text": f"בְּרֵאשִׁית {verse}",
+            "language": "hebrew",
+            "strongs_numbers": ["H7225"],
+        }
+
+    parser.get_verse_text = Mock(side_effect=get_verse_text)
+    parser.get_verse_words.return_value = {
+        "language": "hebrew",
+        "words": [
+            {"original": "בְּרֵאשִׁית", "strongs": "H7225", "morphology": "HR/Ncfsa"},
+            {"original": "בָּרָא"},
+        ],
+    }
+    parser.get_verse_range.return_value = {
+        1: {"original_text": "one", "language": "hebrew"},
+        2: {"original_text": "two", "language": "hebrew"},
+    }
+
+    def get_verses(references):
+        return [
+            {
+                "book": book,
+                "chapter": chapter,
+                "verse_start": start,
+                "verse_end": end or 2,
+                "verses": [
+                    {"original_text": "one", "language": "hebrew", "verse": 1},
+                    {"original_text": "two", "language": "hebrew", "verse": 2},
+                ][start - 1:end or 2],
+            }
+            for book, chapter, start, end in references
+        ]
+
+    parser.get_verses = Mock(side_effect=get_verses)
+    return parser
+
+
+@pytest.fixture
+def client(mock_parser, tmp_path):
+    """Test client running the app lifespan (no Strong's index built)."""
+    app = create_app(
+        parser=mock_parser, cache_size=100, max_age=3600, strongs_index_dir=tmp_path
+    )
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestVerseEndpoints:
+    """Tests for single-verse endpoints."""
+
+    def test_hebrew_post(self, client):
+        """POST body matches the UI request shape."""
+        response = client.post(
+            "/api/sword/hebrew", json={"book": "Genesis", "chapter": 1, "verse": 1}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["original_text"] == "בְּרֵאשִׁית 1"
+        assert data["book"] == "Genesis"
+        assert data["chapter"] == 1
+        assert data["verse"] == 1
+        assert data["strongs_numbers"] == ["H7225"]
+
+    def test_greek_get(self, client):
+        """GET path variant returns the same payload shape."""
+        response = client.get("/api/sword/greek/John/1/1")
+
+        assert response.status_code == 200
+        assert response.json()["language"] == "greek"
+
+    def test_language_selects_testament(self, client, mock_parser):
+        """Language in the path is passed through as testament."""
+        client.get("/api/sword/greek/John/1/2")
+        mock_parser.get_verse_text.assert_called_with("John", 1, 2, testament="NT")
+
+    def test_unknown_language(self, client):
+        """Unknown language segment is a 404."""
+        response = client.get("/api/sword/latin/John/1/1")
+        assert response.status_code == 404
+
+    def test_verse_not_found(self, client):
+        """Missing verse is a 404."""
+        response = client.post(
+            "/api/sword/hebrew", json={"book": "Genesis", "chapter": 1, "verse": 99}
+        )
+        assert response.status_code == 404
+
+    def test_invalid_body(self, client):
+        """Missing fields are a 400."""
+        response = client.post("/api/sword/hebrew", json={"book": "Genesis"})
+        assert response.status_code == 400
+
+
+class TestCaching:
+    """Tests for ETag / Cache-Control handling."""
+
+    def test_cache_headers(self, client):
+        """Responses carry ETag and Cache-Control."""
+        response = client.get("/api/sword/hebrew/Genesis/1/1")
+
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_if_none_match_returns_304(self, client):
+        """Matching If-None-Match yields 304 with no body."""
+        first = client.get("/api/sword/hebrew/Genesis/1/1")
+        etag = first.headers["etag"]
+
+        second = client.get(
+            "/api/sword/hebrew/Genesis/1/1", headers={"If-None-Match": etag}
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_parser_called_once_per_verse(self, client, mock_parser):
+        """Repeated requests are served from cache."""
+        for _ in range(5):
+            client.get("/api/sword/hebrew/Genesis/1/1")
+
+        assert mock_parser.get_verse_text.call_count == 1
+
+    def test_response_cache_evicts_oldest(self):
+        """LRU cache stays within max_size."""
+        cache = ResponseCache(max_size=2)
+        cache.put(("a",), {"v": 1})
+        cache.put(("b",), {"v": 2})
+        cache.get(("a",))
+        cache.put(("c",), {"v": 3})
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)) is None
+        assert len(cache) == 2
+
+
+class TestInterlinearAndChapter:
+    """Tests for interlinear and chapter-range endpoints."""
+
+    def test_interlinear_word_shape(self, client):
+        """Words include transliteration/gloss keys expected by the UI."""
+        response = client.post(
+            "/api/sword/interlinear", json={"book": "Genesis", "chapter": 1, "verse": 1}
+        )
+
+        assert response.status_code == 200
+        words = response.json()["words"]
+        assert words[0]["strongs"] == "H7225"
+        assert words[0]["morphology"] == "HR/Ncfsa"
+        assert words[1]["transliteration"] == ""
+        assert "strongs" not in words[1]
+
+    def test_chapter_range(self, client, mock_parser):
+        """Chapter endpoint returns ordered verses."""
+        response = client.get("/api/sword/chapter/Genesis/1?start=1&end=2")
+
+        assert response.status_code == 200
+        verses = response.json()["verses"]
+        assert [v["verse"] for v in verses] == [1, 2]
+        mock_parser.get_verse_range.assert_called_once_with("Genesis", 1, 1, 2)
+
+    def test_chapter_defaults_to_whole_chapter(self, client, mock_parser):
+        """Omitting the end requests the full chapter."""
+        client.post("/api/sword/chapter", json={"book": "Genesis", "chapter": 1})
+        mock_parser.get_verse_range.assert_called_once_with("Genesis", 1, 1, None)
+
+
+class TestBatch:
+    """Tests for the batch endpoint."""
+
+    def test_batch_preserves_order_and_nulls(self, client):
+        """Results align with the request, null for missing verses."""
+        response = client.post("/api/sword/batch", json={"verses": [
+            {"book": "Genesis", "chapter": 1, "verse": 2},
+            {"book": "Genesis", "chapter": 1, "verse": 99},
+            {"book": "John", "chapter": 1, "verse": 1},
+        ]})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0]["verse"] == 2
+        assert results[1] is None
+        assert results[2]["language"] == "greek"
+
+    def test_batch_references_mixed_forms(self, client, mock_parser):
+        """String and object references return one range each."""
+        response = client.post("/api/sword/batch", json={"references": [
+            "Genesis 1",
+            "1 John 3:2",
+            {"book": "Genesis", "chapter": 2, "verse_start": 1, "verse_end": 2},
+        ]})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 3
+        assert [v["verse"] for v in results[0]["verses"]] == [1, 2]
+        assert results[0]["verses"][0]["book"] == "Genesis"
+        assert results[1]["book"] == "1 John"
+        assert [v["verse"] for v in results[1]["verses"]] == [2]
+        assert results[2]["chapter"] == 2
+
+        called = [call.args[0][0] for call in mock_parser.get_verses.call_args_list]
+        assert called == [
+            ("Genesis", 1, 1, None),
+            ("1 John", 3, 2, 2),
+            ("Genesis", 2, 1, 2),
+        ]
+
+    def test_batch_references_cached(self, client, mock_parser):
+        """Repeated ranges are served from cache."""
+        for _ in range(3):
+            client.post("/api/sword/batch", json={"references": ["Genesis 1"]})
+
+        assert mock_parser.get_verses.call_count == 1
+
+    def test_batch_rejects_invalid_reference(self, client):
+        """Unparseable reference strings are a 400."""
+        response = client.post("/api/sword/batch", json={"references": ["Genesis"]})
+        assert response.status_code == 400
+
+    def test_batch_rejects_invalid_item(self, client):
+        """Malformed items are a 400."""
+        response = client.post("/api/sword/batch", json={"verses": [{"book": "Genesis"}]})
+        assert response.status_code == 400
+
+
+class TestStrongs:
+    """Tests for the Strong's concordance endpoint."""
+
+    @pytest.fixture
+    def strongs_client(self, mock_parser, tmp_path):
+        """Test client with a two-entry index on disk."""
+        (tmp_path / "postings.bin").write_bytes(array("I", [1001001, 1002001, 43001001]).tobytes())
+        (tmp_path / "index.json").write_text(json.dumps({
+            "version": 1,
+            "verses": 3,
+            "entries": {"H1254": [0, 2, 3], "G3056": [2, 1, 1]},
+        }))
+        app = create_app(parser=mock_parser, strongs_index_dir=tmp_path)
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def test_strongs_lookup(self, strongs_client):
+        """Verses and counts come from the index."""
+        response = strongs_client.get("/api/sword/strongs/h01254?limit=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["strongs"] == "H1254"
+        assert data["verse_count"] == 2
+        assert data["verses"] == [{"book": "Genesis", "chapter": 1, "verse": 1}]
+        assert "etag" in response.headers
+
+    def test_strongs_invalid_number(self, strongs_client):
+        """Malformed Strong's numbers are a 400."""
+        response = strongs_client.get("/api/sword/strongs/X12")
+        assert response.status_code == 400
+
+    def test_strongs_index_not_built(self, client):
+        """Without a built index the endpoint is unavailable."""
+        response = client.get("/api/sword/strongs/H7225")
+        assert response.status_code == 503
+
+
+def test_health(client):
+    """Health reports loaded modules."""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["modules"] == {"WLC": True, "SBLGNT": True}
@@ -0,0 +1,112 @@
+"""Unit tests for the offline IVF vector index."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from prism_client import PrismClient
+from vector_index import VectorIndex, build_vector_index, iter_embedding_records
+
+
+DIMENSION = 16
+
+
+def _records(count=300, seed=1):
+    """Random unit-ish embeddings spread over two domains."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, DIMENSION)).astype(np.float32)
+    return [
+        {
+            "document_title": f"Chunk {i}",
+            "content": f"content {i}",
+            "domain": "bible/kjv" if i % 2 == 0 else "lexicon/strongs",
+            "metadata": {"n": i},
+            "document_id": f"doc-{i}",
+            "embedding": vectors[i].tolist(),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def records():
+    return _records()
+
+
+@pytest.fixture
+def index_dir(records, tmp_path):
+    build_vector_index(records, tmp_path / "vector_index", n_lists=8)
+    return tmp_path / "vector_index"
+
+
+def test_build_stats(records, tmp_path):
+    """Build reports counts and clamps the list count."""
+    stats = build_vector_index(records[:5], tmp_path, n_lists=50)
+
+    assert stats == {"count": 5, "dimension": DIMENSION, "lists": 5, "domains": 2}
+
+
+def test_exact_match_ranks_first(records, index_dir):
+    """A stored vector finds its own chunk with similarity 1."""
+    with VectorIndex(index_dir) as index:
+        result = index.search(records[42]["embedding"], top_k=3)
+
+    top = result["results"][0]
+    assert top["document_title"] == "Chunk 42"
+    assert top["similarity"] == pytest.approx(1.0, abs=1e-5)
+    assert top["metadata"] == {"n": 42}
+    assert len(result["results"]) == 3
+    similarities = [r["similarity"] for r in result["results"]]
+    assert similarities == sorted(similarities, reverse=True)
+
+
+def test_full_probe_matches_brute_force(records, index_dir):
+    """Scanning every list returns the exact nearest neighbours."""
+    vectors = np.array([r["embedding"] for r in records], dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    query = np.random.default_rng(7).normal(size=DIMENSION).astype(np.float32)
+    expected = np.argsort(-(vectors @ (query / np.linalg.norm(query))))[:5]
+
+    with VectorIndex(index_dir) as index:
+        result = index.search(query.tolist(), top_k=5, nprobe=8)
+
+    assert [r["document_id"] for r in result["results"]] == [f"doc-{i}" for i in expected]
+
+
+def test_domain_filter(records, index_dir):
+    """Domain filters restrict results; unknown domains return nothing."""
+    with VectorIndex(index_dir) as index:
+        result = index.search(records[3]["embedding"], top_k=10, domain="bible/kjv", nprobe=8)
+        assert {r["domain"] for r in result["results"]} == {"bible/kjv"}
+        assert index.search(records[3]["embedding"], domain="geography/biblical")["results"] == []
+        with pytest.raises(ValueError):
+            index.search([1.0, 2.0])
+
+
+def test_iter_embedding_records(tmp_path, records):
+    """JSON-lines exports stream back as dicts."""
+    path = tmp_path / "chunks.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in records[:3]) + "\n\n")
+
+    assert [r["document_id"] for r in iter_embedding_records([path])] == ["doc-0", "doc-1", "doc-2"]
+
+
+def test_load_missing_index(tmp_path):
+    """Loading before building raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        VectorIndex(tmp_path).load()
+
+
+@pytest.mark.asyncio
+async def test_prism_client_searches_locally(records, index_dir, mock_httpx_client):
+    """PrismClient answers searches from the local index."""
+    with VectorIndex(index_dir, nprobe=8) as index:
+        client = PrismClient(embedder=lambda text: records[10]["embedding"], local_index=index)
+        client.client = mock_httpx_client
+
+        result = await client.search_documents("anything", domain="bible/kjv", top_k=2)
+
+    assert result["results"][0]["document_title"] == "Chunk 10"
+    mock_httpx_client.post.assert_not_called()
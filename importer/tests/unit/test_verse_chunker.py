@@ -2,6 +2,7 @@
 
 import pytest
 
+import verse_chunker
 from verse_chunker import (
     count_tokens,
     chunk_verses,
@@ -10,6 +11,7 @@ from verse_chunker import (
     analyze_chunking_quality,
 )
 from config import settings
+from verse_place_index import VersePlaceIndex
 
 
 class TestCountTokens:
@@ -158,6 +160,8 @@ class TestCreateChunkDocument:
         assert "chapter" in metadata
         assert "verse_start" in metadata
         assert "verse_end" in metadata
+        assert metadata["verse_id_start"] == genesis_1_verses[0].verse_id
+        assert metadata["verse_id_end"] == genesis_1_verses[-1].verse_id
         assert "testament" in metadata
         assert "translation" in metadata
         assert "language" in metadata
@@ -216,6 +220,38 @@ class TestCreateChunkDocument:
         assert "Chapter 1" in path
         assert "Verses" in path
 
+    def test_create_chunk_places_from_verse_index(self, genesis_1_verses, monkeypatch):
+        """Chunks carry the places the geography index lists for their verses."""
+        index = VersePlaceIndex(None)
+        index.add_document({
+            "title": "Biblical Place: Eden",
+            "metadata": {"slug": "eden", "place_name": "Eden", "place_type": "region", "verse_ids": [1002008]},
+        })
+        index.add_document({
+            "title": "Biblical Place: Heaven",
+            "metadata": {
+                "slug": "heaven",
+                "place_name": "Heaven",
+                "place_type": "region",
+                "latitude": 31.0,
+                "longitude": 35.0,
+                "verse_ids": [1001001, 1001003],
+            },
+        })
+        monkeypatch.setattr(verse_chunker, "default_verse_place_index", lambda: index.build())
+
+        chunk = _create_chunk_document(genesis_1_verses, "KJV")
+
+        assert chunk["metadata"]["places"] == [{
+            "slug": "heaven",
+            "name": "Heaven",
+            "place_type": "region",
+            "latitude": 31.0,
+            "longitude": 35.0,
+            "verses": [1, 3],
+        }]
+        assert chunk["metadata"]["entities"]["places"] == ["Heaven"]
+
     def test_create_chunk_empty_verses_raises(self):
         """Cannot create chunk from empty verse list."""
         with pytest.raises(ValueError) as exc_info:
@@ -0,0 +1,141 @@
+"""Unit tests for canonical packed verse IDs."""
+
+import pytest
+
+from csv_parser import BIBLE_BOOKS
+from verse_ids import (
+    BOOKS,
+    VerseRange,
+    format_verse_id,
+    get_book,
+    pack_verse_id,
+    parse_reference,
+    parse_verse_id,
+    unpack_verse_id,
+    verse_id_for,
+)
+
+
+class TestBooks:
+    """Tests for the book table and name resolution."""
+
+    def test_book_table_matches_csv_order(self):
+        """Book IDs follow the scrollmapper CSV order."""
+        assert len(BOOKS) == 66
+        assert [book.name for book in BOOKS] == BIBLE_BOOKS
+        assert [book.id for book in BOOKS] == list(range(1, 67))
+
+    @pytest.mark.parametrize("name,book_id", [
+        ("Genesis", 1),
+        ("gen", 1),
+        ("I Samuel", 9),
+        ("1 Samuel", 9),
+        ("1Sam", 9),
+        ("1 Sam.", 9),
+        ("First Samuel", 9),
+        ("Isa", 23),
+        ("Psalm", 19),
+        ("Song of Songs", 22),
+        ("III John", 64),
+        ("3 Jn", 64),
+        ("Revelation", 66),
+    ])
+    def test_get_book_variants(self, name, book_id):
+        """CSV names, display names, OSIS IDs and abbreviations resolve."""
+        assert get_book(name).id == book_id
+
+    def test_get_book_unknown(self):
+        """Unknown names return None."""
+        assert get_book("Book") is None
+
+    def test_testament(self):
+        """Testament is derived from the book ID."""
+        assert get_book("Malachi").testament == "OT"
+        assert get_book("Matthew").testament == "NT"
+
+
+class TestVerseIds:
+    """Tests for packing, parsing and formatting."""
+
+    def test_pack_round_trip(self):
+        """Packing is lossless and sorts canonically."""
+        assert pack_verse_id(1, 1, 1) == 1001001
+        assert unpack_verse_id(pack_verse_id(19, 119, 176)) == (19, 119, 176)
+        assert pack_verse_id(1, 50, 26) < pack_verse_id(2, 1, 1)
+
+    def test_verse_id_for(self):
+        """Any book spelling gives the same ID."""
+        assert verse_id_for("I Kings", 3, 4) == verse_id_for("1 Kgs", 3, 4) == 11003004
+        with pytest.raises(ValueError):
+            verse_id_for("Book", 1, 1)
+
+    def test_parse_verse_id(self):
+        """Display and OSIS references parse to the same ID."""
+        assert parse_verse_id("Genesis 1:1") == 1001001
+        assert parse_verse_id("Gen.1.1") == 1001001
+        assert parse_verse_id("2 Kgs 5:12") == 12005012
+        with pytest.raises(ValueError):
+            parse_verse_id("John 3:16-18")
+        with pytest.raises(ValueError):
+            parse_verse_id("not a reference")
+
+    def test_format_verse_id(self):
+        """IDs format in display, CSV and OSIS styles."""
+        assert format_verse_id(9003004) == "1 Samuel 3:4"
+        assert format_verse_id(9003004, style="csv") == "I Samuel 3:4"
+        assert format_verse_id(9003004, style="osis") == "1Sam.3.4"
+
+
+class TestVerseRange:
+    """Tests for VerseRange."""
+
+    def test_parse_ranges(self):
+        """Verse, range, cross-chapter and whole-chapter references."""
+        assert parse_reference("John 3:16") == VerseRange(43003016, 43003016)
+        assert parse_reference("John 3:16-18") == VerseRange(43003016, 43003018)
+        assert parse_reference("John 3:16-4:2") == VerseRange(43003016, 43004002)
+        assert parse_reference("Psalm 23") == VerseRange.chapter(19, 23)
+
+    def test_contains_and_overlaps(self):
+        """Membership and overlap are integer comparisons."""
+        passage = parse_reference("Matthew 5:1-12")
+        assert parse_verse_id("Matt 5:3") in passage
+        assert parse_verse_id("Matt 5:13") not in passage
+        assert passage.overlaps(parse_reference("Matthew 5:10-20"))
+        assert not passage.overlaps(parse_reference("Luke 6:20-23"))
+        assert passage.book_id == 40
+
+    @pytest.mark.parametrize("reference", [
+        "John 3:16", "John 3:16-18", "John 3:16-4:2", "Psalms 23",
+        "Genesis 50:26-Exodus 1:1", "Ruth 4:22-1 Samuel 1:1",
+    ])
+    def test_format_round_trip(self, reference):
+        """Formatting a parsed range gives the reference back."""
+        assert parse_reference(reference).format() == reference
+
+    @pytest.mark.parametrize("verse_range", [
+        VerseRange(1001001, 1001001),
+        VerseRange(1001001, 1001005),
+        VerseRange(1001001, 2001001),
+        VerseRange.chapter(19, 23),
+        VerseRange(43003016, 43004002),
+    ])
+    @pytest.mark.parametrize("style", ["display", "csv", "osis"])
+    def test_parse_round_trip(self, verse_range, style):
+        """Every format style parses back to the same range, across books too."""
+        assert parse_reference(verse_range.format(style)) == verse_range
+
+    def test_range_verse_ids(self):
+        """Ranges iterate every verse, across chapters and books, by KJV chapter lengths."""
+        assert list(parse_reference("John 3:16-18").verse_ids()) == [43003016, 43003017, 43003018]
+        assert list(parse_reference("Gen 1:30-2:2").verse_ids()) == [1001030, 1001031, 1002001, 1002002]
+        assert list(parse_reference("Mal 4:6-Matt 1:1").verse_ids()) == [39004006, 40001001]
+        assert len(list(parse_reference("Psalm 119").verse_ids())) == 176
+        assert list(parse_reference("3 John 1:15").verse_ids()) == [64001015]
+
+    def test_format_osis(self):
+        """OSIS formatting for ranges and chapters."""
+        assert parse_reference("John 3:16-18").format("osis") == "John.3.16-John.3.18"
+        assert parse_reference("Psalm 23").format("osis") == "Ps.23"
+        assert parse_reference("Gen.1.1-Exod.1.1").format("osis") == "Gen.1.1-Exod.1.1"
+        assert VerseRange(1001001, 2001999).format("osis") == "Gen.1.1-Exod.1.999"
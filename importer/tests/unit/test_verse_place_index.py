@@ -0,0 +1,65 @@
+"""Unit tests for the verse → place reverse index."""
+
+import json
+
+import pytest
+
+import verse_place_index
+from verse_ids import verse_id_for
+from verse_place_index import VersePlaceIndex
+
+
+@pytest.fixture
+def index(tmp_path, place_document):
+    index = VersePlaceIndex(tmp_path / "verse_places.json")
+    index.add_document(place_document(
+        "jerusalem", "Jerusalem", 31.7767, 35.2345,
+        verse_ids=[verse_id_for("Matthew", 2, 1), verse_id_for("Matthew", 2, 3), verse_id_for("Luke", 2, 22)],
+    ))
+    index.add_document(place_document(
+        "bethlehem", "Bethlehem", 31.7054, 35.2024,
+        verse_ids=[verse_id_for("Matthew", 2, 1), verse_id_for("Matthew", 2, 5), verse_id_for("Matthew", 2, 16)],
+    ))
+    index.add_document(place_document("eden", "Eden", verse_ids=[verse_id_for("Genesis", 2, 8)]))
+    assert not index.add_document(place_document("nowhere", "Nowhere"))
+    return index.build()
+
+
+def test_places_for_range(index):
+    """A verse range returns each place once, with the verses mentioning it."""
+    places = index.places_for_range(verse_id_for("Matthew", 2, 1), verse_id_for("Matthew", 2, 6))
+
+    assert [(p["slug"], p["verses"]) for p in places] == [("bethlehem", [1, 5]), ("jerusalem", [1, 3])]
+    assert places[1]["latitude"] == 31.7767
+    assert index.places_for_range(verse_id_for("Matthew", 2, 6), verse_id_for("Matthew", 2, 15)) == []
+
+
+def test_places_for_verse(index):
+    assert [p["slug"] for p in index.places_for_verse(verse_id_for("Luke", 2, 22))] == ["jerusalem"]
+    eden = index.places_for_verse(verse_id_for("Genesis", 2, 8))[0]
+    assert eden["latitude"] is None and eden["verses"] == [8]
+
+
+def test_save_load_round_trip(index):
+    index.save()
+    loaded = VersePlaceIndex(index.path).load()
+
+    assert len(loaded) == len(index) == 6
+    start, end = verse_id_for("Matthew", 1, 1), verse_id_for("Matthew", 28, 20)
+    assert loaded.places_for_range(start, end) == index.places_for_range(start, end)
+    assert json.loads(index.path.read_text())["places"]["slug"] == ["bethlehem", "eden", "jerusalem"]
+
+
+def test_load_missing_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        VersePlaceIndex(tmp_path / "missing.json").load()
+
+
+def test_default_index_missing(tmp_path, monkeypatch):
+    """Chunking works without an index; it is looked up only once."""
+    monkeypatch.setattr(verse_place_index.settings, "verse_place_index_path", tmp_path / "missing.json")
+    monkeypatch.setattr(verse_place_index, "_default_loaded", False)
+    monkeypatch.setattr(verse_place_index, "_default_index", None)
+
+    assert verse_place_index.default_verse_place_index() is None
+    assert verse_place_index._default_loaded
@@ -0,0 +1,367 @@
+"""Offline IVF vector index over exported chunk embeddings.
+
+Lets batch evaluation jobs and offline environments run semantic queries
+without a round trip to Prism/pgvector. The index is built from exported
+chunk embeddings (JSON lines, one chunk per line):
+
+    {"document_title": "Psalms 23:1-6 (KJV)", "content": "...",
+     "domain": "bible/kjv", "metadata": {...}, "document_id": "...",
+     "embedding": [0.012, -0.034, ...]}
+
+Vectors are L2-normalized and clustered with spherical k-means into
+inverted lists (IVF). A query scores the list centroids, then only the
+vectors of the nprobe closest lists. Stored files:
+
+    index.json          - version, dimension, counts, domain table
+    centroids.npy       - float32 [lists, dimension]
+    vectors.npy         - float32 [count, dimension], rows grouped by list
+    offsets.npy         - int64 [lists + 1], row range of each list
+    domains.npy         - uint8 [count], index into the domain table
+    records.jsonl       - chunk fields without the embedding, row order
+    record_offsets.npy  - int64 [count + 1], byte range of each record
+
+Everything but index.json and the centroids is memory-mapped on load, and
+only the records of the returned hits are decoded.
+
+Requires the `vector` extra (numpy).
+
+Usage:
+    python cli.py build-vector-index --input chunks.jsonl
+    python cli.py vector-search "The Lord is my shepherd" --domain bible/kjv
+"""
+
+import json
+import logging
+import mmap
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+KEYS_FILE = "index.json"
+CENTROIDS_FILE = "centroids.npy"
+VECTORS_FILE = "vectors.npy"
+OFFSETS_FILE = "offsets.npy"
+DOMAINS_FILE = "domains.npy"
+RECORDS_FILE = "records.jsonl"
+RECORD_OFFSETS_FILE = "record_offsets.npy"
+
+KMEANS_SAMPLE_SIZE = 50_000
+ASSIGN_BLOCK_SIZE = 8192
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Closest centroid (by cosine) for each row, in blocks to bound memory."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), ASSIGN_BLOCK_SIZE):
+        block = vectors[start:start + ASSIGN_BLOCK_SIZE]
+        assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def train_centroids(
+    vectors: np.ndarray,
+    n_lists: int,
+    iterations: int = 20,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Spherical k-means on a sample of unit vectors.
+
+    Args:
+        vectors: float32 [count, dimension], L2-normalized
+        n_lists: Number of clusters
+        iterations: Lloyd iterations
+        seed: Random seed for sampling and initialization
+
+    Returns:
+        float32 [n_lists, dimension] unit centroids
+    """
+    rng = np.random.default_rng(seed)
+    sample = vectors
+    if len(vectors) > KMEANS_SAMPLE_SIZE:
+        sample = vectors[rng.choice(len(vectors), KMEANS_SAMPLE_SIZE, replace=False)]
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=n_lists)
+        # Empty clusters keep their previous centroid
+        filled = counts > 0
+        centroids[filled] = _normalize_rows(sums[filled])
+    return centroids.astype(np.float32)
+
+
+def build_vector_index(
+    records: Iterable[Dict[str, Any]],
+    output_dir: Path,
+    n_lists: Optional[int] = None,
+    iterations: int = 20,
+    seed: int = 0,
+) -> Dict[str, int]:
+    """
+    Build an IVF index from chunk records with embeddings.
+
+    Args:
+        records: Dicts with "embedding" plus result fields ("document_title"
+            or "title", "content", "domain", "metadata", "document_id")
+        output_dir: Directory to write the index to
+        n_lists: Number of inverted lists (default: about sqrt(count))
+        iterations: k-means iterations
+        seed: Random seed
+
+    Returns:
+        Stats dict (count, dimension, lists, domains)
+
+    Raises:
+        ValueError: If there are no records or dimensions differ
+    """
+    embeddings = []
+    kept = []
+    for record in records:
+        embeddings.append(record["embedding"])
+        kept.append({
+            "document_id": record.get("document_id"),
+            "document_title": record.get("document_title", record.get("title", "")),
+            "content": record.get("content", ""),
+            "domain": record.get("domain", ""),
+            "metadata": record.get("metadata", {}),
+        })
+    if not kept:
+        raise ValueError("No embedded records to index")
+
+    try:
+        vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+    except ValueError as e:
+        raise ValueError(f"Embeddings must all have the same dimension: {e}") from e
+    del embeddings
+
+    count, dimension = vectors.shape
+    n_lists = max(1, min(n_lists or int(np.sqrt(count)), count))
+    logger.info(f"Clustering {count} vectors of dimension {dimension} into {n_lists} lists")
+
+    centroids = train_centroids(vectors, n_lists, iterations, seed)
+    assignments = _assign(vectors, centroids)
+    order = np.argsort(assignments, kind="stable")
+    offsets = np.zeros(n_lists + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(assignments, minlength=n_lists))
+
+    domain_table = sorted({record["domain"] for record in kept})
+    domain_codes = {domain: code for code, domain in enumerate(domain_table)}
+    if len(domain_table) > 255:
+        raise ValueError("At most 255 domains per index")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    np.save(output_dir / CENTROIDS_FILE, centroids)
+    np.save(output_dir / VECTORS_FILE, vectors[order])
+    np.save(output_dir / OFFSETS_FILE, offsets)
+    np.save(
+        output_dir / DOMAINS_FILE,
+        np.array([domain_codes[kept[row]["domain"]] for row in order], dtype=np.uint8),
+    )
+
+    record_offsets = np.zeros(count + 1, dtype=np.int64)
+    with open(output_dir / RECORDS_FILE, "wb") as f:
+        for position, row in enumerate(order):
+            line = json.dumps(kept[row], ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(line)
+            record_offsets[position + 1] = record_offsets[position] + len(line)
+    np.save(output_dir / RECORD_OFFSETS_FILE, record_offsets)
+
+    stats = {
+        "count": count,
+        "dimension": dimension,
+        "lists": n_lists,
+        "domains": len(domain_table),
+    }
+    with open(output_dir / KEYS_FILE, "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_VERSION, **stats, "domain_table": domain_table}, f)
+
+    logger.info(f"Wrote vector index with {count} vectors to {output_dir}")
+    return stats
+
+
+def iter_embedding_records(paths: Sequence[Path]) -> Iterable[Dict[str, Any]]:
+    """Read exported chunk embeddings from JSON-lines files."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class VectorIndex:
+    """Read-only, memory-mapped IVF index."""
+
+    def __init__(self, index_dir: Path, nprobe: int = 8):
+        """
+        Initialize index reader.
+
+        Args:
+            index_dir: Directory written by build_vector_index
+            nprobe: Inverted lists scanned per query (recall vs. speed)
+        """
+        self.index_dir = index_dir
+        self.nprobe = nprobe
+        self.dimension = 0
+        self.domain_table: List[str] = []
+        self.vectors: Optional[np.ndarray] = None
+        self._file = None
+        self._records: Optional[mmap.mmap] = None
+
+    def load(self) -> "VectorIndex":
+        """
+        Load the index.
+
+        Raises:
+            FileNotFoundError: If the index has not been built
+            ValueError: If the index version is not supported
+        """
+        keys_path = self.index_dir / KEYS_FILE
+        if not keys_path.exists():
+            raise FileNotFoundError(
+                f"Vector index not found: {keys_path}. Run build-vector-index first."
+            )
+        with open(keys_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported vector index version: {data.get('version')}")
+
+        self.dimension = data["dimension"]
+        self.domain_table = data["domain_table"]
+        self.centroids = np.load(self.index_dir / CENTROIDS_FILE)
+        self.vectors = np.load(self.index_dir / VECTORS_FILE, mmap_mode="r")
+        self.offsets = np.load(self.index_dir / OFFSETS_FILE)
+        self.domains = np.load(self.index_dir / DOMAINS_FILE, mmap_mode="r")
+        self.record_offsets = np.load(self.index_dir / RECORD_OFFSETS_FILE, mmap_mode="r")
+
+        self._file = open(self.index_dir / RECORDS_FILE, "rb")
+        self._records = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        logger.info(f"Loaded vector index with {len(self)} vectors")
+        return self
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.vectors = self.domains = self.record_offsets = None
+
+    def __enter__(self) -> "VectorIndex":
+        return self.load()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return 0 if self.vectors is None else len(self.vectors)
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Decode the stored fields of one row."""
+        start, end = int(self.record_offsets[row]), int(self.record_offsets[row + 1])
+        return json.loads(self._records[start:end])
+
+    def search_rows(
+        self,
+        vector: Sequence[float],
+        top_k: int = 5,
+        domain: Optional[str] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Approximate nearest rows for one query vector.
+
+        Returns:
+            [(row, similarity), ...] best first
+        """
+        query = np.asarray(vector, dtype=np.float32)
+        if query.shape != (self.dimension,):
+            raise ValueError(
+                f"Query has dimension {query.shape[-1]}, index has {self.dimension}"
+            )
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        domain_code = None
+        if domain is not None:
+            if domain not in self.domain_table:
+                return []
+            domain_code = self.domain_table.index(domain)
+
+        n_lists = len(self.centroids)
+        nprobe = min(nprobe or self.nprobe, n_lists)
+        centroid_scores = self.centroids @ query
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+
+        rows = []
+        scores = []
+        for list_id in probe:
+            start, end = self.offsets[list_id], self.offsets[list_id + 1]
+            if start == end:
+                continue
+            list_scores = self.vectors[start:end] @ query
+            list_rows = np.arange(start, end)
+            if domain_code is not None:
+                mask = self.domains[start:end] == domain_code
+                list_scores, list_rows = list_scores[mask], list_rows[mask]
+            rows.append(list_rows)
+            scores.append(list_scores)
+        if not rows:
+            return []
+
+        rows = np.concatenate(rows)
+        scores = np.concatenate(scores)
+        if len(scores) > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(int(rows[i]), float(scores[i])) for i in best]
+
+    def search(
+        self,
+        vector: Sequence[float],
+        top_k: int = 5,
+        domain: Optional[str] = None,
+        nprobe: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search like PrismClient.search_documents, by query vector.
+
+        Returns:
+            {"results": [{"document_title", "content", "similarity",
+             "domain", "metadata", "document_id"}, ...], "total": n}
+        """
+        results = []
+        for row, similarity in self.search_rows(vector, top_k, domain, nprobe):
+            result = self.record(row)
+            result["similarity"] = similarity
+            results.append(result)
+        return {"results": results, "total": len(results)}
+
+    def search_batch(
+        self,
+        vectors: Sequence[Sequence[float]],
+        top_k: int = 5,
+        domain: Optional[str] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search many query vectors (see search)."""
+        return [self.search(vector, top_k, domain, nprobe) for vector in vectors]
@@ -1,11 +1,12 @@
 """Adaptive verse chunking for optimal LLM consumption."""
 
-import re
 import tiktoken
 from typing import Generator, List, Dict, Any, Optional
 
-from csv_parser import BibleVerse, group_by_chapter, get_book_genre, get_genre_params, identify_parallel_passages
+from csv_parser import BibleVerse, group_by_chapter, get_book_genre, get_genre_params, find_parallel_passages
 from config import settings
+from reference_parser import iter_references
+from verse_place_index import default_verse_place_index
 
 
 # Initialize tiktoken encoder (cl100k_base is used by GPT-4 and compatible models)
@@ -17,25 +18,6 @@ def count_tokens(text: str) -> int:
     return len(encoder.encode(text))
 
 
-# Regex pattern for verse references
-VERSE_REFERENCE_PATTERN = re.compile(
-    r'\b(' + '|'.join([
-        "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-        "Joshua", "Judges", "Ruth", "Samuel", "Kings", "Chronicles",
-        "Ezra", "Nehemiah", "Esther", "Job", "Psalms?", "Proverbs",
-        "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah",
-        "Lamentations", "Ezekiel", "Daniel", "Hosea", "Joel", "Amos",
-        "Obadiah", "Jonah", "Micah", "Nahum", "Habakkuk", "Zephaniah",
-        "Haggai", "Zechariah", "Malachi",
-        "Matthew", "Mark", "Luke", "John", "Acts", "Romans",
-        "Corinthians", "Galatians", "Ephesians", "Philippians",
-        "Colossians", "Thessalonians", "Timothy", "Titus", "Philemon",
-        "Hebrews", "James", "Peter", "Jude", "Revelation"
-    ]) + r')\s+(\d+):(\d+)(?:-(\d+))?',
-    re.IGNORECASE
-)
-
-
 def detect_cross_references(text: str) -> List[str]:
     """
     Extract verse references mentioned in text.
@@ -44,20 +26,10 @@ def detect_cross_references(text: str) -> List[str]:
         text: Verse content to scan
 
     Returns:
-        List of referenced verses (e.g., ["Genesis 15:6", "Psalm 32:1"])
+        List of referenced verses in canonical form
+        (e.g., ["Genesis 15:6", "Psalms 32:1-2", "1 John 3:16"])
     """
-    matches = VERSE_REFERENCE_PATTERN.findall(text)
-    references = []
-
-    for match in matches:
-        book, chapter, verse_start, verse_end = match
-        if verse_end:
-            ref = f"{book} {chapter}:{verse_start}-{verse_end}"
-        else:
-            ref = f"{book} {chapter}:{verse_start}"
-        references.append(ref)
-
-    return references
+    return [match.format() for match in iter_references(text)]
 
 
 def chunk_verses(
@@ -311,13 +283,21 @@ def _create_chunk_document(
     cross_refs = detect_cross_references(content)
 
     # Check for parallel passages
-    parallel_info = identify_parallel_passages(
+    parallel_matches = find_parallel_passages(
         first_verse.book_name,
         first_verse.chapter,
         first_verse.verse,
         last_verse.verse,
     )
 
+    # Places mentioned in these verses, from the import-geography reverse index
+    place_index = default_verse_place_index()
+    places = (
+        place_index.places_for_range(first_verse.verse_id, last_verse.verse_id)
+        if place_index is not None
+        else []
+    )
+
     # Get comprehensive metadata if available
     try:
         from metadata_enrichment import get_comprehensive_metadata
@@ -339,6 +319,8 @@ def _create_chunk_document(
         "chapter": first_verse.chapter,
         "verse_start": first_verse.verse,
         "verse_end": last_verse.verse,
+        "verse_id_start": first_verse.verse_id,
+        "verse_id_end": last_verse.verse_id,
         "testament": first_verse.testament,
         "translation": translation,
         "language": "en",  # Translation language (content language)
@@ -373,12 +355,20 @@ def _create_chunk_document(
         metadata["cross_references"] = cross_refs
 
     # Parallel passages from synoptic gospels
-    if parallel_info:
-        metadata["parallel_passages"] = parallel_info
+    if parallel_matches:
+        metadata["parallel_passages"] = parallel_matches[0]
+        if len(parallel_matches) > 1:
+            metadata["additional_parallel_passages"] = parallel_matches[1:]
 
     # Comprehensive metadata from enrichment module
     metadata.update(comprehensive_meta)
 
+    # Geography: places with coordinates and the verses that mention them
+    if places:
+        metadata["places"] = places
+        entities = metadata.setdefault("entities", {"people": [], "groups": []})
+        entities["places"] = [place["name"] for place in places]
+
     return {
         "title": title,
         "content": content,
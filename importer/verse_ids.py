@@ -0,0 +1,500 @@
+"""Canonical packed integer verse IDs.
+
+Every verse is identified by one integer:
+
+    verse_id = book * 1_000_000 + chapter * 1_000 + verse
+
+with book numbers in canonical order (Genesis = 1 ... Revelation = 66), so
+IDs sort in reading order and range checks are integer comparisons
+("Genesis 1:1" → 1001001, "Revelation 22:21" → 66022021).
+
+The book table also records the name variants used across the importer:
+scrollmapper CSV names ("I Samuel"), SWORD display names ("1 Samuel"),
+OSIS IDs ("1Sam") and common abbreviations ("1 Sam", "1Sa").
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+BOOK_MULTIPLIER = 1_000_000
+CHAPTER_MULTIPLIER = 1_000
+
+
+@dataclass(frozen=True)
+class Book:
+    """One canonical book and its name variants."""
+
+    id: int
+    name: str  # scrollmapper CSV name (e.g., "I Samuel")
+    display_name: str  # SWORD / UI name (e.g., "1 Samuel")
+    osis: str  # OSIS book ID (e.g., "1Sam")
+    abbreviations: Tuple[str, ...] = field(default=())
+    verse_counts: Tuple[int, ...] = field(default=(), repr=False)  # per chapter, KJV
+
+    @property
+    def testament(self) -> str:
+        """Get testament ("OT" or "NT")."""
+        return "OT" if self.id <= 39 else "NT"
+
+    def verse_count(self, chapter: int) -> int:
+        """Number of verses in a chapter (0 if the book has no such chapter)."""
+        return self.verse_counts[chapter - 1] if 1 <= chapter <= len(self.verse_counts) else 0
+
+
+# (CSV name, display name, OSIS ID, abbreviations)
+_BOOK_TABLE = [
+    # Old Testament (1-39)
+    ("Genesis", "Genesis", "Gen", ("Gen", "Ge", "Gn")),
+    ("Exodus", "Exodus", "Exod", ("Exod", "Exo", "Ex")),
+    ("Leviticus", "Leviticus", "Lev", ("Lev", "Le", "Lv")),
+    ("Numbers", "Numbers", "Num", ("Num", "Nu", "Nm", "Nb")),
+    ("Deuteronomy", "Deuteronomy", "Deut", ("Deut", "Deu", "De", "Dt")),
+    ("Joshua", "Joshua", "Josh", ("Josh", "Jos", "Jsh")),
+    ("Judges", "Judges", "Judg", ("Judg", "Jdg", "Jg", "Jdgs")),
+    ("Ruth", "Ruth", "Ruth", ("Rth", "Ru")),
+    ("I Samuel", "1 Samuel", "1Sam", ("1 Sam", "1 Sa", "1 Sm")),
+    ("II Samuel", "2 Samuel", "2Sam", ("2 Sam", "2 Sa", "2 Sm")),
+    ("I Kings", "1 Kings", "1Kgs", ("1 Kgs", "1 Kings", "1 Ki", "1 Kg")),
+    ("II Kings", "2 Kings", "2Kgs", ("2 Kgs", "2 Kings", "2 Ki", "2 Kg")),
+    ("I Chronicles", "1 Chronicles", "1Chr", ("1 Chr", "1 Chron", "1 Ch")),
+    ("II Chronicles", "2 Chronicles", "2Chr", ("2 Chr", "2 Chron", "2 Ch")),
+    ("Ezra", "Ezra", "Ezra", ("Ezr", "Ez")),
+    ("Nehemiah", "Nehemiah", "Neh", ("Neh", "Ne")),
+    ("Esther", "Esther", "Esth", ("Esth", "Est", "Es")),
+    ("Job", "Job", "Job", ("Jb",)),
+    ("Psalms", "Psalms", "Ps", ("Psalm", "Ps", "Psa", "Pss", "Psm")),
+    ("Proverbs", "Proverbs", "Prov", ("Prov", "Pro", "Prv", "Pr")),
+    ("Ecclesiastes", "Ecclesiastes", "Eccl", ("Eccl", "Eccles", "Ecc", "Qoh")),
+    ("Song of Solomon", "Song of Songs", "Song", ("Song", "Song of Songs", "SOS", "Canticles", "Cant")),
+    ("Isaiah", "Isaiah", "Isa", ("Isa", "Is")),
+    ("Jeremiah", "Jeremiah", "Jer", ("Jer", "Je", "Jr")),
+    ("Lamentations", "Lamentations", "Lam", ("Lam", "La")),
+    ("Ezekiel", "Ezekiel", "Ezek", ("Ezek", "Eze", "Ezk")),
+    ("Daniel", "Daniel", "Dan", ("Dan", "Da", "Dn")),
+    ("Hosea", "Hosea", "Hos", ("Hos", "Ho")),
+    ("Joel", "Joel", "Joel", ("Jl",)),
+    ("Amos", "Amos", "Amos", ("Am",)),
+    ("Obadiah", "Obadiah", "Obad", ("Obad", "Ob")),
+    ("Jonah", "Jonah", "Jonah", ("Jon", "Jnh")),
+    ("Micah", "Micah", "Mic", ("Mic", "Mc")),
+    ("Nahum", "Nahum", "Nah", ("Nah", "Na")),
+    ("Habakkuk", "Habakkuk", "Hab", ("Hab", "Hb")),
+    ("Zephaniah", "Zephaniah", "Zeph", ("Zeph", "Zep", "Zp")),
+    ("Haggai", "Haggai", "Hag", ("Hag", "Hg")),
+    ("Zechariah", "Zechariah", "Zech", ("Zech", "Zec", "Zc")),
+    ("Malachi", "Malachi", "Mal", ("Mal", "Ml")),
+    # New Testament (40-66)
+    ("Matthew", "Matthew", "Matt", ("Matt", "Mat", "Mt")),
+    ("Mark", "Mark", "Mark", ("Mrk", "Mar", "Mk", "Mr")),
+    ("Luke", "Luke", "Luke", ("Luk", "Lk")),
+    ("John", "John", "John", ("Joh", "Jhn", "Jn")),
+    ("Acts", "Acts", "Acts", ("Act", "Ac")),
+    ("Romans", "Romans", "Rom", ("Rom", "Ro", "Rm")),
+    ("I Corinthians", "1 Corinthians", "1Cor", ("1 Cor", "1 Co")),
+    ("II Corinthians", "2 Corinthians", "2Cor", ("2 Cor", "2 Co")),
+    ("Galatians", "Galatians", "Gal", ("Gal", "Ga")),
+    ("Ephesians", "Ephesians", "Eph", ("Eph", "Ephes")),
+    ("Philippians", "Philippians", "Phil", ("Phil", "Php", "Pp")),
+    ("Colossians", "Colossians", "Col", ("Col",)),
+    ("I Thessalonians", "1 Thessalonians", "1Thess", ("1 Thess", "1 Thes", "1 Th")),
+    ("II Thessalonians", "2 Thessalonians", "2Thess", ("2 Thess", "2 Thes", "2 Th")),
+    ("I Timothy", "1 Timothy", "1Tim", ("1 Tim", "1 Ti")),
+    ("II Timothy", "2 Timothy", "2Tim", ("2 Tim", "2 Ti")),
+    ("Titus", "Titus", "Titus", ("Tit",)),
+    ("Philemon", "Philemon", "Phlm", ("Phlm", "Philem", "Phm")),
+    ("Hebrews", "Hebrews", "Heb", ("Heb",)),
+    ("James", "James", "Jas", ("Jas", "Jm")),
+    ("I Peter", "1 Peter", "1Pet", ("1 Pet", "1 Pe", "1 Pt")),
+    ("II Peter", "2 Peter", "2Pet", ("2 Pet", "2 Pe", "2 Pt")),
+    ("I John", "1 John", "1John", ("1 Jn", "1 Jhn", "1 Jo")),
+    ("II John", "2 John", "2John", ("2 Jn", "2 Jhn", "2 Jo")),
+    ("III John", "3 John", "3John", ("3 Jn", "3 Jhn", "3 Jo")),
+    ("Jude", "Jude", "Jude", ("Jud", "Jd")),
+    ("Revelation of John", "Revelation", "Rev", ("Rev", "Re", "Rv", "Revelation", "Apocalypse")),
+]
+
+# Verses per chapter in KJV versification, one tuple per book in canonical order
+_VERSE_COUNTS = [
+    (  # Gen
+        31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18, 34, 24, 20,
+        67, 34, 35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38, 34, 34, 28, 34,
+        31, 22, 33, 26,
+    ),
+    (  # Exod
+        22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26, 36, 31, 33,
+        18, 40, 37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38,
+    ),
+    (  # Lev
+        17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27, 24, 33, 44,
+        23, 55, 46, 34,
+    ),
+    (  # Num
+        54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29, 35, 41, 30,
+        25, 18, 65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13,
+    ),
+    (  # Deut
+        46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20, 23, 30, 25,
+        22, 19, 19, 26, 68, 29, 20, 30, 52, 29, 12,
+    ),
+    (  # Josh
+        18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9, 45, 34, 16,
+        33,
+    ),
+    (36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48, 25),  # Judg
+    (22, 23, 18, 22),  # Ruth
+    (  # 1Sam
+        28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42, 15, 23, 29,
+        22, 44, 25, 12, 25, 11, 31, 13,
+    ),
+    (  # 2Sam
+        27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26, 22, 51, 39,
+        25,
+    ),
+    (  # 1Kgs
+        53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43, 29, 53,
+    ),
+    (  # 2Kgs
+        18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21, 26, 20, 37,
+        20, 30,
+    ),
+    (  # 1Chr
+        54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8, 30, 19, 32,
+        31, 31, 32, 34, 21, 30,
+    ),
+    (  # 2Chr
+        17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37, 20, 12, 21,
+        27, 28, 23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23,
+    ),
+    (11, 70, 13, 24, 17, 22, 28, 36, 15, 44),  # Ezra
+    (11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31),  # Neh
+    (22, 23, 15, 17, 14, 14, 10, 17, 32, 3),  # Esth
+    (  # Job
+        22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29, 34, 30, 17,
+        25, 6, 14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24, 34, 17,
+    ),
+    (  # Ps
+        6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9, 13, 31, 6, 10, 22, 12,
+        14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17, 13, 11, 5, 26, 17, 11, 9, 14, 20, 23,
+        19, 9, 6, 7, 23, 13, 11, 11, 17, 12, 8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23,
+        10, 12, 20, 72, 13, 19, 16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9,
+        9, 5, 8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8,
+        5, 6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13, 10, 7, 12, 15, 21, 10, 20, 14, 9, 6,
+    ),
+    (  # Prov
+        33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30, 31, 29, 35,
+        34, 28, 28, 27, 28, 27, 33, 31,
+    ),
+    (18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14),  # Eccl
+    (17, 17, 11, 16, 16, 13, 13, 14),  # Song
+    (  # Isa
+        31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6, 17, 25, 18, 23,
+        12, 21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25, 28, 28, 25, 13, 15,
+        22, 26, 11, 23, 15, 12, 17, 13, 12, 21, 14, 21, 22, 11, 12, 19, 12, 25, 24,
+    ),
+    (  # Jer
+        19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18, 14, 30, 40,
+        10, 38, 24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22, 13, 30, 5, 28,
+        7, 47, 39, 46, 64, 34,
+    ),
+    (22, 22, 66, 22, 22),  # Lam
+    (  # Ezek
+        28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49, 32, 31, 49,
+        27, 17, 21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20, 27, 31, 25, 24,
+        23, 35,
+    ),
+    (21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13),  # Dan
+    (11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9),  # Hos
+    (20, 32, 21),  # Joel
+    (15, 16, 15, 13, 27, 14, 17, 14, 15),  # Amos
+    (21,),  # Obad
+    (17, 10, 10, 11),  # Jonah
+    (16, 13, 12, 13, 15, 16, 20),  # Mic
+    (15, 13, 19),  # Nah
+    (17, 20, 19),  # Hab
+    (18, 15, 20),  # Zeph
+    (15, 23),  # Hag
+    (21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21),  # Zech
+    (14, 17, 18, 6),  # Mal
+    (  # Matt
+        25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34, 46, 46, 39,
+        51, 46, 75, 66, 20,
+    ),
+    (45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20),  # Mark
+    (  # Luke
+        80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47, 38, 71, 56,
+        53,
+    ),
+    (51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31, 25),  # John
+    (  # Acts
+        26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38, 40, 30, 35,
+        27, 27, 32, 44, 31,
+    ),
+    (32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27),  # Rom
+    (31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24),  # 1Cor
+    (24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14),  # 2Cor
+    (24, 21, 29, 31, 26, 18),  # Gal
+    (23, 22, 21, 32, 33, 24),  # Eph
+    (30, 30, 21, 23),  # Phil
+    (29, 23, 25, 18),  # Col
+    (10, 20, 13, 18, 28),  # 1Thess
+    (12, 17, 18),  # 2Thess
+    (20, 15, 16, 16, 25, 21),  # 1Tim
+    (18, 26, 17, 22),  # 2Tim
+    (16, 15, 15),  # Titus
+    (25,),  # Phlm
+    (14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25),  # Heb
+    (27, 26, 18, 17, 20),  # Jas
+    (25, 25, 22, 19, 14),  # 1Pet
+    (21, 22, 18),  # 2Pet
+    (10, 29, 24, 21, 21),  # 1John
+    (13,),  # 2John
+    (14,),  # 3John
+    (25,),  # Jude
+    (20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15, 27, 21),  # Rev
+]
+
+BOOKS: List[Book] = [
+    Book(book_id, name, display_name, osis, abbreviations, verse_counts)
+    for book_id, ((name, display_name, osis, abbreviations), verse_counts) in enumerate(
+        zip(_BOOK_TABLE, _VERSE_COUNTS), start=1
+    )
+]
+
+# Prefixes that can replace the leading number of a numbered book
+_ORDINAL_PREFIXES = {
+    "1": ("1", "I", "1st", "First"),
+    "2": ("2", "II", "2nd", "Second"),
+    "3": ("3", "III", "3rd", "Third"),
+}
+
+
+def normalize_book_key(name: str) -> str:
+    """Lowercase and strip periods/extra spaces ("1 Sam." → "1 sam")."""
+    return " ".join(name.replace(".", " ").split()).lower()
+
+
+def book_name_variants(book: Book) -> List[str]:
+    """
+    List every accepted spelling of a book name.
+
+    Numbered books are expanded with every ordinal form ("1 Sam", "1Sam",
+    "I Sam", "First Sam"). Only digits are accepted without a space, since
+    "ISa" would collide with Isaiah.
+    """
+    variants = {book.name, book.display_name, book.osis, *book.abbreviations}
+    expanded = set()
+    for variant in variants:
+        number, _, rest = variant.partition(" ")
+        if number in _ORDINAL_PREFIXES and rest:
+            expanded.update(f"{prefix} {rest}" for prefix in _ORDINAL_PREFIXES[number])
+            expanded.add(f"{number}{rest}")
+        elif variant[0] in "123" and variant[1:2].isalpha():
+            # OSIS form without a space ("1Sam")
+            number, rest = variant[0], variant[1:]
+            expanded.update(f"{prefix} {rest}" for prefix in _ORDINAL_PREFIXES[number])
+            expanded.add(variant)
+        else:
+            expanded.add(variant)
+    return sorted(expanded)
+
+
+BOOK_LOOKUP: Dict[str, Book] = {
+    normalize_book_key(variant): book for book in BOOKS for variant in book_name_variants(book)
+}
+
+# "Genesis 1:1", "1 Sam 3:4-6", "Gen.1.1" (OSIS), "Psalm 23"
+_REFERENCE_PATTERN = re.compile(
+    r"^\s*(.+?)[\s.]*(\d+)(?:[:.](\d+)(?:\s*[-–]\s*(?:(\d+)[:.])?(\d+))?)?\s*$"
+)
+
+# A range whose end names its book: "Gen.1.1-Exod.1.1", "Ruth 4:22-1 Sam 1:1"
+_BOOK_RANGE_PATTERN = re.compile(r"^(.+?\d)\s*[-–]\s*(\d?\s*[^\W\d_].*)$")
+
+
+def get_book(name: str) -> Optional[Book]:
+    """
+    Resolve any accepted book spelling to its Book.
+
+    Args:
+        name: Book name, OSIS ID or abbreviation (case-insensitive)
+
+    Returns:
+        Book, or None if the name is not recognized
+    """
+    return BOOK_LOOKUP.get(normalize_book_key(name))
+
+
+def pack_verse_id(book_id: int, chapter: int, verse: int) -> int:
+    """Pack (book, chapter, verse) into one sortable integer."""
+    return book_id * BOOK_MULTIPLIER + chapter * CHAPTER_MULTIPLIER + verse
+
+
+def unpack_verse_id(verse_id: int) -> Tuple[int, int, int]:
+    """Split a packed verse ID into (book_id, chapter, verse)."""
+    book_id, rest = divmod(verse_id, BOOK_MULTIPLIER)
+    chapter, verse = divmod(rest, CHAPTER_MULTIPLIER)
+    return book_id, chapter, verse
+
+
+def verse_id_for(book: str, chapter: int, verse: int) -> int:
+    """
+    Get the verse ID for a book name and chapter/verse.
+
+    Raises:
+        ValueError: If the book name is not recognized
+    """
+    resolved = get_book(book)
+    if resolved is None:
+        raise ValueError(f"Unknown book: {book}")
+    return pack_verse_id(resolved.id, chapter, verse)
+
+
+def format_verse_id(verse_id: int, style: str = "display") -> str:
+    """
+    Format a verse ID as a reference.
+
+    Args:
+        verse_id: Packed verse ID
+        style: "display" ("1 Samuel 3:4"), "csv" ("I Samuel 3:4")
+            or "osis" ("1Sam.3.4")
+
+    Returns:
+        Reference string
+    """
+    book_id, chapter, verse = unpack_verse_id(verse_id)
+    book = BOOKS[book_id - 1]
+    if style == "osis":
+        return f"{book.osis}.{chapter}.{verse}"
+    name = book.name if style == "csv" else book.display_name
+    return f"{name} {chapter}:{verse}"
+
+
+@dataclass(frozen=True, order=True)
+class VerseRange:
+    """Inclusive range of packed verse IDs."""
+
+    start: int
+    end: int
+
+    @classmethod
+    def chapter(cls, book_id: int, chapter: int) -> "VerseRange":
+        """Range covering a whole chapter."""
+        return cls(
+            pack_verse_id(book_id, chapter, 1),
+            pack_verse_id(book_id, chapter, CHAPTER_MULTIPLIER - 1),
+        )
+
+    @property
+    def book_id(self) -> int:
+        """Book of the first verse."""
+        return self.start // BOOK_MULTIPLIER
+
+    def __contains__(self, verse_id: int) -> bool:
+        return self.start <= verse_id <= self.end
+
+    def overlaps(self, other: "VerseRange") -> bool:
+        """Check whether two ranges share at least one verse."""
+        return self.start <= other.end and other.start <= self.end
+
+    def verse_ids(self) -> Iterator[int]:
+        """
+        Iterate the verse IDs in the range, in order.
+
+        Chapters are walked up to their KJV verse count; the end verse of
+        the range is kept even beyond it (other versifications), except
+        the open end of a whole chapter.
+        """
+        start_book, start_chapter, start_verse = unpack_verse_id(self.start)
+        end_book, end_chapter, end_verse = unpack_verse_id(self.end)
+        for book_id in range(start_book, end_book + 1):
+            book = BOOKS[book_id - 1]
+            first_chapter = start_chapter if book_id == start_book else 1
+            last_chapter = end_chapter if book_id == end_book else len(book.verse_counts)
+            for chapter in range(first_chapter, last_chapter + 1):
+                first = start_verse if (book_id, chapter) == (start_book, start_chapter) else 1
+                last = book.verse_count(chapter)
+                if (book_id, chapter) == (end_book, end_chapter) and end_verse < CHAPTER_MULTIPLIER - 1:
+                    last = end_verse
+                for verse in range(first, last + 1):
+                    yield pack_verse_id(book_id, chapter, verse)
+
+    def format(self, style: str = "display") -> str:
+        """
+        Format as a reference ("John 3:16-18", "Gen.1.1-Gen.1.5", "Psalms 23").
+
+        Ranges across books name both ("Genesis 50:26-Exodus 1:1").
+        """
+        start_book, start_chapter, start_verse = unpack_verse_id(self.start)
+        end_book, end_chapter, end_verse = unpack_verse_id(self.end)
+        book = BOOKS[start_book - 1]
+
+        if style == "osis":
+            if (start_book, start_chapter) == (end_book, end_chapter) and (
+                start_verse == 1 and end_verse == CHAPTER_MULTIPLIER - 1
+            ):
+                return f"{book.osis}.{start_chapter}"
+            if self.start == self.end:
+                return format_verse_id(self.start, "osis")
+            return f"{format_verse_id(self.start, 'osis')}-{format_verse_id(self.end, 'osis')}"
+
+        name = book.name if style == "csv" else book.display_name
+        if start_book != end_book:
+            return f"{format_verse_id(self.start, style)}-{format_verse_id(self.end, style)}"
+        if start_chapter != end_chapter:
+            return f"{format_verse_id(self.start, style)}-{end_chapter}:{end_verse}"
+        if start_verse == 1 and end_verse == CHAPTER_MULTIPLIER - 1:
+            return f"{name} {start_chapter}"
+        if start_verse == end_verse:
+            return f"{name} {start_chapter}:{start_verse}"
+        return f"{name} {start_chapter}:{start_verse}-{end_verse}"
+
+
+def parse_reference(reference: str) -> VerseRange:
+    """
+    Parse a single reference into a VerseRange.
+
+    Accepts "Genesis 1:1", "1 Sam 3:4-6", "John 3:16-4:2", OSIS "Gen.1.1"
+    and "Gen.1.1-Exod.1.1", ranges naming both books ("Genesis 50:26-Exodus
+    1:1") and whole chapters ("Psalm 23").
+
+    Raises:
+        ValueError: If the reference or its book is not recognized
+    """
+    book_range = _BOOK_RANGE_PATTERN.match(reference)
+    if book_range:
+        start = parse_reference(book_range.group(1))
+        end = parse_reference(book_range.group(2))
+        return VerseRange(start.start, max(start.start, end.end))
+
+    match = _REFERENCE_PATTERN.match(reference)
+    if not match:
+        raise ValueError(f"Invalid verse reference: {reference}")
+    book_name, chapter, verse, end_chapter, end_verse = match.groups()
+
+    book = get_book(book_name)
+    if book is None:
+        raise ValueError(f"Unknown book in reference: {reference}")
+
+    chapter = int(chapter)
+    if verse is None:
+        return VerseRange.chapter(book.id, chapter)
+
+    start = pack_verse_id(book.id, chapter, int(verse))
+    if end_verse is None:
+        return VerseRange(start, start)
+    end = pack_verse_id(book.id, int(end_chapter or chapter), int(end_verse))
+    return VerseRange(start, max(start, end))
+
+
+def parse_verse_id(reference: str) -> int:
+    """
+    Parse a single-verse reference ("Genesis 1:1", "Gen.1.1") into a verse ID.
+
+    Raises:
+        ValueError: If the reference is invalid or names a range
+    """
+    verse_range = parse_reference(reference)
+    if verse_range.start != verse_range.end:
+        raise ValueError(f"Expected a single verse: {reference}")
+    return verse_range.start
@@ -0,0 +1,202 @@
+"""Reverse index from verse IDs to the biblical places they mention.
+
+Place documents list the verses that mention them (metadata "verse_ids"),
+but going from a verse or chunk to its places meant scanning every place.
+import-geography inverts those lists once and stores them in CSR form, with
+verse IDs sorted so a verse range is found with two binary searches:
+
+    {"version": 1,
+     "places": {"slug": [...], "name": [...], "place_type": [...],
+                "lat": [...], "lon": [...]},
+     "verse_ids": [1002008, 1002010, ...],
+     "offsets": [0, 1, 3, ...],
+     "place_refs": [17, 4, 17, ...]}
+
+Verse verse_ids[i] mentions places place_refs[offsets[i]:offsets[i + 1]]
+(row numbers into the place columns). Coordinates are null for places that
+have not been located.
+
+Usage:
+    python cli.py import-geography      # writes the index
+    python cli.py import-bible ...      # chunks pick up places from it
+"""
+
+import json
+import logging
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from atomic_files import write_json
+from config import settings
+from verse_ids import unpack_verse_id
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Place columns besides coordinates
+PLACE_FIELDS = ("slug", "name", "place_type")
+
+
+class VersePlaceIndex:
+    """Verse ID → place lookup for attaching geography to verse chunks."""
+
+    def __init__(self, path: Optional[Path]):
+        """
+        Initialize index.
+
+        Args:
+            path: JSON file holding the index (None for in-memory use)
+        """
+        self.path = path
+        self.places: List[Dict[str, Any]] = []
+        self.verse_ids: List[int] = []
+        self.offsets: List[int] = [0]
+        self.place_refs: List[int] = []
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed verses."""
+        return len(self.verse_ids)
+
+    def load(self) -> "VersePlaceIndex":
+        """
+        Load the index from disk.
+
+        Raises:
+            FileNotFoundError: If geography has not been imported
+            ValueError: If the index version is not supported
+        """
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"Verse place index not found: {self.path}. Run import-geography first."
+            )
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported verse place index version: {data.get('version')}")
+
+        columns = data["places"]
+        self.places = [
+            {
+                **{field: columns[field][row] for field in PLACE_FIELDS},
+                "latitude": columns["lat"][row],
+                "longitude": columns["lon"][row],
+            }
+            for row in range(len(columns["slug"]))
+        ]
+        self.verse_ids = data["verse_ids"]
+        self.offsets = data["offsets"]
+        self.place_refs = data["place_refs"]
+        logger.info(f"Loaded verse place index with {len(self.verse_ids)} verses, {len(self.places)} places")
+        return self
+
+    def save(self) -> None:
+        """Write the index atomically (temp file + rename)."""
+        columns = {field: [place[field] for place in self.places] for field in PLACE_FIELDS}
+        columns["lat"] = [place["latitude"] for place in self.places]
+        columns["lon"] = [place["longitude"] for place in self.places]
+        write_json(
+            self.path,
+            {
+                "version": INDEX_VERSION,
+                "places": columns,
+                "verse_ids": self.verse_ids,
+                "offsets": self.offsets,
+                "place_refs": self.place_refs,
+            },
+        )
+        logger.info(f"Wrote verse place index with {len(self.verse_ids)} verses to {self.path}")
+
+    # -- Building -----------------------------------------------------------
+
+    def add_document(self, document: Dict[str, Any]) -> bool:
+        """
+        Record a converted place document.
+
+        Places without verse IDs are skipped. Call build() when done.
+
+        Returns:
+            True if the place was added
+        """
+        metadata = document.get("metadata", {})
+        verse_ids = metadata.get("verse_ids")
+        if not verse_ids:
+            return False
+        slug = metadata.get("slug", document.get("title", ""))
+        self._pending[slug] = {
+            "slug": slug,
+            "name": metadata.get("place_name", slug),
+            "place_type": metadata.get("place_type"),
+            "latitude": metadata.get("latitude"),
+            "longitude": metadata.get("longitude"),
+            "verse_ids": verse_ids,
+        }
+        return True
+
+    def build(self) -> "VersePlaceIndex":
+        """Invert recorded places into the verse → place arrays."""
+        places = sorted(self._pending.values(), key=lambda place: place["slug"])
+        by_verse: Dict[int, List[int]] = {}
+        for row, place in enumerate(places):
+            for verse_id in place["verse_ids"]:
+                by_verse.setdefault(verse_id, []).append(row)
+
+        self.places = [{key: value for key, value in place.items() if key != "verse_ids"} for place in places]
+        self.verse_ids = sorted(by_verse)
+        self.offsets = [0]
+        self.place_refs = []
+        for verse_id in self.verse_ids:
+            self.place_refs.extend(by_verse[verse_id])
+            self.offsets.append(len(self.place_refs))
+        return self
+
+    # -- Queries ------------------------------------------------------------
+
+    def places_for_range(self, verse_id_start: int, verse_id_end: int) -> List[Dict[str, Any]]:
+        """
+        Places mentioned anywhere in an inclusive verse ID range.
+
+        Returns:
+            Place dicts (slug, name, place_type, latitude, longitude) with the
+            "verses" (verse numbers) that mention them, in order of first mention
+        """
+        lo = bisect_left(self.verse_ids, verse_id_start)
+        hi = bisect_right(self.verse_ids, verse_id_end)
+        found: Dict[int, Dict[str, Any]] = {}
+        for i in range(lo, hi):
+            verse = unpack_verse_id(self.verse_ids[i])[2]
+            for row in self.place_refs[self.offsets[i]:self.offsets[i + 1]]:
+                if row not in found:
+                    found[row] = {**self.places[row], "verses": []}
+                found[row]["verses"].append(verse)
+        return list(found.values())
+
+    def places_for_verse(self, verse_id: int) -> List[Dict[str, Any]]:
+        """Places mentioned in one verse."""
+        return self.places_for_range(verse_id, verse_id)
+
+
+_default_index: Optional[VersePlaceIndex] = None
+_default_loaded = False
+
+
+def default_verse_place_index() -> Optional[VersePlaceIndex]:
+    """
+    Index at settings.verse_place_index_path, loaded once.
+
+    Returns:
+        The index, or None if geography has not been imported
+    """
+    global _default_index, _default_loaded
+    if not _default_loaded:
+        _default_loaded = True
+        try:
+            _default_index = VersePlaceIndex(settings.verse_place_index_path).load()
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning(f"Chunks will not carry places: {e}")
+            _default_index = None
+    return _default_index
@@ -8,6 +8,21 @@
 // Get API URL from environment or use default
 const PRISM_API_URL = import.meta.env.VITE_PRISM_API_URL || 'http://localhost:8100';
 
+// Prebuilt places bundle written by the importer
+// (python cli.py import-geography writes static/data/places.geojson)
+const GEOGRAPHY_BUNDLE_URL = import.meta.env.VITE_GEOGRAPHY_BUNDLE_URL || '/data/places.geojson';
+const BUNDLE_VERSION = 1;
+
+// Precomputed marker cluster tiles ({z}/{x}/{y}.json) written by the importer
+// (static/data/place-clusters)
+const PLACE_CLUSTERS_URL = import.meta.env.VITE_PLACE_CLUSTERS_URL || '/data/place-clusters';
+const CLUSTERS_VERSION = 1;
+
+// Journey routes with precomputed polylines written by the importer
+// (python cli.py build-journeys writes static/data/journeys.json)
+const JOURNEYS_URL = import.meta.env.VITE_JOURNEYS_URL || '/data/journeys.json';
+const JOURNEYS_VERSION = 1;
+
 // Simple in-memory cache for places (10 minute TTL)
 let placesCache: { data: BiblicalPlace[]; timestamp: number } | null = null;
 const CACHE_TTL = 10 * 60 * 1000; // 10 minutes
@@ -31,6 +46,61 @@ export interface PlacesResponse {
 	total: number;
 }
 
+export interface PlaceCluster {
+	id: string;
+	latitude: number;
+	longitude: number;
+	count: number;
+	bounds?: [number, number, number, number]; // [west, south, east, north]
+	expansion_zoom?: number;
+	place_id?: string; // single place (count === 1)
+	name?: string;
+	confidence_level?: 'high' | 'moderate' | 'low';
+}
+
+export interface ClusterIndex {
+	min_zoom: number;
+	max_zoom: number;
+	tiles: Record<string, Set<string>>; // zoom -> "x/y" of non-empty tiles
+}
+
+export interface JourneyStop {
+	sequence: number;
+	name: string;
+	latitude: number;
+	longitude: number;
+	verse_references: string[];
+	event_description?: string;
+	cumulative_km: number;
+	place: { slug: string; name: string; document_id: string | null; distance_km: number } | null;
+}
+
+export interface JourneySegment {
+	from: number;
+	to: number;
+	type: string; // road, sea, wilderness, ...
+	historical_route?: string;
+	distance_km: number;
+	path: [number, number][]; // [lat, lon]
+}
+
+export interface Journey {
+	id: string;
+	name: string;
+	category: string;
+	subcategory: string;
+	biblical_references: string[];
+	bbox: [number, number, number, number]; // [west, south, east, north]
+	stats: {
+		stops: number;
+		total_km: number;
+		km_by_route_type: Record<string, number>;
+		km_per_day: number | null;
+	};
+	stops: JourneyStop[];
+	segments: JourneySegment[];
+}
+
 export interface SearchPlacesParams {
 	query?: string;
 	placeType?: string;
@@ -40,105 +110,24 @@ export interface SearchPlacesParams {
 }
 
 /**
- * Fetch all biblical places from Prism
+ * Fetch biblical places.
+ *
+ * Loads the prebuilt places bundle (one cacheable request, every place) and
+ * falls back to listing documents from Prism when the bundle is unavailable.
  */
 export async function fetchBiblicalPlaces(params: SearchPlacesParams = {}): Promise<PlacesResponse> {
-	const { limit = 100, offset = 0, placeType, confidenceLevel } = params;
-
-	// Check cache if no filters applied
-	if (!placeType && !confidenceLevel && placesCache && Date.now() - placesCache.timestamp < CACHE_TTL) {
-		return {
-			places: placesCache.data.slice(offset, offset + limit),
-			total: placesCache.data.length
-		};
-	}
+	const { limit, offset = 0, placeType, confidenceLevel } = params;
 
 	try {
-		// Step 1: Get list of all geography document IDs
-		console.log('[Geography] Fetching document list...');
-
-		// Add timeout to prevent hanging
-		const controller = new AbortController();
-		const timeout = setTimeout(() => controller.abort(), 10000); // 10 second timeout
-
-		const listResponse = await fetch(`${PRISM_API_URL}/api/v1/documents?domain=geography/biblical&limit=100`, {
-			method: 'GET',
-			headers: {
-				'Content-Type': 'application/json',
-			},
-			signal: controller.signal,
-		});
-
-		clearTimeout(timeout);
-
-		if (!listResponse.ok) {
-			throw new Error(`Failed to load geography data (HTTP ${listResponse.status})`);
+		let allPlaces: BiblicalPlace[];
+		if (placesCache && Date.now() - placesCache.timestamp < CACHE_TTL) {
+			allPlaces = placesCache.data;
+		} else {
+			const bundlePlaces = await fetchPlacesBundle();
+			allPlaces = bundlePlaces ?? (await fetchPlacesFromPrism());
+			placesCache = { data: allPlaces, timestamp: Date.now() };
 		}
 
-		const listData = await listResponse.json();
-		const documentIds = (listData.items || []).map((item: any) => item.id);
-		console.log(`[Geography] Found ${documentIds.length} documents. Fetching details...`);
-
-		// Step 2: Fetch full details (with metadata) for all documents in batches
-		const batchSize = 50;
-		const allPlaces: BiblicalPlace[] = [];
-		let processedCount = 0;
-
-		// Respect API limit of 100 per request - fetch only what was requested
-		// Note: Prism API has max limit=100, so we can't fetch more than that anyway
-		const maxToFetch = Math.min(documentIds.length, limit);
-		const idsToFetch = documentIds.slice(0, maxToFetch);
-		console.log(`[Geography] Will fetch ${idsToFetch.length} documents (limited from ${documentIds.length} total)`);
-
-		for (let i = 0; i < idsToFetch.length; i += batchSize) {
-			const batch = idsToFetch.slice(i, i + batchSize);
-			console.log(`[Geography] Fetching batch ${Math.floor(i / batchSize) + 1}/${Math.ceil(idsToFetch.length / batchSize)} (${batch.length} documents)...`);
-
-			const fetchPromises = batch.map(async (id: string) => {
-				try {
-					// Add timeout for each individual fetch
-					const controller = new AbortController();
-					const timeout = setTimeout(() => controller.abort(), 5000); // 5 second timeout per document
-
-					const response = await fetch(`${PRISM_API_URL}/api/v1/documents/${id}`, {
-						signal: controller.signal
-					});
-
-					clearTimeout(timeout);
-
-					if (response.ok) {
-						const doc = await response.json();
-						return doc;
-					}
-					console.warn(`[Geography] Failed to fetch document ${id}: HTTP ${response.status}`);
-					return null;
-				} catch (e) {
-					if (e instanceof Error && e.name === 'AbortError') {
-						console.warn(`[Geography] Timeout fetching document ${id}`);
-					} else {
-						console.error(`[Geography] Error fetching document ${id}:`, e);
-					}
-					return null;
-				}
-			});
-
-			const batchResults = await Promise.all(fetchPromises);
-			const validDocs = batchResults.filter(doc => doc !== null);
-
-			for (const doc of validDocs) {
-				const place = transformDocumentToPlace(doc);
-				// Filter out invalid coordinates
-				if (place.latitude !== 0 && place.longitude !== 0) {
-					allPlaces.push(place);
-				}
-			}
-
-			processedCount += batch.length;
-			console.log(`[Geography] Processed ${processedCount}/${idsToFetch.length} documents (${allPlaces.length} valid places so far)`);
-		}
-
-		console.log(`[Geography] Completed! Loaded ${allPlaces.length} places with valid coordinates.`);
-
 		// Apply client-side filters if specified
 		let filteredPlaces = allPlaces;
 
@@ -150,12 +139,7 @@ export async function fetchBiblicalPlaces(params: SearchPlacesParams = {}): Prom
 			filteredPlaces = filteredPlaces.filter(p => p.confidence_level === confidenceLevel);
 		}
 
-		// Cache all places if no filters
-		if (!placeType && !confidenceLevel) {
-			placesCache = { data: filteredPlaces, timestamp: Date.now() };
-		}
-
-		const places = filteredPlaces.slice(offset, offset + limit);
+		const places = filteredPlaces.slice(offset, limit === undefined ? undefined : offset + limit);
 
 		return {
 			places,
@@ -173,6 +157,216 @@ export async function fetchBiblicalPlaces(params: SearchPlacesParams = {}): Prom
 	}
 }
 
+/**
+ * Load every place from the prebuilt GeoJSON bundle.
+ *
+ * Returns null if the bundle is missing or has an unsupported version.
+ */
+async function fetchPlacesBundle(): Promise<BiblicalPlace[] | null> {
+	try {
+		const controller = new AbortController();
+		const timeout = setTimeout(() => controller.abort(), 10000); // 10 second timeout
+
+		const response = await fetch(GEOGRAPHY_BUNDLE_URL, { signal: controller.signal });
+		clearTimeout(timeout);
+
+		if (!response.ok) {
+			console.warn(`[Geography] Places bundle unavailable (HTTP ${response.status}), using Prism`);
+			return null;
+		}
+
+		const bundle = await response.json();
+		if (bundle.version !== BUNDLE_VERSION) {
+			console.warn(`[Geography] Unsupported places bundle version ${bundle.version}, using Prism`);
+			return null;
+		}
+
+		const places = (bundle.features || []).map(transformFeatureToPlace);
+		console.log(`[Geography] Loaded ${places.length} places from bundle (${bundle.generated_at})`);
+		return places;
+	} catch (e) {
+		console.warn('[Geography] Failed to load places bundle, using Prism:', e);
+		return null;
+	}
+}
+
+/**
+ * Fetch places from Prism one document at a time (capped at 100 by the API).
+ */
+async function fetchPlacesFromPrism(): Promise<BiblicalPlace[]> {
+	// Step 1: Get list of all geography document IDs
+	console.log('[Geography] Fetching document list...');
+
+	// Add timeout to prevent hanging
+	const controller = new AbortController();
+	const timeout = setTimeout(() => controller.abort(), 10000); // 10 second timeout
+
+	const listResponse = await fetch(`${PRISM_API_URL}/api/v1/documents?domain=geography/biblical&limit=100`, {
+		method: 'GET',
+		headers: {
+			'Content-Type': 'application/json',
+		},
+		signal: controller.signal,
+	});
+
+	clearTimeout(timeout);
+
+	if (!listResponse.ok) {
+		throw new Error(`Failed to load geography data (HTTP ${listResponse.status})`);
+	}
+
+	const listData = await listResponse.json();
+	const documentIds = (listData.items || []).map((item: any) => item.id);
+	console.log(`[Geography] Found ${documentIds.length} documents. Fetching details...`);
+
+	// Step 2: Fetch full details (with metadata) for all documents in batches
+	const batchSize = 50;
+	const allPlaces: BiblicalPlace[] = [];
+	let processedCount = 0;
+
+	for (let i = 0; i < documentIds.length; i += batchSize) {
+		const batch = documentIds.slice(i, i + batchSize);
+		console.log(`[Geography] Fetching batch ${Math.floor(i / batchSize) + 1}/${Math.ceil(documentIds.length / batchSize)} (${batch.length} documents)...`);
+
+		const fetchPromises = batch.map(async (id: string) => {
+			try {
+				// Add timeout for each individual fetch
+				const controller = new AbortController();
+				const timeout = setTimeout(() => controller.abort(), 5000); // 5 second timeout per document
+
+				const response = await fetch(`${PRISM_API_URL}/api/v1/documents/${id}`, {
+					signal: controller.signal
+				});
+
+				clearTimeout(timeout);
+
+				if (response.ok) {
+					const doc = await response.json();
+					return doc;
+				}
+				console.warn(`[Geography] Failed to fetch document ${id}: HTTP ${response.status}`);
+				return null;
+			} catch (e) {
+				if (e instanceof Error && e.name === 'AbortError') {
+					console.warn(`[Geography] Timeout fetching document ${id}`);
+				} else {
+					console.error(`[Geography] Error fetching document ${id}:`, e);
+				}
+				return null;
+			}
+		});
+
+		const batchResults = await Promise.all(fetchPromises);
+		const validDocs = batchResults.filter(doc => doc !== null);
+
+		for (const doc of validDocs) {
+			const place = transformDocumentToPlace(doc);
+			// Filter out invalid coordinates
+			if (place.latitude !== 0 && place.longitude !== 0) {
+				allPlaces.push(place);
+			}
+		}
+
+		processedCount += batch.length;
+		console.log(`[Geography] Processed ${processedCount}/${documentIds.length} documents (${allPlaces.length} valid places so far)`);
+	}
+
+	console.log(`[Geography] Completed! Loaded ${allPlaces.length} places with valid coordinates.`);
+	return allPlaces;
+}
+
+let clusterIndexPromise: Promise<ClusterIndex | null> | null = null;
+const clusterTileCache = new Map<string, Promise<PlaceCluster[]>>();
+
+/**
+ * Load the cluster tile index (null if clusters were not built).
+ */
+export function fetchClusterIndex(): Promise<ClusterIndex | null> {
+	if (!clusterIndexPromise) {
+		clusterIndexPromise = fetch(`${PLACE_CLUSTERS_URL}/index.json`)
+			.then(async response => {
+				if (!response.ok) return null;
+				const index = await response.json();
+				if (index.version !== CLUSTERS_VERSION) return null;
+				const tiles: Record<string, Set<string>> = {};
+				for (const [zoom, keys] of Object.entries(index.tiles as Record<string, string[]>)) {
+					tiles[zoom] = new Set(keys);
+				}
+				return { min_zoom: index.min_zoom, max_zoom: index.max_zoom, tiles };
+			})
+			.catch(e => {
+				console.warn('[Geography] Place clusters unavailable, clustering disabled:', e);
+				return null;
+			});
+	}
+	return clusterIndexPromise;
+}
+
+/**
+ * Fetch the precomputed clusters covering a viewport at a map zoom.
+ *
+ * Only non-empty tiles listed in the index are requested; tiles are cached.
+ */
+export async function fetchClusters(
+	index: ClusterIndex,
+	zoom: number,
+	bounds: { west: number; south: number; east: number; north: number }
+): Promise<PlaceCluster[]> {
+	const z = Math.max(index.min_zoom, Math.min(Math.floor(zoom), index.max_zoom + 1));
+	const available = index.tiles[String(z)] || new Set<string>();
+	const scale = 2 ** z;
+	const tileX = (lon: number) => Math.max(0, Math.min(scale - 1, Math.floor((lon / 360 + 0.5) * scale)));
+	const tileY = (lat: number) => {
+		const sin = Math.sin((Math.max(-85.05113, Math.min(85.05113, lat)) * Math.PI) / 180);
+		const y = 0.5 - (0.25 * Math.log((1 + sin) / (1 - sin))) / Math.PI;
+		return Math.max(0, Math.min(scale - 1, Math.floor(y * scale)));
+	};
+
+	const requests: Promise<PlaceCluster[]>[] = [];
+	for (let x = tileX(bounds.west); x <= tileX(bounds.east); x++) {
+		for (let y = tileY(bounds.north); y <= tileY(bounds.south); y++) {
+			const key = `${x}/${y}`;
+			if (!available.has(key)) continue;
+			const url = `${PLACE_CLUSTERS_URL}/${z}/${key}.json`;
+			if (!clusterTileCache.has(url)) {
+				clusterTileCache.set(
+					url,
+					fetch(url)
+						.then(response => (response.ok ? response.json() : { features: [] }))
+						.then(tile => tile.features.map(transformFeatureToCluster))
+						.catch(() => {
+							clusterTileCache.delete(url);
+							return [];
+						})
+				);
+			}
+			requests.push(clusterTileCache.get(url)!);
+		}
+	}
+	return (await Promise.all(requests)).flat();
+}
+
+let journeysPromise: Promise<Journey[]> | null = null;
+
+/**
+ * Load every journey route in one request (empty if journeys were not built).
+ */
+export function fetchJourneys(): Promise<Journey[]> {
+	if (!journeysPromise) {
+		journeysPromise = fetch(JOURNEYS_URL)
+			.then(async response => {
+				if (!response.ok) return [];
+				const artifact = await response.json();
+				return artifact.version === JOURNEYS_VERSION ? (artifact.journeys as Journey[]) : [];
+			})
+			.catch(e => {
+				console.warn('[Geography] Journeys unavailable:', e);
+				return [];
+			});
+	}
+	return journeysPromise;
+}
+
 /**
  * Search for places by name using semantic search
  */
@@ -294,6 +488,51 @@ function transformDocumentToPlace(doc: any): BiblicalPlace {
 	};
 }
 
+function transformFeatureToPlace(feature: any): BiblicalPlace {
+	// Bundle features: { id: slug, geometry: { coordinates: [lon, lat] }, properties }
+	const properties = feature.properties || {};
+	const [longitude, latitude] = feature.geometry?.coordinates || [0, 0];
+
+	return {
+		id: feature.id,
+		document_id: properties.document_id || feature.id,
+		name: properties.name || feature.id,
+		latitude,
+		longitude,
+		place_type: properties.place_type || 'unknown',
+		confidence_score: properties.confidence_score || 0,
+		confidence_level: properties.confidence_level || getConfidenceLevel(properties.confidence_score || 0),
+		verse_references: properties.verse_references || [],
+		alternate_names: properties.alternate_names || [],
+		content: '',
+	};
+}
+
+function transformFeatureToCluster(feature: any): PlaceCluster {
+	const properties = feature.properties || {};
+	const [longitude, latitude] = feature.geometry.coordinates;
+
+	if (properties.cluster) {
+		return {
+			id: feature.id,
+			latitude,
+			longitude,
+			count: properties.count,
+			bounds: properties.bounds,
+			expansion_zoom: properties.expansion_zoom,
+		};
+	}
+	return {
+		id: feature.id,
+		latitude,
+		longitude,
+		count: 1,
+		place_id: feature.id,
+		name: properties.name,
+		confidence_level: properties.confidence_level,
+	};
+}
+
 function transformSearchResultToPlace(result: any): BiblicalPlace {
 	// Search results have format: { document_id, content, metadata, similarity }
 	const metadata = result.metadata || {};
@@ -5,13 +5,19 @@
  * via SWORD modules through the Python parser backend.
  */
 
-// Note: This assumes a future API endpoint. For now, uses mock data for development.
-const USE_MOCK_DATA = true; // Toggle when API endpoint is ready
+// SWORD service URL (python cli.py serve-sword). Falls back to mock data when unset.
+const SWORD_API_URL = import.meta.env.VITE_SWORD_API_URL || '';
+const USE_MOCK_DATA = !SWORD_API_URL;
 
 // Simple cache for verse data (30 minute TTL)
 const verseCache = new Map<string, { data: any; timestamp: number }>();
 const CACHE_TTL = 30 * 60 * 1000; // 30 minutes
 
+// Batch requests in flight, keyed by verse or chapter, so concurrent lookups share one fetch
+const inFlight = new Map<string, Promise<void>>();
+// First verse missed per chapter; a second miss in the chapter loads the whole chapter
+const chapterMisses = new Map<string, number>();
+
 export interface VerseText {
 	original_text: string;
 	language: 'hebrew' | 'greek';
@@ -60,63 +66,121 @@ export const NT_BOOKS = [
 	"1 John", "2 John", "3 John", "Jude", "Revelation"
 ];
 
+export interface VerseRangeRequest {
+	book: string;
+	chapter: number;
+	verse_start?: number;
+	verse_end?: number;
+}
+
+export interface VerseRange {
+	book: string;
+	chapter: number;
+	verse_start: number;
+	verse_end: number;
+	verses: VerseText[];
+}
+
 /**
- * Get Hebrew text for an Old Testament verse
+ * Fetch several verse ranges in a single request.
+ *
+ * References may be strings ("Genesis 1", "John 3:16-18") or objects.
+ * Results are returned in request order and every verse is added to the cache.
  */
-export async function getHebrewText(book: string, chapter: number, verse: number): Promise<VerseText | null> {
-	// Check cache first
-	const cacheKey = `hebrew:${book}:${chapter}:${verse}`;
+export async function getOriginalTexts(references: (string | VerseRangeRequest)[]): Promise<VerseRange[]> {
+	if (USE_MOCK_DATA || references.length === 0) return [];
+
+	try {
+		const response = await fetch(`${SWORD_API_URL}/api/sword/batch`, {
+			method: 'POST',
+			headers: { 'Content-Type': 'application/json' },
+			body: JSON.stringify({ references })
+		});
+
+		if (!response.ok) return [];
+		const { results } = await response.json();
+		const timestamp = Date.now();
+		for (const range of results as VerseRange[]) {
+			for (const verse of range.verses) {
+				verseCache.set(`${verse.language}:${verse.book}:${verse.chapter}:${verse.verse}`, {
+					data: verse,
+					timestamp
+				});
+			}
+		}
+		return results;
+	} catch (error) {
+		console.error('Error fetching verse ranges:', error);
+		return [];
+	}
+}
+
+/**
+ * Run one batch request per key at a time; later callers await the same fetch.
+ */
+function loadOnce(key: string, references: VerseRangeRequest[]): Promise<void> {
+	let pending = inFlight.get(key);
+	if (!pending) {
+		pending = getOriginalTexts(references)
+			.then(() => undefined)
+			.finally(() => inFlight.delete(key));
+		inFlight.set(key, pending);
+	}
+	return pending;
+}
+
+/**
+ * Get original-language text for a single verse.
+ *
+ * The first miss in a chapter fetches just that verse. A miss on another
+ * verse of the same chapter (a chapter being rendered verse-by-verse) loads
+ * the rest of the chapter in one batch request, which concurrent lookups
+ * share instead of each firing their own.
+ */
+async function getOriginalText(
+	language: 'hebrew' | 'greek',
+	book: string,
+	chapter: number,
+	verse: number
+): Promise<VerseText | null> {
+	const cacheKey = `${language}:${book}:${chapter}:${verse}`;
 	const cached = verseCache.get(cacheKey);
 	if (cached && Date.now() - cached.timestamp < CACHE_TTL) {
 		return cached.data;
 	}
 
 	if (USE_MOCK_DATA) {
-		const data = getMockHebrewText(book, chapter, verse);
+		const data = language === 'hebrew'
+			? getMockHebrewText(book, chapter, verse)
+			: getMockGreekText(book, chapter, verse);
 		verseCache.set(cacheKey, { data, timestamp: Date.now() });
 		return data;
 	}
 
-	try {
-		// TODO: Replace with actual API endpoint when backend is ready
-		const response = await fetch(`/api/sword/hebrew`, {
-			method: 'POST',
-			headers: { 'Content-Type': 'application/json' },
-			body: JSON.stringify({ book, chapter, verse })
-		});
-
-		if (!response.ok) return null;
-		const data = await response.json();
-		verseCache.set(cacheKey, { data, timestamp: Date.now() });
-		return data;
-	} catch (error) {
-		console.error('Error fetching Hebrew text:', error);
-		return null;
+	const chapterKey = `${language}:${book}:${chapter}`;
+	const firstMiss = chapterMisses.get(chapterKey);
+	if (inFlight.has(chapterKey) || (firstMiss !== undefined && firstMiss !== verse)) {
+		await loadOnce(chapterKey, [{ book, chapter }]);
+	} else {
+		chapterMisses.set(chapterKey, verse);
+		await loadOnce(cacheKey, [{ book, chapter, verse_start: verse, verse_end: verse }]);
 	}
+	const loaded = verseCache.get(cacheKey);
+	return loaded ? loaded.data : null;
+}
+
+/**
+ * Get Hebrew text for an Old Testament verse
+ */
+export async function getHebrewText(book: string, chapter: number, verse: number): Promise<VerseText | null> {
+	return getOriginalText('hebrew', book, chapter, verse);
 }
 
 /**
  * Get Greek text for a New Testament verse
  */
 export async function getGreekText(book: string, chapter: number, verse: number): Promise<VerseText | null> {
-	if (USE_MOCK_DATA) {
-		return getMockGreekText(book, chapter, verse);
-	}
-
-	try {
-		// TODO: Replace with actual API endpoint when backend is ready
-		const response = await fetch(`/api/sword/greek`, {
-			method: 'POST',
-			headers: { 'Content-Type': 'application/json' },
-			body: JSON.stringify({ book, chapter, verse })
-		});
-
-		if (!response.ok) return null;
-		return await response.json();
-	} catch (error) {
-		console.error('Error fetching Greek text:', error);
-		return null;
-	}
+	return getOriginalText('greek', book, chapter, verse);
 }
 
 /**
@@ -128,8 +192,7 @@ export async function getInterlinear(book: string, chapter: number, verse: numbe
 	}
 
 	try {
-		// TODO: Replace with actual API endpoint when backend is ready
-		const response = await fetch(`/api/sword/interlinear`, {
+		const response = await fetch(`${SWORD_API_URL}/api/sword/interlinear`, {
 			method: 'POST',
 			headers: { 'Content-Type': 'application/json' },
 			body: JSON.stringify({ book, chapter, verse })